@@ -1,11 +1,22 @@
-"""Real-time FFT Analysis example."""
+"""Real-time FFT Analysis example.
+
+    python examples/fft_analyzer.py              # run until the window is closed
+    python examples/fft_analyzer.py --frames 60  # render 60 frames and exit
+"""
 
 from __future__ import annotations
 
-import pegasus as pg
+import argparse
+from typing import List, Optional, Sequence
+
+import dearpygui.dearpygui as dpg
 import numpy as np
-from typing import List
-import time
+
+from pegasus.events.handlers import add_visible_handler
+from pegasus.performance.buffers import RingSeries
+from pegasus.performance.profiler import run_render_loop
+from pegasus.plotting.series import SpectrogramSeries
+from pegasus.spectral import SlidingSpectrum
 
 
 def generate_signal(
@@ -19,72 +30,84 @@ def generate_signal(
     return signal
 
 
-def compute_fft(signal: np.ndarray, sample_rate: float) -> tuple:
-    """Compute FFT of signal."""
-    fft = np.fft.fft(signal)
-    freqs = np.fft.fftfreq(len(signal), 1 / sample_rate)
-    magnitude = np.abs(fft)
-
-    # Return only positive frequencies
-    positive_freqs = freqs[: len(freqs) // 2]
-    positive_magnitude = magnitude[: len(magnitude) // 2]
-
-    return positive_freqs, positive_magnitude
-
-
-def main():
+def main(argv: Optional[Sequence[str]] = None):
     """Run real-time FFT analyzer."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--frames", type=int, default=None,
+                        help="exit after rendering this many frames")
+    args = parser.parse_args(argv)
+
     # Setup
-    pg.create_context()
-    viewport = pg.Viewport(
-        pg.ViewportConfig(title="Real-time FFT Analyzer", width=1200, height=800)
-    )
-    viewport.create()
-    viewport.setup_dearpygui()
+    dpg.create_context()
+    dpg.create_viewport(title="Real-time FFT Analyzer", width=1200, height=800)
+    dpg.setup_dearpygui()
 
     # Parameters
-    sample_rate = 1000.0  # Hz
-    duration = 1.0  # seconds
-    num_samples = int(sample_rate * duration)
-
-    # Generate initial signal
-    t = np.linspace(0, duration, num_samples)
+    sample_rate = 8000.0  # Hz
     frequencies = [50, 120, 200]  # Hz
-    signal = generate_signal(t, frequencies)
-    freqs, magnitude = compute_fft(signal, sample_rate)
+    block = int(sample_rate / 60)  # Samples arriving per rendered frame
+
+    spectrum = SlidingSpectrum(window_size=1024, hop=128, sample_rate=sample_rate)
+    samples = RingSeries(None, capacity=int(sample_rate))  # Last second of signal
+    clock = {"t": 0.0}
 
     # Create window
-    with pg.window(label="FFT Analyzer", width=1100, height=700):
+    with dpg.window(label="FFT Analyzer", width=1100, height=900) as window:
         # Time domain plot
-        with pg.plot(label="Time Domain Signal", height=300, width=1000):
-            pg.add_plot_legend()
-            pg.add_plot_axis(pg.mvXAxis, label="Time (s)")
-            y_axis = pg.add_plot_axis(pg.mvYAxis, label="Amplitude")
+        with dpg.plot(label="Time Domain Signal", height=250, width=1000):
+            dpg.add_plot_legend()
+            dpg.add_plot_axis(dpg.mvXAxis, label="Time (s)")
+            y_axis = dpg.add_plot_axis(dpg.mvYAxis, label="Amplitude")
 
-            time_tag = pg.add_line_series(t, signal, label="Signal", parent=y_axis)
+            samples.tag = dpg.add_line_series([], [], label="Signal", parent=y_axis)
 
         # Frequency domain plot
-        with pg.plot(label="Frequency Domain (FFT)", height=300, width=1000):
-            pg.add_plot_legend()
-            pg.add_plot_axis(pg.mvXAxis, label="Frequency (Hz)")
-            y_axis = pg.add_plot_axis(pg.mvYAxis, label="Magnitude")
-
-            freq_tag = pg.add_line_series(freqs, magnitude, label="FFT Magnitude", parent=y_axis)
-
-            # Add markers for detected peaks
-            threshold = np.max(magnitude) * 0.5
-            peaks = freqs[magnitude > threshold]
-            for peak in peaks[:3]:  # Mark top 3 peaks
-                pg.add_plot_axis(pg.mvXAxis, label=f"Peak @ {peak:.1f} Hz")
+        with dpg.plot(label="Frequency Domain (FFT)", height=250, width=1000):
+            dpg.add_plot_legend()
+            dpg.add_plot_axis(dpg.mvXAxis, label="Frequency (Hz)")
+            y_axis = dpg.add_plot_axis(dpg.mvYAxis, label="Magnitude (dB)")
+
+            freq_tag = dpg.add_line_series(spectrum.frequencies, spectrum.latest,
+                                           label="FFT Magnitude", parent=y_axis)
+
+        # Scrolling spectrogram, one texture column per FFT frame
+        with dpg.plot(label="Spectrogram", height=300, width=1000):
+            dpg.add_plot_axis(dpg.mvXAxis, label="Time (s)")
+            y_axis = dpg.add_plot_axis(dpg.mvYAxis, label="Frequency (Hz)")
+
+            spectrogram = SpectrogramSeries(
+                spectrum.bins, history=600, parent=y_axis,
+                frame_seconds=spectrum.frame_seconds,
+                max_frequency=spectrum.frequencies[-1],
+            )
+
+    def on_frame(sender=None, app_data=None):
+        t = clock["t"] + np.arange(block) / sample_rate
+        clock["t"] += block / sample_rate
+        signal = generate_signal(t, frequencies)
+
+        samples.extend(t, signal)
+        samples.flush()
+        frames = spectrum.push(signal)
+        if len(frames):
+            dpg.set_value(freq_tag, [spectrum.frequencies, spectrum.latest])
+            spectrogram.push(frames)
+            spectrogram.flush()
+
+    add_visible_handler(window, on_frame)
 
     # Show and run
-    viewport.show()
+    dpg.set_primary_window(window, True)
+    dpg.show_viewport()
     print("FFT Analyzer running...")
-    print(f"Sample Rate: {sample_rate} Hz")
+    print(f"Sample Rate: {sample_rate} Hz, window {spectrum.window_size}, hop {spectrum.hop}")
     print(f"Signal Frequencies: {frequencies} Hz")
-    viewport.start()
+    if args.frames is None:
+        dpg.start_dearpygui()
+    else:
+        run_render_loop(max_frames=args.frames)
 
-    pg.destroy_context()
+    dpg.destroy_context()
 
 
 if __name__ == "__main__":
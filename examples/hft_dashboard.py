@@ -1,40 +1,51 @@
-"""HFT Dashboard example with real-time order book visualization."""
+"""HFT Dashboard example with real-time order book visualization.
+
+    python examples/hft_dashboard.py              # run until the window is closed
+    python examples/hft_dashboard.py --frames 60  # render 60 frames and exit
+"""
 
 from __future__ import annotations
 
-import pegasus as pg
+import argparse
+from typing import Optional, Sequence
+
+import dearpygui.dearpygui as dpg
 import numpy as np
-from typing import List, Dict
-import random
+
+from pegasus.events.handlers import add_visible_handler
+from pegasus.orderbook import BID, OrderBook
+from pegasus.performance.profiler import run_render_loop
+from pegasus.plotting.series import DepthSeries, add_ohlc_series
 
 
 class OrderBookSimulator:
-    """Simulates real-time order book data."""
+    """Simulates a real-time L2 feed into an array-backed ``OrderBook``."""
 
-    def __init__(self, levels: int = 10):
+    def __init__(self, levels: int = 1000, tick: float = 0.1):
         self.levels = levels
+        self.tick = tick
         self.mid_price = 50000.0
         self.spread = 0.5
-
-    def get_order_book(self) -> Dict[str, List[float]]:
-        """Generate simulated order book snapshot."""
-        bids = []
-        asks = []
-
-        for i in range(self.levels):
-            bid_price = self.mid_price - self.spread / 2 - i * 0.1
-            ask_price = self.mid_price + self.spread / 2 + i * 0.1
-            bid_size = random.uniform(0.1, 2.0) * (1 - i / self.levels)
-            ask_size = random.uniform(0.1, 2.0) * (1 - i / self.levels)
-
-            bids.append((bid_price, bid_size))
-            asks.append((ask_price, ask_size))
-
-        return {"bids": bids, "asks": asks}
-
-    def update(self):
-        """Update mid price."""
-        self.mid_price += random.uniform(-5, 5)
+        self.book = OrderBook(levels=levels)
+        self.rng = np.random.default_rng()
+
+        offsets = self.spread / 2 + np.arange(levels) * tick
+        decay = 1 - np.arange(levels) / levels
+        self.book.snapshot(
+            self.mid_price - offsets, self.rng.uniform(0.1, 2.0, levels) * decay,
+            self.mid_price + offsets, self.rng.uniform(0.1, 2.0, levels) * decay,
+        )
+
+    def update(self, deltas: int = 2000):
+        """Applies one batch of random add/modify/delete deltas around the mid price."""
+        self.mid_price += self.rng.uniform(-0.5, 0.5)
+        sides = self.rng.integers(0, 2, deltas)
+        distance = self.spread / 2 + self.rng.integers(0, self.levels, deltas) * self.tick
+        prices = np.round(np.where(sides == BID, self.mid_price - distance,
+                                   self.mid_price + distance) / self.tick) * self.tick
+        sizes = self.rng.uniform(0.1, 2.0, deltas)
+        sizes[self.rng.random(deltas) < 0.2] = 0.0  # Deletes
+        self.book.apply(sides, prices, sizes)
 
 
 def create_candlestick_data(n: int = 100) -> tuple:
@@ -48,59 +59,64 @@ def create_candlestick_data(n: int = 100) -> tuple:
     return dates, opens, highs, lows, closes
 
 
-def main():
+def main(argv: Optional[Sequence[str]] = None):
     """Run HFT dashboard example."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--frames", type=int, default=None,
+                        help="exit after rendering this many frames")
+    args = parser.parse_args(argv)
+
     # Setup
-    pg.create_context()
-    viewport = pg.Viewport(pg.ViewportConfig(title="HFT Dashboard", width=1400, height=900))
-    viewport.create()
-    viewport.setup_dearpygui()
+    dpg.create_context()
+    dpg.create_viewport(title="HFT Dashboard", width=1400, height=900)
+    dpg.setup_dearpygui()
 
     # Generate initial data
-    simulator = OrderBookSimulator(levels=20)
+    simulator = OrderBookSimulator(levels=1000)
     dates, opens, highs, lows, closes = create_candlestick_data(200)
 
     # Create window with docking
-    with pg.window(label="HFT Dashboard", width=1300, height=800):
+    with dpg.window(label="HFT Dashboard", width=1300, height=800) as window:
         # Price chart with candlesticks
-        with pg.plot(label="BTC/USD Price", height=400, width=1200):
-            pg.add_plot_legend()
-            pg.add_plot_axis(pg.mvXAxis, label="Time")
-            y_axis = pg.add_plot_axis(pg.mvYAxis, label="Price ($)")
-
-            candle_tag = pg.add_candle_series(
-                dates,
-                opens,
-                highs,
-                lows,
-                closes,
-                label="Price",
-                parent=y_axis,
-            )
+        with dpg.plot(label="BTC/USD Price", height=400, width=1200):
+            dpg.add_plot_legend()
+            dpg.add_plot_axis(dpg.mvXAxis, label="Time")
+            y_axis = dpg.add_plot_axis(dpg.mvYAxis, label="Price ($)")
+
+            add_ohlc_series(dates, opens, highs, lows, closes, label="Price", parent=y_axis)
 
         # Order book depth chart
-        with pg.plot(label="Order Book Depth", height=300, width=600):
-            pg.add_plot_legend()
-            pg.add_plot_axis(pg.mvXAxis, label="Price ($)")
-            y_axis = pg.add_plot_axis(pg.mvYAxis, label="Size")
+        with dpg.plot(label="Order Book Depth", height=300, width=600):
+            dpg.add_plot_legend()
+            dpg.add_plot_axis(dpg.mvXAxis, label="Price ($)")
+            y_axis = dpg.add_plot_axis(dpg.mvYAxis, label="Size")
 
-            # Will be updated in real-time
-            bid_tag = pg.add_bar_series([], [], label="Bids", parent=y_axis)
-            ask_tag = pg.add_bar_series([], [], label="Asks", parent=y_axis)
+            # Re-sent every frame the book changed
+            depth = DepthSeries(simulator.book, parent=y_axis)
 
         # Volume profile
-        with pg.plot(label="Volume Profile", height=300, width=600):
-            pg.add_plot_legend()
-            pg.add_plot_axis(pg.mvXAxis, label="Volume")
-            pg.add_plot_axis(pg.mvYAxis, label="Price ($)")
+        with dpg.plot(label="Volume Profile", height=300, width=600):
+            dpg.add_plot_legend()
+            dpg.add_plot_axis(dpg.mvXAxis, label="Volume")
+            dpg.add_plot_axis(dpg.mvYAxis, label="Price ($)")
+
+    def on_frame(sender=None, app_data=None):
+        simulator.update()
+        depth.flush()
+
+    add_visible_handler(window, on_frame)
 
     # Show and run
-    viewport.show()
+    dpg.set_primary_window(window, True)
+    dpg.show_viewport()
     print("HFT Dashboard running...")
     print("Note: This is a simulated demo with random data")
-    viewport.start()
+    if args.frames is None:
+        dpg.start_dearpygui()
+    else:
+        run_render_loop(max_frames=args.frames)
 
-    pg.destroy_context()
+    dpg.destroy_context()
 
 
 if __name__ == "__main__":
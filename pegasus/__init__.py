@@ -2,21 +2,42 @@
 Pegasus: A bare-metal, GPU-accelerated high-performance charting library.
 
 Simplified API - import chart types directly:
-    from pegasus import CandlestickChart, LineChart, ScatterChart
-    from pegasus import load_ohlc_csv
+    from pegasus import CandlestickChart, LineChart, ScatterChart, HeatmapChart, Dashboard
+    from pegasus import render_charts
+    from pegasus import load_ohlc_csv, load_ohlc_many
+
+Names are imported lazily on first access (PEP 562), so ``import pegasus``
+loads neither Dear PyGui nor pandas, and charts never load pandas.
 """
 
 from __future__ import annotations
 
+import importlib
+from typing import TYPE_CHECKING
+
 __version__ = "0.1.0"
 __author__ = "Your Name"
 __license__ = "MIT"
 
-# High-level chart classes
-from pegasus.charts import CandlestickChart, LineChart, ScatterChart
+# Public name -> module defining it, imported on first attribute access
+_LAZY = {
+    # High-level chart classes
+    "CandlestickChart": "pegasus.charts",
+    "LineChart": "pegasus.charts",
+    "ScatterChart": "pegasus.charts",
+    "HeatmapChart": "pegasus.charts",
+    "Dashboard": "pegasus.charts",
+    # Headless export
+    "render_charts": "pegasus.export",
+    # Data utilities (pandas)
+    "load_ohlc_csv": "pegasus.utils.data",
+    "load_ohlc_many": "pegasus.utils.data",
+}
 
-# Data utilities
-from pegasus.utils.data import load_ohlc_csv
+if TYPE_CHECKING:
+    from pegasus.charts import CandlestickChart, Dashboard, HeatmapChart, LineChart, ScatterChart
+    from pegasus.export import render_charts
+    from pegasus.utils.data import load_ohlc_csv, load_ohlc_many
 
 __all__ = [
     "__version__",
@@ -24,8 +45,26 @@ __all__ = [
     "__license__",
     # Charts
     "CandlestickChart",
-    "LineChart", 
+    "LineChart",
     "ScatterChart",
+    "HeatmapChart",
+    "Dashboard",
+    # Export
+    "render_charts",
     # Data
     "load_ohlc_csv",
+    "load_ohlc_many",
 ]
+
+
+def __getattr__(name: str):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module 'pegasus' has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value  # Later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
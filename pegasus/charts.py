@@ -1,34 +1,115 @@
 """High-level chart classes for Pegasus."""
+import itertools
+import time
+
 import dearpygui.dearpygui as dpg
-from typing import List, Optional, Callable
+import numpy as np
+from typing import TYPE_CHECKING, Callable, List, Optional, Sequence, Tuple
+
+from pegasus.events.handlers import add_query_handler, add_visible_handler
+from pegasus.performance.decimation import OHLCPyramid, density_histogram, shared_index
+from pegasus.performance.textures import apply_colormap, colormap_lut
+from pegasus.plotting import series
+from pegasus.plotting.axes import VisibleRangeFit
+from pegasus.types import SeriesLike
+from pegasus.utils.arrays import as_series_arrays
+
+# Profiling, hover lookups, headless rendering, memory-mapped sources and
+# indicators are imported where they are used, to keep chart imports light
+if TYPE_CHECKING:
+    from pegasus.dataplane import SharedRingBuffer
+    from pegasus.indicators import Indicator
+    from pegasus.performance.profiler import FrameProfiler
+    from pegasus.performance.query import GridIndex
+    from pegasus.utils.mmap_series import MmapLineSource, MmapOHLCSource
+    from pegasus.utils.ohlc import TimeframeBars
+
+
+def _snap(x: np.ndarray, value: float, radius: float) -> int:
+    """Sample of sorted ``x`` nearest to ``value`` if within ``radius`` or about one sample spacing."""
+    from pegasus.performance.query import nearest_index
+    i = nearest_index(x, value)
+    if i < 0:
+        return -1
+    spacing = (x[min(i + 1, len(x) - 1)] - x[max(i - 1, 0)]) / 2
+    return i if abs(x[i] - value) <= max(radius, spacing) else -1
 
 
 class Chart:
-    """Base chart class that handles DPG lifecycle and common functionality."""
+    """
+    Base chart class that handles DPG lifecycle and common functionality.
+
+    Every chart gets its own item tags (``plot_tag``, ``x_axis_tag``,
+    ``y_axis_tag``), so several charts can live in one context, e.g. in a
+    ``Dashboard``.
+
+    While the mouse moves over the plot, a crosshair and a readout of the data
+    under the cursor (bar, point) are shown. Set ``chart.readout = False``
+    before ``show()`` to disable them.
+
+    ``render_to_png`` draws the full data range with a NumPy rasterizer
+    instead, with no DPG context or display, e.g. for batch report export
+    on a server (see ``pegasus.export.render_charts``).
+    """
+
+    _ids = itertools.count()
+    _READOUT_RADIUS = 10  # Pixels around the cursor searched for a point
     
     def __init__(self, title: str = "Pegasus Chart", width: int = 1280, height: int = 800):
         self.title = title
         self.width = width
         self.height = height
-        self._plot_tag = "main_plot"
-        self._window_tag = "primary_window"
-        self._x_axis_tag = "x_axis"
-        self._y_axis_tag = "y_axis"
+        uid = next(Chart._ids)
+        self._plot_tag = f"pegasus_plot_{uid}"
+        self._window_tag = f"pegasus_window_{uid}"
+        self._x_axis_tag = f"pegasus_x_axis_{uid}"
+        self._y_axis_tag = f"pegasus_y_axis_{uid}"
         self._y_axis_hover_width = 60
-        
+        self.profiler: Optional["FrameProfiler"] = None
+        self._profiler_overlay = False
+        self._y_fit: Optional[VisibleRangeFit] = None
+        self.readout = True
+        self._readout_tag = None
+        self._frame_callbacks: List[Callable[[], object]] = []
+
+    @property
+    def plot_tag(self) -> str:
+        return self._plot_tag
+
+    @property
+    def x_axis_tag(self) -> str:
+        return self._x_axis_tag
+
+    @property
+    def y_axis_tag(self) -> str:
+        return self._y_axis_tag
+
+    def _mouse_in_plot(self) -> Optional[float]:
+        """Mouse x offset from the plot's left edge, or None if the mouse is outside it."""
+        mouse_x, mouse_y = dpg.get_mouse_pos(local=False)
+        left, top = dpg.get_item_rect_min(self._plot_tag)
+        right, bottom = dpg.get_item_rect_max(self._plot_tag)
+        if left <= mouse_x <= right and top <= mouse_y <= bottom:
+            return mouse_x - left
+        return None
+
     def _setup_scroll_zoom_handler(self):
         """Register mouse wheel handler for axis-specific zooming."""
         def on_mouse_wheel(sender, app_data):
             try:
-                mouse_x, _ = dpg.get_mouse_pos()
+                offset = self._mouse_in_plot()
+                if offset is None:
+                    return  # Over another chart of the same context
                 
-                # Y-axis is roughly leftmost 80px of the viewport
-                in_y_axis = mouse_x < 80
+                # Y-axis is roughly leftmost 80px of the plot
+                in_y_axis = offset < 80
                 
                 zoom_factor = 0.1
                 
                 if in_y_axis:
-                    # Zoom Y-axis only
+                    # Zoom Y-axis only; the user now owns the price range
+                    if self._y_fit is not None:
+                        self._y_fit.enabled = False
                     y_min, y_max = dpg.get_axis_limits(self._y_axis_tag)
                     y_range = y_max - y_min
                     y_center = (y_min + y_max) / 2
@@ -54,26 +135,161 @@ class Chart:
             except Exception as e:
                 print(f"Scroll error: {e}")
         
+        def on_double_click(sender, app_data):
+            if self._y_fit is not None and self._mouse_in_plot() is not None:
+                self._y_fit.enable()
+
         with dpg.handler_registry():
             dpg.add_mouse_wheel_handler(callback=on_mouse_wheel)
+            dpg.add_mouse_double_click_handler(callback=on_double_click)
+
+    def enable_profiling(self, overlay: bool = False, capacity: int = 36_000) -> "FrameProfiler":
+        """
+        Runs ``show`` on a manual, instrumented render loop.
+
+        Every frame's total, data-apply, callback and render times are recorded
+        in the returned ``FrameProfiler``, which stays readable after the window
+        is closed (``summary()``, ``export()``).
+
+        Args:
+            overlay: Show a live FPS / p99 overlay window on top of the chart
+            capacity: Number of most recent frames kept
+
+        Returns:
+            FrameProfiler: Recorder filled while the chart is shown
+        """
+        from pegasus.performance.profiler import FrameProfiler
+        self.profiler = FrameProfiler(capacity)
+        self._profiler_overlay = overlay
+        return self.profiler
+
+    def on_frame(self, callback: Callable[[], object]) -> None:
+        """Calls ``callback()`` once per frame while the chart is shown, e.g. ``Replay.advance``."""
+        self._frame_callbacks.append(callback)
+
+    def _collect_frame_callbacks(self) -> List[Callable[[], object]]:
+        """Callbacks ``show`` runs every frame: those passed to ``on_frame``."""
+        return list(self._frame_callbacks)
 
     def _create_context(self):
         """Initialize DPG context and viewport."""
         dpg.create_context()
+        if self.profiler is not None:
+            # Queue callbacks so the manual loop can run and time them
+            dpg.configure_app(manual_callback_management=True)
         dpg.create_viewport(title=self.title, width=self.width, height=self.height)
         dpg.setup_dearpygui()
         
-    def _start_render_loop(self):
+    def _start_render_loop(self, frames: Optional[int] = None):
         """Start the DPG render loop."""
         dpg.set_primary_window(self._window_tag, True)
         dpg.show_viewport()
-        dpg.start_dearpygui()
+        if self.profiler is None and frames is None:
+            dpg.start_dearpygui()
+        else:
+            overlay = None
+            if self._profiler_overlay:
+                with dpg.window(label="Frame timings", pos=(20, 40), autosize=True,
+                                no_collapse=True, no_close=True):
+                    overlay = dpg.add_text("")
+            from pegasus.performance.profiler import run_render_loop
+            run_render_loop(self.profiler, overlay=overlay, max_frames=frames)
         dpg.destroy_context()
 
-    def show(self):
-        """Display the chart. Override in subclasses."""
+    def _add_readout(self):
+        """Adds the hover annotation to the plot being built."""
+        if not self.readout:
+            return
+        self._readout_tag = dpg.add_plot_annotation(parent=self._plot_tag, show=False,
+                                                    offset=(12, -12), clamped=True)
+        add_query_handler(self._plot_tag, self._on_hover)
+
+    def _on_hover(self, x: float, y: float):
+        x_min, x_max = dpg.get_axis_limits(self._x_axis_tag)
+        y_min, y_max = dpg.get_axis_limits(self._y_axis_tag)
+        width, height = dpg.get_item_rect_size(self._plot_tag)
+        rx = self._READOUT_RADIUS * (x_max - x_min) / max(width, 1)
+        ry = self._READOUT_RADIUS * (y_max - y_min) / max(height, 1)
+        hit = self._hover_row(x, y, rx, ry) if rx > 0 and ry > 0 else None
+        if hit is None:
+            dpg.configure_item(self._readout_tag, show=False)
+            return
+        anchor_x, anchor_y, text = hit
+        dpg.configure_item(self._readout_tag, show=True, label=text)
+        dpg.set_value(self._readout_tag, (anchor_x, anchor_y))
+
+    def _hover_row(self, x: float, y: float, rx: float, ry: float
+                   ) -> Optional[Tuple[float, float, str]]:
+        """
+        Data under the cursor as ``(anchor_x, anchor_y, text)``, or None.
+
+        ``rx``/``ry`` are the readout radius converted to data units.
+        """
+        return None
+
+    def _setup_handlers(self):
+        """Registers global input handlers; called once per context before building."""
+
+    def _build_plot(self):
+        """Creates the plot, its axes and series in the current container. Override in subclasses."""
         raise NotImplementedError
 
+    def _rasterize(self, pixels: np.ndarray):
+        """Draws the full data range into ``pixels`` with a ``RasterPlot``. Override in subclasses."""
+        raise NotImplementedError(f"{type(self).__name__} cannot be rendered headlessly")
+
+    def rasterize(self, width: Optional[int] = None, height: Optional[int] = None) -> np.ndarray:
+        """
+        Draws the chart without a display into a ``(height, width, 4)`` uint8 RGBA array.
+
+        Draws the full data range from the same data as ``show()``, through the
+        same OHLC pyramids, min/max overviews and density coloring. Defaults
+        to the chart's size.
+        """
+        pixels = np.empty((height or self.height, width or self.width, 4), dtype=np.uint8)
+        self._rasterize(pixels)
+        return pixels
+
+    def render_to_png(self, path: str, width: Optional[int] = None,
+                      height: Optional[int] = None, compress_level: int = 6) -> str:
+        """
+        Renders the chart headlessly (see ``rasterize``) and writes it to ``path`` as a PNG.
+
+        Args:
+            path: Output file
+            width: Image width in pixels (defaults to the chart's width)
+            height: Image height in pixels (defaults to the chart's height)
+            compress_level: zlib level, 1 (fastest) to 9 (smallest)
+
+        Returns:
+            str: ``path``
+        """
+        from pegasus.plotting.raster import encode_png
+        data = encode_png(self.rasterize(width, height), compress_level)
+        with open(path, "wb") as f:
+            f.write(data)
+        return path
+
+    def show(self, frames: Optional[int] = None):
+        """
+        Display the chart in its own context, window and render loop.
+
+        Args:
+            frames: Close after this many frames, e.g. to time startup (None
+                runs until the viewport is closed)
+        """
+        self._create_context()
+        self._setup_handlers()
+
+        with dpg.window(tag=self._window_tag):
+            dpg.add_text(self.title)
+            self._build_plot()
+        for callback in self._collect_frame_callbacks():
+            add_visible_handler(self._window_tag,
+                                lambda sender=None, app_data=None, callback=callback: callback())
+
+        self._start_render_loop(frames)
+
 
 class CandlestickChart(Chart):
     """
@@ -83,136 +299,606 @@ class CandlestickChart(Chart):
         - Scroll on chart: Zoom time axis only
         - Scroll on Y-axis: Zoom price axis
         - Left-click drag: Pan
-        - Double-click: Reset/fit to data
+        - Double-click: Reset/fit to data, and resume auto-fit of the price axis
+
+    With ``auto_fit_y`` (the default) the price axis follows the high/low of
+    the visible bars after every zoom or pan, answered from a ``RangeMinMax``
+    index instead of a scan. Zooming the price axis by hand turns it off.
+
+    More than ``series.CANDLE_PYRAMID_THRESHOLD`` bars are rendered through an
+    OHLC pyramid (source, M5, M15, H1, D1): the timeframe drawn follows the zoom
+    and only the visible bars are sent, so the candle count on screen stays
+    bounded. Pass ``pyramid=False`` to always send every bar.
+
+    For live data, pass ``live_bars`` (one timeframe of a ``BarAggregator``) or
+    use ``CandlestickChart.from_bars``. The chart then re-sends only the open
+    candle each frame and the closed history only when a bar closes.
+
+    Histories too large for memory can be drawn from memory-mapped column files
+    with ``CandlestickChart.from_source``; only the bars in view are read.
+
+    ``indicators`` (e.g. ``[SMA(20), Bollinger(20), RSI(14)]`` from
+    ``pegasus.indicators``) are drawn as line series: price overlays on the
+    price axis, oscillators on a second y-axis. With ``live_bars`` they are
+    updated incrementally, recomputing only the last bar while it is open.
     """
     
-    def __init__(self, dates: List[float], opens: List[float], highs: List[float],
-                 lows: List[float], closes: List[float], label: str = "OHLC",
+    def __init__(self, dates: SeriesLike, opens: SeriesLike, highs: SeriesLike,
+                 lows: SeriesLike, closes: SeriesLike, label: str = "OHLC",
                  title: str = "Pegasus Candlestick Chart", width: int = 1280, height: int = 800,
                  bull_color: tuple = (0, 255, 117, 255), bear_color: tuple = (255, 82, 82, 255),
-                 weight: float = 0.25):
+                 weight: float = 0.25, live_bars: Optional["TimeframeBars"] = None,
+                 pyramid: Optional[bool] = None, source: Optional["MmapOHLCSource"] = None,
+                 indicators: Optional[Sequence["Indicator"]] = None, auto_fit_y: bool = True):
         super().__init__(title, width, height)
-        self.dates = dates
-        self.opens = opens
-        self.highs = highs
-        self.lows = lows
-        self.closes = closes
+        if source is not None and indicators:
+            raise ValueError("indicators need in-memory bars and cannot be used with a source")
+        self.dates, self.opens, self.highs, self.lows, self.closes = as_series_arrays(
+            dates, opens, highs, lows, closes
+        )
         self.label = label
         self.bull_color = bull_color
         self.bear_color = bear_color
         self.weight = weight
+        self.live_bars = live_bars
+        self.pyramid = pyramid
+        self.source = source
+        self.indicators = list(indicators or [])
+        self.auto_fit_y = auto_fit_y
+        self._candles: Optional[series.PyramidCandleSeries] = None
+
+    @classmethod
+    def from_bars(cls, bars: "TimeframeBars", **kwargs) -> "CandlestickChart":
+        """Creates a chart that renders ``bars`` live as they are updated."""
+        empty = np.empty(0, dtype=np.float64)
+        return cls(empty, empty, empty, empty, empty, live_bars=bars, **kwargs)
+
+    @classmethod
+    def from_source(cls, source: "MmapOHLCSource", **kwargs) -> "CandlestickChart":
+        """Creates a chart that reads the visible bars of ``source`` from disk."""
+        empty = np.empty(0, dtype=np.float64)
+        return cls(empty, empty, empty, empty, empty, source=source, **kwargs)
     
-    def show(self):
-        """Render and display the candlestick chart."""
-        self._create_context()
+    def _add_indicators(self):
+        """Adds the indicator lines; called inside the plot after the price axis."""
+        oscillator_axis = None
+        for indicator in self.indicators:
+            axis = self._y_axis_tag
+            if not indicator.overlay:
+                if oscillator_axis is None:
+                    oscillator_axis = dpg.add_plot_axis(dpg.mvYAxis2, label="Oscillator",
+                                                        opposite=True)
+                axis = oscillator_axis
+            if self.live_bars is not None:
+                live = series.IndicatorSeries(indicator, self.live_bars, parent=axis)
+                add_visible_handler(self._plot_tag, lambda *args, live=live: live.flush())
+            else:
+                series.add_indicator_series(indicator, self.dates, self.opens, self.highs,
+                                            self.lows, self.closes, parent=axis)
+
+    def _use_pyramid(self) -> bool:
+        if self.pyramid is None:
+            return len(self.dates) > series.CANDLE_PYRAMID_THRESHOLD
+        return self.pyramid
+
+    def _hover_bar(self, x: float, rx: float) -> Optional[np.ndarray]:
+        """The drawn ``[date, open, high, low, close]`` bar under ``x``, found by binary search."""
+        if self.live_bars is not None:
+            bars = self.live_bars
+            with bars.lock:
+                columns = bars.closed.views()
+                open_bar = bars.open_bar
+                if open_bar is not None and (len(columns[0]) == 0
+                                             or x > (columns[0][-1] + open_bar[0]) / 2):
+                    if abs(x - open_bar[0]) <= max(rx, bars.seconds):
+                        return open_bar.copy()
+                    return None
+                i = _snap(columns[0], x, rx)
+                return None if i < 0 else np.array([col[i] for col in columns])
+        if self.source is not None:
+            start = self.source.store.search(x) - 1
+            columns = self.source.store.read(start, start + 2, self.source.names)
+        elif self._candles is not None:
+            # The level drawn at the current zoom, e.g. D1 bars when zoomed out
+            columns = self._candles.pyramid.levels[max(self._candles.level, 0)]
+        else:
+            columns = (self.dates, self.opens, self.highs, self.lows, self.closes)
+        i = _snap(columns[0], x, rx)
+        return None if i < 0 else np.array([col[i] for col in columns])
+
+    def _hover_row(self, x, y, rx, ry):
+        bar = self._hover_bar(x, rx)
+        if bar is None:
+            return None
+        t, o, h, l, c = bar
+        stamp = time.strftime("%Y-%m-%d %H:%M", time.gmtime(t))
+        return t, h, f"{stamp}  O {o:.6g}  H {h:.6g}  L {l:.6g}  C {c:.6g}"
+
+    def _setup_handlers(self):
         self._setup_scroll_zoom_handler()
-        
-        with dpg.window(tag=self._window_tag):
-            dpg.add_text(self.title)
+
+    def _rasterize(self, pixels):
+        from pegasus.plotting.raster import PALETTE, RasterPlot
+        width = pixels.shape[1]
+        overlays = []
+        if self.live_bars is not None:
+            bars = self.live_bars
+            with bars.lock:
+                columns = tuple(col.copy() for col in bars.closed.views())
+                if bars.open_bar is not None:
+                    columns = tuple(np.append(col, value)
+                                    for col, value in zip(columns, bars.open_bar))
+        elif self.source is not None:
+            columns = self.source.query(*self.source.bounds, max_bars=width // 2)
+        else:
+            columns = (self.dates, self.opens, self.highs, self.lows, self.closes)
+            for indicator in self.indicators:
+                if indicator.overlay:
+                    values = indicator.compute(*columns)
+                    overlays += [(columns[0][indicator.warmup:], col[indicator.warmup:])
+                                 for col in values]
+            if self._use_pyramid() and len(self.dates):
+                pyramid = shared_index(OHLCPyramid, *columns,
+                                       timeframes=("M5", "M15", "H1", "D1"))
+                _, columns = pyramid.query(self.dates[0], self.dates[-1], width)
+
+        dates, opens, highs, lows, closes = columns
+        if len(dates):
+            x_range = (float(dates[0]), float(dates[-1]))
+            y_range = (float(np.nanmin(lows)), float(np.nanmax(highs)))
+        else:
+            x_range = y_range = (0.0, 1.0)
+        plot = RasterPlot(pixels, x_range, y_range, time_axis=True)
+        plot.candles(dates, opens, highs, lows, closes, self.bull_color, self.bear_color,
+                     self.weight)
+        # Overlay indicators only; oscillators have their own axis in show()
+        for (x, y), color in zip(overlays, itertools.cycle(PALETTE)):
+            plot.line(x, y, color)
+
+    def _build_plot(self):
+        """Creates the candlestick plot in the current container."""
+        with dpg.plot(
+            tag=self._plot_tag,
+            label=self.label,
+            height=-1,
+            width=-1,
+            no_menus=False,
+            crosshairs=self.readout,
+            pan_button=dpg.mvMouseButton_Left,   # Left-click drag to pan
+            fit_button=dpg.mvMouseButton_Middle, # Middle-click double-click to fit
+        ):
+            dpg.add_plot_legend()
             
-            with dpg.plot(
-                tag=self._plot_tag,
-                label=self.label,
-                height=-1,
-                width=-1,
-                no_menus=False,
-                pan_button=dpg.mvMouseButton_Left,   # Left-click drag to pan
-                fit_button=dpg.mvMouseButton_Middle, # Middle-click double-click to fit
-            ):
-                dpg.add_plot_legend()
-                
-                # X-Axis with time scale
-                dpg.add_plot_axis(dpg.mvXAxis, label="Time", tag=self._x_axis_tag, 
-                                  scale=dpg.mvPlotScale_Time)
-                
-                # Y-Axis
-                with dpg.plot_axis(dpg.mvYAxis, label="Price", tag=self._y_axis_tag):
-                    # DPG expects: dates, opens, closes, lows, highs
-                    kwargs = {
-                        'label': self.label,
-                        'bull_color': self.bull_color,
-                        'bear_color': self.bear_color,
-                        'weight': self.weight,
-                    }
+            # X-Axis with time scale
+            dpg.add_plot_axis(dpg.mvXAxis, label="Time", tag=self._x_axis_tag, 
+                              scale=dpg.mvPlotScale_Time)
+            
+            # Y-Axis
+            with dpg.plot_axis(dpg.mvYAxis, label="Price", tag=self._y_axis_tag):
+                # DPG expects: dates, opens, closes, lows, highs
+                kwargs = {
+                    'label': self.label,
+                    'bull_color': self.bull_color,
+                    'bear_color': self.bear_color,
+                    'weight': self.weight,
+                }
+                if self.live_bars is not None:
+                    live = series.LiveCandleSeries(self.live_bars, parent=self._y_axis_tag,
+                                                   **kwargs)
+                    add_visible_handler(self._plot_tag, lambda *args: live.flush())
+                elif self.source is not None:
+                    series.MmapCandleSeries(self.source, parent=self._y_axis_tag,
+                                            x_axis=self._x_axis_tag, **kwargs)
+                elif self._use_pyramid():
+                    self._candles = series.PyramidCandleSeries(
+                        self.dates, self.opens, self.highs, self.lows, self.closes,
+                        parent=self._y_axis_tag, x_axis=self._x_axis_tag, **kwargs
+                    )
+                else:
                     dpg.add_candle_series(
                         self.dates, self.opens, self.closes, self.lows, self.highs,
                         **kwargs
                     )
-            
-            dpg.fit_axis_data(self._y_axis_tag)
+
+            self._add_indicators()
+            self._add_readout()
+
+        if self.auto_fit_y and self.live_bars is None and self.source is None:
+            self._y_fit = VisibleRangeFit(self._plot_tag, self._x_axis_tag, self._y_axis_tag,
+                                          self.dates, self.lows, self.highs)
         
-        self._start_render_loop()
+        dpg.fit_axis_data(self._y_axis_tag)
 
 
 class LineChart(Chart):
-    """Simple line chart."""
+    """
+    Simple line chart.
+
+    Series longer than ``series.DECIMATION_THRESHOLD`` points are rendered through
+    a viewport-aware min/max pyramid, so only about two vertices per pixel column
+    are sent to DPG while every spike at the current zoom stays visible.
+    Pass ``decimate=False`` to always send the raw data.
+
+    Use ``LineChart.from_source`` to draw a memory-mapped series that does not
+    fit in memory; only the chunks in view are read.
+
+    ``LineChart.from_shared`` draws the latest samples of a ``SharedRingBuffer``
+    written by a feed process, re-sent each frame the writer published.
+
+    ``auto_fit_y=True`` keeps the y-axis fitted to the visible points while
+    zooming and panning.
+    """
     
-    def __init__(self, x: List[float], y: List[float], label: str = "Line",
+    def __init__(self, x: SeriesLike, y: SeriesLike, label: str = "Line",
                  title: str = "Pegasus Line Chart", width: int = 1280, height: int = 800,
-                 color: tuple = (0, 255, 255, 255)):
+                 color: tuple = (0, 255, 255, 255), decimate: Optional[bool] = None,
+                 source: Optional["MmapLineSource"] = None, auto_fit_y: bool = False,
+                 shared: Optional["SharedRingBuffer"] = None):
         super().__init__(title, width, height)
-        self.x = x
-        self.y = y
+        self.x, self.y = as_series_arrays(x, y)
         self.label = label
         self.color = color
+        self.decimate = decimate
+        self.source = source
+        self.shared = shared
+        self.auto_fit_y = auto_fit_y
+
+    @classmethod
+    def from_source(cls, source: "MmapLineSource", **kwargs) -> "LineChart":
+        """Creates a chart that reads the visible part of ``source`` from disk."""
+        empty = np.empty(0, dtype=np.float64)
+        return cls(empty, empty, source=source, **kwargs)
+
+    @classmethod
+    def from_shared(cls, ring: "SharedRingBuffer", **kwargs) -> "LineChart":
+        """Creates a chart of the ``(x, y)`` samples another process writes into ``ring``."""
+        empty = np.empty(0, dtype=np.float64)
+        return cls(empty, empty, shared=ring, **kwargs)
     
-    def show(self):
-        """Render and display the line chart."""
-        self._create_context()
-        
-        with dpg.window(tag=self._window_tag):
-            dpg.add_text(self.title)
-            
-            with dpg.plot(
-                tag=self._plot_tag,
-                label=self.label,
-                height=-1,
-                width=-1,
-                pan_button=dpg.mvMouseButton_Left,
-                fit_button=dpg.mvMouseButton_Left,
-            ):
-                dpg.add_plot_legend()
-                dpg.add_plot_axis(dpg.mvXAxis, label="X", tag=self._x_axis_tag)
-                
-                with dpg.plot_axis(dpg.mvYAxis, label="Y", tag=self._y_axis_tag):
-                    dpg.add_line_series(self.x, self.y, label=self.label)
+    def _rasterize(self, pixels):
+        from pegasus.plotting.raster import RasterPlot
+        if self.source is not None:
+            # Out of core: read the min/max overview instead of every row
+            x_range = self.source.bounds
+            xs, ys = self.source.query(*x_range, 2 * pixels.shape[1])
+        else:
+            # RasterPlot.line reduces in-memory points to per-column min/max itself
+            xs, ys = self.x, self.y
+            if self.shared is not None:
+                # Copy the window so the writer cannot move it while drawing
+                xs, ys = (np.array(col) for col in self.shared.views())
+            x_range = (float(xs[0]), float(xs[-1])) if len(xs) else (0.0, 1.0)
+        y_range = (float(np.nanmin(ys)), float(np.nanmax(ys))) if len(ys) else (0.0, 1.0)
+        RasterPlot(pixels, x_range, y_range).line(xs, ys, self.color)
+
+    def _build_plot(self):
+        """Creates the line plot in the current container."""
+        with dpg.plot(
+            tag=self._plot_tag,
+            label=self.label,
+            height=-1,
+            width=-1,
+            crosshairs=self.readout,
+            pan_button=dpg.mvMouseButton_Left,
+            fit_button=dpg.mvMouseButton_Left,
+        ):
+            dpg.add_plot_legend()
+            dpg.add_plot_axis(dpg.mvXAxis, label="X", tag=self._x_axis_tag)
             
-            dpg.fit_axis_data(self._y_axis_tag)
+            with dpg.plot_axis(dpg.mvYAxis, label="Y", tag=self._y_axis_tag):
+                if self.source is not None:
+                    series.MmapLineSeries(self.source, label=self.label,
+                                          parent=self._y_axis_tag, x_axis=self._x_axis_tag)
+                elif self.shared is not None:
+                    # Loaded here so charts without a shared ring never import multiprocessing
+                    from pegasus.dataplane import SharedRingSeries
+                    empty = np.empty(0, dtype=np.float64)
+                    tag = dpg.add_line_series(empty, empty, label=self.label,
+                                              parent=self._y_axis_tag)
+                    live = SharedRingSeries(tag, self.shared)
+                    add_visible_handler(self._plot_tag, lambda *args: live.flush())
+                else:
+                    series.add_line_series(self.x, self.y, label=self.label,
+                                           parent=self._y_axis_tag, decimate=self.decimate)
+
+            self._add_readout()
+
+        if self.auto_fit_y and self.source is None and self.shared is None:
+            self._y_fit = VisibleRangeFit(self._plot_tag, self._x_axis_tag, self._y_axis_tag,
+                                          self.x, self.y)
         
-        self._start_render_loop()
+        dpg.fit_axis_data(self._y_axis_tag)
+
+    def _hover_row(self, x, y, rx, ry):
+        if self.source is not None:
+            start = self.source.store.search(x) - 1
+            xs, ys = self.source.store.read(start, start + 2, (self.source.x, self.source.y))
+        elif self.shared is not None:
+            xs, ys = self.shared.views()  # One binary search, no copy
+        else:
+            xs, ys = self.x, self.y
+        i = _snap(xs, x, rx)
+        if i < 0:
+            return None
+        return float(xs[i]), float(ys[i]), f"x {xs[i]:.6g}  y {ys[i]:.6g}"
+
+
+# Marker color of exported scatter charts (DPG's default first series color)
+_SCATTER_COLOR = (76, 114, 176, 255)
 
 
 class ScatterChart(Chart):
-    """Scatter plot chart."""
+    """
+    Scatter plot chart.
+
+    Above ``series.DENSITY_THRESHOLD`` points, the chart draws point density
+    as a texture, re-binned on every zoom or pan. It switches back to real
+    markers once at most ``marker_threshold`` points are in view. Pass
+    ``density=False`` to always send every point as a marker.
+
+    The hover readout finds the nearest point through a ``GridIndex`` (a
+    uniform grid over the points), built on the first hover and shared by
+    charts over the same arrays. In density mode it shows the bin's count.
+    """
     
-    def __init__(self, x: List[float], y: List[float], label: str = "Scatter",
-                 title: str = "Pegasus Scatter Chart", width: int = 1280, height: int = 800):
+    def __init__(self, x: SeriesLike, y: SeriesLike, label: str = "Scatter",
+                 title: str = "Pegasus Scatter Chart", width: int = 1280, height: int = 800,
+                 density: Optional[bool] = None, marker_threshold: int = 50_000,
+                 colormap: str = "viridis"):
         super().__init__(title, width, height)
-        self.x = x
-        self.y = y
+        self.x, self.y = as_series_arrays(x, y)
         self.label = label
+        self.density = density
+        self.marker_threshold = marker_threshold
+        self.colormap = colormap
+        self._index: Optional["GridIndex"] = None
+        self._density: Optional[series.DensityScatterSeries] = None
+
+    def _use_density(self) -> bool:
+        if self.density is None:
+            return len(self.x) > series.DENSITY_THRESHOLD
+        return self.density
     
-    def show(self):
-        """Render and display the scatter chart."""
-        self._create_context()
-        
-        with dpg.window(tag=self._window_tag):
-            dpg.add_text(self.title)
+    def _rasterize(self, pixels):
+        from pegasus.plotting.raster import RasterPlot
+        finite = np.isfinite(self.x) & np.isfinite(self.y)
+        if finite.any():
+            x_range = (float(self.x[finite].min()), float(self.x[finite].max()))
+            y_range = (float(self.y[finite].min()), float(self.y[finite].max()))
+        else:
+            x_range = y_range = (0.0, 1.0)
+        plot = RasterPlot(pixels, x_range, y_range)
+        x, y = self.x, self.y
+        if not finite.all():
+            x, y = x[finite], y[finite]
+        if not (self._use_density() and len(x) > self.marker_threshold):
+            plot.points(x, y, _SCATTER_COLOR)
+            return
+        # The same 2x2 pixel bins and coloring as the live density view. One
+        # pass over the points beats building a DensityGrid for a single view.
+        bins_x = max((plot.right - plot.left) // 2, 1)
+        bins_y = max((plot.bottom - plot.top) // 2, 1)
+        box = (plot.x_min, plot.x_max, plot.y_min, plot.y_max)
+        density = density_histogram(x, y, *box, bins_x, bins_y)
+        rgba = series.density_pixels(density, colormap_lut(self.colormap))
+        plot.image(rgba, box[:2], box[2:])
+
+    def _build_plot(self):
+        """Creates the scatter plot in the current container."""
+        with dpg.plot(
+            tag=self._plot_tag,
+            label=self.label,
+            height=-1,
+            width=-1,
+            crosshairs=self.readout,
+            pan_button=dpg.mvMouseButton_Left,
+            fit_button=dpg.mvMouseButton_Left,
+        ):
+            dpg.add_plot_legend()
+            dpg.add_plot_axis(dpg.mvXAxis, label="X", tag=self._x_axis_tag)
             
-            with dpg.plot(
-                tag=self._plot_tag,
-                label=self.label,
-                height=-1,
-                width=-1,
-                pan_button=dpg.mvMouseButton_Left,
-                fit_button=dpg.mvMouseButton_Left,
-            ):
-                dpg.add_plot_legend()
-                dpg.add_plot_axis(dpg.mvXAxis, label="X", tag=self._x_axis_tag)
-                
-                with dpg.plot_axis(dpg.mvYAxis, label="Y", tag=self._y_axis_tag):
+            with dpg.plot_axis(dpg.mvYAxis, label="Y", tag=self._y_axis_tag):
+                if self._use_density():
+                    self._density = series.DensityScatterSeries(
+                        self.x, self.y, label=self.label, parent=self._y_axis_tag,
+                        x_axis=self._x_axis_tag, marker_threshold=self.marker_threshold,
+                        colormap=self.colormap)
+                else:
                     dpg.add_scatter_series(self.x, self.y, label=self.label)
-            
-            dpg.fit_axis_data(self._y_axis_tag)
+
+            self._add_readout()
         
-        self._start_render_loop()
+        dpg.fit_axis_data(self._y_axis_tag)
+
+    def _hover_row(self, x, y, rx, ry):
+        if self._density is not None:
+            # Only the points in view are searched, and only while drawn as markers
+            count = self._density.bin_count(x, y)
+            if count is not None:
+                return x, y, f"x {x:.6g}  y {y:.6g}  ~{count:,.0f} points"
+            i = self._density.nearest(x, y, rx, ry)
+        else:
+            if self._index is None:
+                from pegasus.performance.query import GridIndex
+                self._index = shared_index(GridIndex, self.x, self.y)
+            i = self._index.nearest(x, y, rx, ry)
+        if i < 0:
+            return None
+        px, py = float(self.x[i]), float(self.y[i])
+        return px, py, f"x {px:.6g}  y {py:.6g}"
+
+
+class HeatmapChart(Chart):
+    """
+    Heatmap of a ``(rows, cols)`` grid, drawn from a texture (``HeatmapSeries``).
+
+    Row 0 is drawn at the top. Keep a reference to ``chart.heatmap`` after
+    ``show()`` has built the plot to update rows or columns live; the texture is
+    uploaded once per frame when something changed.
+
+    Args:
+        values: ``(rows, cols)`` values
+        bounds_min: Plot coordinates of the bottom-left corner
+        bounds_max: Plot coordinates of the top-right corner (defaults to
+            ``(cols, rows)``)
+        vmin: Value mapped to the lowest color (defaults to the minimum)
+        vmax: Value mapped to the highest color (defaults to the maximum)
+        colormap: Name from ``COLORMAPS``
+    """
+
+    def __init__(self, values, label: str = "Heatmap", title: str = "Pegasus Heatmap",
+                 width: int = 1280, height: int = 800, bounds_min=(0.0, 0.0), bounds_max=None,
+                 vmin: Optional[float] = None, vmax: Optional[float] = None,
+                 colormap: str = "viridis"):
+        super().__init__(title, width, height)
+        self.values = np.asarray(values, dtype=np.float32)
+        if self.values.ndim != 2:
+            raise ValueError("values must be a (rows, cols) array")
+        rows, cols = self.values.shape
+        self.label = label
+        self.bounds_min = tuple(bounds_min)
+        self.bounds_max = tuple(bounds_max) if bounds_max is not None else (float(cols),
+                                                                            float(rows))
+        self.vmin = float(np.nanmin(self.values)) if vmin is None else vmin
+        self.vmax = float(np.nanmax(self.values)) if vmax is None else vmax
+        self.colormap = colormap
+        self.heatmap: Optional[series.HeatmapSeries] = None
+
+    def _build_plot(self):
+        """Creates the heatmap plot in the current container."""
+        with dpg.plot(tag=self._plot_tag, label=self.label, height=-1, width=-1):
+            dpg.add_plot_axis(dpg.mvXAxis, label="X", tag=self._x_axis_tag)
+            with dpg.plot_axis(dpg.mvYAxis, label="Y", tag=self._y_axis_tag):
+                self.heatmap = series.HeatmapSeries(
+                    self.values, parent=self._y_axis_tag, bounds_min=self.bounds_min,
+                    bounds_max=self.bounds_max, vmin=self.vmin, vmax=self.vmax,
+                    colormap=self.colormap, label=self.label)
+        add_visible_handler(self._plot_tag, self.heatmap.flush)
+        dpg.fit_axis_data(self._x_axis_tag)
+        dpg.fit_axis_data(self._y_axis_tag)
+
+    def _rasterize(self, pixels):
+        from pegasus.plotting.raster import RasterPlot
+        values = self.heatmap.values if self.heatmap is not None else self.values
+        x_range = (self.bounds_min[0], self.bounds_max[0])
+        y_range = (self.bounds_min[1], self.bounds_max[1])
+        plot = RasterPlot(pixels, x_range, y_range, pad_y=0.0)
+        rgba = apply_colormap(values, self.vmin, self.vmax, colormap_lut(self.colormap))
+        plot.image(rgba, x_range, y_range)
+
+
+class Dashboard(Chart):
+    """
+    Grid of charts sharing one DPG context, one window and one render loop.
+
+    Charts are laid out row by row in a ``dpg.subplots`` grid in the order
+    they were added. With ``link_x=True`` all x-axes pan and zoom together,
+    which suits panels over the same time range. Each chart keeps its own
+    item tags, handlers and auto-fit, and charts given the same arrays share
+    them zero-copy along with their decimation pyramids and range indexes,
+    so a 12-panel screen holds one copy of each dataset.
+
+    Args:
+        rows: Number of grid rows
+        columns: Number of grid columns
+        title: Window title
+        width: Viewport width
+        height: Viewport height
+        link_x: Link the x-axes of all panels
+        row_ratios: Relative row heights (defaults to equal)
+        column_ratios: Relative column widths (defaults to equal)
+
+    Example:
+        board = Dashboard(rows=2, columns=2)
+        board.add(CandlestickChart.from_bars(bars, label="EURUSD"))
+        board.add(LineChart(bars.dates, spread, label="Spread"))
+        board.show()
+    """
+
+    def __init__(self, rows: int, columns: int, title: str = "Pegasus Dashboard",
+                 width: int = 1280, height: int = 800, link_x: bool = True,
+                 row_ratios: Optional[Sequence[float]] = None,
+                 column_ratios: Optional[Sequence[float]] = None):
+        super().__init__(title, width, height)
+        if rows < 1 or columns < 1:
+            raise ValueError("rows and columns must be at least 1")
+        self.rows = rows
+        self.columns = columns
+        self.link_x = link_x
+        self.row_ratios = row_ratios
+        self.column_ratios = column_ratios
+        self.charts: List[Chart] = []
+
+    def add(self, chart: Chart) -> Chart:
+        """Appends ``chart`` to the next free cell and returns it."""
+        if len(self.charts) >= self.rows * self.columns:
+            raise ValueError(f"dashboard is full ({self.rows}x{self.columns} panels)")
+        if isinstance(chart, Dashboard):
+            raise TypeError("dashboards cannot be nested")
+        self.charts.append(chart)
+        return chart
+
+    def _setup_handlers(self):
+        for chart in self.charts:
+            chart._setup_handlers()
+
+    def _collect_frame_callbacks(self) -> List[Callable[[], object]]:
+        """The dashboard's own ``on_frame`` callbacks followed by each panel's."""
+        callbacks = super()._collect_frame_callbacks()
+        for chart in self.charts:
+            callbacks += chart._collect_frame_callbacks()
+        return callbacks
+
+    def show(self, frames: Optional[int] = None):
+        """
+        Display every panel in one context, window and render loop.
+
+        Profiling enabled on a single panel (``enable_profiling``) times the
+        dashboard's loop, which is the only one that runs.
+
+        Args:
+            frames: Close after this many frames (None runs until the viewport
+                is closed)
+
+        Raises:
+            ValueError: If more than one of the dashboard and its panels has
+                profiling enabled
+        """
+        profiled = [chart for chart in self.charts if chart.profiler is not None]
+        if profiled:
+            panel = profiled[0]
+            if len(profiled) > 1 or self.profiler not in (None, panel.profiler):
+                raise ValueError("a dashboard has one render loop: enable profiling on the "
+                                 "dashboard or on a single panel")
+            self.profiler = panel.profiler
+            self._profiler_overlay = panel._profiler_overlay
+        super().show(frames)
+
+    def _build_plot(self):
+        """Creates the subplot grid and every chart's plot inside it."""
+        options = {}
+        if self.row_ratios is not None:
+            options["row_ratios"] = list(self.row_ratios)
+        if self.column_ratios is not None:
+            options["column_ratios"] = list(self.column_ratios)
+        with dpg.subplots(self.rows, self.columns, tag=self._plot_tag, width=-1, height=-1,
+                          link_all_x=self.link_x, **options):
+            for chart in self.charts:
+                chart._build_plot()
+
+    def _rasterize(self, pixels):
+        """Draws every chart into its cell of the grid."""
+        from pegasus.plotting.raster import BACKGROUND
+        height, width = pixels.shape[:2]
+        pixels[...] = BACKGROUND
+        rows = _grid_edges(height, self.rows, self.row_ratios)
+        cols = _grid_edges(width, self.columns, self.column_ratios)
+        for k, chart in enumerate(self.charts):
+            r, c = divmod(k, self.columns)
+            chart._rasterize(pixels[rows[r]:rows[r + 1], cols[c]:cols[c + 1]])
+
+
+def _grid_edges(size: int, count: int, ratios: Optional[Sequence[float]]) -> np.ndarray:
+    """Pixel edges of ``count`` cells splitting ``size`` by ``ratios`` (default equal)."""
+    weights = np.ones(count) if ratios is None else np.asarray(ratios, dtype=np.float64)
+    return np.rint(np.concatenate(([0.0], np.cumsum(weights))) / weights.sum() * size).astype(int)
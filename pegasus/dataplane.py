@@ -0,0 +1,332 @@
+"""Shared-memory data plane: feed processes write ring buffers that the UI process maps."""
+import multiprocessing
+import platform
+import sys
+import time
+import warnings
+from multiprocessing import shared_memory
+from typing import Callable, List, Optional, Tuple
+
+import numpy as np
+
+from pegasus.performance.buffers import RingBuffer, update_series_data
+from pegasus.streaming import FeedStats
+
+# Header of a shared ring: one cache line of int64 fields ahead of the data
+_MAGIC = 0x5045474153525247  # "PEGASRRG"
+_HEADER_SIZE = 64
+_MAGIC_FIELD, _CAPACITY, _COLUMNS, _DTYPE, _SEQUENCE, _FINISHED = range(6)
+
+_DTYPES = {np.dtype(t).num: np.dtype(t) for t in (np.float32, np.float64)}
+
+# Machines whose stores reach other cores in program order (x86 TSO). Python has
+# no memory fence, so elsewhere a reader can see the counter before the samples.
+_ORDERED_STORES = {"x86_64", "amd64", "i386", "i686", "x86"}
+
+
+def _check_store_ordering() -> None:
+    """Warns when the lock-free publish of ``SharedRingBuffer`` is not safe on this machine."""
+    machine = platform.machine().lower()
+    if machine not in _ORDERED_STORES:
+        warnings.warn(
+            f"SharedRingBuffer relies on x86 store ordering; on {machine or 'this machine'} "
+            "readers may see new samples before they are fully written",
+            RuntimeWarning, stacklevel=3)
+
+
+class SharedRingBuffer(RingBuffer):
+    """
+    ``RingBuffer`` in ``multiprocessing.shared_memory``, written by one process and read by others.
+
+    The layout is the same mirrored ``(columns, 2 * capacity)`` block, so
+    readers get the latest samples as one contiguous zero-copy view. The
+    writer publishes a sequence counter (total samples written) after the
+    data of every ``append``/``extend``; readers derive the window from the
+    counter alone and never lock. The counter is a single aligned 8-byte
+    store, and stores become visible in program order on x86-64. Python
+    cannot issue a memory fence, so creating or attaching a ring on other
+    architectures (e.g. ARM) emits a ``RuntimeWarning``: readers there may
+    see a published sample before its data.
+
+    With one writer the ring never blocks: it overwrites the oldest samples,
+    and readers that fall behind simply see the latest window. A reader can
+    check it was not lapped during a read by comparing the counter before and
+    after (see ``SharedRingSeries``).
+
+    The creating process owns the segment and unlinks it on ``close``.
+    Pickling a ring (e.g. as an argument to ``start_feed``) sends only its
+    name; the receiving process attaches to the same memory.
+
+    Args:
+        capacity: Maximum number of samples kept
+        columns: Number of columns, e.g. 2 for ``(t, price)``
+        dtype: ``np.float64`` or ``np.float32``
+        name: Segment name (None picks a unique one)
+
+    Example:
+        ring = SharedRingBuffer(1_000_000, columns=2)
+        start_feed(parse_feed, ring, "EURUSD")  # Calls ring.extend(t, p) in its own process
+        LineChart.from_shared(ring).show()
+    """
+
+    def __init__(self, capacity: int, columns: int = 2, dtype=np.float64,
+                 name: Optional[str] = None):
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        dtype = np.dtype(dtype)
+        if dtype.num not in _DTYPES:
+            raise ValueError(f"dtype must be float32 or float64, got {dtype}")
+        _check_store_ordering()
+        size = _HEADER_SIZE + columns * 2 * capacity * dtype.itemsize
+        shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+        header = np.ndarray(_HEADER_SIZE // 8, dtype=np.int64, buffer=shm.buf)
+        header[:] = 0
+        header[[_CAPACITY, _COLUMNS, _DTYPE]] = capacity, columns, dtype.num
+        header[_MAGIC_FIELD] = _MAGIC
+        self._map(shm, owner=True)
+
+    @classmethod
+    def attach(cls, name: str) -> "SharedRingBuffer":
+        """Maps an existing ring created by another process (or this one)."""
+        _check_store_ordering()
+        if sys.version_info >= (3, 13):
+            # Only the creator should unlink the segment when it exits
+            shm = shared_memory.SharedMemory(name=name, track=False)
+        else:
+            shm = shared_memory.SharedMemory(name=name)
+        if np.ndarray(1, dtype=np.int64, buffer=shm.buf)[0] != _MAGIC:
+            shm.close()
+            raise ValueError(f"shared memory {name!r} is not a pegasus ring")
+        ring = cls.__new__(cls)
+        ring._map(shm, owner=False)
+        return ring
+
+    def _map(self, shm: shared_memory.SharedMemory, owner: bool) -> None:
+        self._shm = shm
+        self._owner = owner
+        self._header = np.ndarray(_HEADER_SIZE // 8, dtype=np.int64, buffer=shm.buf)
+        self.capacity = int(self._header[_CAPACITY])
+        self.columns = int(self._header[_COLUMNS])
+        self._data = np.ndarray((self.columns, 2 * self.capacity),
+                                dtype=_DTYPES[int(self._header[_DTYPE])],
+                                buffer=shm.buf, offset=_HEADER_SIZE)
+        # Writer state continues from the published counter
+        self._sequence = int(self._header[_SEQUENCE])
+        self._head = self._sequence % self.capacity
+        self._size = min(self._sequence, self.capacity)
+
+    def __reduce__(self):
+        return SharedRingBuffer.attach, (self.name,)
+
+    @property
+    def name(self) -> str:
+        return self._shm.name
+
+    @property
+    def sequence(self) -> int:
+        """Total samples written so far, as last published by the writer."""
+        return int(self._header[_SEQUENCE])
+
+    @property
+    def finished(self) -> bool:
+        """True once the writer called ``finish``."""
+        return bool(self._header[_FINISHED])
+
+    def __len__(self) -> int:
+        return min(self.sequence, self.capacity)
+
+    def _publish(self, count: int) -> None:
+        self._sequence += count
+        self._header[_SEQUENCE] = self._sequence
+
+    def append(self, *values: float) -> None:
+        """Writes one sample and publishes it. Writer process only."""
+        super().append(*values)
+        self._publish(1)
+
+    def extend(self, *columns) -> None:
+        """Writes a batch of samples and publishes them at once. Writer process only."""
+        n = len(columns[0]) if columns else 0
+        skipped = max(n - self.capacity, 0)
+        if skipped:
+            # Only the last ``capacity`` samples are stored; skip the slots of
+            # the others so the head stays at ``sequence % capacity``
+            self._sequence += skipped
+            self._head = self._sequence % self.capacity
+        super().extend(*columns)
+        self._publish(n - skipped)
+
+    def clear(self) -> None:
+        """Drops all samples; readers see the counter restart from zero. Writer process only."""
+        super().clear()
+        self._sequence = 0
+        self._header[_SEQUENCE] = 0
+
+    def finish(self) -> None:
+        """Marks the stream as complete. Writer process only."""
+        self._header[_FINISHED] = 1
+
+    def window(self, sequence: int, samples: Optional[int] = None) -> Tuple[np.ndarray, ...]:
+        """
+        Zero-copy views of the ``samples`` most recent samples as of ``sequence``.
+
+        The views stay valid while the writer adds fewer than
+        ``capacity - samples`` samples after ``sequence``.
+        """
+        size = min(sequence, self.capacity if samples is None else samples, self.capacity)
+        stop = sequence % self.capacity + self.capacity
+        return tuple(self._data[:, stop - size:stop])
+
+    def view(self, column: int = 0) -> np.ndarray:
+        """Returns the published samples of one column, oldest first, as a contiguous view."""
+        return self.window(self.sequence)[column]
+
+    def views(self) -> Tuple[np.ndarray, ...]:
+        """Returns contiguous views of every published column, oldest sample first."""
+        return self.window(self.sequence)
+
+    def close(self) -> None:
+        """
+        Unmaps the ring, and unlinks the segment if this process created it.
+
+        Views returned by ``view``/``views``/``window`` must be released first.
+        """
+        if self._shm is None:
+            return
+        self._header = None
+        self._data = None
+        self._shm.close()
+        if self._owner:
+            self._shm.unlink()
+        self._shm = None
+
+    def __enter__(self) -> "SharedRingBuffer":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+
+class SharedRingSeries:
+    """
+    DPG series drawing the latest samples of a ``SharedRingBuffer``.
+
+    ``flush`` reads the sequence counter, hands DPG zero-copy views of the
+    window ending there and reads the counter again. If the writer lapped
+    the window while DPG copied it, the frame is counted in ``torn`` and the
+    window is re-sent on the next ``flush``. Keeping ``window`` below the
+    capacity leaves the writer that many samples of headroom per frame.
+
+    Args:
+        tag: Existing DPG series tag (line, scatter, ...)
+        ring: Ring to read, usually from ``SharedRingBuffer.attach`` or the creator
+        window: Most recent samples drawn (defaults to three quarters of the capacity)
+    """
+
+    def __init__(self, tag, ring: SharedRingBuffer, window: Optional[int] = None):
+        self.tag = tag
+        self.ring = ring
+        self.window = window or max(ring.capacity * 3 // 4, 1)
+        if self.window > ring.capacity:
+            raise ValueError("window cannot exceed the ring capacity")
+        self.torn = 0
+        self._sequence = -1
+
+    def flush(self) -> bool:
+        """Sends the current window if the writer published since. Returns True if data was sent."""
+        ring = self.ring
+        sequence = ring.sequence
+        if sequence == self._sequence:
+            return False
+        update_series_data(self.tag, ring.window(sequence, self.window))
+        if ring.sequence - sequence > ring.capacity - self.window:
+            self.torn += 1
+            self._sequence = -1
+        else:
+            self._sequence = sequence
+        return True
+
+
+def start_feed(target: Callable[..., None], *args,
+               start_method: str = "spawn") -> multiprocessing.process.BaseProcess:
+    """
+    Runs ``target(*args)`` in a new daemon process and returns it.
+
+    ``SharedRingBuffer`` arguments are re-attached by name in the child, so
+    the feed writes straight into memory the UI process has mapped. Parsing
+    runs on another core, outside the UI process's GIL. ``spawn`` avoids
+    forking the render thread and DPG state.
+    """
+    process = multiprocessing.get_context(start_method).Process(
+        target=target, args=args, daemon=True)
+    process.start()
+    return process
+
+
+def synthetic_feed(ring: SharedRingBuffer, messages: int, batch: int = 1_000,
+                   rate: Optional[float] = None) -> None:
+    """
+    Writes a random-walk ``(timestamp, price)`` tick feed into ``ring``, then calls ``finish``.
+
+    A stand-in feed handler for tests and benchmarks, run with ``start_feed``.
+    """
+    rng = np.random.default_rng()
+    price = 1.0
+    start = time.perf_counter()
+    epoch = time.time()
+    sent = 0
+    while sent < messages:
+        n = min(batch, messages - sent)
+        # One microsecond apart so timestamps stay strictly increasing
+        t = epoch + (sent + np.arange(n)) * 1e-6
+        prices = price + np.cumsum(rng.normal(0.0, 1e-5, n))
+        price = prices[-1]
+        ring.extend(t, prices)
+        sent += n
+        if rate:
+            delay = start + sent / rate - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+    ring.finish()
+
+
+def shared_memory_throughput(messages: int = 1_000_000, producers: int = 2,
+                             batch: int = 1_000, capacity: int = 1 << 20,
+                             poll_seconds: float = 1e-3) -> FeedStats:
+    """
+    Measures ticks per second written by ``producers`` feed processes into shared rings.
+
+    Each producer runs ``synthetic_feed`` into its own ring; this process only
+    polls the sequence counters, like a render loop would once per frame.
+    Timing starts at the first poll that sees data, so process start-up is
+    not counted. ``stats.batches`` counts the polls that saw new data.
+    """
+    rings: List[SharedRingBuffer] = [SharedRingBuffer(capacity) for _ in range(producers)]
+    processes = []
+    try:
+        for ring in rings:
+            processes.append(start_feed(synthetic_feed, ring, messages, batch))
+        stats = FeedStats()
+        seen = 0
+        while not all(ring.finished for ring in rings):
+            if any(p.exitcode is not None and not r.finished for p, r in zip(processes, rings)):
+                raise RuntimeError("a feed process exited before finishing its stream")
+            total = sum(ring.sequence for ring in rings)
+            if total != seen:
+                if not seen:
+                    stats = FeedStats()
+                stats.batches += 1
+                seen = total
+            time.sleep(poll_seconds)
+        stats.finished = time.perf_counter()
+        stats.messages = sum(ring.sequence for ring in rings)
+        stats.bytes = stats.messages * 2 * 8
+        for process in processes:
+            process.join()
+        return stats
+    finally:
+        for process in processes:
+            if process.is_alive():
+                process.terminate()
+        for ring in rings:
+            ring.close()
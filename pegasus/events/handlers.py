@@ -1,5 +1,45 @@
-def add_click_handler(callback):
-    pass
+import dearpygui.dearpygui as dpg
+
+
+def _item_registry(item):
+    """Returns the handler registry bound to ``item``, creating it on first use."""
+    # Asked of DPG rather than cached: ids restart with every context, so a
+    # remembered registry id may name another chart's registry by now
+    registry = dpg.get_item_info(item)["handlers"]
+    if registry is None:
+        registry = dpg.add_item_handler_registry()
+        dpg.bind_item_handler_registry(item, registry)
+    return registry
+
+
+def add_visible_handler(item, callback):
+    """
+    Runs ``callback`` once per frame while ``item`` is visible.
+
+    DPG allows a single handler registry per item, so all callbacks attached to
+    the same item share one registry.
+
+    Returns:
+        Tag of the created visible handler
+    """
+    return dpg.add_item_visible_handler(callback=callback, parent=_item_registry(item))
+
+def add_click_handler(plot, callback, button: int = -1):
+    """
+    Runs ``callback(x, y)`` with the plot coordinates of every click on ``plot``.
+
+    Args:
+        plot: Plot tag
+        callback: Called as ``callback(x, y)``
+        button: Mouse button, e.g. ``dpg.mvMouseButton_Left`` (default: any)
+
+    Returns:
+        Tag of the created clicked handler
+    """
+    def on_click(sender, app_data):
+        x, y = dpg.get_plot_mouse_pos()
+        callback(x, y)
+    return dpg.add_item_clicked_handler(button, callback=on_click, parent=_item_registry(plot))
 
 def add_drag_handler(callback):
     pass
@@ -7,5 +47,26 @@ def add_drag_handler(callback):
 def add_zoom_handler(callback):
     pass
 
-def add_query_handler(callback):
-    pass
+def add_query_handler(plot, callback):
+    """
+    Runs ``callback(x, y)`` with the plot coordinates of the mouse when it moves over ``plot``.
+
+    The hover handler fires every frame the plot is hovered; the callback only
+    runs when the position changed, so a resting cursor costs nothing. Pair it
+    with the lookups in ``pegasus.performance.query`` for crosshair readouts.
+
+    Args:
+        plot: Plot tag
+        callback: Called as ``callback(x, y)``
+
+    Returns:
+        Tag of the created hover handler
+    """
+    last = [None]
+
+    def on_hover(sender, app_data):
+        pos = tuple(dpg.get_plot_mouse_pos())
+        if pos != last[0]:
+            last[0] = pos
+            callback(*pos)
+    return dpg.add_item_hover_handler(callback=on_hover, parent=_item_registry(plot))
@@ -0,0 +1,58 @@
+"""Batch PNG export of charts without a display, spread over a process pool."""
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Callable, Iterable, List, Optional, Tuple, Union
+
+from pegasus.charts import Chart
+
+# A chart, or a zero-argument callable building one in the worker
+ChartJob = Tuple[Union[Chart, Callable[[], Chart]], str]
+
+
+def _render(job: ChartJob, width: Optional[int], height: Optional[int],
+            compress_level: int) -> str:
+    chart, path = job
+    if not isinstance(chart, Chart):
+        chart = chart()
+    return chart.render_to_png(path, width, height, compress_level)
+
+
+def render_charts(
+    jobs: Iterable[ChartJob],
+    max_workers: Optional[int] = None,
+    width: Optional[int] = None,
+    height: Optional[int] = None,
+    compress_level: int = 6,
+) -> List[str]:
+    """
+    Renders many charts to PNG files in parallel with ``Chart.render_to_png``.
+
+    Each job is a ``(chart, path)`` pair. Charts are pickled to the worker
+    processes with their data; for large data sets pass a zero-argument
+    callable instead of the chart (e.g. ``partial(build_report, symbol)``),
+    so each worker loads its own data and only the path travels back. Live
+    charts (``live_bars``) hold a lock and cannot be sent to a worker.
+
+    Args:
+        jobs: ``(chart or chart factory, output path)`` pairs
+        max_workers: Worker processes (defaults to the CPU count; 1 renders serially)
+        width: Image width for every chart (defaults to each chart's width)
+        height: Image height for every chart (defaults to each chart's height)
+        compress_level: zlib level, 1 (fastest) to 9 (smallest)
+
+    Returns:
+        list: Written paths, in job order
+
+    Example:
+        paths = render_charts((partial(daily_chart, symbol), f"out/{symbol}.png")
+                              for symbol in symbols)
+    """
+    jobs = list(jobs)
+    render = partial(_render, width=width, height=height, compress_level=compress_level)
+    workers = min(max_workers or os.cpu_count() or 1, len(jobs))
+    if workers <= 1:
+        return [render(job) for job in jobs]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        # Several jobs per task amortize pickling and scheduling overhead
+        return list(pool.map(render, jobs, chunksize=max(len(jobs) // (4 * workers), 1)))
@@ -0,0 +1,462 @@
+"""Technical indicators: vectorized over full histories, O(1) per bar for live data."""
+import math
+from typing import Optional, Tuple, Union
+
+import numpy as np
+
+from pegasus.utils.ohlc import timeframe_seconds
+
+# Rows per block when computing rolling windows; bounds temporaries and cumsum error
+_ROLLING_BLOCK = 1 << 16
+
+
+def _linear_filter(x: np.ndarray, decay: float, y0: float = 0.0) -> np.ndarray:
+    """
+    Solves ``y[t] = decay * y[t - 1] + x[t]`` (with ``y[-1] = y0``) without a Python loop per row.
+
+    Rows are split into blocks short enough that ``decay ** -block`` stays
+    below 1e8. Each block is solved from zero with one scaled ``cumsum``, then
+    the value carried in from the previous block is added back, which only
+    needs a scalar loop over the blocks.
+    """
+    n = x.size
+    if n == 0:
+        return np.empty(0)
+    if decay <= 0.0:
+        return np.array(x, dtype=np.float64)
+    block = n if decay >= 1.0 else int(min(max(math.log(1e8) / -math.log(decay), 1), 4096, n))
+    rows = -(-n // block)
+    padded = np.zeros(rows * block)
+    padded[:n] = x
+    padded = padded.reshape(rows, block)
+    j = np.arange(block)
+    local = np.cumsum(padded * decay ** -j, axis=1) * decay ** j
+
+    carry = np.empty(rows)
+    value = y0
+    step = decay ** block
+    for i, end in enumerate(local[:, -1].tolist()):
+        carry[i] = value
+        value = end + step * value
+    local += carry[:, None] * decay ** (j + 1)
+    return local.reshape(-1)[:n]
+
+
+def _rolling_moments(x: np.ndarray, period: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Rolling mean and population variance, NaN for the first ``period - 1`` rows."""
+    n = x.size
+    mean = np.full(n, np.nan)
+    var = np.full(n, np.nan)
+    for start in range(period - 1, n, _ROLLING_BLOCK):
+        stop = min(start + _ROLLING_BLOCK, n)
+        segment = x[start - period + 1:stop]
+        # Sums are taken relative to the block's first value to limit cancellation
+        shifted = segment - segment[0]
+        s1 = np.concatenate(([0.0], np.cumsum(shifted)))
+        s2 = np.concatenate(([0.0], np.cumsum(shifted * shifted)))
+        m = (s1[period:] - s1[:-period]) / period
+        mean[start:stop] = m + segment[0]
+        var[start:stop] = np.maximum((s2[period:] - s2[:-period]) / period - m * m, 0.0)
+    return mean, var
+
+
+def _check_period(period: int) -> int:
+    if period < 1:
+        raise ValueError("period must be at least 1")
+    return int(period)
+
+
+def sma(values, period: int) -> np.ndarray:
+    """Simple moving average; the first ``period - 1`` values are NaN."""
+    return _rolling_moments(np.asarray(values, dtype=np.float64), _check_period(period))[0]
+
+
+def ema(values, period: int) -> np.ndarray:
+    """
+    Exponential moving average with ``alpha = 2 / (period + 1)``.
+
+    Seeded with the simple average of the first ``period`` values, which lands
+    at index ``period - 1``; earlier values are NaN.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    period = _check_period(period)
+    out = np.full(values.size, np.nan)
+    if values.size < period:
+        return out
+    alpha = 2.0 / (period + 1)
+    seed = values[:period].mean()
+    out[period - 1] = seed
+    out[period:] = _linear_filter(alpha * values[period:], 1.0 - alpha, seed)
+    return out
+
+
+def bollinger(values, period: int = 20, k: float = 2.0) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Bollinger bands ``(middle, upper, lower)``: SMA ± ``k`` population standard deviations."""
+    mean, var = _rolling_moments(np.asarray(values, dtype=np.float64), _check_period(period))
+    width = k * np.sqrt(var)
+    return mean, mean + width, mean - width
+
+
+def vwap(dates, highs, lows, closes, volumes=None,
+         session: Optional[Union[str, int, float]] = "D1") -> np.ndarray:
+    """
+    Volume-weighted average of the typical price ``(high + low + close) / 3``.
+
+    The average restarts at every ``session`` boundary (``None`` never
+    restarts). Without ``volumes`` every bar has weight 1.
+    """
+    dates = np.asarray(dates, dtype=np.float64)
+    price = (np.asarray(highs, dtype=np.float64) + np.asarray(lows, dtype=np.float64)
+             + np.asarray(closes, dtype=np.float64)) / 3.0
+    weights = (np.ones_like(price) if volumes is None
+               else np.asarray(volumes, dtype=np.float64))
+    if price.size == 0:
+        return price
+    pv = np.cumsum(price * weights)
+    v = np.cumsum(weights)
+    if session is not None:
+        sessions = dates // timeframe_seconds(session)
+        starts = np.flatnonzero(np.concatenate(([True], sessions[1:] != sessions[:-1])))
+        run = np.diff(np.append(starts, price.size))
+        # Subtract everything accumulated before the session started
+        pv -= np.repeat(np.concatenate(([0.0], pv[starts[1:] - 1])), run)
+        v -= np.repeat(np.concatenate(([0.0], v[starts[1:] - 1])), run)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return pv / v
+
+
+def _wilder(gains: np.ndarray, losses: np.ndarray, period: int):
+    """Wilder-smoothed average gain and loss per row, starting at row ``period - 1``."""
+    seed_gain = gains[:period].mean()
+    seed_loss = losses[:period].mean()
+    decay = (period - 1) / period
+    avg_gain = np.concatenate(([seed_gain], _linear_filter(gains[period:] / period, decay, seed_gain)))
+    avg_loss = np.concatenate(([seed_loss], _linear_filter(losses[period:] / period, decay, seed_loss)))
+    return avg_gain, avg_loss
+
+
+def _rsi_value(avg_gain, avg_loss):
+    total = avg_gain + avg_loss
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(total > 0, 100.0 * avg_gain / np.where(total > 0, total, 1.0), 50.0)
+
+
+def rsi(values, period: int = 14) -> np.ndarray:
+    """
+    Relative strength index with Wilder smoothing, in 0..100.
+
+    The first value is at index ``period``; earlier values are NaN. A flat
+    window (no gains and no losses) reads 50.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    period = _check_period(period)
+    out = np.full(values.size, np.nan)
+    if values.size <= period:
+        return out
+    delta = np.diff(values)
+    avg_gain, avg_loss = _wilder(np.maximum(delta, 0.0), np.maximum(-delta, 0.0), period)
+    out[period:] = _rsi_value(avg_gain, avg_loss)
+    return out
+
+
+class Indicator:
+    """
+    Base class of the incremental indicators.
+
+    ``load`` computes a whole history with the vectorized function and keeps
+    the state needed to continue it. ``push`` then appends one closed bar in
+    O(1), and ``peek`` evaluates a still-open bar against the committed state
+    without changing it, so a live chart only recomputes its last value when
+    the open bar moves.
+
+    Every method takes and returns all ``outputs`` at once (one line each);
+    values during the first ``warmup`` bars are NaN. ``overlay`` indicators
+    share the price axis; the others (oscillators) get their own y-axis.
+    """
+
+    outputs: Tuple[str, ...] = ("value",)
+    warmup = 0
+    overlay = True
+    label = "Indicator"
+
+    def compute(self, dates, opens, highs, lows, closes, volumes=None) -> Tuple[np.ndarray, ...]:
+        """Returns the indicator over a full history without touching the live state."""
+        raise NotImplementedError
+
+    def load(self, dates, opens, highs, lows, closes, volumes=None) -> Tuple[np.ndarray, ...]:
+        """Computes a full history and continues the live state from its last bar."""
+        raise NotImplementedError
+
+    def push(self, t: float, o: float, h: float, l: float, c: float,
+             v: float = 1.0) -> Tuple[float, ...]:
+        """Appends one closed bar and returns its values."""
+        raise NotImplementedError
+
+    def peek(self, t: float, o: float, h: float, l: float, c: float,
+             v: float = 1.0) -> Tuple[float, ...]:
+        """Returns the values a bar would have if pushed now, without pushing it."""
+        raise NotImplementedError
+
+
+class _Window:
+    """Last ``period`` values with running sums, re-summed every ``period`` pushes."""
+
+    def __init__(self, period: int):
+        self.period = period
+        self.values = np.zeros(period)
+        self.count = 0
+        self.ref = 0.0  # Sums are relative to ``ref`` to limit cancellation
+        self.s1 = 0.0
+        self.s2 = 0.0
+
+    def load(self, values: np.ndarray) -> None:
+        self.count = values.size
+        tail = values[-self.period:]
+        self.values[:] = 0.0
+        self.values[np.arange(self.count - tail.size, self.count) % self.period] = tail
+        self._resum()
+
+    def _resum(self) -> None:
+        live = self.values[:min(self.count, self.period)]
+        self.ref = float(self.values[(self.count - 1) % self.period]) if self.count else 0.0
+        shifted = live - self.ref
+        self.s1 = float(shifted.sum())
+        self.s2 = float((shifted * shifted).sum())
+
+    def sums(self, x: float) -> Tuple[float, float, bool]:
+        """Sums of the window after appending ``x`` (relative to ``ref``), and whether it is full."""
+        d = x - self.ref
+        s1, s2 = self.s1 + d, self.s2 + d * d
+        if self.count >= self.period:
+            old = self.values[self.count % self.period] - self.ref
+            s1 -= old
+            s2 -= old * old
+        return s1, s2, self.count + 1 >= self.period
+
+    def push(self, x: float) -> None:
+        self.s1, self.s2, _ = self.sums(x)
+        self.values[self.count % self.period] = x
+        self.count += 1
+        if self.count % self.period == 0:
+            self._resum()
+
+    def moments(self, x: float) -> Tuple[float, float]:
+        """Mean and population variance of the window after appending ``x`` (NaN until full)."""
+        s1, s2, full = self.sums(x)
+        if not full:
+            return math.nan, math.nan
+        m = s1 / self.period
+        return m + self.ref, max(s2 / self.period - m * m, 0.0)
+
+
+class SMA(Indicator):
+    """Simple moving average of closes."""
+
+    def __init__(self, period: int = 20):
+        self.period = _check_period(period)
+        self.warmup = self.period - 1
+        self.label = f"SMA {self.period}"
+        self._window = _Window(self.period)
+
+    def compute(self, dates, opens, highs, lows, closes, volumes=None):
+        return (sma(closes, self.period),)
+
+    def load(self, dates, opens, highs, lows, closes, volumes=None):
+        closes = np.asarray(closes, dtype=np.float64)
+        self._window.load(closes)
+        return (sma(closes, self.period),)
+
+    def push(self, t, o, h, l, c, v=1.0):
+        value = self._window.moments(c)[0]
+        self._window.push(c)
+        return (value,)
+
+    def peek(self, t, o, h, l, c, v=1.0):
+        return (self._window.moments(c)[0],)
+
+
+class Bollinger(Indicator):
+    """Bollinger bands of closes: middle, upper and lower line."""
+
+    outputs = ("middle", "upper", "lower")
+
+    def __init__(self, period: int = 20, k: float = 2.0):
+        self.period = _check_period(period)
+        self.k = k
+        self.warmup = self.period - 1
+        self.label = f"BB {self.period} {k:g}"
+        self._window = _Window(self.period)
+
+    def compute(self, dates, opens, highs, lows, closes, volumes=None):
+        return bollinger(closes, self.period, self.k)
+
+    def load(self, dates, opens, highs, lows, closes, volumes=None):
+        closes = np.asarray(closes, dtype=np.float64)
+        self._window.load(closes)
+        return bollinger(closes, self.period, self.k)
+
+    def _bands(self, c: float) -> Tuple[float, float, float]:
+        mean, var = self._window.moments(c)
+        width = self.k * math.sqrt(var) if var == var else math.nan
+        return mean, mean + width, mean - width
+
+    def push(self, t, o, h, l, c, v=1.0):
+        bands = self._bands(c)
+        self._window.push(c)
+        return bands
+
+    def peek(self, t, o, h, l, c, v=1.0):
+        return self._bands(c)
+
+
+class EMA(Indicator):
+    """Exponential moving average of closes, seeded with the SMA of the first ``period`` bars."""
+
+    def __init__(self, period: int = 20):
+        self.period = _check_period(period)
+        self.alpha = 2.0 / (self.period + 1)
+        self.warmup = self.period - 1
+        self.label = f"EMA {self.period}"
+        self._count = 0
+        self._seed = 0.0
+        self._value = math.nan
+
+    def compute(self, dates, opens, highs, lows, closes, volumes=None):
+        return (ema(closes, self.period),)
+
+    def load(self, dates, opens, highs, lows, closes, volumes=None):
+        closes = np.asarray(closes, dtype=np.float64)
+        values = ema(closes, self.period)
+        self._count = closes.size
+        self._seed = float(closes[:self.period].sum())
+        self._value = float(values[-1]) if values.size else math.nan
+        return (values,)
+
+    def _next(self, c: float) -> float:
+        if self._count >= self.period:
+            return self._value + self.alpha * (c - self._value)
+        if self._count == self.period - 1:
+            return (self._seed + c) / self.period
+        return math.nan
+
+    def push(self, t, o, h, l, c, v=1.0):
+        value = self._next(c)
+        if self._count < self.period:
+            self._seed += c
+        self._count += 1
+        self._value = value
+        return (value,)
+
+    def peek(self, t, o, h, l, c, v=1.0):
+        return (self._next(c),)
+
+
+class RSI(Indicator):
+    """Relative strength index of closes with Wilder smoothing."""
+
+    overlay = False
+
+    def __init__(self, period: int = 14):
+        self.period = _check_period(period)
+        self.warmup = self.period
+        self.label = f"RSI {self.period}"
+        self._prev = math.nan
+        self._count = 0  # Number of price changes seen
+        self._gain = 0.0  # Seed sums, then Wilder averages
+        self._loss = 0.0
+
+    def compute(self, dates, opens, highs, lows, closes, volumes=None):
+        return (rsi(closes, self.period),)
+
+    def load(self, dates, opens, highs, lows, closes, volumes=None):
+        closes = np.asarray(closes, dtype=np.float64)
+        self._prev = float(closes[-1]) if closes.size else math.nan
+        self._count = max(closes.size - 1, 0)
+        delta = np.diff(closes)
+        gains, losses = np.maximum(delta, 0.0), np.maximum(-delta, 0.0)
+        if self._count >= self.period:
+            avg_gain, avg_loss = _wilder(gains, losses, self.period)
+            self._gain, self._loss = float(avg_gain[-1]), float(avg_loss[-1])
+        else:
+            self._gain, self._loss = float(gains.sum()), float(losses.sum())
+        return (rsi(closes, self.period),)
+
+    def _next(self, c: float) -> Tuple[float, float, float]:
+        """Gain state, loss state and RSI after a bar closing at ``c``."""
+        if self._prev != self._prev:
+            return self._gain, self._loss, math.nan
+        delta = c - self._prev
+        gain, loss = max(delta, 0.0), max(-delta, 0.0)
+        p = self.period
+        if self._count >= p:
+            gain = (self._gain * (p - 1) + gain) / p
+            loss = (self._loss * (p - 1) + loss) / p
+        else:
+            gain, loss = self._gain + gain, self._loss + loss
+            if self._count < p - 1:
+                return gain, loss, math.nan
+            gain, loss = gain / p, loss / p
+        total = gain + loss
+        return gain, loss, 100.0 * gain / total if total > 0 else 50.0
+
+    def push(self, t, o, h, l, c, v=1.0):
+        gain, loss, value = self._next(c)
+        if self._prev == self._prev:
+            self._count += 1
+        self._gain, self._loss, self._prev = gain, loss, c
+        return (value,)
+
+    def peek(self, t, o, h, l, c, v=1.0):
+        return (self._next(c)[2],)
+
+
+class VWAP(Indicator):
+    """
+    Session VWAP of the typical price.
+
+    Pegasus bars carry no volume, so bars are equally weighted unless volumes
+    are passed to ``load``/``push``.
+    """
+
+    def __init__(self, session: Optional[Union[str, int, float]] = "D1"):
+        self.session = session
+        self._seconds = timeframe_seconds(session) if session is not None else None
+        self.label = f"VWAP {session}" if session is not None else "VWAP"
+        self._id = math.nan
+        self._pv = 0.0
+        self._v = 0.0
+
+    def compute(self, dates, opens, highs, lows, closes, volumes=None):
+        return (vwap(dates, highs, lows, closes, volumes, self.session),)
+
+    def load(self, dates, opens, highs, lows, closes, volumes=None):
+        values = vwap(dates, highs, lows, closes, volumes, self.session)
+        self._id, self._pv, self._v = math.nan, 0.0, 0.0
+        if values.size:
+            dates = np.asarray(dates, dtype=np.float64)
+            start = 0
+            if self._seconds is not None:
+                self._id = float(dates[-1] // self._seconds)
+                start = int(np.searchsorted(dates, self._id * self._seconds))
+            price = (np.asarray(highs[start:], dtype=np.float64)
+                     + np.asarray(lows[start:], dtype=np.float64)
+                     + np.asarray(closes[start:], dtype=np.float64)) / 3.0
+            weights = (np.ones_like(price) if volumes is None
+                       else np.asarray(volumes[start:], dtype=np.float64))
+            self._pv, self._v = float((price * weights).sum()), float(weights.sum())
+        return (values,)
+
+    def _next(self, t, h, l, c, v) -> Tuple[float, float, float]:
+        session = t // self._seconds if self._seconds is not None else math.nan
+        pv, vol = (self._pv, self._v) if session == self._id or self._seconds is None else (0.0, 0.0)
+        pv += (h + l + c) / 3.0 * v
+        vol += v
+        return session, pv, vol
+
+    def push(self, t, o, h, l, c, v=1.0):
+        self._id, self._pv, self._v = self._next(t, h, l, c, v)
+        return (self._pv / self._v if self._v else math.nan,)
+
+    def peek(self, t, o, h, l, c, v=1.0):
+        _, pv, vol = self._next(t, h, l, c, v)
+        return (pv / vol if vol else math.nan,)
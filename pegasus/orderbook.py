@@ -0,0 +1,333 @@
+"""Array-backed L2/L3 order books for depth visualization."""
+import threading
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+# Side codes used by ``OrderBook.apply`` and ``L3OrderBook.apply_orders``
+BID = 0
+ASK = 1
+
+# Summed level sizes at or below this are treated as empty (float residue of adds
+# and removes that should cancel out)
+SIZE_EPSILON = 1e-9
+
+
+def _last_per_key(keys: np.ndarray, *columns: np.ndarray) -> tuple:
+    """Sorts a batch by key and keeps the last occurrence of every key."""
+    order = np.argsort(keys, kind='stable')
+    keys = keys[order]
+    last = np.empty(keys.size, dtype=bool)
+    last[-1:] = True
+    np.not_equal(keys[1:], keys[:-1], out=last[:-1])
+    return (keys[last],) + tuple(col[order][last] for col in columns)
+
+
+def _sum_per_key(keys: np.ndarray, values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Sorts a batch by key and sums the values of equal keys."""
+    order = np.argsort(keys, kind='stable')
+    keys = keys[order]
+    starts = np.flatnonzero(np.concatenate(([True], keys[1:] != keys[:-1])))
+    return keys[starts], np.add.reduceat(values[order], starts)
+
+
+def _locate(sorted_keys: np.ndarray, keys: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Returns insertion positions of ``keys`` and whether each one is already present."""
+    pos = np.searchsorted(sorted_keys, keys)
+    found = np.zeros(keys.size, dtype=bool)
+    inside = pos < sorted_keys.size
+    found[inside] = sorted_keys[pos[inside]] == keys[inside]
+    return pos, found
+
+
+def _restructure(columns: List[np.ndarray], count: int, remove: np.ndarray,
+                 insert_pos: np.ndarray, inserts: List[np.ndarray]) -> int:
+    """
+    Removes and inserts rows of sorted, preallocated columns in one pass.
+
+    ``columns[0]`` holds the sort keys. ``remove`` are row indices to drop and
+    ``insert_pos`` the positions (in the current rows) the new, sorted rows
+    go before. Rows past the storage capacity are dropped from the end.
+
+    Returns:
+        int: New row count
+    """
+    keep = np.ones(count, dtype=bool)
+    keep[remove] = False
+    kept_rows = np.flatnonzero(keep)
+    # Positions relative to the kept rows, then offsets by the rows inserted before
+    insert_at = np.searchsorted(kept_rows, insert_pos)
+    insert_dest = insert_at + np.arange(insert_at.size)
+    kept_dest = np.arange(kept_rows.size) + np.searchsorted(insert_at, np.arange(kept_rows.size),
+                                                            side='right')
+    capacity = columns[0].size
+    total = min(kept_rows.size + insert_at.size, capacity)
+    kept_ok = kept_dest < capacity
+    insert_ok = insert_dest < capacity
+    for col, new in zip(columns, inserts):
+        kept = col[kept_rows[kept_ok]]
+        col[kept_dest[kept_ok]] = kept
+        col[insert_dest[insert_ok]] = new[insert_ok]
+    return total
+
+
+class BookSide:
+    """
+    One side of a price-level book in sorted, preallocated arrays.
+
+    Levels are kept best first (highest bid, lowest ask) in fixed-size arrays
+    together with the cumulative size from the best level outwards. Batches
+    of deltas are applied with ``searchsorted`` and at most one shift of the
+    level arrays; the cumulative depth is recomputed only from the best
+    level a batch touched, so a change deep in the book costs little.
+
+    Args:
+        capacity: Maximum number of levels kept; worse levels are dropped
+        descending: True for bids (best price is the highest)
+    """
+
+    def __init__(self, capacity: int = 1000, descending: bool = False):
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self.capacity = capacity
+        self.descending = descending
+        self._sign = -1.0 if descending else 1.0
+        self._keys = np.empty(capacity, dtype=np.float64)  # price * sign, ascending
+        self._prices = np.empty(capacity, dtype=np.float64)
+        self._sizes = np.empty(capacity, dtype=np.float64)
+        self._depth = np.empty(capacity, dtype=np.float64)
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def update(self, prices, sizes) -> None:
+        """
+        Sets the size of each price level; a size of zero or less deletes it.
+
+        Later deltas for the same price within the batch win.
+        """
+        self._apply(prices, sizes, additive=False)
+
+    def add(self, prices, size_deltas) -> None:
+        """
+        Adds signed size changes to levels, creating or deleting them as needed.
+
+        Levels whose size drops to ``SIZE_EPSILON`` or below are deleted.
+        """
+        self._apply(prices, size_deltas, additive=True)
+
+    def clear(self) -> None:
+        """Removes every level without releasing storage."""
+        self._count = 0
+
+    def _apply(self, prices, sizes, additive: bool) -> None:
+        prices = np.asarray(prices, dtype=np.float64).reshape(-1)
+        sizes = np.asarray(sizes, dtype=np.float64).reshape(-1)
+        if prices.size == 0:
+            return
+        keys = prices * self._sign
+        if additive:
+            keys, sizes = _sum_per_key(keys, sizes)
+        else:
+            keys, sizes = _last_per_key(keys, sizes)
+
+        n = self._count
+        pos, found = _locate(self._keys[:n], keys)
+        at = pos[found]
+        if additive:
+            sizes[found] += self._sizes[at]
+        self._sizes[at] = sizes[found]
+
+        live = sizes > (SIZE_EPSILON if additive else 0)
+        remove = at[~live[found]]
+        insert = ~found & live
+        if remove.size or insert.any():
+            columns = [self._keys, self._prices, self._sizes]
+            new_keys = keys[insert]
+            inserts = [new_keys, new_keys * self._sign, sizes[insert]]
+            self._count = _restructure(columns, n, remove, pos[insert], inserts)
+
+        first = int(pos[0])
+        if first < self._count:
+            depth = self._depth[first:self._count]
+            np.cumsum(self._sizes[first:self._count], out=depth)
+            if first:
+                depth += self._depth[first - 1]
+
+    @property
+    def best(self) -> Optional[float]:
+        """Best price, or None if the side is empty."""
+        return float(self._prices[0]) if self._count else None
+
+    def prices(self) -> np.ndarray:
+        """Level prices, best first, as a view."""
+        return self._prices[:self._count]
+
+    def sizes(self) -> np.ndarray:
+        """Level sizes, best first, as a view."""
+        return self._sizes[:self._count]
+
+    def depth(self) -> np.ndarray:
+        """Cumulative size from the best level outwards, as a view."""
+        return self._depth[:self._count]
+
+
+class OrderBook:
+    """
+    L2 order book: bid and ask ``BookSide`` arrays updated in bulk.
+
+    Feed code applies batches of ``(side, price, size)`` deltas with
+    ``apply`` (set semantics, size 0 deletes) from any thread; renderers read
+    ``depth()`` under ``lock`` and use ``version`` to skip unchanged frames.
+    No Python object is created per delta.
+
+    Args:
+        levels: Price levels kept per side
+
+    Example:
+        book = OrderBook(levels=1000)
+        book.snapshot(bid_px, bid_sz, ask_px, ask_sz)
+        book.apply(sides, prices, sizes)
+        bid_px, bid_depth, ask_px, ask_depth = book.depth()
+    """
+
+    def __init__(self, levels: int = 1000):
+        self.bids = BookSide(levels, descending=True)
+        self.asks = BookSide(levels, descending=False)
+        self.lock = threading.Lock()
+        self.version = 0
+
+    def apply(self, sides, prices, sizes) -> None:
+        """Applies a batch of L2 deltas: ``sides`` holds ``BID``/``ASK`` per delta."""
+        sides = np.asarray(sides)
+        prices = np.asarray(prices, dtype=np.float64)
+        sizes = np.asarray(sizes, dtype=np.float64)
+        bid = sides == BID
+        with self.lock:
+            self.bids.update(prices[bid], sizes[bid])
+            self.asks.update(prices[~bid], sizes[~bid])
+            self.version += 1
+
+    def snapshot(self, bid_prices, bid_sizes, ask_prices, ask_sizes) -> None:
+        """Replaces the whole book."""
+        with self.lock:
+            self.bids.clear()
+            self.asks.clear()
+            self.bids.update(bid_prices, bid_sizes)
+            self.asks.update(ask_prices, ask_sizes)
+            self.version += 1
+
+    @property
+    def best_bid(self) -> Optional[float]:
+        return self.bids.best
+
+    @property
+    def best_ask(self) -> Optional[float]:
+        return self.asks.best
+
+    @property
+    def mid(self) -> Optional[float]:
+        """Mid price, or None while either side is empty."""
+        if not (len(self.bids) and len(self.asks)):
+            return None
+        return (self.bids.best + self.asks.best) / 2
+
+    @property
+    def spread(self) -> Optional[float]:
+        if not (len(self.bids) and len(self.asks)):
+            return None
+        return self.asks.best - self.bids.best
+
+    def depth(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Returns (bid prices, bid cumulative size, ask prices, ask cumulative size), best first."""
+        return self.bids.prices(), self.bids.depth(), self.asks.prices(), self.asks.depth()
+
+
+class L3OrderBook(OrderBook):
+    """
+    L3 (order-by-order) book aggregated into ``OrderBook`` price levels.
+
+    Orders live in arrays sorted by id that grow by doubling. ``apply_orders``
+    looks up a batch of ids at once, turns every add, modify and delete into
+    signed size changes per price level and applies them with
+    ``BookSide.add``. Levels beyond ``levels`` are dropped from the depth
+    view, so size it for the deepest level you want to draw.
+
+    Args:
+        levels: Price levels kept per side
+        order_capacity: Initial order storage
+    """
+
+    def __init__(self, levels: int = 1000, order_capacity: int = 10_000):
+        super().__init__(levels)
+        capacity = max(order_capacity, 1)
+        self._ids = np.empty(capacity, dtype=np.int64)
+        self._sides = np.empty(capacity, dtype=np.int8)
+        self._order_prices = np.empty(capacity, dtype=np.float64)
+        self._order_sizes = np.empty(capacity, dtype=np.float64)
+        self._orders = 0
+
+    def __len__(self) -> int:
+        return self._orders
+
+    def _columns(self) -> List[np.ndarray]:
+        return [self._ids, self._sides, self._order_prices, self._order_sizes]
+
+    def _reserve(self, size: int) -> None:
+        capacity = self._ids.size
+        if size <= capacity:
+            return
+        while capacity < size:
+            capacity *= 2
+        n = self._orders
+        grown = []
+        for col in self._columns():
+            new = np.empty(capacity, dtype=col.dtype)
+            new[:n] = col[:n]
+            grown.append(new)
+        self._ids, self._sides, self._order_prices, self._order_sizes = grown
+
+    def apply_orders(self, ids, sides, prices, sizes) -> None:
+        """
+        Applies a batch of order events with set semantics.
+
+        An unknown id adds an order, a known id is modified (size and/or
+        price), and a size of zero or less deletes it. Later events for the
+        same id within the batch win.
+        """
+        ids = np.asarray(ids, dtype=np.int64).reshape(-1)
+        if ids.size == 0:
+            return
+        ids, sides, prices, sizes = _last_per_key(
+            ids, np.asarray(sides, dtype=np.int8).reshape(-1),
+            np.asarray(prices, dtype=np.float64).reshape(-1),
+            np.asarray(sizes, dtype=np.float64).reshape(-1))
+
+        with self.lock:
+            n = self._orders
+            pos, found = _locate(self._ids[:n], ids)
+            at = pos[found]
+            live = sizes > 0
+
+            # Level changes: take out what known orders had, put in what they have now
+            level_sides = np.concatenate([self._sides[at], sides[live]])
+            level_prices = np.concatenate([self._order_prices[at], prices[live]])
+            level_sizes = np.concatenate([-self._order_sizes[at], sizes[live]])
+            bid = level_sides == BID
+            self.bids.add(level_prices[bid], level_sizes[bid])
+            self.asks.add(level_prices[~bid], level_sizes[~bid])
+
+            kept = live[found]
+            self._sides[at[kept]] = sides[found][kept]
+            self._order_prices[at[kept]] = prices[found][kept]
+            self._order_sizes[at[kept]] = sizes[found][kept]
+
+            insert = ~found & live
+            remove = at[~kept]
+            if remove.size or insert.any():
+                self._reserve(n + int(insert.sum()))
+                self._orders = _restructure(
+                    self._columns(), n, remove, pos[insert],
+                    [ids[insert], sides[insert], prices[insert], sizes[insert]])
+            self.version += 1
@@ -1,8 +1,332 @@
+"""Series buffers and data update helpers for Pegasus."""
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, Dict, List, Optional, Tuple
+
+import dearpygui.dearpygui as dpg
+import numpy as np
+
+from pegasus.events.handlers import add_visible_handler
+from pegasus.utils.arrays import as_series_array
+
+
+class RingBuffer:
+    """
+    Fixed-capacity circular buffer of one or more float columns.
+
+    Storage is preallocated once as ``(columns, 2 * capacity)`` and every value
+    is written twice, at ``i`` and ``i + capacity``. The most recent ``len(self)``
+    samples are therefore always one contiguous slice, so ``views()`` hands DPG
+    zero-copy windows without ever reallocating or rotating the buffer.
+
+    Args:
+        capacity: Maximum number of samples kept (older samples are overwritten)
+        columns: Number of columns, e.g. 2 for ``(x, y)`` or 5 for OHLC
+        dtype: ``np.float64`` or ``np.float32``
+    """
+
+    def __init__(self, capacity: int, columns: int = 2, dtype=np.float64):
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self.capacity = capacity
+        self.columns = columns
+        self._data = np.zeros((columns, 2 * capacity), dtype=dtype)
+        self._head = 0  # Next write position in [0, capacity)
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def dtype(self) -> np.dtype:
+        return self._data.dtype
+
+    def append(self, *values: float) -> None:
+        """Appends one sample, one value per column, in O(1)."""
+        if len(values) != self.columns:
+            raise ValueError(f"expected {self.columns} values, got {len(values)}")
+        head = self._head
+        self._data[:, head] = values
+        self._data[:, head + self.capacity] = values
+        self._head = (head + 1) % self.capacity
+        self._size = min(self._size + 1, self.capacity)
+
+    def extend(self, *columns) -> None:
+        """
+        Appends a batch of samples, one array per column.
+
+        Cost is proportional to the batch, never to the buffer size. Batches
+        longer than the capacity keep only their last ``capacity`` samples.
+        """
+        if len(columns) != self.columns:
+            raise ValueError(f"expected {self.columns} columns, got {len(columns)}")
+        block = np.asarray(columns, dtype=self._data.dtype)
+        if block.ndim != 2:
+            raise ValueError("columns must be one-dimensional and of equal length")
+        n = block.shape[1]
+        cap = self.capacity
+        if n == 0:
+            return
+        if n > cap:
+            block = block[:, -cap:]
+            n = cap
+
+        head = self._head
+        first = min(n, cap - head)
+        rest = n - first
+        self._data[:, head:head + first] = block[:, :first]
+        self._data[:, head + cap:head + cap + first] = block[:, :first]
+        if rest:
+            self._data[:, :rest] = block[:, first:]
+            self._data[:, cap:cap + rest] = block[:, first:]
+
+        self._head = (head + n) % cap
+        self._size = min(self._size + n, cap)
+
+    def view(self, column: int = 0) -> np.ndarray:
+        """Returns the live samples of one column, oldest first, as a contiguous view."""
+        stop = self._head + self.capacity
+        return self._data[column, stop - self._size:stop]
+
+    def views(self) -> Tuple[np.ndarray, ...]:
+        """Returns contiguous views of every column, oldest sample first."""
+        stop = self._head + self.capacity
+        return tuple(self._data[:, stop - self._size:stop])
+
+    def clear(self) -> None:
+        """Drops all samples without releasing storage."""
+        self._head = 0
+        self._size = 0
+
+
+class GrowableBuffer:
+    """
+    Append-only columns with amortized O(1) growth.
+
+    Storage doubles when full, so appending a batch never copies the existing
+    data more than a constant number of times overall. ``views()`` returns
+    contiguous views of the filled part.
+
+    Args:
+        columns: Number of columns
+        dtype: Column dtype
+        capacity: Initial capacity
+    """
+
+    def __init__(self, columns: int = 1, dtype=np.float64, capacity: int = 1024):
+        self.columns = columns
+        self._data = np.empty((columns, max(capacity, 1)), dtype=dtype)
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _reserve(self, size: int) -> None:
+        capacity = self._data.shape[1]
+        if size <= capacity:
+            return
+        while capacity < size:
+            capacity *= 2
+        data = np.empty((self.columns, capacity), dtype=self._data.dtype)
+        data[:, :self._size] = self._data[:, :self._size]
+        self._data = data
+
+    def extend(self, *columns) -> None:
+        """Appends a batch of samples, one array per column."""
+        if len(columns) != self.columns:
+            raise ValueError(f"expected {self.columns} columns, got {len(columns)}")
+        n = len(columns[0])
+        self._reserve(self._size + n)
+        for i, col in enumerate(columns):
+            self._data[i, self._size:self._size + n] = col
+        self._size += n
+
+    def truncate(self, size: int) -> None:
+        """Drops samples beyond ``size``."""
+        self._size = min(self._size, size)
+
+    def view(self, column: int = 0) -> np.ndarray:
+        """Returns the filled part of one column."""
+        return self._data[column, :self._size]
+
+    def views(self) -> Tuple[np.ndarray, ...]:
+        """Returns the filled part of every column."""
+        return tuple(self._data[:, :self._size])
+
+
+class RingSeries:
+    """
+    DPG series backed by a ``RingBuffer``.
+
+    Feed code calls ``append``/``extend`` as often as data arrives; ``flush``
+    pushes the current window to DPG only if something changed, so it can be
+    called once per frame regardless of the message rate.
+
+    Args:
+        tag: Existing DPG series tag (line, scatter, bar, ...)
+        capacity: Number of most recent samples to keep, e.g. ``5_000_000``
+        columns: Number of series columns
+        dtype: ``np.float64`` or ``np.float32``
+    """
+
+    def __init__(self, tag, capacity: int, columns: int = 2, dtype=np.float64):
+        self.tag = tag
+        self.buffer = RingBuffer(capacity, columns=columns, dtype=dtype)
+        self._dirty = False
+
+    def __len__(self) -> int:
+        return len(self.buffer)
+
+    def append(self, *values: float) -> None:
+        """Appends one sample."""
+        self.buffer.append(*values)
+        self._dirty = True
+
+    def extend(self, *columns) -> None:
+        """Appends a batch of samples."""
+        self.buffer.extend(*columns)
+        self._dirty = True
+
+    def flush(self) -> bool:
+        """Sends the current window to DPG if it changed. Returns True if data was sent."""
+        if not self._dirty:
+            return False
+        update_series_data(self.tag, self.buffer.views())
+        self._dirty = False
+        return True
+
+
+@dataclass
+class FrameUpdateStats:
+    """What one ``UpdateScheduler.apply`` call did."""
+
+    frame: int
+    queue_depth: int  # Updates submitted since the previous frame
+    applied: int  # Series actually touched after coalescing
+    apply_seconds: float
+
+
+class UpdateScheduler:
+    """
+    Collects series updates from any thread and applies them once per frame.
+
+    Feed threads call ``set`` (replace a series' data) or ``append`` (add samples
+    to a ``RingSeries``). Nothing touches DPG until the render thread calls
+    ``apply``, usually through ``install``. Between two frames, repeated ``set``
+    calls for a tag collapse into the latest one and ``append`` batches for a
+    series are concatenated into one ``extend``, so GUI cost is bounded by the
+    frame rate rather than the message rate.
+
+    Submitted arrays are kept by reference until applied and must not be
+    mutated by the caller in the meantime.
+
+    Args:
+        history: Number of per-frame ``FrameUpdateStats`` kept in ``history``
+    """
+
+    def __init__(self, history: int = 600):
+        self._lock = threading.Lock()
+        self._sets: Dict[object, tuple] = {}
+        self._appends: Dict[int, Tuple[RingSeries, List[tuple]]] = {}
+        self._submitted = 0
+        self._frame = 0
+        self.history: Deque[FrameUpdateStats] = deque(maxlen=history)
+
+    def set(self, tag, *columns) -> None:
+        """Schedules replacing the data of series ``tag``; only the latest call per frame is applied."""
+        with self._lock:
+            self._sets[tag] = columns
+            self._submitted += 1
+
+    def append(self, series: RingSeries, *columns) -> None:
+        """Schedules appending samples to ``series``; batches within a frame are merged."""
+        with self._lock:
+            entry = self._appends.get(id(series))
+            if entry is None:
+                self._appends[id(series)] = (series, [columns])
+            else:
+                entry[1].append(columns)
+            self._submitted += 1
+
+    @property
+    def pending(self) -> int:
+        """Number of updates submitted since the last ``apply``."""
+        return self._submitted
+
+    @property
+    def last_stats(self) -> Optional[FrameUpdateStats]:
+        """Stats of the most recent frame, or None before the first ``apply``."""
+        return self.history[-1] if self.history else None
+
+    def apply(self) -> FrameUpdateStats:
+        """Applies all pending updates. Must be called from the render thread."""
+        start = time.perf_counter()
+        with self._lock:
+            sets, self._sets = self._sets, {}
+            appends, self._appends = self._appends, {}
+            submitted, self._submitted = self._submitted, 0
+
+        for tag, columns in sets.items():
+            update_series_data(tag, columns)
+        for series, batches in appends.values():
+            if len(batches) == 1:
+                series.extend(*batches[0])
+            else:
+                series.extend(*(np.concatenate(col) for col in zip(*batches)))
+            series.flush()
+
+        self._frame += 1
+        stats = FrameUpdateStats(
+            frame=self._frame,
+            queue_depth=submitted,
+            applied=len(sets) + len(appends),
+            apply_seconds=time.perf_counter() - start,
+        )
+        self.history.append(stats)
+        return stats
+
+    def install(self, item) -> None:
+        """Calls ``apply`` every frame while ``item`` (typically the primary window) is visible."""
+        add_visible_handler(item, lambda sender=None, app_data=None: self.apply())
+
+
+_default_scheduler = UpdateScheduler()
+
+
+def get_scheduler() -> UpdateScheduler:
+    """Returns the process-wide scheduler used by ``batch_render``."""
+    return _default_scheduler
+
+
 def set_vertex_buffer_size(size: int):
     pass
 
 def update_series_data(tag, data):
-    pass
+    """
+    Replaces the data of an existing series.
+
+    Args:
+        tag: DPG series tag
+        data: Sequence of columns, e.g. ``(x, y)`` for line series or
+            ``(dates, opens, closes, lows, highs)`` for candle series, or a
+            ``RingBuffer`` whose current window is sent. Each column may be a
+            float64/float32 ndarray or any buffer-protocol object and reaches
+            DPG without an intermediate Python list.
+    """
+    if isinstance(data, RingBuffer):
+        data = data.views()
+    dpg.set_value(tag, [as_series_array(col) for col in data])
 
 def batch_render():
-    pass
+    """
+    Applies every update queued on the default scheduler since the last frame.
+
+    Call once per frame from the render thread, or use
+    ``get_scheduler().install(window)`` to have it run automatically.
+
+    Returns:
+        FrameUpdateStats: Queue depth and apply time for this frame
+    """
+    return _default_scheduler.apply()
@@ -0,0 +1,437 @@
+"""Viewport-aware decimation and range indexes for large line, candlestick and scatter series."""
+import weakref
+from typing import List, Tuple
+
+import numpy as np
+
+
+class MinMaxPyramid:
+    """
+    Multi-resolution min/max index over a sorted (x, y) series.
+
+    Level ``k`` groups the raw samples into buckets of ``factor ** k`` points and
+    stores, for every bucket, the index of its minimum and maximum ``y`` value.
+    Querying a visible x-range picks the finest level that still yields no more
+    than ``max_points`` vertices and emits each bucket's min and max in time
+    order, so every spike stays visible at the current zoom.
+
+    Args:
+        x: Sorted (ascending) x values
+        y: y values, same length as x
+        factor: Bucket growth factor between consecutive levels
+    """
+
+    def __init__(self, x, y, factor: int = 4):
+        self.x = np.ascontiguousarray(x, dtype=np.float64)
+        self.y = np.ascontiguousarray(y, dtype=np.float64)
+        if self.x.shape != self.y.shape or self.x.ndim != 1:
+            raise ValueError("x and y must be one-dimensional and of equal length")
+        if factor < 2:
+            raise ValueError("factor must be at least 2")
+        if self.x.size > 1 and np.any(self.x[1:] < self.x[:-1]):
+            raise ValueError("x must be sorted in ascending order")
+        self.factor = factor
+        self._index_dtype = np.int32 if self.x.size < 2**31 else np.int64
+        # Each level: (bucket_size, argmin indices, argmax indices)
+        self._levels: List[Tuple[int, np.ndarray, np.ndarray]] = []
+        self._build()
+
+    def __len__(self) -> int:
+        return self.x.size
+
+    def _build(self) -> None:
+        """Build every level bottom-up, each one reducing the previous by ``factor``."""
+        n = self.x.size
+        f = self.factor
+        if n <= f:
+            return
+
+        # First level straight from the raw samples
+        idx = np.arange(n, dtype=self._index_dtype)
+        imin, imax = self._reduce(idx, idx)
+        size = f
+        self._levels.append((size, imin, imax))
+
+        while imin.size > 1:
+            imin, imax = self._reduce(imin, imax)
+            size *= f
+            self._levels.append((size, imin, imax))
+
+    def _reduce(self, imin: np.ndarray, imax: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Group ``factor`` consecutive buckets and keep the extreme of each group."""
+        f = self.factor
+        pad = (-imin.size) % f
+        if pad:
+            # Repeat the last bucket so the tail group does not change its extremes
+            imin = np.concatenate([imin, np.repeat(imin[-1:], pad)])
+            imax = np.concatenate([imax, np.repeat(imax[-1:], pad)])
+        imin = imin.reshape(-1, f)
+        imax = imax.reshape(-1, f)
+        rows = np.arange(imin.shape[0])
+        new_min = imin[rows, self.y[imin].argmin(axis=1)]
+        new_max = imax[rows, self.y[imax].argmax(axis=1)]
+        return new_min, new_max
+
+    def visible_range(self, x_min: float, x_max: float) -> Tuple[int, int]:
+        """
+        Return the ``[start, stop)`` index range covering ``x_min..x_max``.
+
+        One extra sample is included on each side so the line enters and leaves
+        the plot area instead of stopping short of the edges.
+        """
+        n = self.x.size
+        start = max(int(np.searchsorted(self.x, x_min, side="left")) - 1, 0)
+        stop = min(int(np.searchsorted(self.x, x_max, side="right")) + 1, n)
+        return start, stop
+
+    def query(self, x_min: float, x_max: float, max_points: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Decimate the visible range to at most ``max_points`` vertices (two if it is smaller).
+
+        Args:
+            x_min: Left edge of the visible x-range
+            x_max: Right edge of the visible x-range
+            max_points: Vertex budget, typically twice the plot width in pixels
+
+        Returns:
+            tuple: (x, y) arrays. When the visible range already fits the budget
+            these are views into the raw data and no copy is made.
+        """
+        start, stop = self.visible_range(x_min, x_max)
+        count = stop - start
+        buckets = max(max_points // 2, 1)
+        if count <= max_points or not self._levels:
+            return self.x[start:stop], self.y[start:stop]
+
+        # Finest level whose buckets overlapping the range fit the budget. The top
+        # level is a single bucket, so one always does.
+        for size, imin, imax in self._levels:
+            b0 = start // size
+            b1 = (stop - 1) // size + 1
+            if b1 - b0 <= buckets:
+                break
+
+        lo = imin[b0:b1]
+        hi = imax[b0:b1]
+
+        idx = np.empty(2 * lo.size, dtype=lo.dtype)
+        np.minimum(lo, hi, out=idx[0::2])
+        np.maximum(lo, hi, out=idx[1::2])
+        return self.x[idx], self.y[idx]
+
+
+class OHLCPyramid:
+    """
+    Candles pre-aggregated at several timeframes for zoom-dependent rendering.
+
+    Level 0 is the source data; each further level is built once with
+    ``resample_ohlc`` (first open, max high, min low, last close). Timeframes
+    not coarser than the source bars are skipped. ``query`` picks the finest
+    level that keeps at most ``max_bars_per_pixel`` candles per pixel column
+    across the visible range and returns that level's visible slice as views.
+
+    Args:
+        dates: Sorted bar timestamps (Unix seconds)
+        opens, highs, lows, closes: Price columns
+        timeframes: Coarser levels to build, finest first
+
+    Example:
+        pyramid = OHLCPyramid(dates, opens, highs, lows, closes)
+        level, (d, o, h, l, c) = pyramid.query(x_min, x_max, width=1600)
+    """
+
+    def __init__(self, dates, opens, highs, lows, closes,
+                 timeframes=("M5", "M15", "H1", "D1")):
+        from pegasus.utils.ohlc import resample_ohlc, timeframe_seconds
+        base = tuple(np.ascontiguousarray(col, dtype=np.float64)
+                     for col in (dates, opens, highs, lows, closes))
+        dates = base[0]
+        if dates.size > 1 and np.any(dates[1:] < dates[:-1]):
+            raise ValueError("dates must be sorted in ascending order")
+        base_seconds = float(np.median(np.diff(dates))) if dates.size > 1 else 0.0
+
+        self.names: List[str] = ["source"]
+        self.levels: List[Tuple[np.ndarray, ...]] = [base]
+        for timeframe in timeframes:
+            if timeframe_seconds(timeframe) <= base_seconds:
+                continue
+            self.names.append(str(timeframe))
+            self.levels.append(resample_ohlc(*base, timeframe))
+
+    def __len__(self) -> int:
+        return self.levels[0][0].size
+
+    def visible_range(self, level: int, x_min: float, x_max: float) -> Tuple[int, int]:
+        """``[start, stop)`` bars of ``level`` covering the range, plus one bar on each side."""
+        dates = self.levels[level][0]
+        start = max(int(np.searchsorted(dates, x_min, side="left")) - 1, 0)
+        stop = min(int(np.searchsorted(dates, x_max, side="right")) + 1, dates.size)
+        return start, stop
+
+    def level_for(self, x_min: float, x_max: float, width: float,
+                  max_bars_per_pixel: float = 0.5) -> int:
+        """Finest level whose visible bar count fits ``width * max_bars_per_pixel``."""
+        budget = max(width * max_bars_per_pixel, 1.0)
+        for level in range(len(self.levels)):
+            start, stop = self.visible_range(level, x_min, x_max)
+            if stop - start <= budget:
+                return level
+        return len(self.levels) - 1
+
+    def query(self, x_min: float, x_max: float, width: float,
+              max_bars_per_pixel: float = 0.5) -> Tuple[int, Tuple[np.ndarray, ...]]:
+        """
+        Returns the level to draw and its visible (dates, opens, highs, lows, closes).
+
+        The columns are views into the level's arrays; nothing is copied.
+        """
+        level = self.level_for(x_min, x_max, width, max_bars_per_pixel)
+        start, stop = self.visible_range(level, x_min, x_max)
+        return level, tuple(col[start:stop] for col in self.levels[level])
+
+
+class RangeMinMax:
+    """
+    Range minimum/maximum index over lows and highs (or one y column).
+
+    Values are grouped into blocks of ``block`` samples. A sparse table over
+    the block minima and maxima answers any run of whole blocks with two
+    lookups, and the at most two partial blocks at the ends are scanned
+    directly. A query therefore costs O(block) regardless of the range
+    length, and the index takes about ``2 * n / block * log2(n / block)``
+    floats.
+
+    Args:
+        lows: Values whose minimum is queried (e.g. candle lows or line y)
+        highs: Values whose maximum is queried (defaults to ``lows``)
+        block: Samples per block
+
+    Example:
+        index = RangeMinMax(lows, highs)
+        start, stop = np.searchsorted(dates, (x_min, x_max))
+        y_min, y_max = index.minmax(start, stop)
+    """
+
+    def __init__(self, lows, highs=None, block: int = 64):
+        self.lows = np.ascontiguousarray(lows, dtype=np.float64)
+        self.highs = self.lows if highs is None else np.ascontiguousarray(highs, dtype=np.float64)
+        if self.lows.shape != self.highs.shape or self.lows.ndim != 1:
+            raise ValueError("lows and highs must be one-dimensional and of equal length")
+        self.block = block
+        pad = (-self.lows.size) % block
+        mins = np.concatenate((self.lows, np.full(pad, np.inf))).reshape(-1, block).min(axis=1)
+        maxs = np.concatenate((self.highs, np.full(pad, -np.inf))).reshape(-1, block).max(axis=1)
+        # Level k holds the extreme of 2**k consecutive blocks starting at each block
+        self._mins: List[np.ndarray] = [mins]
+        self._maxs: List[np.ndarray] = [maxs]
+        blocks = mins.size
+        span = 1
+        while 2 * span <= blocks:
+            mins = np.minimum(mins[:-span], mins[span:])
+            maxs = np.maximum(maxs[:-span], maxs[span:])
+            self._mins.append(mins)
+            self._maxs.append(maxs)
+            span *= 2
+
+    def __len__(self) -> int:
+        return self.lows.size
+
+    def minmax(self, start: int, stop: int) -> Tuple[float, float]:
+        """Minimum of ``lows`` and maximum of ``highs`` over ``[start, stop)``."""
+        start = max(int(start), 0)
+        stop = min(int(stop), self.lows.size)
+        if stop <= start:
+            raise ValueError("empty range")
+        b = self.block
+        first, last = start // b, (stop - 1) // b
+        if first == last:
+            return float(self.lows[start:stop].min()), float(self.highs[start:stop].max())
+
+        head, tail = slice(start, (first + 1) * b), slice(last * b, stop)
+        lo = min(self.lows[head].min(), self.lows[tail].min())
+        hi = max(self.highs[head].max(), self.highs[tail].max())
+        count = last - first - 1  # Whole blocks in between
+        if count:
+            level = count.bit_length() - 1
+            mins, maxs = self._mins[level], self._maxs[level]
+            other = last - (1 << level)
+            lo = min(lo, mins[first + 1], mins[other])
+            hi = max(hi, maxs[first + 1], maxs[other])
+        return float(lo), float(hi)
+
+
+class DensityGrid:
+    """
+    Point counts over a fixed fine grid, for density rendering of scatter data.
+
+    The points' bounding box is divided into ``resolution ** 2`` cells. A
+    summed-area table of the cell counts answers "how many points in this
+    box" with four lookups, and re-bins any visible region into an output
+    grid in O(bins) regardless of the number of points. The points are also
+    kept ordered by cell (row by row), so the points inside a box are a few
+    contiguous runs, one per grid row. Above 10k points the box is taken
+    from the 0.1%/99.9% quantiles, so a few far outliers do not squeeze
+    everything else into a handful of cells; points beyond it are kept in
+    ``outliers`` and binned exactly.
+
+    Args:
+        x, y: Point coordinates (NaN points are ignored)
+        resolution: Fine grid cells per axis
+
+    Example:
+        grid = DensityGrid(x, y)
+        if grid.count(x0, x1, y0, y1) < 50_000:
+            idx = grid.points(x0, x1, y0, y1)
+        else:
+            density = grid.histogram(x0, x1, y0, y1, bins_x=640, bins_y=400)
+    """
+
+    def __init__(self, x, y, resolution: int = 2048):
+        self.x = np.asarray(x)
+        self.y = np.asarray(y)
+        if self.x.shape != self.y.shape or self.x.ndim != 1:
+            raise ValueError("x and y must be one-dimensional and of equal length")
+        side = self.side = resolution
+        finite = np.isfinite(self.x) & np.isfinite(self.y)
+        q = (0.001, 0.999) if np.count_nonzero(finite) > 10_000 else (0.0, 1.0)
+        if finite.any():
+            self.x0, x1 = (float(v) for v in np.quantile(self.x[finite], q))
+            self.y0, y1 = (float(v) for v in np.quantile(self.y[finite], q))
+        else:
+            self.x0 = x1 = self.y0 = y1 = 0.0
+        self.cw = (x1 - self.x0) / side or 1.0
+        self.ch = (y1 - self.y0) / side or 1.0
+
+        index_dtype = np.int32 if self.x.size < 2**31 else np.int64
+        with np.errstate(invalid="ignore"):
+            inside = (finite & (self.x >= self.x0) & (self.x <= x1)
+                      & (self.y >= self.y0) & (self.y <= y1))
+            cx = np.minimum((self.x - self.x0) / self.cw, side - 1).astype(np.int64)
+            cy = np.minimum((self.y - self.y0) / self.ch, side - 1).astype(np.int64)
+        cells = cy * side + cx
+        cells[~inside] = side * side  # Trailing bucket that no query reaches
+        self.outliers = np.flatnonzero(finite & ~inside).astype(index_dtype)
+        counts = np.bincount(cells, minlength=side * side + 1)
+        self.starts = np.zeros(counts.size + 1, dtype=index_dtype)
+        np.cumsum(counts, out=self.starts[1:])
+        self.order = np.argsort(cells).astype(index_dtype)
+        # sat[j, i] = points in cells [0, j) x [0, i)
+        self.sat = np.zeros((side + 1, side + 1), dtype=index_dtype)
+        self.sat[1:, 1:] = counts[:-1].reshape(side, side).cumsum(0).cumsum(1)
+
+    def __len__(self) -> int:
+        return self.x.size
+
+    def _edges(self, lo, hi, origin: float, width: float):
+        """Fine grid lines at or just outside ``lo`` and ``hi``, clipped to the grid."""
+        return (int(np.clip(np.floor((lo - origin) / width), 0, self.side)),
+                int(np.clip(np.ceil((hi - origin) / width), 0, self.side)))
+
+    def _box(self, x_min, x_max, y_min, y_max) -> Tuple[int, int, int, int]:
+        i0, i1 = self._edges(x_min, x_max, self.x0, self.cw)
+        j0, j1 = self._edges(y_min, y_max, self.y0, self.ch)
+        return i0, i1, j0, j1
+
+    def _inside(self, idx: np.ndarray, x_min, x_max, y_min, y_max) -> np.ndarray:
+        x, y = self.x[idx], self.y[idx]
+        return idx[(x >= x_min) & (x <= x_max) & (y >= y_min) & (y <= y_max)]
+
+    def count(self, x_min: float, x_max: float, y_min: float, y_max: float) -> int:
+        """Points in the cells overlapping the box (an upper bound of the points inside it)."""
+        i0, i1, j0, j1 = self._box(x_min, x_max, y_min, y_max)
+        sat = self.sat
+        outliers = self._inside(self.outliers, x_min, x_max, y_min, y_max).size
+        return int(sat[j1, i1] - sat[j0, i1] - sat[j1, i0] + sat[j0, i0]) + outliers
+
+    def points(self, x_min: float, x_max: float, y_min: float, y_max: float) -> np.ndarray:
+        """Indices of the points inside the box, in cell order followed by outliers."""
+        outliers = self._inside(self.outliers, x_min, x_max, y_min, y_max)
+        i0, i1, j0, j1 = self._box(x_min, x_max, y_min, y_max)
+        if i1 <= i0 or j1 <= j0:
+            return outliers
+        rows = np.arange(j0, j1) * self.side
+        starts, stops = self.starts[rows + i0], self.starts[rows + i1]
+        counts = stops - starts
+        # Concatenated runs starts[k]:stops[k], one per grid row
+        offsets = np.repeat(starts - np.cumsum(counts) + counts, counts)
+        idx = self._inside(self.order[offsets + np.arange(offsets.size)],
+                           x_min, x_max, y_min, y_max)
+        return np.concatenate((idx, outliers)) if outliers.size else idx
+
+    def histogram(self, x_min: float, x_max: float, y_min: float, y_max: float,
+                  bins_x: int, bins_y: int) -> np.ndarray:
+        """
+        Point density of the box as a float32 ``(bins_y, bins_x)`` array, bottom row first.
+
+        Values are points per unit of data area, so bins of different size are
+        comparable. While the box spans at least one fine cell per bin, each
+        bin is summed from the summed-area table (bin edges snapped to cell
+        edges) and outliers are added exactly; closer in, all points in view
+        are binned exactly.
+        """
+        i0, i1, j0, j1 = self._box(x_min, x_max, y_min, y_max)
+        if i1 - i0 >= bins_x and j1 - j0 >= bins_y:
+            ex = np.linspace(x_min, x_max, bins_x + 1)
+            ey = np.linspace(y_min, y_max, bins_y + 1)
+            fx = np.clip(np.rint((ex - self.x0) / self.cw), i0, i1).astype(np.intp)
+            fy = np.clip(np.rint((ey - self.y0) / self.ch), j0, j1).astype(np.intp)
+            corners = self.sat.take(fy, axis=0).take(fx, axis=1)
+            counts = corners[1:, 1:] - corners[:-1, 1:] - corners[1:, :-1] + corners[:-1, :-1]
+            density = counts.astype(np.float32)
+            # Bins clipped at the grid edge can be empty slivers of zero area
+            area = np.outer(np.diff(fy) * self.ch, np.diff(fx) * self.cw).astype(np.float32)
+            np.divide(density, area, out=density, where=area > 0)
+            outliers = self._inside(self.outliers, x_min, x_max, y_min, y_max)
+            if outliers.size:
+                density += density_histogram(self.x[outliers], self.y[outliers],
+                                             x_min, x_max, y_min, y_max, bins_x, bins_y)
+            return density
+        idx = self.points(x_min, x_max, y_min, y_max)
+        return density_histogram(self.x[idx], self.y[idx], x_min, x_max, y_min, y_max,
+                                 bins_x, bins_y)
+
+
+def density_histogram(x, y, x_min: float, x_max: float, y_min: float, y_max: float,
+                      bins_x: int, bins_y: int) -> np.ndarray:
+    """
+    Exact point density of the box in one pass over the points, like ``DensityGrid.histogram``.
+
+    Cheaper than building a ``DensityGrid`` for a single view, e.g. one
+    exported image. Points outside the box (or NaN) must already be removed.
+    """
+    bx = np.minimum(((x - x_min) * (bins_x / (x_max - x_min))).astype(np.intp), bins_x - 1)
+    by = np.minimum(((y - y_min) * (bins_y / (y_max - y_min))).astype(np.intp), bins_y - 1)
+    counts = np.bincount(by * bins_x + bx, minlength=bins_x * bins_y).astype(np.float32)
+    counts /= np.float32((x_max - x_min) / bins_x * (y_max - y_min) / bins_y)
+    return counts.reshape(bins_y, bins_x)
+
+
+_shared = weakref.WeakValueDictionary()
+
+
+def shared_index(cls, *arrays, **options):
+    """
+    Returns the ``cls(*arrays, **options)`` index, building it once per data set.
+
+    Indexes are cached by the identity of the input arrays and the options, so
+    charts (e.g. the panels of a ``Dashboard``) that are given the same arrays
+    also share one pyramid or range index instead of building a copy each.
+    An index is dropped when the last series using it is garbage collected.
+
+    Args:
+        cls: Index class (e.g. ``MinMaxPyramid``, ``OHLCPyramid``, ``RangeMinMax``)
+        *arrays: Input arrays passed positionally to ``cls``
+        **options: Keyword options passed to ``cls``
+
+    Example:
+        pyramid = shared_index(MinMaxPyramid, x, y, factor=4)
+        assert shared_index(MinMaxPyramid, x, y, factor=4) is pyramid
+    """
+    key = (cls, tuple(id(a) for a in arrays), tuple(sorted(options.items())))
+    index = _shared.get(key)
+    if index is None or any(a is not b for a, b in zip(arrays, index._shared_sources)):
+        index = cls(*arrays, **options)
+        # Keeping the sources alive keeps their ids from being reused while cached
+        index._shared_sources = arrays
+        _shared[key] = index
+    return index
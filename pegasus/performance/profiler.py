@@ -0,0 +1,198 @@
+"""Manual render loop with per-frame phase timings."""
+import csv
+import inspect
+import json
+import os
+import time
+from dataclasses import asdict, dataclass
+from typing import Callable, Dict, Optional
+
+import dearpygui.dearpygui as dpg
+import numpy as np
+
+from pegasus.performance.buffers import RingBuffer, UpdateScheduler, get_scheduler
+
+# Columns recorded per frame, all in seconds except ``callbacks``
+COLUMNS = (
+    "frame",  # Time since the end of the previous frame
+    "apply",  # Scheduler apply (queued series updates)
+    "callbacks",  # Number of DPG callbacks run
+    "callback_total",  # Time spent in all callbacks
+    "callback_max",  # Slowest single callback (callback latency)
+    "render",  # render_dearpygui_frame
+)
+
+
+@dataclass
+class PhaseStats:
+    """Distribution of one recorded column, in milliseconds (or counts for ``callbacks``)."""
+
+    p50: float
+    p99: float
+    max: float
+    mean: float
+
+
+class FrameProfiler:
+    """
+    Low-overhead per-frame timing recorder.
+
+    ``record`` writes one row per frame into a preallocated ``RingBuffer``,
+    so profiling a long session costs a fixed amount of memory and no
+    allocation per frame. Summaries and exports cover the last ``capacity``
+    frames.
+
+    Args:
+        capacity: Number of most recent frames kept
+
+    Example:
+        profiler = chart.enable_profiling(overlay=True)
+        chart.show()
+        profiler.summary()["frame"].p99
+        profiler.export("trace.csv")
+    """
+
+    def __init__(self, capacity: int = 36_000):
+        self.samples = RingBuffer(capacity, columns=len(COLUMNS))
+        self.frames = 0
+
+    def __len__(self) -> int:
+        return len(self.samples)
+
+    def record(self, frame: float, apply: float, callbacks: int, callback_total: float,
+               callback_max: float, render: float) -> None:
+        """Records one frame."""
+        self.samples.append(frame, apply, callbacks, callback_total, callback_max, render)
+        self.frames += 1
+
+    def column(self, name: str) -> np.ndarray:
+        """Returns the recorded values of one column, oldest frame first, as a view."""
+        return self.samples.view(COLUMNS.index(name))
+
+    def summary(self) -> Dict[str, PhaseStats]:
+        """Returns p50/p99/max/mean per column; times are converted to milliseconds."""
+        stats = {}
+        for i, name in enumerate(COLUMNS):
+            values = self.samples.view(i)
+            if values.size == 0:
+                stats[name] = PhaseStats(0.0, 0.0, 0.0, 0.0)
+                continue
+            scale = 1.0 if name == "callbacks" else 1e3
+            p50, p99 = np.percentile(values, (50, 99)) * scale
+            stats[name] = PhaseStats(float(p50), float(p99), float(values.max() * scale),
+                                     float(values.mean() * scale))
+        return stats
+
+    @property
+    def fps(self) -> float:
+        """Frames per second from the median frame time."""
+        frame = self.column("frame")
+        median = float(np.median(frame)) if frame.size else 0.0
+        return 1.0 / median if median > 0 else 0.0
+
+    def export(self, path: str) -> None:
+        """
+        Writes the recorded frames to ``path``.
+
+        ``.json`` files get ``{"columns", "summary", "frames"}`` with one list per
+        column; anything else is written as CSV with one row per frame.
+        """
+        columns = self.samples.views()
+        if os.path.splitext(path)[1].lower() == ".json":
+            trace = {
+                "columns": list(COLUMNS),
+                "summary": {name: asdict(s) for name, s in self.summary().items()},
+                "frames": {name: col.tolist() for name, col in zip(COLUMNS, columns)},
+            }
+            with open(path, "w") as f:
+                json.dump(trace, f)
+            return
+        with open(path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(COLUMNS)
+            writer.writerows(np.column_stack(columns).tolist())
+
+    def overlay_text(self) -> str:
+        """One-line summary used by the overlay."""
+        stats = self.summary()
+        return (f"{self.fps:5.1f} FPS | frame p50 {stats['frame'].p50:.2f} ms "
+                f"p99 {stats['frame'].p99:.2f} ms max {stats['frame'].max:.2f} ms | "
+                f"apply p99 {stats['apply'].p99:.2f} ms | "
+                f"callback p99 {stats['callback_max'].p99:.2f} ms")
+
+
+_arg_counts: Dict[Callable, int] = {}
+
+
+def _run_callbacks(jobs) -> tuple:
+    """Runs queued DPG callbacks like ``dpg.run_callbacks`` and times each one."""
+    if not jobs:
+        return 0, 0.0, 0.0
+    count = 0
+    total = 0.0
+    slowest = 0.0
+    for job in jobs:
+        callback = job[0]
+        if callback is None:
+            continue
+        # Signature inspection is cached; dpg.run_callbacks repeats it per call
+        args = _arg_counts.get(callback)
+        if args is None:
+            args = _arg_counts[callback] = len(inspect.signature(callback).parameters)
+        start = time.perf_counter()
+        callback(*job[1:args + 1])
+        elapsed = time.perf_counter() - start
+        count += 1
+        total += elapsed
+        slowest = max(slowest, elapsed)
+    return count, total, slowest
+
+
+def run_render_loop(profiler: Optional[FrameProfiler] = None,
+                    scheduler: Optional[UpdateScheduler] = None,
+                    overlay=None, overlay_every: int = 30,
+                    max_frames: Optional[int] = None) -> FrameProfiler:
+    """
+    Runs the DPG render loop manually, one ``render_dearpygui_frame`` at a time.
+
+    Each frame applies queued series updates from ``scheduler``, runs queued
+    DPG callbacks and renders, recording how long each phase took. DPG
+    callbacks are only queued for this loop if the app was configured with
+    ``manual_callback_management=True`` (``Chart.enable_profiling`` does
+    this); otherwise DPG runs them on its own thread and only the apply and
+    render phases are measured.
+
+    Args:
+        profiler: Recorder to write into (a new one is created if None)
+        scheduler: Update scheduler applied each frame (defaults to ``get_scheduler()``)
+        overlay: Text item updated with ``FrameProfiler.overlay_text``
+        overlay_every: Frames between overlay updates
+        max_frames: Stop after this many frames (None runs until the viewport closes)
+
+    Returns:
+        FrameProfiler: The recorder
+    """
+    if profiler is None:
+        profiler = FrameProfiler()
+    if scheduler is None:
+        scheduler = get_scheduler()
+    perf_counter = time.perf_counter
+    last = perf_counter()
+    frames = 0
+    while dpg.is_dearpygui_running():
+        start = perf_counter()
+        scheduler.apply()
+        applied = perf_counter()
+        count, total, slowest = _run_callbacks(dpg.get_callback_queue())
+        render_start = perf_counter()
+        dpg.render_dearpygui_frame()
+        end = perf_counter()
+        profiler.record(end - last, applied - start, count, total, slowest, end - render_start)
+        last = end
+
+        frames += 1
+        if overlay is not None and frames % overlay_every == 0:
+            dpg.set_value(overlay, profiler.overlay_text())
+        if max_frames is not None and frames >= max_frames:
+            break
+    return profiler
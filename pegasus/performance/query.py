@@ -0,0 +1,180 @@
+"""Point lookups under the cursor: binary search on sorted x and a uniform grid for scatter data."""
+from typing import List, Tuple
+
+import numpy as np
+
+from pegasus.performance.buffers import GrowableBuffer
+
+
+def nearest_index(x: np.ndarray, value: float, max_distance: float = np.inf) -> int:
+    """
+    Index of the sample of sorted ``x`` closest to ``value`` in O(log n).
+
+    Works on any sorted view, e.g. ``RingBuffer.view(0)`` of a streaming series,
+    so there is nothing to build or update as data arrives.
+
+    Args:
+        x: Sorted (ascending) x values
+        value: Query position
+        max_distance: Largest accepted ``|x[i] - value|``
+
+    Returns:
+        The index, or -1 if ``x`` is empty or the nearest sample is farther than
+        ``max_distance``
+    """
+    n = len(x)
+    if n == 0:
+        return -1
+    i = int(np.searchsorted(x, value))
+    if i == n or (i > 0 and value - x[i - 1] <= x[i] - value):
+        i -= 1
+    return i if abs(x[i] - value) <= max_distance else -1
+
+
+def _ranges(starts: np.ndarray, stops: np.ndarray) -> np.ndarray:
+    """Concatenation of ``arange(start, stop)`` for every pair, without a Python loop."""
+    counts = stops - starts
+    total = int(counts.sum())
+    if total == 0:
+        return np.empty(0, dtype=np.int64)
+    offsets = np.repeat(starts - np.cumsum(counts) + counts, counts)
+    return offsets + np.arange(total)
+
+
+class _Grid:
+    """One static uniform grid over points ``[start, start + size)`` of a ``GridIndex``."""
+
+    def __init__(self, x: np.ndarray, y: np.ndarray, start: int, per_cell: int):
+        self.start = start
+        self.size = x.size
+        ids = np.arange(start, start + x.size)
+        finite = np.isfinite(x) & np.isfinite(y)
+        if not finite.all():
+            x, y, ids = x[finite], y[finite], ids[finite]
+        side = max(int(np.sqrt(x.size / per_cell)), 1)
+        # Bounds from quantiles, so a few outliers do not empty the grid; points
+        # beyond them land in the edge cells
+        q = (0.001, 0.999) if x.size > 10_000 else (0.0, 1.0)
+        self.x0, x1 = np.quantile(x, q) if x.size else (0.0, 1.0)
+        self.y0, y1 = np.quantile(y, q) if y.size else (0.0, 1.0)
+        self.cw = (x1 - self.x0) / side or 1.0
+        self.ch = (y1 - self.y0) / side or 1.0
+        self.side = side
+
+        cells = self._cell(y, self.y0, self.ch) * side + self._cell(x, self.x0, self.cw)
+        order = np.argsort(cells, kind="stable")
+        self.x, self.y, self.ids = x[order], y[order], ids[order]
+        self.starts = np.searchsorted(cells[order], np.arange(side * side + 1))
+
+    def _cell(self, v, origin: float, width: float):
+        return np.clip(np.floor((v - origin) / width), 0, self.side - 1).astype(np.int64)
+
+    def candidates(self, x: float, y: float, rx: float, ry: float) -> np.ndarray:
+        """Sorted positions of all points in cells overlapping the query box."""
+        cx0, cx1 = self._cell(np.array((x - rx, x + rx)), self.x0, self.cw)
+        cy0, cy1 = self._cell(np.array((y - ry, y + ry)), self.y0, self.ch)
+        # Cells of one grid row are consecutive, so each row is a single slice
+        rows = np.arange(cy0, cy1 + 1) * self.side
+        return _ranges(self.starts[rows + cx0], self.starts[rows + cx1 + 1])
+
+
+class GridIndex:
+    """
+    Nearest-point lookups on unsorted (x, y) data, e.g. a scatter plot.
+
+    Points are bucketed into a uniform grid of about ``per_cell`` points per
+    cell, sorted by cell, so the points near the cursor are a few contiguous
+    slices. A lookup scans only the cells overlapping the search radius, so it
+    costs microseconds on millions of points.
+
+    ``extend`` appends points incrementally. New points are scanned directly
+    until ``min_level`` of them have accumulated, then built into a grid of
+    their own; grids of similar size are merged (a binary counter), so each
+    point is re-indexed O(log n) times and a lookup visits O(log n) grids.
+
+    Args:
+        x, y: Initial points
+        per_cell: Target number of points per grid cell
+        min_level: Pending points scanned directly before they are indexed
+
+    Example:
+        index = GridIndex(x, y)
+        i = index.nearest(mouse_x, mouse_y, rx=10 * units_per_px_x, ry=10 * units_per_px_y)
+    """
+
+    def __init__(self, x=(), y=(), per_cell: int = 4, min_level: int = 4096):
+        self.per_cell = per_cell
+        self.min_level = min_level
+        self._points = GrowableBuffer(2, capacity=max(len(x), 1024))
+        self._levels: List[_Grid] = []
+        self._indexed = 0
+        self.extend(x, y)
+
+    def __len__(self) -> int:
+        return len(self._points)
+
+    @property
+    def x(self) -> np.ndarray:
+        return self._points.view(0)
+
+    @property
+    def y(self) -> np.ndarray:
+        return self._points.view(1)
+
+    def extend(self, x, y) -> None:
+        """Appends points; indexes them once ``min_level`` are pending."""
+        if len(x) != len(y):
+            raise ValueError("x and y must be of equal length")
+        self._points.extend(x, y)
+        n = len(self._points)
+        if n - self._indexed < self.min_level:
+            return
+        start = self._indexed
+        while self._levels and self._levels[-1].size <= n - start:
+            start = self._levels.pop().start
+        xs, ys = self._points.views()
+        self._levels.append(_Grid(xs[start:n], ys[start:n], start, self.per_cell))
+        self._indexed = n
+
+    def nearest(self, x: float, y: float, rx: float, ry: float) -> int:
+        """
+        Index of the point closest to ``(x, y)`` inside the ellipse of radii ``rx``, ``ry``.
+
+        Distances are measured in units of the radii, so passing the radius in
+        data units per axis (e.g. 10 pixels converted with each axis' scale)
+        finds the nearest point on screen.
+
+        Returns:
+            The point index, or -1 if no point lies within the radii
+        """
+        xs, ys = self._points.views()
+        pending = slice(self._indexed, len(xs))
+        best, best_d2 = self._closest(x, y, rx, ry, xs[pending], ys[pending],
+                                      np.arange(pending.start, pending.stop), -1, 1.0)
+        # The cells next to the cursor usually hold a close point, which shrinks
+        # the box scanned next; in dense regions that box is then tiny
+        for shrink in (True, False):
+            scale = np.sqrt(best_d2)
+            for level in self._levels:
+                if shrink:
+                    pos = level.candidates(x, y, min(rx, level.cw), min(ry, level.ch))
+                else:
+                    pos = level.candidates(x, y, rx * scale, ry * scale)
+                best, best_d2 = self._closest(x, y, rx, ry, level.x[pos], level.y[pos],
+                                              level.ids[pos], best, best_d2)
+        return best
+
+    @staticmethod
+    def _closest(x, y, rx, ry, gx, gy, ids, best: int, best_d2: float) -> Tuple[int, float]:
+        if gx.size == 0:
+            return best, best_d2
+        d2 = ((gx - x) / rx) ** 2 + ((gy - y) / ry) ** 2
+        np.nan_to_num(d2, copy=False, nan=np.inf)  # Pending points may be NaN gaps
+        k = int(np.argmin(d2))
+        if d2[k] <= best_d2:
+            return int(ids[k]), float(d2[k])
+        return best, best_d2
+
+    def point(self, i: int) -> Tuple[float, float]:
+        """Returns point ``i`` as ``(x, y)``."""
+        return float(self._points.view(0)[i]), float(self._points.view(1)[i])
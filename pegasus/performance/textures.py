@@ -1,8 +1,118 @@
-def create_texture(width, height, data):
-    pass
+"""Dynamic texture helpers for Pegasus."""
+from typing import Dict, Optional, Sequence, Tuple
+
+import dearpygui.dearpygui as dpg
+import numpy as np
+
+# Colormap anchor colors (RGB, 0-1), evenly spaced from low to high values
+COLORMAPS: Dict[str, Sequence[Tuple[float, float, float]]] = {
+    "viridis": [(0.267, 0.005, 0.329), (0.229, 0.322, 0.546), (0.128, 0.567, 0.551),
+                (0.369, 0.789, 0.383), (0.993, 0.906, 0.144)],
+    "magma": [(0.001, 0.000, 0.014), (0.316, 0.071, 0.485), (0.716, 0.215, 0.475),
+              (0.986, 0.533, 0.382), (0.987, 0.991, 0.750)],
+    "gray": [(0.0, 0.0, 0.0), (1.0, 1.0, 1.0)],
+}
+
+
+def colormap_lut(name: str = "viridis", size: int = 256) -> np.ndarray:
+    """
+    Returns a ``(size, 4)`` float32 RGBA lookup table for a colormap in ``COLORMAPS``.
+
+    Anchor colors are linearly interpolated; alpha is 1.
+    """
+    try:
+        anchors = np.asarray(COLORMAPS[name], dtype=np.float64)
+    except KeyError:
+        raise ValueError(f"Unknown colormap {name!r}, expected one of {list(COLORMAPS)}") from None
+    positions = np.linspace(0.0, 1.0, len(anchors))
+    samples = np.linspace(0.0, 1.0, size)
+    lut = np.ones((size, 4), dtype=np.float32)
+    for channel in range(3):
+        lut[:, channel] = np.interp(samples, positions, anchors[:, channel])
+    return lut
+
+
+def apply_colormap(values, vmin: float, vmax: float, lut: np.ndarray,
+                   out: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Maps values to RGBA through ``lut``; values outside ``[vmin, vmax]`` are clamped.
+
+    ``out`` (shape ``values.shape + (4,)``, same dtype as ``lut``) receives
+    the colors directly, e.g. a slice of a texture's pixel buffer, instead of
+    a new array. NaN values get the lowest color.
+    """
+    values = np.asarray(values, dtype=np.float32)
+    top = len(lut) - 1
+    scale = top / (vmax - vmin) if vmax > vmin else 0.0
+    scaled = values - np.float32(vmin)
+    scaled *= np.float32(scale)
+    # fmax/fmin also map NaN to the clamp bound
+    np.fmax(scaled, 0, out=scaled)
+    np.fmin(scaled, top, out=scaled)
+    index = scaled.astype(np.uint8 if top <= 255 else np.intp)
+    if out is None:
+        return lut[index]
+    if lut.flags.c_contiguous and out.flags.c_contiguous and out.dtype == lut.dtype:
+        # Gather whole RGBA pixels as single records instead of four channels
+        pixel = np.dtype((np.void, lut.itemsize * 4))
+        np.take(lut.view(pixel).reshape(-1), index, out=out.view(pixel).reshape(index.shape))
+    else:
+        out[...] = lut[index]
+    return out
+
+
+def create_texture(width, height, data=None, parent=None):
+    """
+    Creates a dynamic RGBA texture.
+
+    Args:
+        width: Texture width in pixels
+        height: Texture height in pixels
+        data: Initial pixels, ``width * height * 4`` floats in [0, 1], row-major
+            from the top row (defaults to transparent black)
+        parent: Texture registry (defaults to ``texture_registry()``)
+
+    Returns:
+        Tag of the DPG dynamic texture
+    """
+    if data is None:
+        data = np.zeros(width * height * 4, dtype=np.float32)
+    # Passed explicitly so textures can be created while a window or plot is
+    # on the container stack
+    if parent is None:
+        parent = texture_registry()
+    return dpg.add_dynamic_texture(width, height, _texture_array(data), parent=parent)
+
+
+_registry = None
+
+
+def texture_registry():
+    """Returns the texture registry Pegasus creates textures in, creating it on first use."""
+    global _registry
+    # DPG ids restart with every context: the id kept from an earlier one may
+    # name an unrelated item now
+    if (_registry is None or not dpg.does_item_exist(_registry)
+            or dpg.get_item_type(_registry) != "mvAppItemType::mvTextureRegistry"):
+        _registry = dpg.add_texture_registry()
+    return _registry
+
 
 def bind_texture_to_series(series_tag, texture_tag):
-    pass
+    """Makes an existing image series draw ``texture_tag``."""
+    dpg.configure_item(series_tag, texture_tag=texture_tag)
+
 
 def update_texture_data(tag, data):
-    pass
+    """
+    Replaces the pixels of a dynamic texture.
+
+    ``data`` may be a float32 array of any shape (e.g. ``(height, width, 4)``);
+    a contiguous float32 array is handed to DPG without conversion.
+    """
+    dpg.set_value(tag, _texture_array(data))
+
+
+def _texture_array(data) -> np.ndarray:
+    """Returns ``data`` as a flat, contiguous float32 array, copying only when needed."""
+    return np.ascontiguousarray(data, dtype=np.float32).reshape(-1)
@@ -1,4 +1,9 @@
+"""Plot axis helpers."""
 import dearpygui.dearpygui as dpg
+import numpy as np
+
+from pegasus.events.handlers import add_visible_handler
+from pegasus.performance.decimation import RangeMinMax, shared_index
 
 def add_plot_legend(parent=None):
     dpg.add_plot_legend(parent=parent)
@@ -12,3 +17,55 @@ mvXAxis = dpg.mvXAxis
 mvYAxis = dpg.mvYAxis
 mvYAxis2 = 1 # Placeholder if not directly exposed in dpg namespace the same way
 mvYAxis3 = 2 # Placeholder
+
+
+class VisibleRangeFit:
+    """
+    Keeps a y-axis fitted to the data inside the visible x-range.
+
+    Each frame the plot is visible, the x-axis limits are compared with the
+    last fit. When they changed, the visible rows are found by binary search
+    on ``x`` and their min/max comes from a ``RangeMinMax`` index, so a zoom or
+    pan over millions of bars costs microseconds. Set ``enabled`` to False to
+    leave the y-axis to the user (e.g. after a manual y zoom).
+
+    Args:
+        plot: Plot tag the visible handler is attached to
+        x_axis: X-axis tag whose limits define the visible range
+        y_axis: Y-axis tag to fit
+        x: Sorted x values
+        lows: Values whose minimum sets the bottom (e.g. candle lows or line y)
+        highs: Values whose maximum sets the top (defaults to ``lows``)
+        padding: Fraction of the visible range added above and below
+    """
+
+    def __init__(self, plot, x_axis, y_axis, x, lows, highs=None, padding: float = 0.05):
+        self.x_axis = x_axis
+        self.y_axis = y_axis
+        self.x = np.ascontiguousarray(x, dtype=np.float64)
+        self.index = shared_index(RangeMinMax, lows, highs)
+        self.padding = padding
+        self.enabled = True
+        self._last_limits = None
+        add_visible_handler(plot, self.refresh)
+
+    def refresh(self, sender=None, app_data=None) -> None:
+        """Refits the y-axis if the visible x-range changed since the last fit."""
+        if not self.enabled or len(self.index) == 0:
+            return
+        limits = tuple(dpg.get_axis_limits(self.x_axis))
+        if limits == self._last_limits:
+            return
+        self._last_limits = limits
+        start = int(np.searchsorted(self.x, limits[0], side="left"))
+        stop = int(np.searchsorted(self.x, limits[1], side="right"))
+        if stop <= start:
+            return
+        lo, hi = self.index.minmax(start, stop)
+        pad = (hi - lo) * self.padding or abs(hi) * self.padding or 1.0
+        dpg.set_axis_limits(self.y_axis, lo - pad, hi + pad)
+
+    def enable(self) -> None:
+        """Turns fitting back on and refits at the next frame."""
+        self.enabled = True
+        self._last_limits = None
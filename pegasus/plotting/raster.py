@@ -0,0 +1,331 @@
+"""Headless NumPy rasterizer: draws charts into RGBA arrays and encodes PNGs without a display."""
+import struct
+import time
+import zlib
+from typing import Tuple
+
+import numpy as np
+
+BACKGROUND = (37, 37, 38, 255)
+PLOT_BACKGROUND = (22, 22, 24, 255)
+GRID_COLOR = (52, 52, 58, 255)
+FRAME_COLOR = (110, 110, 115, 255)
+TEXT_COLOR = (200, 200, 200, 255)
+
+# Line colors for series that have none of their own (e.g. indicators)
+PALETTE = ((255, 200, 0, 255), (180, 120, 255, 255), (255, 120, 200, 255),
+           (120, 200, 255, 255), (255, 150, 80, 255))
+
+# 3x5 bitmap glyphs for tick labels, one string of 0/1 per row
+_GLYPHS = {
+    "0": ("111", "101", "101", "101", "111"), "1": ("010", "110", "010", "010", "111"),
+    "2": ("111", "001", "111", "100", "111"), "3": ("111", "001", "111", "001", "111"),
+    "4": ("101", "101", "111", "001", "001"), "5": ("111", "100", "111", "001", "111"),
+    "6": ("111", "100", "111", "101", "111"), "7": ("111", "001", "001", "001", "001"),
+    "8": ("111", "101", "111", "101", "111"), "9": ("111", "101", "111", "001", "111"),
+    "-": ("000", "000", "111", "000", "000"), "+": ("000", "010", "111", "010", "000"),
+    ".": ("000", "000", "000", "000", "010"), ":": ("000", "010", "000", "010", "000"),
+    "E": ("111", "100", "111", "100", "111"), " ": ("000", "000", "000", "000", "000"),
+}
+_TEXT_SCALE = 2
+# Scaled glyph masks, each followed by one (scaled) column of spacing
+_GLYPH_MASKS = {char: np.kron(np.array([[bit == "1" for bit in row + "0"] for row in rows]),
+                              np.ones((_TEXT_SCALE, _TEXT_SCALE), dtype=bool))
+                for char, rows in _GLYPHS.items()}
+_CHAR_WIDTH = 4 * _TEXT_SCALE
+_CHAR_HEIGHT = 5 * _TEXT_SCALE
+
+# Time-axis tick steps in seconds, finest first
+_TIME_STEPS = (1, 5, 15, 30, 60, 300, 900, 1800, 3600, 3 * 3600, 6 * 3600, 12 * 3600,
+               86400, 2 * 86400, 7 * 86400, 14 * 86400, 30 * 86400, 91 * 86400, 365 * 86400)
+
+
+def encode_png(pixels: np.ndarray, compress_level: int = 6) -> bytes:
+    """
+    Encodes a ``(height, width, 4)`` uint8 RGBA array as PNG bytes.
+
+    Rows are stored unfiltered and deflated with ``zlib``; flat chart
+    backgrounds compress well without PNG's per-row predictors.
+    """
+    height, width = pixels.shape[:2]
+    raw = np.zeros((height, width * 4 + 1), dtype=np.uint8)  # Leading 0: no filter
+    raw[:, 1:] = pixels.reshape(height, -1)
+
+    def chunk(kind: bytes, data: bytes) -> bytes:
+        return (struct.pack(">I", len(data)) + kind + data
+                + struct.pack(">I", zlib.crc32(kind + data) & 0xFFFFFFFF))
+
+    header = struct.pack(">IIBBBBB", width, height, 8, 6, 0, 0, 0)  # 8-bit RGBA
+    return (b"\x89PNG\r\n\x1a\n" + chunk(b"IHDR", header)
+            + chunk(b"IDAT", zlib.compress(raw.tobytes(), compress_level))
+            + chunk(b"IEND", b""))
+
+
+def _pack(colors) -> np.ndarray:
+    """RGBA colors (one, or an ``(n, 4)`` array) as uint32 pixel words."""
+    return np.ascontiguousarray(colors, dtype=np.uint8).view(np.uint32)[..., 0]
+
+
+def _nice_ticks(lo: float, hi: float, count: int) -> np.ndarray:
+    """About ``count`` round tick values (1, 2 or 5 times a power of ten) inside ``[lo, hi]``."""
+    raw = (hi - lo) / max(count, 1)
+    magnitude = 10.0 ** np.floor(np.log10(raw))
+    step = next(m * magnitude for m in (1, 2, 5, 10) if m * magnitude >= raw)
+    first = np.ceil(lo / step) * step
+    return first + step * np.arange(int((hi - first) / step + 1e-9) + 1)
+
+
+def _number_labels(ticks: np.ndarray) -> list:
+    if len(ticks) < 2:
+        return [f"{t:.6g}".upper() for t in ticks]
+    step = ticks[1] - ticks[0]
+    largest = np.abs(ticks).max()
+    if largest >= 1e7 or largest < 1e-4:
+        return [f"{t:.3g}".upper() for t in ticks]
+    decimals = max(int(-np.floor(np.log10(step) + 1e-9)), 0)
+    return [f"{t:.{decimals}f}" for t in ticks]
+
+
+def _time_ticks(lo: float, hi: float, count: int) -> Tuple[np.ndarray, list]:
+    raw = (hi - lo) / max(count, 1)
+    step = next((s for s in _TIME_STEPS if s >= raw), _TIME_STEPS[-1])
+    first = np.ceil(lo / step) * step
+    ticks = first + step * np.arange(int((hi - first) / step) + 1)
+    if step >= 86400:
+        fmt = "%Y-%m-%d"
+    elif hi - lo > 86400:
+        fmt = "%m-%d %H:%M"
+    else:
+        fmt = "%H:%M" if step >= 60 else "%H:%M:%S"
+    return ticks, [time.strftime(fmt, time.gmtime(t)) for t in ticks]
+
+
+def _padded(lo: float, hi: float, fraction: float) -> Tuple[float, float]:
+    if not (np.isfinite(lo) and np.isfinite(hi)):
+        return 0.0, 1.0
+    if hi <= lo:
+        half = abs(lo) * 0.01 or 0.5
+        return lo - half, hi + half
+    pad = (hi - lo) * fraction
+    return lo - pad, hi + pad
+
+
+class RasterPlot:
+    """
+    One plot drawn with NumPy into an RGBA pixel array, without Dear PyGui.
+
+    The constructor paints the background, grid, frame and tick labels;
+    series are then drawn with ``line``, ``candles``, ``points`` and
+    ``image``, clipped to the plot area. Every primitive reduces to vertical
+    pixel spans or an image blit, vectorized over the whole series, so the
+    cost follows the number of pixels drawn rather than the number of points.
+    Pixels are written as whole uint32 words through a view of the array.
+    Titles and legends are not drawn; tick labels use a built-in bitmap font.
+
+    Args:
+        pixels: ``(height, width, 4)`` uint8 array drawn into in place, e.g.
+            one panel of a larger image
+        x_range: Data x limits of the plot area
+        y_range: Data y limits; padded by ``pad_y`` of the span on each side
+        time_axis: Label x ticks as UTC dates and times (Unix seconds)
+        pad_y: Fraction of the y span added above and below
+
+    Example:
+        pixels = np.empty((600, 1000, 4), dtype=np.uint8)
+        plot = RasterPlot(pixels, (x[0], x[-1]), (y.min(), y.max()))
+        plot.line(x, y, (0, 255, 255, 255))
+        png = encode_png(pixels)
+    """
+
+    def __init__(self, pixels: np.ndarray, x_range: Tuple[float, float],
+                 y_range: Tuple[float, float], time_axis: bool = False, pad_y: float = 0.05):
+        self.pixels = pixels
+        # One uint32 per pixel; needs each pixel's 4 bytes contiguous, as in any row slice
+        self.words = words = pixels.view(np.uint32)[..., 0]
+        height, width = words.shape
+        self.x_min, self.x_max = _padded(*x_range, 0.0)
+        self.y_min, self.y_max = _padded(*y_range, pad_y)
+        words[...] = _pack(BACKGROUND)
+
+        # Tick labels decide the left margin, the margins the plot area
+        y_ticks = _nice_ticks(self.y_min, self.y_max, max((height - 40) // 60, 2))
+        y_labels = _number_labels(y_ticks)
+        self.left = max(len(label) for label in y_labels) * _CHAR_WIDTH + 12
+        self.top, self.right, self.bottom = 8, width - 12, height - _CHAR_HEIGHT - 12
+        if self.right - self.left < 2 or self.bottom - self.top < 2:
+            raise ValueError(f"{width}x{height} px is too small for a plot")
+        x_count = max((self.right - self.left) // 120, 2)
+        if time_axis:
+            x_ticks, x_labels = _time_ticks(self.x_min, self.x_max, x_count)
+        else:
+            x_ticks = _nice_ticks(self.x_min, self.x_max, x_count)
+            x_labels = _number_labels(x_ticks)
+
+        words[self.top:self.bottom + 1, self.left:self.right + 1] = _pack(PLOT_BACKGROUND)
+        x_cols = np.rint(self._px(x_ticks)).astype(np.intp)
+        y_rows = np.rint(self._py(y_ticks)).astype(np.intp)
+        grid = _pack(GRID_COLOR)
+        words[self.top:self.bottom, x_cols[(x_cols > self.left) & (x_cols < self.right)]] = grid
+        words[y_rows[(y_rows > self.top) & (y_rows < self.bottom)], self.left:self.right] = grid
+        words[[self.top, self.bottom], self.left:self.right + 1] = _pack(FRAME_COLOR)
+        words[self.top:self.bottom + 1, [self.left, self.right]] = _pack(FRAME_COLOR)
+
+        for row, label in zip(y_rows, y_labels):
+            self.text(self.left - 6 - len(label) * _CHAR_WIDTH, row - _CHAR_HEIGHT // 2, label)
+        drawn_to = -1
+        for col, label in zip(x_cols, x_labels):
+            start = col - len(label) * _CHAR_WIDTH // 2
+            if start > drawn_to + _CHAR_WIDTH and start + len(label) * _CHAR_WIDTH <= width:
+                self.text(start, self.bottom + 6, label)
+                drawn_to = start + len(label) * _CHAR_WIDTH
+
+    def _px(self, x) -> np.ndarray:
+        """Data x to fractional pixel columns."""
+        scale = (self.right - self.left) / (self.x_max - self.x_min)
+        return self.left + (np.asarray(x, dtype=np.float64) - self.x_min) * scale
+
+    def _py(self, y) -> np.ndarray:
+        """Data y to fractional pixel rows (row 0 at the top)."""
+        scale = (self.bottom - self.top) / (self.y_max - self.y_min)
+        return self.bottom - (np.asarray(y, dtype=np.float64) - self.y_min) * scale
+
+    def text(self, col: int, row: int, text: str, color=TEXT_COLOR) -> None:
+        """Draws ``text`` with its top-left corner at pixel ``(col, row)``; unknown characters are blank."""
+        if not text:
+            return
+        blank = _GLYPH_MASKS[" "]
+        mask = np.hstack([_GLYPH_MASKS.get(char, blank) for char in text])
+        height, width = self.words.shape
+        r0, c0 = max(row, 0), max(col, 0)
+        r1, c1 = min(row + mask.shape[0], height), min(col + mask.shape[1], width)
+        if r1 > r0 and c1 > c0:
+            self.words[r0:r1, c0:c1][mask[r0 - row:r1 - row, c0 - col:c1 - col]] = _pack(color)
+
+    def spans(self, cols, top, bottom, colors) -> None:
+        """
+        Fills one vertical run of pixels per entry: column ``cols[k]``, rows
+        ``top[k]`` to ``bottom[k]`` (either order, inclusive), clipped to the
+        plot area. ``colors`` is one RGBA color or one per span.
+        """
+        cols = np.asarray(cols, dtype=np.intp)
+        lo = np.minimum(top, bottom).astype(np.intp)
+        hi = np.maximum(top, bottom).astype(np.intp)
+        colors = _pack(colors)
+        keep = (cols > self.left) & (cols < self.right) & (hi > self.top) & (lo < self.bottom)
+        if not keep.all():
+            cols, lo, hi = cols[keep], lo[keep], hi[keep]
+            if colors.ndim == 1:
+                colors = colors[keep]
+        np.clip(lo, self.top + 1, self.bottom - 1, out=lo)
+        np.clip(hi, self.top + 1, self.bottom - 1, out=hi)
+        lengths = hi - lo + 1
+        # Pixel k of span s sits at row lo[s] + k
+        owner = np.repeat(np.arange(cols.size), lengths)
+        rows = np.arange(owner.size) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+        rows += lo[owner]
+        self.words[rows, cols[owner]] = colors[owner] if colors.ndim == 1 else colors
+
+    def line(self, x, y, color, width: int = 1) -> None:
+        """
+        Draws a polyline through points sorted by ``x``; non-finite points are skipped.
+
+        Each pixel column is filled between the lowest and highest point of
+        the line inside it (its vertices there and where it crosses the
+        column's edges), the envelope a ``MinMaxPyramid`` query keeps, so
+        raw data needs no decimation first and every spike stays visible.
+        The cost is one pass over the points.
+        """
+        x = np.asarray(x, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64)
+        finite = np.isfinite(x) & np.isfinite(y)
+        if not finite.all():
+            x, y = x[finite], y[finite]
+        if x.size == 0:
+            return
+        px, py = self._px(x), self._py(y)
+        first = max(int(np.floor(px[0] + 0.5)), self.left + 1)
+        last = min(int(np.floor(px[-1] + 0.5)), self.right - 1)
+        if last < first:
+            return
+        cols = np.arange(first, last + 1)
+        edges = np.interp(np.arange(first - 0.5, last + 1), px, py)
+        lo = np.minimum(edges[:-1], edges[1:])
+        hi = np.maximum(edges[:-1], edges[1:])
+        vertex_cols = np.floor(px + 0.5).astype(np.intp) - first
+        inside = (vertex_cols >= 0) & (vertex_cols < cols.size)
+        vertex_cols, py = vertex_cols[inside], py[inside]
+        if vertex_cols.size:
+            # Sorted x: the vertices of a column are one run
+            starts = np.flatnonzero(np.diff(vertex_cols, prepend=-1))
+            runs = vertex_cols[starts]
+            lo[runs] = np.minimum(lo[runs], np.minimum.reduceat(py, starts))
+            hi[runs] = np.maximum(hi[runs], np.maximum.reduceat(py, starts))
+        half = (width - 1) / 2
+        self.spans(cols, np.rint(lo - half), np.rint(hi + half), color)
+
+    def candles(self, dates, opens, highs, lows, closes, bull_color, bear_color,
+                weight: float = 0.25) -> None:
+        """
+        Draws candles: a one-pixel wick from high to low and a body from open to close.
+
+        Bodies are ``2 * weight`` of the typical bar spacing wide (at least
+        one pixel), as in DPG's candle series.
+        """
+        dates = np.asarray(dates, dtype=np.float64)
+        if dates.size == 0:
+            return
+        centers = np.rint(self._px(dates)).astype(np.intp)
+        spacing = float(np.median(np.diff(dates))) if dates.size > 1 else 0.0
+        body = max(int(round(2 * weight * spacing * (self.right - self.left)
+                             / (self.x_max - self.x_min))), 1)
+        bull = np.asarray(closes) >= np.asarray(opens)
+        colors = np.where(bull[:, None], np.asarray(bull_color, dtype=np.uint8),
+                          np.asarray(bear_color, dtype=np.uint8))
+        self.spans(centers, np.rint(self._py(highs)), np.rint(self._py(lows)), colors)
+
+        owner = np.repeat(np.arange(dates.size), body)
+        offsets = np.tile(np.arange(body) - (body - 1) // 2, dates.size)
+        self.spans(centers[owner] + offsets, np.rint(self._py(opens))[owner],
+                   np.rint(self._py(closes))[owner], colors[owner])
+
+    def points(self, x, y, color, size: int = 3) -> None:
+        """Draws square markers of ``size`` pixels centered on each point."""
+        cols = np.rint(self._px(x)).astype(np.intp)
+        rows = np.rint(self._py(y)).astype(np.intp)
+        inside = ((cols > self.left) & (cols < self.right)
+                  & (rows > self.top) & (rows < self.bottom))
+        cols, rows = cols[inside], rows[inside]
+        offsets = np.arange(size) - (size - 1) // 2
+        cols = (cols[:, None, None] + offsets[None, None, :]).clip(self.left + 1, self.right - 1)
+        rows = (rows[:, None, None] + offsets[None, :, None]).clip(self.top + 1, self.bottom - 1)
+        self.words[rows, cols] = _pack(color)
+
+    def image(self, rgba: np.ndarray, x_range: Tuple[float, float],
+              y_range: Tuple[float, float]) -> None:
+        """
+        Draws an RGBA image (float in [0, 1] or uint8, row 0 at the top) over
+        the data box ``x_range`` by ``y_range``, with nearest-neighbour
+        sampling and alpha blending.
+        """
+        rows, cols = rgba.shape[:2]
+        c0, c1 = np.rint(self._px(x_range)).astype(np.intp)
+        r0, r1 = np.rint(self._py(y_range[::-1])).astype(np.intp)
+        left, right = max(c0, self.left + 1), min(c1, self.right)
+        top, bottom = max(r0, self.top + 1), min(r1, self.bottom)
+        if right <= left or bottom <= top:
+            return
+        if rgba.dtype != np.uint8:
+            rgba = np.rint(np.clip(rgba, 0.0, 1.0) * 255).astype(np.uint8)
+        src_cols = ((np.arange(left, right) - c0 + 0.5) * cols / max(c1 - c0, 1)).astype(np.intp)
+        src_rows = ((np.arange(top, bottom) - r0 + 0.5) * rows / max(r1 - r0, 1)).astype(np.intp)
+        sample = _pack(rgba)[np.minimum(src_rows, rows - 1)[:, None], np.minimum(src_cols, cols - 1)]
+        alpha = sample.view(np.uint8).reshape(sample.shape + (4,))[..., 3]
+        target = self.words[top:bottom, left:right]
+        if np.all((alpha == 0) | (alpha == 255)):
+            # Opaque or fully transparent pixels (heatmaps, density bins) are copied
+            np.copyto(target, sample, where=alpha == 255)
+            return
+        weight = alpha[..., None] / np.float32(255)
+        colors = sample.view(np.uint8).reshape(sample.shape + (4,))[..., :3]
+        pixels = self.pixels[top:bottom, left:right, :3]
+        pixels[...] = np.rint(colors * weight + pixels * (1 - weight))
@@ -1,5 +1,29 @@
 """Plotting series wrappers for Dear PyGui."""
+from typing import Optional, Tuple
+
 import dearpygui.dearpygui as dpg
+import numpy as np
+
+from pegasus.events.handlers import add_visible_handler
+from pegasus.performance.buffers import RingBuffer
+from pegasus.performance.decimation import DensityGrid, MinMaxPyramid, OHLCPyramid, shared_index
+from pegasus.performance.textures import (apply_colormap, colormap_lut, create_texture,
+                                          update_texture_data)
+from pegasus.utils.arrays import as_series_array, as_series_arrays
+from pegasus.utils.price_charts import KagiBuilder, PointFigureBuilder, RenkoBuilder
+
+# Series longer than this are decimated by default
+DECIMATION_THRESHOLD = 100_000
+
+# Candle series longer than this are rendered through an OHLC pyramid by default
+CANDLE_PYRAMID_THRESHOLD = 20_000
+
+# Scatter series longer than this are drawn as a density texture by default
+DENSITY_THRESHOLD = 200_000
+
+# Vertex budget used before the plot has been laid out and has a real width
+_DEFAULT_PLOT_WIDTH = 1920
+_DEFAULT_PLOT_HEIGHT = 1080
 
 
 def add_candle_series(dates, opens, highs, lows, closes, label="Candlesticks", parent=None,
@@ -9,13 +33,16 @@ def add_candle_series(dates, opens, highs, lows, closes, label="Candlesticks", p
     
     Input matches OHLC standard order: Open, High, Low, Close.
     DPG expects: dates, opens, closes, lows, highs.
+
+    Columns may be float64/float32 ndarrays or any buffer-protocol object; they
+    are handed to DPG without an intermediate Python list.
     
     Args:
-        dates: List of Unix timestamps
-        opens: List of open prices
-        highs: List of high prices
-        lows: List of low prices
-        closes: List of close prices
+        dates: Unix timestamps
+        opens: Open prices
+        highs: High prices
+        lows: Low prices
+        closes: Close prices
         label: Series label
         parent: Parent axis tag
         bull_color: RGBA tuple for bullish candles
@@ -32,51 +59,993 @@ def add_candle_series(dates, opens, highs, lows, closes, label="Candlesticks", p
     }
     if parent is not None:
         kwargs['parent'] = parent
-    
-    dpg.add_candle_series(dates, opens, closes, lows, highs, **kwargs)
 
+    dates, opens, highs, lows, closes = as_series_arrays(dates, opens, highs, lows, closes)
+    return dpg.add_candle_series(dates, opens, closes, lows, highs, **kwargs)
+
+
+def add_line_series(x, y, label="Line", parent=None, decimate: Optional[bool] = None):
+    """
+    Adds a line series to the plot.
+
+    Args:
+        x: Sorted x values
+        y: y values
+        label: Series label
+        parent: Parent axis tag
+        decimate: Render through a viewport-aware min/max pyramid. Defaults to
+            ``True`` for series longer than ``DECIMATION_THRESHOLD`` points.
+
+    Returns:
+        Tag of the created DPG line series
+    """
+    x, y = as_series_arrays(x, y)
+    if decimate is None:
+        decimate = len(x) > DECIMATION_THRESHOLD
+    if decimate:
+        return DecimatedLineSeries(x, y, label=label, parent=parent).tag
+
+    return dpg.add_line_series(x, y, **_series_kwargs(label, parent))
+
+
+class DecimatedLineSeries:
+    """
+    Line series that only sends DPG as many vertices as the plot has pixels.
+
+    A ``MinMaxPyramid`` is built once from the full data. Every frame the plot
+    is visible, the x-axis limits and plot width are compared against the last
+    query; when either changed, the visible range is re-decimated and pushed to
+    the series with ``set_value``. Panning and zooming therefore cost
+    O(pixels) per change instead of O(points) per frame.
+
+    Args:
+        x: Sorted x values
+        y: y values
+        label: Series label
+        parent: Parent y-axis tag (defaults to the current container)
+        x_axis: X-axis tag used to read visible limits (defaults to the first
+            axis of the parent plot)
+        factor: Bucket growth factor of the pyramid
+    """
+
+    def __init__(self, x, y, label: str = "Line", parent=None, x_axis=None, factor: int = 4):
+        self.pyramid = shared_index(MinMaxPyramid, x, y, factor=factor)
+        self._last_query: Optional[Tuple[float, float, int]] = None
+
+        x0, x1 = (self.pyramid.x[0], self.pyramid.x[-1]) if len(self.pyramid) else (0.0, 0.0)
+        xs, ys = self.pyramid.query(x0, x1, 2 * _DEFAULT_PLOT_WIDTH)
+
+        self.tag = dpg.add_line_series(xs, ys, **_series_kwargs(label, parent))
+
+        axis = dpg.get_item_parent(self.tag)
+        self.plot = dpg.get_item_parent(axis)
+        self.x_axis = x_axis if x_axis is not None else dpg.get_item_children(self.plot, 1)[0]
+        add_visible_handler(self.plot, self.refresh)
+
+    def refresh(self, sender=None, app_data=None) -> None:
+        """Re-query the pyramid if the visible x-range or plot width changed."""
+        x_min, x_max = dpg.get_axis_limits(self.x_axis)
+        if x_max <= x_min:
+            return
+        width = dpg.get_item_rect_size(self.plot)[0] or _DEFAULT_PLOT_WIDTH
+        query = (x_min, x_max, width)
+        if query == self._last_query:
+            return
+        self._last_query = query
+        xs, ys = self.pyramid.query(x_min, x_max, 2 * width)
+        dpg.set_value(self.tag, [xs, ys])
+
+
+class PyramidCandleSeries:
+    """
+    Candlestick series that draws the ``OHLCPyramid`` level matching the zoom.
+
+    Whenever the x-axis limits or plot width change, the finest timeframe that
+    keeps at most ``max_bars_per_pixel`` candles per pixel is chosen, and only
+    its bars around the visible range are sent to DPG. The sent range extends
+    half a screen beyond each edge, so small pans are served without
+    re-sending. The candle count on screen stays bounded at any zoom.
+
+    Args:
+        dates, opens, highs, lows, closes: Sorted source bars
+        label: Series label
+        parent: Parent y-axis tag (defaults to the current container)
+        x_axis: X-axis tag used to read visible limits (defaults to the first
+            axis of the parent plot)
+        timeframes: Coarser levels built by the pyramid, finest first
+        max_bars_per_pixel: Candle density above which a coarser level is used
+        bull_color: RGBA tuple for bullish candles
+        bear_color: RGBA tuple for bearish candles
+        weight: Candle body width (0.0 to 1.0)
+    """
+
+    def __init__(self, dates, opens, highs, lows, closes, label: str = "Candlesticks",
+                 parent=None, x_axis=None, timeframes=("M5", "M15", "H1", "D1"),
+                 max_bars_per_pixel: float = 0.5, bull_color=(0, 255, 117, 255),
+                 bear_color=(255, 82, 82, 255), weight=0.25):
+        self.pyramid = shared_index(OHLCPyramid, dates, opens, highs, lows, closes,
+                                    timeframes=timeframes)
+        self.max_bars_per_pixel = max_bars_per_pixel
+        self.level = -1
+        self._sent: Optional[Tuple[float, float]] = None
+        self._last_query: Optional[Tuple[float, float, int]] = None
+
+        empty = np.empty(0, dtype=np.float64)
+        self.tag = add_candle_series(empty, empty, empty, empty, empty, label=label,
+                                     parent=parent, bull_color=bull_color,
+                                     bear_color=bear_color, weight=weight)
+        source = self.pyramid.levels[0][0]
+        if source.size:
+            self._send(source[0], source[-1], _DEFAULT_PLOT_WIDTH)
+
+        axis = dpg.get_item_parent(self.tag)
+        self.plot = dpg.get_item_parent(axis)
+        self.x_axis = x_axis if x_axis is not None else dpg.get_item_children(self.plot, 1)[0]
+        add_visible_handler(self.plot, self.refresh)
+
+    def _send(self, x_min: float, x_max: float, width: float) -> None:
+        level = self.pyramid.level_for(x_min, x_max, width, self.max_bars_per_pixel)
+        if (level == self.level and self._sent is not None
+                and self._sent[0] <= x_min and x_max <= self._sent[1]):
+            return
+        span = x_max - x_min
+        lo, hi = x_min - span / 2, x_max + span / 2
+        start, stop = self.pyramid.visible_range(level, lo, hi)
+        dates, opens, highs, lows, closes = (col[start:stop] for col in self.pyramid.levels[level])
+        dpg.set_value(self.tag, [dates, opens, closes, lows, highs])
+        self.level = level
+        self._sent = (lo, hi)
+
+    def refresh(self, sender=None, app_data=None) -> None:
+        """Re-send the visible bars if the zoom level or visible range moved past the sent bars."""
+        x_min, x_max = dpg.get_axis_limits(self.x_axis)
+        if x_max <= x_min:
+            return
+        width = dpg.get_item_rect_size(self.plot)[0] or _DEFAULT_PLOT_WIDTH
+        query = (x_min, x_max, width)
+        if query == self._last_query:
+            return
+        self._last_query = query
+        self._send(x_min, x_max, width)
+
+
+class MmapLineSeries:
+    """
+    Line series drawn from an out-of-core ``MmapLineSource``.
+
+    Like ``DecimatedLineSeries``, but the data stays on disk: each time the
+    x-axis limits or plot width change, only the chunks covering the visible
+    range are materialized (decimated to about two vertices per pixel), and
+    the neighbouring chunks are prefetched in the background for the next pan.
+
+    Args:
+        source: Line source over memory-mapped columns
+        label: Series label
+        parent: Parent y-axis tag (defaults to the current container)
+        x_axis: X-axis tag used to read visible limits (defaults to the first
+            axis of the parent plot)
+    """
+
+    def __init__(self, source, label: str = "Line", parent=None, x_axis=None):
+        self.source = source
+        self._last_query: Optional[Tuple[float, float, int]] = None
+
+        xs, ys = source.query(*source.bounds, 2 * _DEFAULT_PLOT_WIDTH)
+        self.tag = dpg.add_line_series(xs, ys, **_series_kwargs(label, parent))
+
+        axis = dpg.get_item_parent(self.tag)
+        self.plot = dpg.get_item_parent(axis)
+        self.x_axis = x_axis if x_axis is not None else dpg.get_item_children(self.plot, 1)[0]
+        add_visible_handler(self.plot, self.refresh)
+
+    def refresh(self, sender=None, app_data=None) -> None:
+        """Re-read the visible range if the x-axis limits or plot width changed."""
+        x_min, x_max = dpg.get_axis_limits(self.x_axis)
+        if x_max <= x_min:
+            return
+        width = dpg.get_item_rect_size(self.plot)[0] or _DEFAULT_PLOT_WIDTH
+        query = (x_min, x_max, width)
+        if query == self._last_query:
+            return
+        self._last_query = query
+        xs, ys = self.source.query(x_min, x_max, 2 * width)
+        dpg.set_value(self.tag, [xs, ys])
+
+
+class MmapCandleSeries:
+    """
+    Candlestick series drawn from an out-of-core ``MmapOHLCSource``.
+
+    The visible bars are read from disk whenever the x-axis limits or plot
+    width change, merged down to at most ``max_bars_per_pixel`` candles per
+    pixel, with neighbouring chunks prefetched in the background.
+
+    Args:
+        source: OHLC source over memory-mapped columns
+        label: Series label
+        parent: Parent y-axis tag (defaults to the current container)
+        x_axis: X-axis tag used to read visible limits (defaults to the first
+            axis of the parent plot)
+        max_bars_per_pixel: Candle density above which bars are merged
+        bull_color: RGBA tuple for bullish candles
+        bear_color: RGBA tuple for bearish candles
+        weight: Candle body width (0.0 to 1.0)
+    """
+
+    def __init__(self, source, label: str = "Candlesticks", parent=None, x_axis=None,
+                 max_bars_per_pixel: float = 0.5, bull_color=(0, 255, 117, 255),
+                 bear_color=(255, 82, 82, 255), weight=0.25):
+        self.source = source
+        self.max_bars_per_pixel = max_bars_per_pixel
+        self._last_query: Optional[Tuple[float, float, int]] = None
+
+        dates, opens, highs, lows, closes = source.query(
+            *source.bounds, int(_DEFAULT_PLOT_WIDTH * max_bars_per_pixel))
+        self.tag = add_candle_series(dates, opens, highs, lows, closes, label=label,
+                                     parent=parent, bull_color=bull_color,
+                                     bear_color=bear_color, weight=weight)
+
+        axis = dpg.get_item_parent(self.tag)
+        self.plot = dpg.get_item_parent(axis)
+        self.x_axis = x_axis if x_axis is not None else dpg.get_item_children(self.plot, 1)[0]
+        add_visible_handler(self.plot, self.refresh)
+
+    def refresh(self, sender=None, app_data=None) -> None:
+        """Re-read the visible bars if the x-axis limits or plot width changed."""
+        x_min, x_max = dpg.get_axis_limits(self.x_axis)
+        if x_max <= x_min:
+            return
+        width = dpg.get_item_rect_size(self.plot)[0] or _DEFAULT_PLOT_WIDTH
+        query = (x_min, x_max, width)
+        if query == self._last_query:
+            return
+        self._last_query = query
+        dates, opens, highs, lows, closes = self.source.query(
+            x_min, x_max, max(int(width * self.max_bars_per_pixel), 1))
+        dpg.set_value(self.tag, [dates, opens, closes, lows, highs])
+
+
+class LiveCandleSeries:
+    """
+    Candlestick series fed by a ``TimeframeBars`` from a ``BarAggregator``.
+
+    Closed bars and the open bar are drawn by two DPG candle series sharing a
+    label. While a bar is still open only the one-candle live series is re-sent;
+    the history series is re-sent only when a bar closes.
+
+    Args:
+        bars: ``TimeframeBars`` to render (e.g. ``aggregator["M5"]``)
+        label: Series label
+        parent: Parent y-axis tag
+        bull_color: RGBA tuple for bullish candles
+        bear_color: RGBA tuple for bearish candles
+        weight: Candle body width (0.0 to 1.0)
+    """
+
+    def __init__(self, bars, label: str = "Candlesticks", parent=None,
+                 bull_color=(0, 255, 117, 255), bear_color=(255, 82, 82, 255), weight=0.25):
+        self.bars = bars
+        self._closed_version = -1
+        self._open_version = -1
+        empty = np.empty(0, dtype=np.float64)
+        tags = []
+        for _ in range(2):
+            tags.append(add_candle_series(empty, empty, empty, empty, empty, label=label,
+                                          parent=parent, bull_color=bull_color,
+                                          bear_color=bear_color, weight=weight))
+        self.history_tag, self.live_tag = tags
+        self.flush()
+
+    def flush(self) -> bool:
+        """Re-sends whatever changed since the last call. Returns True if data was sent."""
+        bars = self.bars
+        with bars.lock:
+            sent = False
+            if bars.closed_version != self._closed_version:
+                t, o, h, l, c = bars.closed.views()
+                dpg.set_value(self.history_tag, [t, o, c, l, h])
+                self._closed_version = bars.closed_version
+                sent = True
+            if bars.open_version != self._open_version:
+                if bars.open_bar is None:
+                    columns = [np.empty(0, dtype=np.float64)] * 5
+                else:
+                    t, o, h, l, c = (bars.open_bar[i:i + 1] for i in range(5))
+                    columns = [t, o, c, l, h]
+                dpg.set_value(self.live_tag, columns)
+                self._open_version = bars.open_version
+                sent = True
+        return sent
+
+
+def _indicator_labels(indicator) -> list:
+    if len(indicator.outputs) == 1:
+        return [indicator.label]
+    return [f"{indicator.label} {name}" for name in indicator.outputs]
+
+
+def add_indicator_series(indicator, dates, opens, highs, lows, closes, parent=None,
+                         decimate: Optional[bool] = None) -> list:
+    """
+    Adds one line series per output of ``indicator`` computed over a full history.
+
+    Warm-up bars (NaN) are not sent. Long histories are decimated like
+    ``add_line_series``.
+
+    Args:
+        indicator: ``pegasus.indicators.Indicator`` instance, e.g. ``SMA(20)``
+        dates, opens, highs, lows, closes: OHLC columns
+        parent: Parent y-axis tag
+        decimate: Passed to ``add_line_series``
+
+    Returns:
+        list: Tags of the created line series
+    """
+    dates = as_series_array(dates)
+    columns = indicator.compute(dates, opens, highs, lows, closes)
+    skip = indicator.warmup
+    return [add_line_series(dates[skip:], values[skip:], label=label, parent=parent,
+                            decimate=decimate)
+            for label, values in zip(_indicator_labels(indicator), columns)]
+
+
+class IndicatorSeries:
+    """
+    Live indicator lines over a ``TimeframeBars``.
+
+    Values of closed bars are kept in a ``RingBuffer`` the size of the bar
+    history and are computed once, with ``Indicator.push``, when their bar
+    closes. The open bar is evaluated with ``Indicator.peek`` and drawn as a
+    separate two-point tail series under the same label, so a tick that only
+    moves the open bar recomputes and re-sends one value per output.
+
+    Args:
+        indicator: ``pegasus.indicators.Indicator`` instance (its state is reset)
+        bars: ``TimeframeBars`` to follow
+        parent: Parent y-axis tag
+    """
+
+    # More newly closed bars than this are recomputed vectorized instead of pushed
+    _RELOAD_BARS = 1024
+
+    def __init__(self, indicator, bars, parent=None):
+        self.indicator = indicator
+        self.bars = bars
+        self.values = RingBuffer(bars.closed.capacity, columns=1 + len(indicator.outputs))
+        self._pushed = 0
+        self._closed_version = -1
+        self._open_version = -1
+        self._resets = bars.resets
+        empty = np.empty(0, dtype=np.float64)
+        self.history_tags = []
+        self.tail_tags = []
+        for label in _indicator_labels(indicator):
+            self.history_tags.append(dpg.add_line_series(empty, empty,
+                                                         **_series_kwargs(label, parent)))
+            self.tail_tags.append(dpg.add_line_series(empty, empty,
+                                                      **_series_kwargs(label, parent)))
+        with bars.lock:
+            self._reload(*bars.closed.views())
+        self.flush()
+
+    def _reload(self, t, o, h, l, c) -> None:
+        self.values.clear()
+        self.values.extend(t, *self.indicator.load(t, o, h, l, c))
+        self._pushed = len(t)
+
+    def flush(self) -> bool:
+        """Re-sends whatever changed since the last call. Returns True if data was sent."""
+        bars = self.bars
+        with bars.lock:
+            sent = False
+            if bars.closed_version != self._closed_version:
+                if bars.resets != self._resets:
+                    # Bars were cleared and reloaded (e.g. a replay seek): start over
+                    self._reload(*bars.closed.views())
+                    self._resets = bars.resets
+                self._push_closed(*bars.closed.views())
+                x, *columns = self.values.views()
+                skip = max(self.indicator.warmup - (self._pushed - len(self.values)), 0)
+                for tag, y in zip(self.history_tags, columns):
+                    dpg.set_value(tag, [x[skip:], y[skip:]])
+                self._closed_version = bars.closed_version
+                self._open_version = -1  # The tail starts at the last closed value
+                sent = True
+            if bars.open_version != self._open_version:
+                self._send_tail(bars.open_bar)
+                self._open_version = bars.open_version
+                sent = True
+        return sent
+
+    def _push_closed(self, t, o, h, l, c) -> None:
+        last = self.values.view(0)
+        start = int(np.searchsorted(t, last[-1], side="right")) if len(last) else 0
+        if t.size - start > self._RELOAD_BARS:
+            self._reload(t, o, h, l, c)
+            return
+        push = self.indicator.push
+        for i in range(start, t.size):
+            self.values.append(t[i], *push(t[i], o[i], h[i], l[i], c[i]))
+        self._pushed += t.size - start
+
+    def _send_tail(self, bar) -> None:
+        if bar is None:
+            empty = np.empty(0, dtype=np.float64)
+            for tag in self.tail_tags:
+                dpg.set_value(tag, [empty, empty])
+            return
+        live = self.indicator.peek(*bar)
+        for k, (tag, value) in enumerate(zip(self.tail_tags, live)):
+            x, y = [bar[0]], [value]
+            if len(self.values):
+                x.insert(0, self.values.view(0)[-1])
+                y.insert(0, self.values.view(k + 1)[-1])
+            dpg.set_value(tag, [np.array(x), np.array(y)])
+
+
+class DepthSeries:
+    """
+    Cumulative depth chart of an ``OrderBook``: two shaded stair series.
+
+    ``flush`` re-sends both sides only when the book's ``version`` changed, so
+    it can run every frame (e.g. from ``add_visible_handler``) however fast
+    the book is updated.
+
+    Args:
+        book: ``OrderBook`` or ``L3OrderBook`` to render
+        parent: Parent y-axis tag
+        bid_label: Label of the bid series
+        ask_label: Label of the ask series
+    """
+
+    def __init__(self, book, parent=None, bid_label: str = "Bids", ask_label: str = "Asks"):
+        self.book = book
+        self._version = -1
+        empty = np.empty(0, dtype=np.float64)
+        self.bid_tag = dpg.add_stair_series(empty, empty, shaded=True,
+                                            **_series_kwargs(bid_label, parent))
+        self.ask_tag = dpg.add_stair_series(empty, empty, shaded=True,
+                                            **_series_kwargs(ask_label, parent))
+        self.flush()
+
+    def flush(self, sender=None, app_data=None) -> bool:
+        """Re-sends the depth if the book changed. Returns True if data was sent."""
+        book = self.book
+        with book.lock:
+            if book.version == self._version:
+                return False
+            bid_prices, bid_depth, ask_prices, ask_depth = book.depth()
+            # Bids are stored best (highest) first; plot them by ascending price
+            dpg.set_value(self.bid_tag, list(as_series_arrays(bid_prices[::-1], bid_depth[::-1])))
+            dpg.set_value(self.ask_tag, [ask_prices, ask_depth])
+            self._version = book.version
+        return True
+
+
+class SpectrogramSeries:
+    """
+    Scrolling spectrogram drawn from a dynamic texture.
+
+    The texture is ``history`` columns (frames) wide and ``bins`` rows tall.
+    ``push`` colors only the new frames and writes them into the columns
+    after the last one written, wrapping around like a ring buffer; nothing
+    is shifted. The texture is drawn by two image series whose texture
+    coordinates are rotated so the oldest column is always on the left.
+    ``flush`` uploads the texture once per frame, and only if something was
+    pushed.
+
+    Args:
+        bins: Frequency bins per frame (e.g. ``SlidingSpectrum.bins``)
+        history: Number of frames visible
+        parent: Parent y-axis tag
+        frame_seconds: X-axis distance between frames
+        max_frequency: Y-axis value of the top row
+        vmin: Value mapped to the lowest color (e.g. dB floor)
+        vmax: Value mapped to the highest color
+        colormap: Name from ``COLORMAPS``
+        label: Series label
+
+    Example:
+        spectrum = SlidingSpectrum(1024, 256, sample_rate=48_000)
+        spectrogram = SpectrogramSeries(spectrum.bins, parent=y_axis,
+                                        frame_seconds=spectrum.frame_seconds,
+                                        max_frequency=spectrum.frequencies[-1])
+        spectrogram.push(spectrum.push(block))
+    """
+
+    def __init__(self, bins: int, history: int = 512, parent=None, frame_seconds: float = 1.0,
+                 max_frequency: float = 1.0, vmin: float = -100.0, vmax: float = 0.0,
+                 colormap: str = "viridis", label: str = "Spectrogram"):
+        self.bins = bins
+        self.history = history
+        self.frame_seconds = frame_seconds
+        self.max_frequency = max_frequency
+        self.vmin = vmin
+        self.vmax = vmax
+        self.lut = colormap_lut(colormap)
+        self.frames = 0
+        self._pixels = np.zeros((bins, history, 4), dtype=np.float32)
+        self._dirty = False
+
+        self.texture = create_texture(history, bins, self._pixels)
+        # Oldest columns, then the columns written since the ring last wrapped
+        self.tags = [
+            dpg.add_image_series(self.texture, (0.0, 0.0), (0.0, 0.0),
+                                 **_series_kwargs(label, parent)),
+            dpg.add_image_series(self.texture, (0.0, 0.0), (0.0, 0.0),
+                                 **_series_kwargs(label, parent)),
+        ]
+
+    def push(self, magnitudes) -> None:
+        """Writes ``(frames, bins)`` magnitudes into the columns after the newest one."""
+        magnitudes = np.asarray(magnitudes)
+        if magnitudes.size == 0:
+            return
+        self.frames += magnitudes.shape[0]
+        # Frames older than the visible history would be overwritten anyway
+        magnitudes = magnitudes[-self.history:]
+        count = magnitudes.shape[0]
+        columns = (self.frames - count + np.arange(count)) % self.history
+        # Row 0 is the top of the image: highest frequency first
+        colors = apply_colormap(magnitudes[:, ::-1], self.vmin, self.vmax, self.lut)
+        self._pixels[:, columns] = colors.transpose(1, 0, 2)
+        self._dirty = True
 
-def add_line_series(x, y, label="Line", parent=None):
-    """Adds a line series to the plot."""
-    dpg.add_line_series(x, y, label=label, parent=parent)
+    def flush(self, sender=None, app_data=None) -> bool:
+        """Uploads the texture and moves the images if frames were pushed."""
+        if not self._dirty:
+            return False
+        update_texture_data(self.texture, self._pixels)
+
+        step = self.frame_seconds
+        total = self.frames
+        head = total % self.history
+        if total <= self.history:
+            parts = [(0, total, 0.0)]
+        else:
+            oldest = total - self.history
+            parts = [(head, self.history, oldest * step),
+                     (0, head, (oldest + self.history - head) * step)]
+        for tag, part in zip(self.tags, parts + [(0, 0, 0.0)]):
+            first, stop, x0 = part
+            x1 = x0 + (stop - first) * step
+            dpg.configure_item(tag, show=stop > first,
+                               bounds_min=(x0, 0.0), bounds_max=(x1, self.max_frequency),
+                               uv_min=(first / self.history, 0.0),
+                               uv_max=(stop / self.history, 1.0))
+        self._dirty = False
+        return True
+
+
+def _series_kwargs(label, parent) -> dict:
+    """Series keyword arguments; parent is only passed if explicitly provided."""
+    kwargs = {'label': label}
+    if parent is not None:
+        kwargs['parent'] = parent
+    return kwargs
 
 
 def add_scatter_series(x, y, label="Scatter", parent=None):
     """Adds a scatter series to the plot."""
-    dpg.add_scatter_series(x, y, label=label, parent=parent)
+    x, y = as_series_arrays(x, y)
+    return dpg.add_scatter_series(x, y, **_series_kwargs(label, parent))
+
+
+def density_pixels(density: np.ndarray, lut: np.ndarray,
+                   out: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Colors a bottom-row-first density grid as float32 RGBA pixels, top row first.
+
+    Densities are log-scaled relative to the sparsest non-empty bin and mapped
+    through ``lut``; empty bins are transparent.
+    """
+    filled = density > 0
+    lowest = np.min(density, where=filled, initial=np.inf)
+    levels = np.log(np.maximum(density * np.float32(1 / lowest), 1.0)) if filled.any() \
+        else np.zeros(density.shape, dtype=np.float32)
+    out = apply_colormap(levels[::-1], 0.0, float(levels.max()) or 1.0, lut, out=out)
+    out[..., 3] = filled[::-1]
+    return out
+
+
+class DensityScatterSeries:
+    """
+    Scatter series that draws point density instead of markers when crowded.
+
+    A ``DensityGrid`` is built once from the points. Every time the axis
+    limits or plot size change, the visible region is counted with the grid's
+    summed-area table. Up to ``marker_threshold`` points in view are sent to
+    DPG as ordinary markers. Above that, the region is re-binned into one bin
+    per ``bin_pixels`` pixels and drawn as a texture, with log-scaled density
+    mapped through a colormap and empty bins left transparent. Zoomed out, the
+    cost depends on the number of bins, not points, so it stays flat from 10k
+    to 100M points.
+
+    Args:
+        x, y: Point coordinates
+        label: Series label
+        parent: Parent y-axis tag (defaults to the current container)
+        x_axis: X-axis tag used to read visible limits (defaults to the first
+            axis of the parent plot)
+        marker_threshold: Most points in view drawn as markers
+        bin_pixels: Bin size in pixels
+        colormap: Name from ``COLORMAPS``
+        resolution: Fine grid cells per axis of the ``DensityGrid``
+    """
+
+    def __init__(self, x, y, label: str = "Scatter", parent=None, x_axis=None,
+                 marker_threshold: int = 50_000, bin_pixels: int = 2,
+                 colormap: str = "viridis", resolution: int = 2048):
+        self.grid = shared_index(DensityGrid, as_series_array(x), as_series_array(y),
+                                 resolution=resolution)
+        self.label = label
+        self.marker_threshold = marker_threshold
+        self.bin_pixels = bin_pixels
+        self.lut = colormap_lut(colormap)
+        self.markers = True
+        self.visible = np.empty(0, dtype=np.intp)  # Points sent as markers
+        self.density: Optional[np.ndarray] = None  # Bins drawn, bottom row first
+        self.box: Optional[Tuple[float, float, float, float]] = None
+        self.texture = None
+        self.image = None
+        self._pixels: Optional[np.ndarray] = None
+        self._last_query: Optional[Tuple[float, ...]] = None
+
+        empty = np.empty(0, dtype=np.float64)
+        self.tag = dpg.add_scatter_series(empty, empty, **_series_kwargs(label, parent))
+        self.y_axis = dpg.get_item_parent(self.tag)
+        self.plot = dpg.get_item_parent(self.y_axis)
+        self.x_axis = x_axis if x_axis is not None else dpg.get_item_children(self.plot, 1)[0]
+
+        grid = self.grid
+        self._update(grid.x0, grid.x0 + grid.side * grid.cw, grid.y0,
+                     grid.y0 + grid.side * grid.ch, _DEFAULT_PLOT_WIDTH, _DEFAULT_PLOT_HEIGHT)
+        add_visible_handler(self.plot, self.refresh)
+
+    def refresh(self, sender=None, app_data=None) -> None:
+        """Re-bins the visible region if the axis limits or plot size changed."""
+        x_min, x_max = dpg.get_axis_limits(self.x_axis)
+        y_min, y_max = dpg.get_axis_limits(self.y_axis)
+        if x_max <= x_min or y_max <= y_min:
+            return
+        width, height = dpg.get_item_rect_size(self.plot)
+        query = (x_min, x_max, y_min, y_max, width, height)
+        if query == self._last_query:
+            return
+        self._last_query = query
+        self._update(x_min, x_max, y_min, y_max, width or _DEFAULT_PLOT_WIDTH,
+                     height or _DEFAULT_PLOT_HEIGHT)
+
+    def _update(self, x_min, x_max, y_min, y_max, width, height) -> None:
+        grid = self.grid
+        if grid.count(x_min, x_max, y_min, y_max) <= self.marker_threshold:
+            self.visible = grid.points(x_min, x_max, y_min, y_max)
+            dpg.set_value(self.tag, [grid.x[self.visible], grid.y[self.visible]])
+            self._show_markers(True)
+            return
+
+        bins_x = max(int(width // self.bin_pixels), 1)
+        bins_y = max(int(height // self.bin_pixels), 1)
+        density = grid.histogram(x_min, x_max, y_min, y_max, bins_x, bins_y)
+        self.density, self.box = density, (x_min, x_max, y_min, y_max)
+        shape = (bins_y, bins_x, 4)
+        resized = self._pixels is None or self._pixels.shape != shape
+        if resized:
+            self._pixels = np.empty(shape, dtype=np.float32)
+        density_pixels(density, self.lut, out=self._pixels)
+
+        bounds = {"bounds_min": (x_min, y_min), "bounds_max": (x_max, y_max)}
+        if self.image is None:
+            self.texture = create_texture(bins_x, bins_y, self._pixels)
+            self.image = dpg.add_image_series(self.texture, **bounds,
+                                              **_series_kwargs(self.label, self.y_axis))
+        elif resized:
+            old, self.texture = self.texture, create_texture(bins_x, bins_y, self._pixels)
+            dpg.configure_item(self.image, texture_tag=self.texture, **bounds)
+            dpg.delete_item(old)
+        else:
+            update_texture_data(self.texture, self._pixels)
+            dpg.configure_item(self.image, **bounds)
+        self._show_markers(False)
+
+    def _show_markers(self, markers: bool) -> None:
+        if markers != self.markers:
+            dpg.configure_item(self.tag, show=markers)
+            if self.image is not None:
+                dpg.configure_item(self.image, show=not markers)
+        self.markers = markers
+
+    def nearest(self, x: float, y: float, rx: float, ry: float) -> int:
+        """Index of the closest marker within radii ``rx``/``ry``, or -1 (also in density mode)."""
+        if not self.markers or self.visible.size == 0:
+            return -1
+        xs, ys = self.grid.x[self.visible], self.grid.y[self.visible]
+        d2 = ((xs - x) / rx) ** 2 + ((ys - y) / ry) ** 2
+        k = int(np.argmin(d2))
+        return int(self.visible[k]) if d2[k] <= 1.0 else -1
+
+    def bin_count(self, x: float, y: float) -> Optional[float]:
+        """Approximate number of points in the drawn bin under ``(x, y)`` (density mode only)."""
+        if self.markers or self.density is None:
+            return None
+        x_min, x_max, y_min, y_max = self.box
+        if not (x_min <= x < x_max and y_min <= y < y_max):
+            return None
+        rows, cols = self.density.shape
+        col = int((x - x_min) / (x_max - x_min) * cols)
+        row = int((y - y_min) / (y_max - y_min) * rows)
+        area = (x_max - x_min) / cols * (y_max - y_min) / rows
+        return float(self.density[row, col] * area)
 
 
 def add_bar_series(x, y, label="Bar", parent=None):
     """Adds a bar series to the plot."""
-    dpg.add_bar_series(x, y, label=label, parent=parent)
+    x, y = as_series_arrays(x, y)
+    return dpg.add_bar_series(x, y, **_series_kwargs(label, parent))
 
 
 def add_ohlc_series(dates, opens, highs, lows, closes, label="OHLC", parent=None):
     """Adds an OHLC series (uses candlestick renderer)."""
-    dpg.add_candle_series(dates, opens, closes, lows, highs, label=label, parent=parent)
+    dates, opens, highs, lows, closes = as_series_arrays(dates, opens, highs, lows, closes)
+    return dpg.add_candle_series(dates, opens, closes, lows, highs,
+                                 **_series_kwargs(label, parent))
 
 
-# Stubs for advanced chart types (to be implemented)
-def add_renko_series(data, label="Renko", parent=None):
-    """Placeholder for Renko chart series."""
-    pass
+def add_renko_series(data, box_size: float, times=None, label="Renko", parent=None,
+                     bull_color=(0, 255, 117, 255), bear_color=(255, 82, 82, 255),
+                     weight=0.9, base: Optional[float] = None):
+    """
+    Adds a Renko series built from a price stream.
 
+    Args:
+        data: Prices (ticks or closes)
+        box_size: Brick height in price units
+        times: Optional timestamps per price (bricks are indexed by position either way)
+        label: Series label
+        parent: Parent axis tag
+        bull_color: RGBA tuple for up bricks
+        bear_color: RGBA tuple for down bricks
+        weight: Brick width (0.0 to 1.0)
+        base: Price the brick grid is anchored to (defaults to the first price)
 
-def add_kagi_series(data, label="Kagi", parent=None):
-    """Placeholder for Kagi chart series."""
-    pass
+    Returns:
+        RenkoSeries: Call ``extend`` with new prices to add bricks
+
+    Example:
+        renko = add_renko_series(closes, box_size=0.0010, parent="y_axis")
+        renko.extend(new_closes)
+    """
+    return RenkoSeries(data, box_size, times=times, label=label, parent=parent,
+                       bull_color=bull_color, bear_color=bear_color, weight=weight, base=base)
 
 
-def add_point_figure_series(data, label="Point & Figure", parent=None):
-    """Placeholder for Point & Figure chart series."""
-    pass
+def add_kagi_series(data, reversal: float, times=None, label="Kagi", parent=None):
+    """
+    Adds a Kagi line built from a price stream.
+
+    Args:
+        data: Prices (ticks or closes)
+        reversal: Retracement in price units that turns the line
+        times: Optional timestamps per price
+        label: Series label
+        parent: Parent axis tag
+
+    Returns:
+        KagiSeries: Call ``extend`` with new prices to continue the line
+    """
+    return KagiSeries(data, reversal, times=times, label=label, parent=parent)
+
+
+def add_point_figure_series(data, box_size: float, reversal: int = 3, times=None,
+                            label="Point & Figure", parent=None, base: float = 0.0):
+    """
+    Adds a Point & Figure chart built from a price stream.
+
+    X and O boxes are drawn as two scatter series labelled ``"<label> X"`` and
+    ``"<label> O"``, one column per x unit.
+
+    Args:
+        data: Prices (ticks or closes)
+        box_size: Box height in price units
+        reversal: Boxes required to start a new column
+        times: Optional timestamps per price
+        label: Series label prefix
+        parent: Parent axis tag
+        base: Price the box grid is anchored to
+
+    Returns:
+        PointFigureSeries: Call ``extend`` with new prices to add boxes and columns
+    """
+    return PointFigureSeries(data, box_size, reversal=reversal, times=times, label=label,
+                             parent=parent, base=base)
+
+
+class RenkoSeries:
+    """
+    Candle series showing the bricks of a ``RenkoBuilder``, one brick per x unit.
+
+    Args:
+        See ``add_renko_series``.
+    """
+
+    def __init__(self, data, box_size: float, times=None, label: str = "Renko", parent=None,
+                 bull_color=(0, 255, 117, 255), bear_color=(255, 82, 82, 255),
+                 weight: float = 0.9, base: Optional[float] = None):
+        self.builder = RenkoBuilder(box_size, base=base)
+        self.builder.extend(data, times)
+        self.tag = add_candle_series(*self.builder.candles(), label=label, parent=parent,
+                                     bull_color=bull_color, bear_color=bear_color, weight=weight)
+
+    def extend(self, prices, times=None) -> int:
+        """Adds prices and re-sends the bricks if any formed. Returns the number of new bricks."""
+        added = self.builder.extend(prices, times)
+        if added:
+            index, opens, highs, lows, closes = self.builder.candles()
+            dpg.set_value(self.tag, [index, opens, closes, lows, highs])
+        return added
+
+
+class KagiSeries:
+    """
+    Line series showing a ``KagiBuilder`` as a step line, one swing per x unit.
+
+    Args:
+        See ``add_kagi_series``.
+    """
+
+    def __init__(self, data, reversal: float, times=None, label: str = "Kagi", parent=None):
+        self.builder = KagiBuilder(reversal)
+        self.builder.extend(data, times)
+        self.tag = dpg.add_line_series(*self.builder.line(), **_series_kwargs(label, parent))
+
+    def extend(self, prices, times=None) -> bool:
+        """Adds prices and re-sends the line if it moved. Returns True if data was sent."""
+        vertices = len(self.builder)
+        last = self.builder.vertices()[1][-1:].copy()
+        self.builder.extend(prices, times)
+        if len(self.builder) == vertices and np.array_equal(self.builder.vertices()[1][-1:], last):
+            return False
+        dpg.set_value(self.tag, list(self.builder.line()))
+        return True
+
+
+class PointFigureSeries:
+    """
+    Two scatter series showing the X and O boxes of a ``PointFigureBuilder``.
+
+    Args:
+        See ``add_point_figure_series``.
+    """
+
+    def __init__(self, data, box_size: float, reversal: int = 3, times=None,
+                 label: str = "Point & Figure", parent=None, base: float = 0.0):
+        self.builder = PointFigureBuilder(box_size, reversal=reversal, base=base)
+        self.builder.extend(data, times)
+        xs, os_ = self.builder.boxes()
+        self.x_tag = dpg.add_scatter_series(*xs, **_series_kwargs(f"{label} X", parent))
+        self.o_tag = dpg.add_scatter_series(*os_, **_series_kwargs(f"{label} O", parent))
+        self._signature = self._columns_signature()
+
+    def _columns_signature(self) -> tuple:
+        _, _, low, high = self.builder.columns()
+        return (len(low), low[-1:].tobytes(), high[-1:].tobytes())
+
+    def extend(self, prices, times=None) -> bool:
+        """Adds prices and re-sends the boxes if any changed. Returns True if data was sent."""
+        self.builder.extend(prices, times)
+        signature = self._columns_signature()
+        if signature == self._signature:
+            return False
+        self._signature = signature
+        xs, os_ = self.builder.boxes()
+        dpg.set_value(self.x_tag, list(xs))
+        dpg.set_value(self.o_tag, list(os_))
+        return True
 
 
 def add_heatmap(values, rows, cols, label="Heatmap", parent=None):
-    """Adds a heatmap series."""
-    dpg.add_heatmap_series(values, rows, cols, label=label, parent=parent)
+    """
+    Adds a heatmap series.
 
+    Suited to small or static grids; large or frequently refreshed heatmaps
+    should use ``HeatmapSeries``, which draws from a texture.
+    """
+    return dpg.add_heat_series(as_series_array(values), rows, cols,
+                               **_series_kwargs(label, parent))
+
+
+class HeatmapSeries:
+    """
+    Heatmap drawn from a persistent dynamic RGBA texture.
 
+    Values are kept as a float32 ``(rows, cols)`` array and mapped to colors
+    through a precomputed colormap lookup table straight into the texture's
+    pixel buffer. ``update_rows`` and ``update_columns`` recolor only the
+    cells they replace; ``flush`` uploads the texture once per frame, and only
+    if something changed. Row 0 is drawn at the top.
+
+    Args:
+        values: Initial ``(rows, cols)`` values
+        parent: Parent y-axis tag
+        bounds_min: Plot coordinates of the bottom-left corner
+        bounds_max: Plot coordinates of the top-right corner (defaults to
+            ``(cols, rows)``)
+        vmin: Value mapped to the lowest color
+        vmax: Value mapped to the highest color
+        colormap: Name from ``COLORMAPS``
+        label: Series label
+
+    Example:
+        heatmap = HeatmapSeries(np.zeros((1000, 1000)), parent=y_axis, vmax=50.0)
+        heatmap.update_rows(slice(0, 10), new_rows)
+        add_visible_handler(plot, heatmap.flush)
+    """
+
+    def __init__(self, values, parent=None, bounds_min=(0.0, 0.0), bounds_max=None,
+                 vmin: float = 0.0, vmax: float = 1.0, colormap: str = "viridis",
+                 label: str = "Heatmap"):
+        self.values = np.array(values, dtype=np.float32)
+        if self.values.ndim != 2:
+            raise ValueError("values must be a (rows, cols) array")
+        rows, cols = self.values.shape
+        self.vmin = vmin
+        self.vmax = vmax
+        self.lut = colormap_lut(colormap)
+        self._pixels = np.empty((rows, cols, 4), dtype=np.float32)
+        apply_colormap(self.values, vmin, vmax, self.lut, out=self._pixels)
+        self._dirty = False
+
+        if bounds_max is None:
+            bounds_max = (float(cols), float(rows))
+        self.texture = create_texture(cols, rows, self._pixels)
+        self.tag = dpg.add_image_series(self.texture, bounds_min, bounds_max,
+                                        **_series_kwargs(label, parent))
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return self.values.shape
+
+    def update(self, values) -> None:
+        """Replaces every value."""
+        self.values[...] = values
+        apply_colormap(self.values, self.vmin, self.vmax, self.lut, out=self._pixels)
+        self._dirty = True
+
+    def update_rows(self, rows, values) -> None:
+        """
+        Replaces whole rows; ``rows`` is an index, slice, index array or boolean mask.
+
+        Only the replaced rows are recolored.
+        """
+        self.values[rows] = values
+        # Assigned rather than passed as ``out``: an index array selects a copy
+        self._pixels[rows] = apply_colormap(self.values[rows], self.vmin, self.vmax, self.lut)
+        self._dirty = True
+
+    def update_columns(self, columns, values) -> None:
+        """Replaces whole columns; ``values`` has shape ``(rows, len(columns))``."""
+        self.values[:, columns] = values
+        self._pixels[:, columns] = apply_colormap(self.values[:, columns], self.vmin,
+                                                  self.vmax, self.lut)
+        self._dirty = True
+
+    def set_range(self, vmin: float, vmax: float) -> None:
+        """Changes the value range mapped to the colormap and recolors everything."""
+        self.vmin = vmin
+        self.vmax = vmax
+        apply_colormap(self.values, vmin, vmax, self.lut, out=self._pixels)
+        self._dirty = True
+
+    def flush(self, sender=None, app_data=None) -> bool:
+        """Uploads the texture if anything changed. Returns True if it was uploaded."""
+        if not self._dirty:
+            return False
+        update_texture_data(self.texture, self._pixels)
+        self._dirty = False
+        return True
+
+
+# Stubs for advanced chart types (to be implemented)
 def add_surface(x, y, z, rows, cols, label="Surface", parent=None):
     """Placeholder for 3D surface plot."""
     pass
@@ -0,0 +1,241 @@
+"""Deterministic replay of recorded ticks or bars into live charts on a simulated clock."""
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Optional
+
+import numpy as np
+
+from pegasus.events.handlers import add_visible_handler
+from pegasus.utils.ohlc import BarAggregator
+
+# Longest measured frame the clock follows; a stalled frame (window drag, breakpoint)
+# would otherwise deliver minutes of history at once
+_MAX_FRAME_SECONDS = 0.25
+
+
+@dataclass
+class ReplayStats:
+    """Counters for one ``Replay``."""
+
+    events: int = 0
+    batches: int = 0
+    frames: int = 0
+    seeks: int = 0
+    largest_batch: int = 0
+    sink_seconds: float = 0.0  # Time spent inside the sink
+    frame_seconds: float = 0.0  # Time spent in ``run``'s per-frame callback
+    started: float = field(default_factory=time.perf_counter)
+    finished: Optional[float] = None
+
+    @property
+    def elapsed(self) -> float:
+        return (self.finished or time.perf_counter()) - self.started
+
+    @property
+    def events_per_second(self) -> float:
+        """Sustained rate of events delivered to the sink."""
+        elapsed = self.elapsed
+        return self.events / elapsed if elapsed > 0 else 0.0
+
+
+class Replay:
+    """
+    Plays a recorded, time-sorted event stream into a sink on a simulated clock.
+
+    Each ``advance`` moves the clock by the frame's wall time times ``speed``
+    and hands every event up to the new clock time to ``sink`` as one batch of
+    column views, so the sink runs at most once per frame however fast the
+    replay goes. With ``speed=None`` the clock is ignored and each frame
+    delivers the next ``max_batch`` events, which measures the sustained
+    throughput of the update path.
+
+    A replay is deterministic: the events delivered depend only on the
+    durations passed to ``advance``. ``frame_seconds`` fixes that duration so
+    a replay shown on screen delivers the same batches on every run.
+
+    ``seek`` locates its target with a binary search of the timestamps. A
+    forward seek delivers the skipped events as one batch; a backward seek
+    calls ``reset`` and reloads the events before the target in one batch,
+    so the sink ends up in the same state as if it had been played there.
+
+    Args:
+        times: Event timestamps in seconds, sorted ascending
+        *columns: Columns delivered with ``times``, e.g. prices for ticks or
+            opens, highs, lows and closes for bars
+        sink: Called as ``sink(times, *columns)`` with each batch
+        reset: Clears the sink's state before a backward seek (None makes
+            backward seeks an error)
+        speed: Simulated seconds per wall second, e.g. 1 to 10_000 (None plays
+            as fast as possible)
+        max_batch: Events per frame when ``speed`` is None
+        frame_seconds: Wall time of every ``advance()`` (None measures it)
+
+    Example:
+        bars = BarAggregator(("M1", "M5"))
+        replay = Replay.ticks(times, prices, bars, speed=600)
+        chart = CandlestickChart.from_bars(bars["M1"])
+        replay.seek(times[0] + 3600)  # Start one hour in
+        chart.on_frame(replay.advance)
+        chart.show()
+    """
+
+    def __init__(self, times, *columns, sink: Callable[..., None],
+                 reset: Optional[Callable[[], None]] = None, speed: Optional[float] = 1.0,
+                 max_batch: int = 10_000, frame_seconds: Optional[float] = None):
+        self.times = np.ascontiguousarray(times, dtype=np.float64)
+        self.columns = tuple(np.ascontiguousarray(col, dtype=np.float64) for col in columns)
+        if any(col.shape != self.times.shape for col in self.columns):
+            raise ValueError("every column must have one value per timestamp")
+        if self.times.size > 1 and np.any(np.diff(self.times) < 0):
+            raise ValueError("times must be sorted ascending")
+        if speed is not None and speed <= 0:
+            raise ValueError(f"speed must be positive or None, got {speed!r}")
+        self.sink = sink
+        self.reset = reset
+        self.speed = speed
+        self.max_batch = max_batch
+        self.frame_seconds = frame_seconds
+        self.position = 0  # Index of the next event to deliver
+        self.now = float(self.times[0]) if self.times.size else 0.0
+        self.paused = False
+        self.stats = ReplayStats()
+        self._last_frame: Optional[float] = None
+
+    @classmethod
+    def ticks(cls, times, prices, bars: BarAggregator, **kwargs) -> "Replay":
+        """Replays ticks into every timeframe of ``bars``."""
+        return cls(times, prices, sink=bars.update_many, reset=bars.clear, **kwargs)
+
+    @classmethod
+    def bars(cls, dates, opens, highs, lows, closes, bars: BarAggregator,
+             **kwargs) -> "Replay":
+        """
+        Replays finer bars (e.g. M1 from ``load_ohlc_csv``) into every timeframe of ``bars``.
+
+        A bar is delivered when the clock reaches its timestamp.
+        """
+        return cls(dates, opens, highs, lows, closes, sink=bars.load_bars, reset=bars.clear,
+                   **kwargs)
+
+    def __len__(self) -> int:
+        return self.times.size
+
+    @property
+    def done(self) -> bool:
+        """True once every event has been delivered."""
+        return self.position >= self.times.size
+
+    def _deliver(self, start: int, stop: int) -> int:
+        if stop <= start:
+            return 0
+        began = time.perf_counter()
+        self.sink(self.times[start:stop], *(col[start:stop] for col in self.columns))
+        stats = self.stats
+        stats.sink_seconds += time.perf_counter() - began
+        stats.events += stop - start
+        stats.batches += 1
+        stats.largest_batch = max(stats.largest_batch, stop - start)
+        self.position = stop
+        return stop - start
+
+    def advance(self, wall_seconds: Optional[float] = None) -> int:
+        """
+        Runs one frame: moves the clock and delivers the events it passed.
+
+        Args:
+            wall_seconds: Wall time of the frame (defaults to ``frame_seconds``,
+                or the time since the previous frame)
+
+        Returns:
+            int: Number of events delivered
+        """
+        self.stats.frames += 1
+        now = time.perf_counter()
+        if wall_seconds is None:
+            wall_seconds = self.frame_seconds
+        if wall_seconds is None:
+            last, self._last_frame = self._last_frame, now
+            wall_seconds = min(now - last, _MAX_FRAME_SECONDS) if last is not None else 0.0
+        if self.paused or self.done:
+            return 0
+        if self.speed is None:
+            stop = min(self.position + self.max_batch, self.times.size)
+            self.now = float(self.times[stop - 1])
+        else:
+            self.now += wall_seconds * self.speed
+            stop = int(np.searchsorted(self.times, self.now, side="right"))
+        delivered = self._deliver(self.position, stop)
+        if self.done:
+            self.stats.finished = time.perf_counter()
+        return delivered
+
+    def step(self, events: int = 1) -> int:
+        """Delivers the next ``events`` events, also while paused, and moves the clock to them."""
+        stop = min(self.position + events, self.times.size)
+        delivered = self._deliver(self.position, stop)
+        if delivered:
+            self.now = float(self.times[stop - 1])
+        return delivered
+
+    def seek(self, t: float) -> int:
+        """
+        Moves the clock to ``t``; events at or before ``t`` end up delivered.
+
+        Returns:
+            int: The new position (index of the next event)
+        """
+        stop = int(np.searchsorted(self.times, t, side="right"))
+        if stop < self.position:
+            if self.reset is None:
+                raise ValueError("seeking backwards needs a reset callback")
+            self.reset()
+            self.position = 0
+        self._deliver(self.position, stop)
+        self.now = float(t)
+        self.stats.seeks += 1
+        return stop
+
+    def pause(self) -> None:
+        """Stops the clock; ``step`` and ``seek`` still work."""
+        self.paused = True
+
+    def resume(self) -> None:
+        """Restarts the clock without counting the paused time."""
+        self.paused = False
+        self._last_frame = None
+
+    def install(self, item) -> None:
+        """
+        Calls ``advance`` every frame while ``item`` is visible, for windows built by hand.
+
+        For a chart's own window use ``chart.on_frame(replay.advance)``.
+        """
+        add_visible_handler(item, lambda sender=None, app_data=None: self.advance())
+
+    def run(self, frame: Optional[Callable[[], object]] = None,
+            max_frames: Optional[int] = None) -> ReplayStats:
+        """
+        Advances frame after frame until the replay ends, without a display.
+
+        With ``speed=None`` this is a stress test of the update path: pass the
+        per-frame work of the chart as ``frame`` (e.g. ``series.flush`` or
+        ``scheduler.apply``) and read the sustained rate from the stats.
+
+        Args:
+            frame: Called after every ``advance``; its time goes to ``stats.frame_seconds``
+            max_frames: Stop after this many frames
+
+        Returns:
+            ReplayStats: The replay's counters
+        """
+        frames = 0
+        while not self.done and not self.paused:
+            self.advance()
+            if frame is not None:
+                began = time.perf_counter()
+                frame()
+                self.stats.frame_seconds += time.perf_counter() - began
+            frames += 1
+            if max_frames is not None and frames >= max_frames:
+                break
+        return self.stats
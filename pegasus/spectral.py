@@ -0,0 +1,104 @@
+"""Streaming spectral analysis: sliding-window FFT frames for live spectra and spectrograms."""
+import numpy as np
+
+from pegasus.performance.buffers import RingBuffer
+
+# Window functions accepted by ``SlidingSpectrum``
+WINDOWS = {
+    "hann": np.hanning,
+    "hamming": np.hamming,
+    "blackman": np.blackman,
+    "rectangular": np.ones,
+}
+
+
+class SlidingSpectrum:
+    """
+    Short-time Fourier transform of a sample stream, one frame every ``hop`` samples.
+
+    The last ``window_size`` samples live in a preallocated ``RingBuffer``.
+    ``push`` only computes the frames completed by the new samples: their
+    windows are strided views over the ring and the new block, tapered and
+    transformed together with one ``rfft`` call. Work per frame is therefore
+    one FFT of ``window_size`` points, independent of how long the stream has
+    been running.
+
+    Args:
+        window_size: Samples per FFT frame
+        hop: Samples between consecutive frames
+        sample_rate: Samples per second, used for ``frequencies`` and timing
+        window: Taper name from ``WINDOWS``
+        scale: ``"db"`` for 20*log10 magnitudes, ``"linear"`` for raw magnitudes
+
+    Example:
+        spectrum = SlidingSpectrum(window_size=1024, hop=256, sample_rate=48_000)
+        frames = spectrum.push(block)  # (new_frames, bins)
+        line_y = spectrum.latest
+    """
+
+    def __init__(self, window_size: int = 1024, hop: int = 256, sample_rate: float = 1.0,
+                 window: str = "hann", scale: str = "db"):
+        if window_size <= 0 or hop <= 0:
+            raise ValueError("window_size and hop must be positive")
+        if window not in WINDOWS:
+            raise ValueError(f"Unknown window {window!r}, expected one of {list(WINDOWS)}")
+        if scale not in ("db", "linear"):
+            raise ValueError("scale must be 'db' or 'linear'")
+        self.window_size = window_size
+        self.hop = hop
+        self.sample_rate = float(sample_rate)
+        self.scale = scale
+        self.taper = WINDOWS[window](window_size)
+        # Coherent gain correction, so a full-scale sine reads ~1.0 (0 dB)
+        self._norm = 2.0 / self.taper.sum()
+        self.samples = RingBuffer(window_size, columns=1)
+        self.frequencies = np.fft.rfftfreq(window_size, 1.0 / self.sample_rate)
+        self.latest = np.zeros(self.frequencies.size)
+        self.frames = 0
+        self._until_next = window_size  # Samples still needed for the next frame
+
+    @property
+    def bins(self) -> int:
+        return self.frequencies.size
+
+    @property
+    def frame_seconds(self) -> float:
+        """Time between consecutive frames."""
+        return self.hop / self.sample_rate
+
+    def push(self, samples) -> np.ndarray:
+        """
+        Appends samples and returns the magnitudes of the frames they complete.
+
+        Returns:
+            np.ndarray: ``(new_frames, bins)`` array, possibly with zero rows
+        """
+        samples = np.asarray(samples, dtype=np.float64).reshape(-1)
+        n = samples.size
+        ends = np.arange(self._until_next, n + 1, self.hop)
+        if ends.size == 0:
+            self.samples.extend(samples)
+            self._until_next -= n
+            return np.empty((0, self.bins))
+
+        history = self.samples.view()
+        data = np.concatenate((history, samples))
+        windows = np.lib.stride_tricks.sliding_window_view(data, self.window_size)
+        frames = windows[history.size + ends - self.window_size]
+        magnitudes = np.abs(np.fft.rfft(frames * self.taper, axis=1))
+        magnitudes *= self._norm
+        if self.scale == "db":
+            np.maximum(magnitudes, 1e-12, out=magnitudes)
+            magnitudes = 20.0 * np.log10(magnitudes)
+
+        self.samples.extend(samples)
+        self._until_next = int(ends[-1]) + self.hop - n
+        self.frames += ends.size
+        self.latest[:] = magnitudes[-1]
+        return magnitudes
+
+    def reset(self) -> None:
+        """Drops buffered samples; the next frame needs a full window again."""
+        self.samples.clear()
+        self.frames = 0
+        self._until_next = self.window_size
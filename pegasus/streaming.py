@@ -0,0 +1,472 @@
+"""Asynchronous ingestion of TCP and WebSocket feeds into chart series."""
+import asyncio
+import concurrent.futures
+import contextlib
+import json
+import struct
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Coroutine, Optional, Sequence, Tuple
+
+import numpy as np
+
+from pegasus.performance.buffers import RingSeries, UpdateScheduler, get_scheduler
+
+# Overflow policies for the bounded queue between network reader and sink
+BLOCK = "block"              # Stop reading the socket until the sink catches up
+DROP_OLDEST = "drop_oldest"  # Discard the oldest queued batch
+DROP_NEWEST = "drop_newest"  # Discard the incoming batch
+POLICIES = (BLOCK, DROP_OLDEST, DROP_NEWEST)
+
+Batch = Tuple[np.ndarray, ...]
+
+_FRAME_HEADER = struct.Struct("<I")
+
+
+def encode_binary_frame(*columns) -> bytes:
+    """
+    Packs columns into one binary frame.
+
+    A frame is a little-endian ``uint32`` payload length followed by the
+    records as interleaved little-endian float64 values.
+    """
+    records = np.ascontiguousarray(np.column_stack(columns), dtype="<f8")
+    payload = records.tobytes()
+    return _FRAME_HEADER.pack(len(payload)) + payload
+
+
+def encode_json_lines(fields: Sequence[str], *columns) -> bytes:
+    """Encodes columns as newline-delimited JSON objects keyed by ``fields``."""
+    rows = zip(*(np.asarray(col).tolist() for col in columns))
+    return b"".join(
+        json.dumps(dict(zip(fields, row)), separators=(",", ":")).encode() + b"\n"
+        for row in rows
+    )
+
+
+class BinaryFrameDecoder:
+    """
+    Decodes length-prefixed float64 frames produced by ``encode_binary_frame``.
+
+    Every complete frame in the receive buffer is decoded in one pass with a
+    single ``np.frombuffer``; partial frames are kept for the next read.
+
+    Args:
+        columns: Number of float64 values per record
+    """
+
+    def __init__(self, columns: int = 2):
+        self.columns = columns
+        self._buffer = bytearray()
+
+    def feed(self, data: bytes) -> Optional[Batch]:
+        """Adds received bytes and returns the decoded columns, or None if no frame completed."""
+        buf = self._buffer
+        buf += data
+        size = len(buf)
+        offset = 0
+        spans = []
+        while size - offset >= _FRAME_HEADER.size:
+            (length,) = _FRAME_HEADER.unpack_from(buf, offset)
+            end = offset + _FRAME_HEADER.size + length
+            if end > size:
+                break
+            spans.append((offset + _FRAME_HEADER.size, end))
+            offset = end
+        if not spans:
+            return None
+
+        with memoryview(buf) as view:
+            payload = b"".join(view[start:end] for start, end in spans)
+        del buf[:offset]
+
+        records = np.frombuffer(payload, dtype="<f8").reshape(-1, self.columns)
+        return tuple(np.ascontiguousarray(records[:, i]) for i in range(self.columns))
+
+
+class JsonLinesDecoder:
+    """
+    Decodes newline-delimited JSON objects into columns.
+
+    All complete lines of a read are parsed with one ``json.loads`` call on a
+    synthesized JSON array instead of one call per message. If that fails, the
+    lines are parsed one by one and those that are not valid JSON objects with
+    numeric ``fields`` are skipped and counted in ``bad_lines``.
+
+    Args:
+        fields: Keys extracted from each object, one output column per key
+    """
+
+    def __init__(self, fields: Sequence[str] = ("t", "p")):
+        self.fields = tuple(fields)
+        self.bad_lines = 0
+        self._buffer = b""
+
+    def feed(self, data: bytes) -> Optional[Batch]:
+        """Adds received bytes and returns the decoded columns, or None if no line completed."""
+        data = self._buffer + data
+        end = data.rfind(b"\n")
+        if end < 0:
+            self._buffer = data
+            return None
+        self._buffer = data[end + 1:]
+
+        lines = [line for line in data[:end].replace(b"\r", b"").split(b"\n") if line]
+        if not lines:
+            return None
+        try:
+            messages = json.loads(b"[" + b",".join(lines) + b"]")
+            return tuple(
+                np.fromiter((m[key] for m in messages), dtype=np.float64, count=len(messages))
+                for key in self.fields
+            )
+        except (ValueError, KeyError, TypeError):
+            return self._decode_lines(lines)
+
+    def _decode_lines(self, lines) -> Optional[Batch]:
+        """Slow path for a read with a bad line: decodes line by line, skipping bad ones."""
+        rows = []
+        for line in lines:
+            try:
+                message = json.loads(line)
+                rows.append([float(message[key]) for key in self.fields])
+            except (ValueError, KeyError, TypeError):
+                self.bad_lines += 1
+        if not rows:
+            return None
+        columns = np.array(rows, dtype=np.float64)
+        return tuple(np.ascontiguousarray(columns[:, i]) for i in range(len(self.fields)))
+
+
+@dataclass
+class FeedStats:
+    """Counters for one ``StreamClient``."""
+
+    messages: int = 0
+    batches: int = 0
+    bytes: int = 0
+    dropped_messages: int = 0
+    dropped_batches: int = 0
+    started: float = field(default_factory=time.perf_counter)
+    finished: Optional[float] = None
+
+    @property
+    def elapsed(self) -> float:
+        return (self.finished or time.perf_counter()) - self.started
+
+    @property
+    def messages_per_second(self) -> float:
+        """Sustained rate of messages delivered to the sink."""
+        elapsed = self.elapsed
+        return self.messages / elapsed if elapsed > 0 else 0.0
+
+
+class StreamClient:
+    """
+    Reads a feed, decodes it in batches and delivers columns to a sink.
+
+    The network reader and the sink are decoupled by a bounded queue of
+    ``max_pending`` batches. When the sink falls behind, ``policy`` decides
+    what happens: ``BLOCK`` stops reading so TCP flow control pushes back on
+    the sender, ``DROP_OLDEST``/``DROP_NEWEST`` discard batches and count them
+    in ``stats``. Batches still queued when the sink runs are merged into one
+    call. An exception raised by the sink stops the stream and is re-raised
+    by ``run_tcp``/``run_websocket``.
+
+    Args:
+        decoder: ``BinaryFrameDecoder``, ``JsonLinesDecoder`` or any object
+            with ``feed(bytes) -> Optional[tuple of arrays]``
+        sink: Called with the decoded columns, e.g. ``series_sink(series)``
+        max_pending: Capacity of the queue between reader and sink, in batches
+        policy: One of ``POLICIES``
+        read_size: Maximum bytes per socket read
+    """
+
+    def __init__(self, decoder, sink: Callable[..., None], max_pending: int = 64,
+                 policy: str = BLOCK, read_size: int = 1 << 16):
+        if policy not in POLICIES:
+            raise ValueError(f"policy must be one of {POLICIES}, got {policy!r}")
+        self.decoder = decoder
+        self.sink = sink
+        self.max_pending = max_pending
+        self.policy = policy
+        self.read_size = read_size
+        self.stats = FeedStats()
+        self._queue: Optional[asyncio.Queue] = None
+        self._dispatcher: Optional[asyncio.Future] = None
+
+    async def run_tcp(self, host: str, port: int) -> FeedStats:
+        """Streams from a TCP feed until the peer closes the connection."""
+        reader, writer = await asyncio.open_connection(host, port)
+
+        async def chunks():
+            while True:
+                data = await reader.read(self.read_size)
+                if not data:
+                    return
+                yield data
+
+        try:
+            return await self._run(chunks())
+        finally:
+            writer.close()
+            with contextlib.suppress(ConnectionError):
+                await writer.wait_closed()
+
+    async def run_websocket(self, uri: str) -> FeedStats:
+        """
+        Streams from a WebSocket feed until it closes.
+
+        Text messages are treated as JSON lines, binary messages as frames.
+        Requires the optional ``websockets`` package.
+        """
+        try:
+            import websockets
+        except ImportError as e:
+            raise ImportError(
+                "run_websocket requires the 'websockets' package: pip install websockets"
+            ) from e
+
+        async def chunks():
+            async with websockets.connect(uri) as ws:
+                async for message in ws:
+                    yield message.encode() + b"\n" if isinstance(message, str) else message
+
+        return await self._run(chunks())
+
+    async def _run(self, chunks) -> FeedStats:
+        self.stats = FeedStats()
+        self._queue = asyncio.Queue(self.max_pending)
+        self._dispatcher = dispatcher = asyncio.ensure_future(self._dispatch())
+        try:
+            async for data in chunks:
+                self.stats.bytes += len(data)
+                batch = self.decoder.feed(data)
+                if batch is not None and len(batch[0]):
+                    await self._offer(batch)
+            await self._put(None)
+            await dispatcher
+        finally:
+            dispatcher.cancel()
+            self.stats.finished = time.perf_counter()
+        return self.stats
+
+    async def _offer(self, batch: Batch) -> None:
+        if self._dispatcher.done():
+            # The sink raised: surface its error instead of queueing for nobody
+            self._dispatcher.result()
+        queue = self._queue
+        if self.policy == BLOCK:
+            await self._put(batch)
+            return
+        if queue.full():
+            if self.policy == DROP_NEWEST:
+                self._count_drop(batch)
+                return
+            self._count_drop(queue.get_nowait())
+        queue.put_nowait(batch)
+
+    async def _put(self, item: Optional[Batch]) -> None:
+        """Waits for room in the queue, re-raising the sink's error if the dispatcher dies first."""
+        queue = self._queue
+        if not queue.full():
+            queue.put_nowait(item)
+            return
+        put = asyncio.ensure_future(queue.put(item))
+        try:
+            await asyncio.wait((put, self._dispatcher), return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            if not put.done():
+                put.cancel()
+        if not put.done() or put.cancelled():
+            self._dispatcher.result()
+
+    def _count_drop(self, batch: Batch) -> None:
+        self.stats.dropped_batches += 1
+        self.stats.dropped_messages += len(batch[0])
+
+    async def _dispatch(self) -> None:
+        queue = self._queue
+        while True:
+            batches = [await queue.get()]
+            while not queue.empty():
+                batches.append(queue.get_nowait())
+            done = batches[-1] is None
+            batches = [b for b in batches if b is not None]
+            if batches:
+                merged = batches[0] if len(batches) == 1 else tuple(
+                    np.concatenate(col) for col in zip(*batches))
+                self.sink(*merged)
+                self.stats.batches += len(batches)
+                self.stats.messages += len(merged[0])
+            if done:
+                return
+
+
+def series_sink(series: RingSeries, scheduler: Optional[UpdateScheduler] = None):
+    """
+    Returns a sink that appends decoded columns to ``series`` on the next frame.
+
+    Appends go through the frame scheduler, so the streaming thread never
+    touches DPG directly.
+    """
+    scheduler = scheduler or get_scheduler()
+
+    def sink(*columns):
+        scheduler.append(series, *columns)
+    return sink
+
+
+class StreamRunner:
+    """
+    Runs an asyncio event loop on a background thread, off the render thread.
+
+    Usage:
+        with StreamRunner() as runner:
+            client = StreamClient(BinaryFrameDecoder(), series_sink(ticks))
+            runner.submit(client.run_tcp("127.0.0.1", 9000))
+            chart.show()
+    """
+
+    def __init__(self):
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> "StreamRunner":
+        """Starts the loop thread (no-op if already running)."""
+        if self._thread is not None:
+            return self
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self.loop.run_forever, name="pegasus-streaming", daemon=True)
+        self._thread.start()
+        return self
+
+    def submit(self, coro: Coroutine) -> concurrent.futures.Future:
+        """Schedules a coroutine on the streaming loop from any thread."""
+        if self.loop is None:
+            self.start()
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def stop(self) -> None:
+        """Cancels outstanding tasks and stops the loop thread."""
+        if self.loop is None:
+            return
+        loop = self.loop
+
+        async def shutdown():
+            tasks = [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            loop.stop()
+
+        asyncio.run_coroutine_threadsafe(shutdown(), loop)
+        self._thread.join()
+        loop.close()
+        self.loop = None
+        self._thread = None
+
+    def __enter__(self) -> "StreamRunner":
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.stop()
+
+
+class LoopbackFeedServer:
+    """
+    Local TCP server streaming a synthetic random-walk tick feed.
+
+    Intended for tests and benchmarks: every connection receives ``messages``
+    ``(timestamp, price)`` ticks in batches of ``batch`` and is then closed.
+
+    Args:
+        messages: Ticks sent per connection
+        batch: Ticks per write (and per binary frame)
+        fmt: ``"binary"`` or ``"json"``
+        rate: Target ticks per second, or None to send as fast as possible
+        host: Interface to bind
+        port: Port to bind (0 picks a free port)
+    """
+
+    def __init__(self, messages: int = 1_000_000, batch: int = 1_000, fmt: str = "binary",
+                 rate: Optional[float] = None, host: str = "127.0.0.1", port: int = 0):
+        if fmt not in ("binary", "json"):
+            raise ValueError("fmt must be 'binary' or 'json'")
+        self.messages = messages
+        self.batch = batch
+        self.fmt = fmt
+        self.rate = rate
+        self.host = host
+        self.port = port
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    async def start(self) -> Tuple[str, int]:
+        """Starts listening and returns the bound ``(host, port)``."""
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self.host, self.port
+
+    async def close(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def __aenter__(self) -> "LoopbackFeedServer":
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.close()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        rng = np.random.default_rng()
+        price = 1.0
+        start = time.perf_counter()
+        epoch = time.time()
+        sent = 0
+        try:
+            while sent < self.messages:
+                n = min(self.batch, self.messages - sent)
+                # One microsecond apart so timestamps stay strictly increasing
+                t = epoch + (sent + np.arange(n)) * 1e-6
+                prices = price + np.cumsum(rng.normal(0.0, 1e-5, n))
+                price = prices[-1]
+                if self.fmt == "binary":
+                    writer.write(encode_binary_frame(t, prices))
+                else:
+                    writer.write(encode_json_lines(("t", "p"), t, prices))
+                await writer.drain()
+                sent += n
+                if self.rate:
+                    delay = start + sent / self.rate - time.perf_counter()
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+        finally:
+            writer.close()
+            with contextlib.suppress(ConnectionError):
+                await writer.wait_closed()
+
+
+def loopback_throughput(messages: int = 1_000_000, fmt: str = "binary",
+                        batch: int = 1_000, policy: str = BLOCK,
+                        sink: Optional[Callable[..., None]] = None) -> FeedStats:
+    """
+    Measures end-to-end ingestion through a ``LoopbackFeedServer``.
+
+    Runs the server and a ``StreamClient`` on a ``StreamRunner`` loop and
+    returns the client's ``FeedStats``; ``stats.messages_per_second`` is the
+    sustained decode-and-deliver rate. The default sink discards batches.
+    """
+    decoder = BinaryFrameDecoder(2) if fmt == "binary" else JsonLinesDecoder(("t", "p"))
+    client = StreamClient(decoder, sink or (lambda *columns: None), policy=policy)
+
+    async def run():
+        async with LoopbackFeedServer(messages, batch=batch, fmt=fmt) as server:
+            return await client.run_tcp(server.host, server.port)
+
+    with StreamRunner() as runner:
+        return runner.submit(run()).result()
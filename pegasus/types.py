@@ -1,4 +1,12 @@
 from dataclasses import dataclass
+from typing import Sequence, Union
+
+import numpy as np
+
+# Anything the chart and series APIs accept as a data column: contiguous
+# float64/float32 ndarrays are passed to DPG as-is, other buffer-protocol
+# objects are wrapped without copying.
+SeriesLike = Union[np.ndarray, memoryview, Sequence[float]]
 
 @dataclass
 class SeriesData:
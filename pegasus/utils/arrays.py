@@ -0,0 +1,41 @@
+"""Array conversion helpers for the zero-copy data path."""
+from typing import Sequence
+
+import numpy as np
+
+# Dtypes DPG reads straight from the buffer protocol without conversion
+SERIES_DTYPES = (np.dtype(np.float64), np.dtype(np.float32))
+
+
+def as_series_array(data) -> np.ndarray:
+    """
+    Returns ``data`` as a contiguous float64/float32 ndarray, copying only when needed.
+
+    Contiguous float64 or float32 ndarrays are returned unchanged. Other
+    buffer-protocol objects (``memoryview``, ``array.array``, memory-mapped
+    arrays, pandas columns) are wrapped with ``np.asarray`` so they share
+    memory with the source. Integer or strided inputs are converted once to a
+    contiguous float64 array. No Python list is ever produced.
+
+    Args:
+        data: ndarray, buffer-protocol object or sequence of numbers
+
+    Returns:
+        np.ndarray: One-dimensional array suitable for DPG series
+    """
+    if isinstance(data, np.ndarray):
+        arr = data
+    else:
+        to_numpy = getattr(data, "to_numpy", None)
+        arr = to_numpy() if to_numpy is not None else np.asarray(data)
+
+    if arr.dtype not in SERIES_DTYPES:
+        arr = arr.astype(np.float64)
+    if not arr.flags.c_contiguous:
+        arr = np.ascontiguousarray(arr)
+    return arr.reshape(-1) if arr.ndim != 1 else arr
+
+
+def as_series_arrays(*columns: Sequence[float]) -> tuple:
+    """Applies ``as_series_array`` to every column and returns them as a tuple."""
+    return tuple(as_series_array(col) for col in columns)
@@ -1,6 +1,23 @@
 """CSV data loading utilities for Pegasus."""
-import pandas as pd
-from typing import Optional
+import glob
+import hashlib
+import os
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+import numpy as np
+from typing import TYPE_CHECKING, Iterable, Optional, Union
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Bump when the cache layout or parsing semantics change
+_CACHE_VERSION = 1
+
+_NS_PER_SECOND = 1_000_000_000
+
+# strptime fills a missing date with 1900-01-01; subtracting it leaves the time of day
+_TIME_ONLY_EPOCH_NS = np.datetime64('1900-01-01', 'ns').astype(np.int64)
 
 
 def load_ohlc_csv(
@@ -13,10 +30,20 @@ def load_ohlc_csv(
     close_col: str = "CLOSE",
     date_format: str = "%Y.%m.%d",
     time_format: str = "%H:%M:%S",
+    cache: bool = True,
+    cache_dir: Optional[str] = None,
 ):
     """
-    Loads OHLC CSV data and returns lists compatible with Dear PyGui candlestick series.
-    
+    Loads OHLC CSV data and returns arrays compatible with Dear PyGui candlestick series.
+
+    Timestamps are parsed vectorized: each distinct date and time string is
+    parsed once and broadcast back, so a month of M1 data parses a few thousand
+    strings instead of one per row.
+
+    The parsed columns are cached as a single ``.npy`` file keyed by the source
+    path, size, mtime and parse options. Opening the same unchanged CSV again
+    memory-maps that file instead of re-parsing it.
+
     Args:
         filepath: Path to the CSV file
         date_col: Column name for date (or datetime if time_col is None)
@@ -27,14 +54,21 @@ def load_ohlc_csv(
         close_col: Column name for close price
         date_format: strftime format for date
         time_format: strftime format for time
-    
+        cache: Read from and write to the binary cache
+        cache_dir: Cache directory (defaults to ``default_cache_dir()``)
+
     Returns:
-        tuple: (dates, opens, highs, lows, closes) as lists of floats
-    
+        tuple: (dates, opens, highs, lows, closes) as contiguous float64 ndarrays.
+        On a cache hit they are views of the read-only memory map; nothing is
+        converted to Python lists.
+
+    Raises:
+        ValueError: If a date or time cell is empty
+
     Example:
         # Default column names
         dates, opens, highs, lows, closes = load_ohlc_csv("data.csv")
-        
+
         # Custom column names
         dates, opens, highs, lows, closes = load_ohlc_csv(
             "data.csv",
@@ -45,7 +79,7 @@ def load_ohlc_csv(
             low_col="Low",
             close_col="Close"
         )
-        
+
         # Single datetime column
         dates, opens, highs, lows, closes = load_ohlc_csv(
             "data.csv",
@@ -54,24 +88,171 @@ def load_ohlc_csv(
             date_format="%Y-%m-%d %H:%M:%S"
         )
     """
+    options = (date_col, time_col, open_col, high_col, low_col, close_col,
+               date_format, time_format)
+    cache_path = _cache_path(filepath, options, cache_dir) if cache else None
+    if cache_path is not None and os.path.exists(cache_path):
+        columns = np.load(cache_path, mmap_mode='r')
+        return tuple(columns[i] for i in range(columns.shape[0]))
+
+    # pandas is imported only here: cache hits and chart-only programs never load it
+    import pandas as pd
+
     df = pd.read_csv(filepath)
-    
+
     # Handle datetime parsing
     if time_col is not None:
-        # Combine DATE and TIME columns
-        datetime_format = f"{date_format} {time_format}"
-        df['datetime'] = pd.to_datetime(df[date_col] + ' ' + df[time_col], format=datetime_format)
+        # Date and time columns are parsed separately and summed, which avoids
+        # building a joined string for every row
+        nanos = _parse_unique(df[date_col], date_format)
+        nanos += _parse_unique(df[time_col], time_format) - _TIME_ONLY_EPOCH_NS
     else:
         # Single datetime column
-        df['datetime'] = pd.to_datetime(df[date_col], format=date_format)
-    
-    # Use .timestamp() for correct Unix seconds
-    dates = df['datetime'].apply(lambda x: x.timestamp()).tolist()
-    
-    return (
+        nanos = _parse_unique(df[date_col], date_format)
+
+    # Unix seconds, identical to Timestamp.timestamp() for naive datetimes
+    dates = nanos / _NS_PER_SECOND
+
+    result = (
         dates,
-        df[open_col].tolist(),
-        df[high_col].tolist(),
-        df[low_col].tolist(),
-        df[close_col].tolist(),
+        df[open_col].to_numpy(dtype=np.float64),
+        df[high_col].to_numpy(dtype=np.float64),
+        df[low_col].to_numpy(dtype=np.float64),
+        df[close_col].to_numpy(dtype=np.float64),
     )
+    if cache_path is not None:
+        _write_cache(cache_path, result)
+    return result
+
+
+def load_ohlc_many(
+    paths: Union[str, Iterable[str]],
+    max_workers: Optional[int] = None,
+    **options,
+):
+    """
+    Loads many OHLC CSV files in parallel and merges them into one time-sorted series.
+
+    Files are parsed by ``load_ohlc_csv`` in a process pool (cache hits are
+    just memory maps), then concatenated. Files are ordered by their first
+    timestamp, so the usual one-file-per-day layout needs no sort; otherwise
+    the rows are stably sorted by date. Rows sharing a timestamp are reduced
+    to the one from the later file.
+
+    Args:
+        paths: Glob pattern (e.g. ``"data/EURUSD_2025-*.csv"``) or iterable of paths
+        max_workers: Worker processes (defaults to the CPU count; 1 loads serially)
+        **options: Keyword arguments passed to ``load_ohlc_csv``
+
+    Returns:
+        tuple: (dates, opens, highs, lows, closes) as contiguous float64 ndarrays
+
+    Example:
+        dates, opens, highs, lows, closes = load_ohlc_many("data/EURUSD_2025-*.csv")
+    """
+    if isinstance(paths, str):
+        files = sorted(glob.glob(paths))
+    else:
+        files = list(paths)
+    if not files:
+        raise FileNotFoundError(f"No OHLC files match {paths!r}")
+
+    load = partial(load_ohlc_csv, **options)
+    workers = min(max_workers or os.cpu_count() or 1, len(files))
+    if workers == 1:
+        parts = [load(path) for path in files]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            parts = list(pool.map(load, files))
+
+    parts = [part for part in parts if len(part[0])]
+    if not parts:
+        return tuple(np.empty(0, dtype=np.float64) for _ in range(5))
+    parts.sort(key=lambda part: part[0][0])  # Stable: equal starts keep file order
+    columns = [np.concatenate([part[i] for part in parts]) for i in range(5)]
+
+    dates = columns[0]
+    if np.any(dates[1:] < dates[:-1]):
+        order = np.argsort(dates, kind='stable')
+        columns = [col[order] for col in columns]
+        dates = columns[0]
+    # Keep the last row of every run of equal timestamps
+    keep = np.empty(dates.size, dtype=bool)
+    np.not_equal(dates[:-1], dates[1:], out=keep[:-1])
+    keep[-1] = True
+    if not keep.all():
+        columns = [col[keep] for col in columns]
+    return tuple(columns)
+
+
+def default_cache_dir() -> str:
+    """
+    Returns the directory used for parsed CSV caches.
+
+    ``$PEGASUS_CACHE_DIR`` takes precedence, then ``$XDG_CACHE_HOME/pegasus``,
+    then ``~/.cache/pegasus``.
+    """
+    if os.environ.get("PEGASUS_CACHE_DIR"):
+        return os.environ["PEGASUS_CACHE_DIR"]
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "pegasus")
+
+
+def _parse_unique(values: "pd.Series", fmt: str) -> np.ndarray:
+    """
+    Parses each distinct string once and returns int64 nanoseconds per row.
+
+    Raises:
+        ValueError: If a cell is empty, which has no timestamp
+    """
+    import pandas as pd
+
+    codes, uniques = pd.factorize(values)
+    # factorize codes missing cells as -1, which would index the last timestamp
+    missing = np.flatnonzero(codes < 0)
+    if missing.size:
+        raise ValueError(f"Column {values.name!r} has {missing.size} empty cells "
+                         f"(first at row {missing[0]})")
+    parsed = pd.to_datetime(pd.Index(uniques).astype(str), format=fmt)
+    nanos = parsed.to_numpy(dtype='datetime64[ns]').view(np.int64)
+    return nanos[codes]
+
+
+def _cache_path(filepath: str, options: tuple, cache_dir: Optional[str]) -> Optional[str]:
+    """Builds the cache file name for ``filepath``, or None if it cannot be stat'ed."""
+    source = os.path.abspath(filepath)
+    try:
+        stat = os.stat(source)
+    except OSError:
+        return None
+    source_hash = hashlib.sha1(source.encode()).hexdigest()[:12]
+    options_hash = hashlib.sha1(repr(options).encode()).hexdigest()[:12]
+    version = repr((_CACHE_VERSION, stat.st_size, stat.st_mtime_ns))
+    version_hash = hashlib.sha1(version.encode()).hexdigest()[:12]
+    stem = os.path.splitext(os.path.basename(source))[0]
+    # The last field changes with the file's contents; _write_cache evicts on it
+    name = f"{stem}-{source_hash}-{options_hash}-{version_hash}.npy"
+    return os.path.join(cache_dir or default_cache_dir(), name)
+
+
+def _write_cache(cache_path: str, columns: tuple) -> None:
+    """Atomically writes ``columns`` as one (n_columns, n_rows) array and drops stale entries."""
+    directory = os.path.dirname(cache_path)
+    prefix = os.path.basename(cache_path).rsplit('-', 1)[0] + '-'
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(directory, exist_ok=True)
+        with open(tmp_path, 'wb') as f:
+            np.save(f, np.stack(columns))
+        os.replace(tmp_path, cache_path)
+        # Entries for older versions of the same source file and parse options
+        # are no longer reachable; other option sets keep their entries
+        for name in os.listdir(directory):
+            if name.startswith(prefix) and name.endswith('.npy'):
+                path = os.path.join(directory, name)
+                if path != cache_path:
+                    os.remove(path)
+    except OSError as e:
+        warnings.warn(f"Could not write OHLC cache {cache_path}: {e}")
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
@@ -0,0 +1,466 @@
+"""Out-of-core series backed by memory-mapped column files."""
+import json
+import mmap
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+_META_FILE = "columns.json"
+
+
+def write_columns(directory: str, append: bool = False, **columns) -> int:
+    """
+    Writes (or appends) columns as raw binary files that ``MmapColumns`` can map.
+
+    Each column goes to ``<name>.bin`` and the layout to ``columns.json``.
+    Large archives can be converted piecewise with ``append=True`` without
+    ever holding the full dataset in memory. The first column is the sort
+    key (time) and must be ascending across all appends.
+
+    Args:
+        directory: Target directory (created if missing)
+        append: Add rows to an existing store instead of replacing it
+        **columns: Equal-length arrays, e.g. ``t=times, price=prices``
+
+    Returns:
+        int: Total number of rows in the store
+    """
+    arrays = {name: np.ascontiguousarray(col) for name, col in columns.items()}
+    if not arrays:
+        raise ValueError("at least one column is required")
+    shapes = {col.shape for col in arrays.values()}
+    if len(shapes) != 1 or len(next(iter(shapes))) != 1:
+        raise ValueError("columns must be one-dimensional and of equal length")
+    key = next(iter(arrays.values()))
+    if key.size > 1 and np.any(key[1:] < key[:-1]):
+        raise ValueError("the first column must be sorted in ascending order")
+
+    os.makedirs(directory, exist_ok=True)
+    meta_path = os.path.join(directory, _META_FILE)
+    rows = 0
+    if append and os.path.exists(meta_path):
+        with open(meta_path) as f:
+            meta = json.load(f)
+        if list(meta["columns"]) != list(arrays):
+            raise ValueError(f"columns must match the store: {list(meta['columns'])}")
+        rows = meta["rows"]
+        if rows and key.size:
+            last = np.memmap(os.path.join(directory, f"{meta['key']}.bin"),
+                             dtype=meta["columns"][meta["key"]], mode="r")[-1]
+            if key[0] < last:
+                raise ValueError("appended rows must not start before the last stored row")
+        arrays = {name: col.astype(meta["columns"][name], copy=False)
+                  for name, col in arrays.items()}
+    else:
+        meta = {"key": next(iter(arrays)),
+                "columns": {name: col.dtype.str for name, col in arrays.items()}}
+        for name in arrays:
+            open(os.path.join(directory, f"{name}.bin"), "wb").close()
+        _remove_overviews(directory)
+
+    for name, col in arrays.items():
+        with open(os.path.join(directory, f"{name}.bin"), "ab") as f:
+            f.write(col.tobytes())
+    meta["rows"] = rows + key.size
+    with open(meta_path, "w") as f:
+        json.dump(meta, f)
+    if append:
+        # Overviews cover the old row count only
+        _remove_overviews(directory)
+    return meta["rows"]
+
+
+def _remove_overviews(directory: str) -> None:
+    for name in os.listdir(directory):
+        if name.startswith(".overview-"):
+            os.remove(os.path.join(directory, name))
+
+
+class MmapColumns:
+    """
+    Read-only, memory-mapped view of a column store written by ``write_columns``.
+
+    Rows are located with a sparse time index holding the first key of every
+    chunk (in memory) followed by a binary search inside one chunk of the
+    mapped key column. Chunks are materialized as in-memory arrays on demand
+    and kept in an LRU cache of ``cache_chunks`` entries, so the resident set
+    stays bounded however large the files are. ``prefetch`` loads the chunks
+    next to a requested range on a background thread.
+
+    Args:
+        directory: Store directory
+        chunk_size: Rows per chunk
+        cache_chunks: Materialized chunks kept in memory
+
+    Example:
+        write_columns("ticks/", t=times, price=prices)
+        store = MmapColumns("ticks/")
+        start, stop = store.visible_range(x_min, x_max)
+    """
+
+    def __init__(self, directory: str, chunk_size: int = 1_000_000, cache_chunks: int = 16):
+        with open(os.path.join(directory, _META_FILE)) as f:
+            meta = json.load(f)
+        self.directory = directory
+        self.key: str = meta["key"]
+        self.rows: int = meta["rows"]
+        self.chunk_size = chunk_size
+        self.cache_chunks = max(cache_chunks, 2)
+        self.columns: Dict[str, np.ndarray] = {}
+        for name, dtype in meta["columns"].items():
+            path = os.path.join(directory, f"{name}.bin")
+            self.columns[name] = (np.memmap(path, dtype=dtype, mode="r", shape=(self.rows,))
+                                  if self.rows else np.empty(0, dtype=dtype))
+        self.chunks = -(-self.rows // chunk_size)
+        # Sparse index: first key of every chunk
+        self.index = np.array(self.columns[self.key][::chunk_size], dtype=np.float64)
+
+        self._cache: "OrderedDict[int, Dict[str, np.ndarray]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._loading: Dict[int, threading.Event] = {}
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def __len__(self) -> int:
+        return self.rows
+
+    def search(self, value: float, side: str = "left") -> int:
+        """Row position of ``value`` in the key column (like ``np.searchsorted``)."""
+        if self.rows == 0:
+            return 0
+        chunk = int(np.searchsorted(self.index, value, side="right")) - 1
+        if chunk < 0:
+            return 0
+        # The position may fall on the next chunk's first row for side="left"
+        first = chunk * self.chunk_size
+        stop = min(first + self.chunk_size + 1, self.rows)
+        keys = self.columns[self.key][first:stop]
+        return first + int(np.searchsorted(keys, value, side=side))
+
+    def visible_range(self, x_min: float, x_max: float) -> Tuple[int, int]:
+        """``[start, stop)`` rows covering ``x_min..x_max`` plus one row on each side."""
+        start = max(self.search(x_min, "left") - 1, 0)
+        stop = min(self.search(x_max, "right") + 1, self.rows)
+        return start, stop
+
+    def _load(self, chunk: int) -> Dict[str, np.ndarray]:
+        first = chunk * self.chunk_size
+        stop = min(first + self.chunk_size, self.rows)
+        data = {name: np.array(col[first:stop]) for name, col in self.columns.items()}
+        for col in self.columns.values():
+            _release_pages(col, first, stop)
+        return data
+
+    def chunk(self, chunk: int) -> Dict[str, np.ndarray]:
+        """Returns chunk ``chunk`` as in-memory arrays, loading it if needed."""
+        while True:
+            with self._lock:
+                data = self._cache.get(chunk)
+                if data is not None:
+                    self._cache.move_to_end(chunk)
+                    return data
+                pending = self._loading.get(chunk)
+                if pending is None:
+                    pending = self._loading[chunk] = threading.Event()
+                    break
+            # Another thread (usually the prefetcher) is loading it
+            pending.wait()
+
+        try:
+            data = self._load(chunk)
+            with self._lock:
+                self._cache[chunk] = data
+                while len(self._cache) > self.cache_chunks:
+                    self._cache.popitem(last=False)
+        finally:
+            with self._lock:
+                del self._loading[chunk]
+            pending.set()
+        return data
+
+    def read(self, start: int, stop: int, names: Optional[Sequence[str]] = None
+             ) -> Tuple[np.ndarray, ...]:
+        """
+        Returns rows ``[start, stop)`` of the given columns (default: all).
+
+        A range inside one chunk is returned as views of the cached chunk;
+        ranges spanning chunks are concatenated.
+        """
+        names = list(names or self.columns)
+        start = max(start, 0)
+        stop = min(stop, self.rows)
+        if stop <= start:
+            return tuple(np.empty(0, dtype=self.columns[name].dtype) for name in names)
+        first, last = start // self.chunk_size, (stop - 1) // self.chunk_size
+        parts: List[List[np.ndarray]] = [[] for _ in names]
+        for c in range(first, last + 1):
+            data = self.chunk(c)
+            offset = c * self.chunk_size
+            lo = max(start - offset, 0)
+            hi = min(stop - offset, self.chunk_size)
+            for part, name in zip(parts, names):
+                part.append(data[name][lo:hi])
+        return tuple(p[0] if len(p) == 1 else np.concatenate(p) for p in parts)
+
+    def prefetch(self, start: int, stop: int) -> None:
+        """Loads the chunks before and after ``[start, stop)`` on a background thread."""
+        if self.rows == 0:
+            return
+        first, last = start // self.chunk_size, max(stop - 1, start) // self.chunk_size
+        wanted = [c for c in (first - 1, last + 1) if 0 <= c < self.chunks]
+        with self._lock:
+            wanted = [c for c in wanted if c not in self._cache and c not in self._loading]
+        if not wanted:
+            return
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1,
+                                                thread_name_prefix="pegasus-prefetch")
+        for c in wanted:
+            self._executor.submit(self.chunk, c)
+
+    def iter_chunks(self, names: Optional[Iterable[str]] = None):
+        """Yields every chunk's columns in order without filling the cache."""
+        names = list(names or self.columns)
+        for c in range(self.chunks):
+            data = self._load(c)
+            yield tuple(data[name] for name in names)
+
+    def close(self) -> None:
+        """Stops the prefetch thread and drops cached chunks."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        with self._lock:
+            self._cache.clear()
+
+
+def _release_pages(col: np.ndarray, start: int, stop: int) -> None:
+    """Tells the OS the mapped pages of ``col[start:stop]`` are no longer needed."""
+    raw = getattr(col, "_mmap", None)
+    if raw is None or not hasattr(raw, "madvise") or not hasattr(mmap, "MADV_DONTNEED"):
+        return
+    itemsize = col.dtype.itemsize
+    offset = col.offset + start * itemsize
+    begin = offset - offset % mmap.PAGESIZE
+    length = col.offset + stop * itemsize - begin
+    if length > 0:
+        raw.madvise(mmap.MADV_DONTNEED, begin, length)
+
+
+def _overview(store: MmapColumns, name: str, block: int, build) -> np.ndarray:
+    """Loads a per-block summary of the store, building and caching it on first use."""
+    path = os.path.join(store.directory, f".overview-{name}-{block}.npy")
+    if os.path.exists(path):
+        return np.load(path)
+    overview = build()
+    try:
+        np.save(path, overview)
+    except OSError:
+        pass  # Read-only store: keep the overview in memory only
+    return overview
+
+
+def _block_range(block: int, start: int, stop: int) -> Tuple[int, int]:
+    """Overview blocks touched by rows ``[start, stop)``."""
+    return start // block, (stop - 1) // block + 1
+
+
+class MmapLineSource:
+    """
+    Viewport queries over an (x, y) pair of ``MmapColumns``.
+
+    Zoomed in, the visible rows are read exactly. Zoomed out, rows are reduced
+    to the min and max of evenly sized buckets, like ``MinMaxPyramid``. Once
+    buckets are larger than ``overview_block`` rows, a per-block min/max
+    overview (built in one pass on first use and cached next to the columns)
+    is used instead, so even a full-file view reads no raw rows.
+
+    Args:
+        store: Column store
+        x: Key column name (defaults to the store's key)
+        y: Value column name
+        overview_block: Rows per overview block
+    """
+
+    def __init__(self, store: MmapColumns, y: str, x: Optional[str] = None,
+                 overview_block: int = 4096):
+        self.store = store
+        self.x = x or store.key
+        self.y = y
+        self.overview_block = overview_block
+        self._overview: Optional[np.ndarray] = None
+
+    @property
+    def bounds(self) -> Tuple[float, float]:
+        """First and last x value."""
+        keys = self.store.columns[self.x]
+        return (float(keys[0]), float(keys[-1])) if len(keys) else (0.0, 0.0)
+
+    def overview(self) -> np.ndarray:
+        """``(4, blocks)`` array of x at min, min y, x at max, max y per block."""
+        if self._overview is None:
+            self._overview = _overview(self.store, f"{self.y}-minmax", self.overview_block,
+                                       self._build_overview)
+        return self._overview
+
+    def _build_overview(self) -> np.ndarray:
+        parts = []
+        block = self.overview_block
+        carry_x = carry_y = np.empty(0)
+        for x, y in self.store.iter_chunks((self.x, self.y)):
+            x = np.concatenate((carry_x, x))
+            y = np.concatenate((carry_y, y))
+            whole = x.size - x.size % block
+            if whole:
+                parts.append(_minmax_buckets(x[:whole], y[:whole], block, ordered=False))
+            carry_x, carry_y = x[whole:], y[whole:]
+        if carry_x.size:
+            parts.append(_minmax_buckets(carry_x, carry_y, block, ordered=False))
+        return np.concatenate(parts, axis=1) if parts else np.empty((4, 0))
+
+    def query(self, x_min: float, x_max: float, max_points: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Returns at most about ``max_points`` (x, y) vertices for the visible range."""
+        start, stop = self.store.visible_range(x_min, x_max)
+        self.store.prefetch(start, stop)
+        count = stop - start
+        if count <= max_points:
+            return self.store.read(start, stop, (self.x, self.y))
+
+        bucket = -(-count // max(max_points // 2, 1))
+        if bucket < self.overview_block:
+            x, y = self.store.read(start, stop, (self.x, self.y))
+            return _interleave(_minmax_buckets(x, y, bucket))
+
+        b0, b1 = _block_range(self.overview_block, start, stop)
+        overview = self.overview()[:, b0:b1]
+        group = -(-bucket // self.overview_block)
+        return _interleave(_group_minmax(overview, group))
+
+
+def _minmax_buckets(x: np.ndarray, y: np.ndarray, bucket: int, ordered: bool = True) -> np.ndarray:
+    """``(4, buckets)`` x at min, min, x at max, max of consecutive buckets."""
+    pad = (-x.size) % bucket
+    if pad:
+        x = np.concatenate((x, np.repeat(x[-1:], pad)))
+        y = np.concatenate((y, np.repeat(y[-1:], pad)))
+    xs = x.reshape(-1, bucket)
+    ys = y.reshape(-1, bucket)
+    rows = np.arange(xs.shape[0])
+    imin = ys.argmin(axis=1)
+    imax = ys.argmax(axis=1)
+    return np.stack((xs[rows, imin], ys[rows, imin], xs[rows, imax], ys[rows, imax]))
+
+
+def _group_minmax(overview: np.ndarray, group: int) -> np.ndarray:
+    """Merges ``group`` consecutive overview blocks."""
+    if group <= 1:
+        return overview
+    starts = np.arange(0, overview.shape[1], group)
+    x_lo, lo, x_hi, hi = overview
+    imin = _argreduce(lo, starts, np.minimum)
+    imax = _argreduce(hi, starts, np.maximum)
+    return np.stack((x_lo[imin], lo[imin], x_hi[imax], hi[imax]))
+
+
+def _argreduce(values: np.ndarray, starts: np.ndarray, op) -> np.ndarray:
+    """Index of the min/max of every group starting at ``starts``."""
+    extreme = op.reduceat(values, starts)
+    group = np.repeat(np.arange(starts.size), np.diff(np.append(starts, values.size)))
+    hits = np.flatnonzero(values == extreme[group])
+    # First hit per group
+    first = np.unique(group[hits], return_index=True)[1]
+    return hits[first]
+
+
+def _interleave(buckets: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Emits each bucket's min and max in x order as one (x, y) polyline."""
+    x_lo, lo, x_hi, hi = buckets
+    swap = x_hi < x_lo
+    x = np.empty(2 * x_lo.size)
+    y = np.empty_like(x)
+    x[0::2] = np.where(swap, x_hi, x_lo)
+    y[0::2] = np.where(swap, hi, lo)
+    x[1::2] = np.where(swap, x_lo, x_hi)
+    y[1::2] = np.where(swap, lo, hi)
+    return x, y
+
+
+class MmapOHLCSource:
+    """
+    Viewport queries over OHLC columns of ``MmapColumns``.
+
+    When more bars are visible than requested, consecutive bars are merged
+    (first open, max high, min low, last close) into at most ``max_bars``
+    candles. Merges larger than ``overview_block`` bars use a per-block OHLC
+    overview built once and cached next to the columns.
+
+    Args:
+        store: Column store
+        date, open, high, low, close: Column names
+        overview_block: Bars per overview block
+    """
+
+    def __init__(self, store: MmapColumns, date: Optional[str] = None, open: str = "open",
+                 high: str = "high", low: str = "low", close: str = "close",
+                 overview_block: int = 1024):
+        self.store = store
+        self.names = (date or store.key, open, high, low, close)
+        self.overview_block = overview_block
+        self._overview: Optional[np.ndarray] = None
+
+    @property
+    def bounds(self) -> Tuple[float, float]:
+        """First and last bar date."""
+        keys = self.store.columns[self.names[0]]
+        return (float(keys[0]), float(keys[-1])) if len(keys) else (0.0, 0.0)
+
+    def overview(self) -> np.ndarray:
+        """``(5, blocks)`` array of merged (date, open, high, low, close) per block."""
+        if self._overview is None:
+            self._overview = _overview(self.store, "ohlc", self.overview_block,
+                                       self._build_overview)
+        return self._overview
+
+    def _build_overview(self) -> np.ndarray:
+        parts = []
+        block = self.overview_block
+        carry = tuple(np.empty(0) for _ in self.names)
+        for columns in self.store.iter_chunks(self.names):
+            columns = tuple(np.concatenate((c, col)) for c, col in zip(carry, columns))
+            whole = columns[0].size - columns[0].size % block
+            if whole:
+                parts.append(_merge_bars(tuple(col[:whole] for col in columns), block))
+            carry = tuple(col[whole:] for col in columns)
+        if carry[0].size:
+            parts.append(_merge_bars(carry, block))
+        return np.concatenate(parts, axis=1) if parts else np.empty((5, 0))
+
+    def query(self, x_min: float, x_max: float, max_bars: int) -> Tuple[np.ndarray, ...]:
+        """Returns at most about ``max_bars`` (dates, opens, highs, lows, closes)."""
+        start, stop = self.store.visible_range(x_min, x_max)
+        self.store.prefetch(start, stop)
+        count = stop - start
+        if count <= max_bars:
+            return self.store.read(start, stop, self.names)
+
+        bucket = -(-count // max(max_bars, 1))
+        if bucket < self.overview_block:
+            return tuple(_merge_bars(self.store.read(start, stop, self.names), bucket))
+
+        b0, b1 = _block_range(self.overview_block, start, stop)
+        group = -(-bucket // self.overview_block)
+        return tuple(_merge_bars(tuple(self.overview()[:, b0:b1]), group))
+
+
+def _merge_bars(columns: Tuple[np.ndarray, ...], group: int) -> np.ndarray:
+    """Merges every ``group`` consecutive bars into one; returns a ``(5, bars)`` array."""
+    dates, opens, highs, lows, closes = columns
+    if group <= 1:
+        return np.stack(columns)
+    starts = np.arange(0, dates.size, group)
+    ends = np.minimum(starts + group, dates.size) - 1
+    return np.stack((dates[starts], opens[starts], np.maximum.reduceat(highs, starts),
+                     np.minimum.reduceat(lows, starts), closes[ends]))
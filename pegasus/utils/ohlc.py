@@ -0,0 +1,221 @@
+"""Tick-to-OHLC aggregation across multiple timeframes."""
+import threading
+from typing import Dict, Iterable, Optional, Tuple, Union
+
+import numpy as np
+
+from pegasus.performance.buffers import RingBuffer
+
+# Timeframe names understood by ``timeframe_seconds``
+TIMEFRAMES: Dict[str, int] = {
+    "M1": 60,
+    "M5": 300,
+    "M15": 900,
+    "M30": 1_800,
+    "H1": 3_600,
+    "H4": 14_400,
+    "D1": 86_400,
+}
+
+OHLC = Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]
+
+
+def timeframe_seconds(timeframe: Union[str, int, float]) -> float:
+    """Returns the bar length in seconds for a name like ``"M5"`` or a number of seconds."""
+    if isinstance(timeframe, str):
+        try:
+            return float(TIMEFRAMES[timeframe.upper()])
+        except KeyError:
+            raise ValueError(
+                f"Unknown timeframe {timeframe!r}, expected one of {list(TIMEFRAMES)}"
+            ) from None
+    if timeframe <= 0:
+        raise ValueError("timeframe must be positive")
+    return float(timeframe)
+
+
+def resample_ohlc(dates, opens, highs, lows, closes, timeframe: Union[str, int, float]) -> OHLC:
+    """
+    Aggregates time-sorted bars (or ticks) into coarser bars in one vectorized pass.
+
+    Each output bar starts at ``floor(t / seconds) * seconds`` and takes the first
+    open, max high, min low and last close of its group.
+
+    Args:
+        dates: Sorted Unix timestamps
+        opens, highs, lows, closes: Price columns
+        timeframe: Target bar length, e.g. ``"M5"`` or ``300``
+
+    Returns:
+        tuple: (dates, opens, highs, lows, closes) of the aggregated bars
+    """
+    seconds = timeframe_seconds(timeframe)
+    dates = np.asarray(dates, dtype=np.float64)
+    if dates.size == 0:
+        empty = np.empty(0, dtype=np.float64)
+        return empty, empty, empty, empty, empty
+
+    buckets = np.floor(dates / seconds) * seconds
+    starts = np.flatnonzero(np.concatenate(([True], buckets[1:] != buckets[:-1])))
+    ends = np.append(starts[1:], dates.size) - 1
+    return (
+        buckets[starts],
+        np.asarray(opens, dtype=np.float64)[starts],
+        np.maximum.reduceat(np.asarray(highs, dtype=np.float64), starts),
+        np.minimum.reduceat(np.asarray(lows, dtype=np.float64), starts),
+        np.asarray(closes, dtype=np.float64)[ends],
+    )
+
+
+def ticks_to_ohlc(times, prices, timeframe: Union[str, int, float]) -> OHLC:
+    """Aggregates time-sorted ticks into OHLC bars (see ``resample_ohlc``)."""
+    return resample_ohlc(times, prices, prices, prices, prices, timeframe)
+
+
+class TimeframeBars:
+    """
+    Bars of one timeframe: closed bars in a ``RingBuffer`` plus the open bar.
+
+    Updating with a tick only mutates the open bar; a bar moves to the closed
+    buffer once a tick of a later bucket arrives. ``closed_version`` and
+    ``open_version`` count changes so renderers can re-send only what moved;
+    ``resets`` counts ``clear`` calls so they can drop derived state.
+
+    Args:
+        timeframe: Bar length, e.g. ``"M1"`` or seconds
+        capacity: Number of closed bars kept
+        lock: Lock shared with the owning ``BarAggregator``
+    """
+
+    def __init__(self, timeframe: Union[str, int, float], capacity: int = 100_000,
+                 lock: Optional[threading.Lock] = None):
+        self.timeframe = timeframe
+        self.seconds = timeframe_seconds(timeframe)
+        self.closed = RingBuffer(capacity, columns=5)
+        self.open_bar: Optional[np.ndarray] = None  # [t, o, h, l, c]
+        self.closed_version = 0
+        self.open_version = 0
+        self.resets = 0
+        self.lock = lock or threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.closed) + (self.open_bar is not None)
+
+    def update(self, t: float, price: float) -> None:
+        """Applies one tick in O(1). Ticks older than the open bar are folded into it."""
+        bucket = (t // self.seconds) * self.seconds
+        bar = self.open_bar
+        if bar is not None and bucket <= bar[0]:
+            if price > bar[2]:
+                bar[2] = price
+            if price < bar[3]:
+                bar[3] = price
+            bar[4] = price
+        else:
+            if bar is not None:
+                self.closed.append(*bar)
+                self.closed_version += 1
+            self.open_bar = np.array([bucket, price, price, price, price])
+        self.open_version += 1
+
+    def merge(self, dates, opens, highs, lows, closes) -> None:
+        """
+        Merges time-sorted bars of this timeframe, e.g. from ``resample_ohlc``.
+
+        The first bar is folded into the open bar if it belongs to the same
+        bucket; all but the last remaining bar are closed in one ``extend``.
+        """
+        if len(dates) == 0:
+            return
+        bar = self.open_bar
+        first = 0
+        if bar is not None and dates[0] <= bar[0]:
+            bar[2] = max(bar[2], highs[0])
+            bar[3] = min(bar[3], lows[0])
+            bar[4] = closes[0]
+            first = 1
+        if first < len(dates):
+            last = len(dates) - 1
+            if bar is not None:
+                self.closed.append(*bar)
+            if last > first:
+                self.closed.extend(dates[first:last], opens[first:last], highs[first:last],
+                                   lows[first:last], closes[first:last])
+            if bar is not None or last > first:
+                self.closed_version += 1
+            self.open_bar = np.array(
+                [dates[last], opens[last], highs[last], lows[last], closes[last]], dtype=np.float64)
+        self.open_version += 1
+
+    def clear(self) -> None:
+        """Drops all bars, e.g. to rewind a replay."""
+        self.closed.clear()
+        self.open_bar = None
+        self.closed_version += 1
+        self.open_version += 1
+        self.resets += 1
+
+    def arrays(self) -> OHLC:
+        """Returns all bars, closed and open, as new contiguous arrays."""
+        columns = self.closed.views()
+        if self.open_bar is None:
+            return tuple(np.array(col) for col in columns)
+        return tuple(np.append(col, value) for col, value in zip(columns, self.open_bar))
+
+
+class BarAggregator:
+    """
+    Maintains OHLC bars for several timeframes from one tick stream.
+
+    ``update`` is O(1) per tick and timeframe. Batches (``update_many``) and
+    history (``load_ticks``/``load_bars``) are aggregated with vectorized
+    group reductions and merged into the open bars.
+
+    Args:
+        timeframes: Timeframes to maintain, e.g. ``("M1", "M5", "H1", "D1")``
+        capacity: Number of closed bars kept per timeframe
+
+    Example:
+        agg = BarAggregator(("M1", "M5", "H1", "D1"))
+        agg.load_ticks(hist_times, hist_prices)
+        agg.update(t, price)
+        m5 = agg["M5"]
+    """
+
+    def __init__(self, timeframes: Iterable[Union[str, int, float]] = ("M1", "M5", "H1", "D1"),
+                 capacity: int = 100_000):
+        self.lock = threading.Lock()
+        self.timeframes: Dict[Union[str, int, float], TimeframeBars] = {
+            tf: TimeframeBars(tf, capacity, lock=self.lock) for tf in timeframes
+        }
+
+    def __getitem__(self, timeframe: Union[str, int, float]) -> TimeframeBars:
+        return self.timeframes[timeframe]
+
+    def update(self, t: float, price: float) -> None:
+        """Applies one tick to every timeframe."""
+        with self.lock:
+            for bars in self.timeframes.values():
+                bars.update(t, price)
+
+    def update_many(self, times, prices) -> None:
+        """Applies a time-sorted batch of ticks to every timeframe."""
+        times = np.asarray(times, dtype=np.float64)
+        prices = np.asarray(prices, dtype=np.float64)
+        with self.lock:
+            for bars in self.timeframes.values():
+                bars.merge(*ticks_to_ohlc(times, prices, bars.seconds))
+
+    load_ticks = update_many
+
+    def clear(self) -> None:
+        """Drops the bars of every timeframe."""
+        with self.lock:
+            for bars in self.timeframes.values():
+                bars.clear()
+
+    def load_bars(self, dates, opens, highs, lows, closes) -> None:
+        """Aggregates finer historical bars (e.g. M1 from ``load_ohlc_csv``) into every timeframe."""
+        with self.lock:
+            for bars in self.timeframes.values():
+                bars.merge(*resample_ohlc(dates, opens, highs, lows, closes, bars.seconds))
@@ -0,0 +1,392 @@
+"""Vectorized, incremental Renko, Kagi and Point & Figure engines."""
+from typing import Optional, Tuple
+
+import numpy as np
+
+from pegasus.performance.buffers import GrowableBuffer
+
+# Upper bound on the block length used by ``play_scan``
+_MAX_SCAN_BLOCK = 1024
+
+
+def play_scan(lo: np.ndarray, hi: np.ndarray, start: float) -> np.ndarray:
+    """
+    Computes ``s[t] = clip(s[t - 1], lo[t], hi[t])`` for every ``t`` without a per-element loop.
+
+    This hysteresis recursion (the "play" operator) is the core of Renko, Kagi
+    and Point & Figure construction. Composing two clips gives another clip,
+    so the recursion is an associative scan. It is evaluated blockwise: the
+    composite clip of every block is computed with one vectorized step per
+    block column, block composites are prefix-scanned, and each block is then
+    replayed from its entry state. Runs of identical ``(lo, hi)`` bounds are
+    collapsed first, since re-applying the same clip changes nothing.
+
+    Args:
+        lo: Lower bounds, ``lo <= hi`` elementwise
+        hi: Upper bounds
+        start: State before the first element
+
+    Returns:
+        np.ndarray: State after each element
+    """
+    n = len(lo)
+    if n == 0:
+        return np.empty(0, dtype=np.result_type(lo, hi))
+
+    keep = np.empty(n, dtype=bool)
+    keep[0] = True
+    np.not_equal(lo[1:], lo[:-1], out=keep[1:])
+    keep[1:] |= hi[1:] != hi[:-1]
+    positions = np.flatnonzero(keep)
+    m = positions.size
+
+    if m < n:
+        lo = lo[positions]
+        hi = hi[positions]
+
+    # Pad with the last bound (a no-op clip) to fill whole blocks, then lay
+    # blocks out as columns so each step below reads one contiguous row
+    block = int(min(max(np.sqrt(m), 16), _MAX_SCAN_BLOCK))
+    blocks = -(-m // block)
+    pad = blocks * block - m
+    low = np.concatenate([lo, np.repeat(lo[-1:], pad)]).reshape(blocks, block)
+    high = np.concatenate([hi, np.repeat(hi[-1:], pad)]).reshape(blocks, block)
+    low = np.ascontiguousarray(low.T)
+    high = np.ascontiguousarray(high.T)
+
+    # Composite clip of every block
+    comp_low = low[0].copy()
+    comp_high = high[0].copy()
+    for j in range(1, block):
+        _clip(comp_low, low[j], high[j])
+        _clip(comp_high, low[j], high[j])
+
+    # Inclusive prefix scan of block composites
+    shift = 1
+    while shift < blocks:
+        new_low = np.clip(comp_low[:-shift], comp_low[shift:], comp_high[shift:])
+        new_high = np.clip(comp_high[:-shift], comp_low[shift:], comp_high[shift:])
+        comp_low[shift:] = new_low
+        comp_high[shift:] = new_high
+        shift *= 2
+
+    # Replay each block from the state it is entered with; rows of `low` are
+    # no longer needed once read, so they receive the states
+    state = np.empty(blocks, dtype=comp_low.dtype)
+    state[0] = start
+    state[1:] = np.clip(start, comp_low[:-1], comp_high[:-1])
+    for j in range(block):
+        _clip(state, low[j], high[j])
+        low[j] = state
+
+    states = low.T.reshape(-1)[:m]
+    if m == n:
+        return states
+    # Collapsed elements repeat the state of the element they were merged into
+    return states[np.cumsum(keep) - 1]
+
+
+def _clip(values: np.ndarray, lo: np.ndarray, hi: np.ndarray) -> None:
+    """In-place ``np.clip`` without its argument checking overhead."""
+    np.maximum(values, lo, out=values)
+    np.minimum(values, hi, out=values)
+
+
+def _runs(states: np.ndarray, start) -> Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+    """
+    Splits state changes into runs of the same direction.
+
+    Returns:
+        (end_index, direction, end_state) per run, or None if the state never moved
+    """
+    prev = np.empty_like(states)
+    prev[0] = start
+    prev[1:] = states[:-1]
+    moved = np.flatnonzero(states != prev)
+    if moved.size == 0:
+        return None
+    direction = np.sign(states[moved] - prev[moved]).astype(np.int8)
+    last_of_run = np.flatnonzero(np.append(direction[1:] != direction[:-1], True))
+    end = moved[last_of_run]
+    return end, direction[last_of_run], states[end]
+
+
+def _tick_times(times, start: int, n: int) -> np.ndarray:
+    if times is None:
+        return np.arange(start, start + n, dtype=np.float64)
+    return np.asarray(times, dtype=np.float64)
+
+
+class RenkoBuilder:
+    """
+    Builds Renko bricks from a price stream.
+
+    A new brick forms once price closes one box beyond the last brick in its
+    direction, or two boxes against it (reversal). Batches are processed with
+    ``play_scan``; state carries over so ``extend`` can be called repeatedly
+    as prices arrive without rebuilding earlier bricks.
+
+    Args:
+        box_size: Brick height in price units
+        base: Price the brick grid is anchored to (defaults to the first price)
+    """
+
+    def __init__(self, box_size: float, base: Optional[float] = None):
+        if box_size <= 0:
+            raise ValueError("box_size must be positive")
+        self.box_size = float(box_size)
+        self.base = base
+        self._state: Optional[int] = None  # Last brick spans levels [state, state + 1]
+        self._count = 0
+        self._bricks = GrowableBuffer(columns=4)  # time, low, high, direction
+
+    def __len__(self) -> int:
+        return len(self._bricks)
+
+    def extend(self, prices, times=None) -> int:
+        """
+        Adds prices (and optional timestamps) and returns the number of new bricks.
+
+        Without ``times``, bricks are stamped with the running tick index.
+        """
+        prices = np.asarray(prices, dtype=np.float64)
+        n = prices.size
+        if n == 0:
+            return 0
+        times = _tick_times(times, self._count, n)
+        self._count += n
+        if self.base is None:
+            self.base = float(prices[0])
+
+        units = (prices - self.base) / self.box_size
+        lo = np.floor(units).astype(np.int64) - 1
+        hi = np.ceil(units).astype(np.int64)
+        if self._state is None:
+            self._state = int(lo[0])
+        states = play_scan(lo, hi, self._state)
+
+        prev = np.empty_like(states)
+        prev[0] = self._state
+        prev[1:] = states[:-1]
+        self._state = int(states[-1])
+        moved = np.flatnonzero(states != prev)
+        if moved.size == 0:
+            return 0
+
+        # Moving from level a to b adds one brick per level in between
+        step = np.sign(states[moved] - prev[moved])
+        counts = np.abs(states[moved] - prev[moved])
+        first = prev[moved] + step
+        total = int(counts.sum())
+        offsets = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+        direction = np.repeat(step, counts)
+        levels = np.repeat(first, counts) + direction * offsets
+
+        low = self.base + levels * self.box_size
+        self._bricks.extend(np.repeat(times[moved], counts), low, low + self.box_size,
+                            direction)
+        return total
+
+    def bricks(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Returns (times, lows, highs, directions) of all bricks as views."""
+        return self._bricks.views()
+
+    def candles(self) -> Tuple[np.ndarray, ...]:
+        """Returns bricks as (index, opens, highs, lows, closes) for a candle series."""
+        _, low, high, direction = self._bricks.views()
+        up = direction > 0
+        return (np.arange(low.size, dtype=np.float64), np.where(up, low, high), high, low,
+                np.where(up, high, low))
+
+
+class KagiBuilder:
+    """
+    Builds a Kagi line from a price stream.
+
+    The line keeps its direction while price extends and turns once price
+    retraces ``reversal`` from the latest extreme. Turning points come from a
+    continuous ``play_scan`` of width ``reversal``. Each vertex is also
+    classified yang (thick) or yin (thin): a swing turns the line yang when
+    it exceeds the previous shoulder and yin when it breaks the previous waist.
+
+    Args:
+        reversal: Reversal amount in price units
+    """
+
+    def __init__(self, reversal: float):
+        if reversal <= 0:
+            raise ValueError("reversal must be positive")
+        self.reversal = float(reversal)
+        self._state: Optional[float] = None
+        self._direction = 0
+        self._count = 0
+        self._vertices = GrowableBuffer(columns=2)  # time, price
+
+    def __len__(self) -> int:
+        return len(self._vertices)
+
+    def extend(self, prices, times=None) -> int:
+        """Adds prices and returns the change in the number of vertices."""
+        prices = np.asarray(prices, dtype=np.float64)
+        n = prices.size
+        if n == 0:
+            return 0
+        times = _tick_times(times, self._count, n)
+        self._count += n
+        before = len(self._vertices)
+        if self._state is None:
+            self._state = float(prices[0]) - self.reversal
+            self._vertices.extend(times[:1], prices[:1])
+
+        states = play_scan(prices - self.reversal, prices, self._state)
+        runs = _runs(states, self._state)
+        self._state = float(states[-1])
+        if runs is None:
+            return 0
+        end, direction, end_state = runs
+        extremes = np.where(direction > 0, end_state + self.reversal, end_state)
+
+        vertex_t, vertex_p = self._vertices.views()
+        if direction[0] == self._direction:
+            # The current swing continues: move its extreme
+            vertex_t[-1] = times[end[0]]
+            vertex_p[-1] = extremes[0]
+            end, extremes = end[1:], extremes[1:]
+        self._vertices.extend(times[end], extremes)
+        self._direction = int(direction[-1])
+        return len(self._vertices) - before
+
+    def vertices(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Returns (times, prices) of the turning points, starting with the first price."""
+        return self._vertices.views()
+
+    def yang(self) -> np.ndarray:
+        """Returns a bool per vertex: True where the line leading into it is yang (thick)."""
+        _, price = self._vertices.views()
+        state = np.zeros(price.size, dtype=np.int8)
+        if price.size > 2:
+            rising = price[2:] > price[1:-1]
+            state[2:] = np.where(rising & (price[2:] > price[:-2]), 1,
+                                 np.where(~rising & (price[2:] < price[:-2]), -1, 0))
+        if price.size > 1:
+            state[1] = 1 if price[1] > price[0] else -1
+        # Carry the last break forward
+        last = np.maximum.accumulate(np.where(state != 0, np.arange(state.size), 0))
+        return state[last] > 0
+
+    def line(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Returns step-line (x, y) points: vertical swings joined by unit-width shoulders."""
+        _, price = self._vertices.views()
+        if price.size == 0:
+            empty = np.empty(0, dtype=np.float64)
+            return empty, empty
+        k = np.arange(price.size, dtype=np.float64)
+        x = np.empty(2 * price.size - 1)
+        y = np.empty_like(x)
+        x[0::2] = k
+        x[1::2] = k[1:]
+        y[0::2] = price
+        y[1::2] = price[:-1]
+        return x, y
+
+
+class PointFigureBuilder:
+    """
+    Builds Point & Figure columns from a price stream.
+
+    X columns extend while price makes new boxes up, O columns while it makes
+    new boxes down; a new column starts after a move of ``reversal`` boxes
+    against the current one. Implemented as an integer ``play_scan``, so
+    batches of any size are processed without per-price Python loops.
+
+    Args:
+        box_size: Box height in price units
+        reversal: Boxes required to start a new column (typically 3)
+        base: Price the box grid is anchored to
+    """
+
+    def __init__(self, box_size: float, reversal: int = 3, base: float = 0.0):
+        if box_size <= 0:
+            raise ValueError("box_size must be positive")
+        if reversal < 1:
+            raise ValueError("reversal must be at least 1")
+        self.box_size = float(box_size)
+        self.reversal = int(reversal)
+        self.base = float(base)
+        self._state: Optional[int] = None
+        self._direction = 0
+        self._origin = 0
+        self._count = 0
+        self._columns = GrowableBuffer(columns=4)  # time, direction, low box, high box
+
+    def __len__(self) -> int:
+        return len(self._columns)
+
+    def extend(self, prices, times=None) -> int:
+        """Adds prices and returns the change in the number of columns."""
+        prices = np.asarray(prices, dtype=np.float64)
+        n = prices.size
+        if n == 0:
+            return 0
+        times = _tick_times(times, self._count, n)
+        self._count += n
+        before = len(self._columns)
+
+        units = (prices - self.base) / self.box_size
+        # Up column with top T is state T - r + 1; down column with bottom K is state K
+        lo = np.floor(units).astype(np.int64) - self.reversal + 1
+        hi = np.ceil(units).astype(np.int64)
+        if self._state is None:
+            self._state = int(lo[0])
+            self._origin = int(np.floor(units[0]))
+
+        states = play_scan(lo, hi, self._state)
+        runs = _runs(states, self._state)
+        self._state = int(states[-1])
+        if runs is None:
+            return 0
+        end, direction, end_state = runs
+        extreme = np.where(direction > 0, end_state + self.reversal - 1, end_state)
+
+        col_t, col_dir, col_low, col_high = self._columns.views()
+        if direction[0] == self._direction:
+            col_t[-1] = times[end[0]]
+            if direction[0] > 0:
+                col_high[-1] = extreme[0]
+            else:
+                col_low[-1] = extreme[0]
+            end, direction, extreme = end[1:], direction[1:], extreme[1:]
+
+        if end.size:
+            # A new column starts one box past the previous column's extreme
+            if len(self._columns):
+                prev_extreme = col_high[-1] if self._direction > 0 else col_low[-1]
+                previous = np.append(prev_extreme, extreme[:-1])
+                other = previous + direction
+            else:
+                other = np.append(self._origin, extreme[:-1] + direction[1:])
+            low = np.where(direction > 0, other, extreme)
+            high = np.where(direction > 0, extreme, other)
+            self._columns.extend(times[end], direction, low, high)
+            self._direction = int(direction[-1])
+        return len(self._columns) - before
+
+    def columns(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Returns (times, directions, low boxes, high boxes) per column."""
+        return self._columns.views()
+
+    def boxes(self) -> Tuple[Tuple[np.ndarray, np.ndarray], Tuple[np.ndarray, np.ndarray]]:
+        """
+        Expands columns into box centres for marker rendering.
+
+        Returns:
+            tuple: ((x, y) of X boxes, (x, y) of O boxes)
+        """
+        _, direction, low, high = self._columns.views()
+        counts = (high - low + 1).astype(np.int64)
+        column = np.repeat(np.arange(counts.size, dtype=np.float64), counts)
+        offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        level = np.repeat(low, counts) + offsets
+        y = self.base + (level + 0.5) * self.box_size
+        up = np.repeat(direction > 0, counts)
+        return (column[up], y[up]), (column[~up], y[~up])
@@ -0,0 +1,21 @@
+"""
+Benchmarks only run with ``pytest --benchmark-only``; a plain ``pytest`` skips them.
+
+They need no display: chart construction runs against the ``recording_dpg``
+stand-in. Runs are stored as JSON in ``tests/benchmarks/baselines`` (see
+``pyproject.toml`` and the README there). Save a baseline, then fail later runs
+whose median regresses by more than 20%::
+
+    pytest tests/benchmarks --benchmark-only --benchmark-save=baseline
+    pytest tests/benchmarks --benchmark-only --benchmark-compare
+"""
+import pytest
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("benchmark_only", False):
+        return
+    skip = pytest.mark.skip(reason="benchmark; run with --benchmark-only")
+    for item in items:
+        if "benchmark" in getattr(item, "fixturenames", ()):
+            item.add_marker(skip)
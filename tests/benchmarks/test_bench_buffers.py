@@ -0,0 +1,86 @@
+"""Buffer and update throughput of ``pegasus.performance``."""
+import numpy as np
+import pytest
+
+from pegasus.performance.buffers import (RingBuffer, RingSeries, UpdateScheduler,
+                                         update_series_data)
+from pegasus.performance.decimation import MinMaxPyramid, RangeMinMax
+
+CAPACITY = 1_000_000
+
+
+def test_bench_ring_buffer_append(benchmark):
+    buffer = RingBuffer(CAPACITY)
+    samples = 10_000
+
+    def append():
+        for i in range(samples):
+            buffer.append(i, 1.0)
+
+    benchmark(append)
+    benchmark.extra_info["appends_per_second"] = samples / benchmark.stats.stats.mean
+
+
+@pytest.mark.parametrize("batch", [100, 10_000])
+def test_bench_ring_buffer_extend(benchmark, batch):
+    buffer = RingBuffer(CAPACITY)
+    x = np.arange(batch, dtype=np.float64)
+    y = np.ones(batch)
+    benchmark(buffer.extend, x, y)
+    benchmark.extra_info["samples_per_second"] = batch / benchmark.stats.stats.mean
+
+
+def test_bench_ring_series_flush(benchmark, recording_dpg):
+    ring = RingSeries(1, CAPACITY)
+    ring.extend(np.arange(CAPACITY, dtype=np.float64), np.ones(CAPACITY))
+    tick = np.ones(1)
+
+    def frame():
+        ring.extend(tick, tick)
+        ring.flush()
+
+    benchmark(frame)
+
+
+def test_bench_update_series_data(benchmark, recording_dpg):
+    x = np.arange(CAPACITY, dtype=np.float64)
+    benchmark(update_series_data, 1, (x, x))
+
+
+@pytest.mark.parametrize("updates", [1_000, 100_000])
+def test_bench_scheduler_apply(benchmark, recording_dpg, updates):
+    scheduler = UpdateScheduler()
+    rings = [RingSeries(tag, 100_000) for tag in range(10)]
+    tick = np.ones(1)
+
+    def frame():
+        # ``updates`` submissions from feed code, coalesced into one apply
+        for i in range(updates):
+            scheduler.append(rings[i % 10], tick, tick)
+        return scheduler.apply()
+
+    benchmark.pedantic(frame, rounds=5, iterations=1)
+    benchmark.extra_info["updates_per_second"] = updates / benchmark.stats.stats.mean
+
+
+def test_bench_pyramid_build(benchmark):
+    x = np.arange(10_000_000, dtype=np.float64)
+    y = np.cumsum(np.random.default_rng(0).normal(size=x.size))
+    benchmark.pedantic(MinMaxPyramid, args=(x, y), rounds=3, iterations=1)
+
+
+def test_bench_pyramid_query(benchmark):
+    x = np.arange(10_000_000, dtype=np.float64)
+    y = np.cumsum(np.random.default_rng(0).normal(size=x.size))
+    pyramid = MinMaxPyramid(x, y)
+    benchmark(pyramid.query, 1_000_000.0, 9_000_000.0, 3_840)
+
+
+@pytest.mark.parametrize("method", ["scan", "index"])
+def test_bench_visible_min_max(benchmark, method):
+    lows = np.cumsum(np.random.default_rng(0).normal(size=10_000_000))
+    highs = lows + 1.0
+    if method == "scan":
+        benchmark(lambda: (lows[1_000_000:9_000_000].min(), highs[1_000_000:9_000_000].max()))
+    else:
+        benchmark(RangeMinMax(lows, highs).minmax, 1_000_000, 9_000_000)
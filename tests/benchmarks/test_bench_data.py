@@ -0,0 +1,81 @@
+"""``load_ohlc_csv`` parse and cache-hit times at 10k, 1M and 10M rows.
+
+Set ``PEGASUS_BENCH_ROWS`` (comma separated) to change the sizes.
+``load_ohlc_many`` is measured on a quarter of one-file-per-day M1 data
+(``PEGASUS_BENCH_DAYS``, default 90), serially and with a process pool. Generated
+CSVs are written once per session to a temporary directory, or to
+``PEGASUS_BENCH_DIR`` if set so they can be reused across runs.
+"""
+import os
+
+import pandas as pd
+import pytest
+from test_data import MINUTES_PER_DAY, write_ohlc_csv
+
+from pegasus.utils.data import load_ohlc_csv, load_ohlc_many
+
+ROWS = [int(n) for n in os.environ.get("PEGASUS_BENCH_ROWS", "10000,1000000,10000000").split(",")]
+DAYS = int(os.environ.get("PEGASUS_BENCH_DAYS", "90"))
+
+
+@pytest.fixture(scope="session")
+def csv_dir(tmp_path_factory):
+    directory = os.environ.get("PEGASUS_BENCH_DIR")
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+        return directory
+    return str(tmp_path_factory.mktemp("ohlc"))
+
+
+@pytest.fixture(params=ROWS, ids=lambda rows: f"{rows}rows")
+def csv_file(request, csv_dir):
+    rows = request.param
+    path = os.path.join(csv_dir, f"ohlc_{rows}.csv")
+    if not os.path.exists(path):
+        write_ohlc_csv(path, rows)
+    return path, rows
+
+
+def _rounds(rows):
+    return 1 if rows >= 10_000_000 else 3
+
+
+def test_bench_load_ohlc_csv_parse(benchmark, csv_file):
+    path, rows = csv_file
+    result = benchmark.pedantic(load_ohlc_csv, args=(path,), kwargs={"cache": False},
+                                rounds=_rounds(rows), iterations=1)
+    assert len(result[0]) == rows
+    benchmark.extra_info["rows_per_second"] = rows / benchmark.stats.stats.mean
+
+
+def test_bench_load_ohlc_csv_cache_hit(benchmark, csv_file, tmp_path):
+    path, rows = csv_file
+    load_ohlc_csv(path, cache_dir=str(tmp_path))
+
+    def load():
+        # Touch every column so the memory map is actually read
+        return [float(col.sum()) for col in load_ohlc_csv(path, cache_dir=str(tmp_path))]
+
+    benchmark.pedantic(load, rounds=_rounds(rows) * 3, iterations=1)
+    benchmark.extra_info["rows_per_second"] = rows / benchmark.stats.stats.mean
+
+
+@pytest.fixture(scope="session")
+def day_files(csv_dir):
+    """One CSV per day, ``DAYS`` days, like ``EURUSD_2025-10-29.csv``."""
+    paths = []
+    for day in pd.date_range("2000-01-01", periods=DAYS, freq="D").strftime("%Y-%m-%d"):
+        path = os.path.join(csv_dir, f"EURUSD_{day}.csv")
+        if not os.path.exists(path):
+            write_ohlc_csv(path, MINUTES_PER_DAY, start=day)
+        paths.append(path)
+    return paths
+
+
+@pytest.mark.parametrize("workers", [1, None], ids=["serial", "pool"])
+def test_bench_load_ohlc_many(benchmark, day_files, workers):
+    result = benchmark.pedantic(load_ohlc_many, args=(day_files,),
+                                kwargs={"max_workers": workers, "cache": False},
+                                rounds=3, iterations=1)
+    assert len(result[0]) == DAYS * MINUTES_PER_DAY
+    benchmark.extra_info["files_per_second"] = DAYS / benchmark.stats.stats.mean
@@ -0,0 +1,49 @@
+"""
+Shared-memory data plane: writer cost, per-frame reader cost and multi-process feed throughput.
+
+``messages_per_second`` in extra_info is the aggregate rate of all feed processes.
+"""
+import os
+
+import numpy as np
+import pytest
+
+from pegasus.dataplane import SharedRingBuffer, SharedRingSeries, shared_memory_throughput
+
+CAPACITY = 1_000_000
+
+
+@pytest.fixture
+def ring():
+    ring = SharedRingBuffer(CAPACITY)
+    yield ring
+    ring.close()
+
+
+@pytest.mark.parametrize("batch", [1, 1_000])
+def test_bench_shared_ring_extend(benchmark, ring, batch):
+    x = np.arange(batch, dtype=np.float64)
+    benchmark(ring.extend, x, x)
+    benchmark.extra_info["samples_per_second"] = batch / benchmark.stats.stats.mean
+
+
+def test_bench_shared_ring_series_flush(benchmark, recording_dpg, ring):
+    """One frame: a new tick published, then the 750k-sample window handed to DPG."""
+    ring.extend(np.arange(CAPACITY, dtype=np.float64), np.ones(CAPACITY))
+    series = SharedRingSeries(1, ring)
+    tick = np.ones(1)
+
+    def frame():
+        ring.extend(tick, tick)
+        recording_dpg.calls.clear()
+        return series.flush()
+
+    benchmark(frame)
+    recording_dpg.calls.clear()
+
+
+@pytest.mark.parametrize("producers", sorted({1, os.cpu_count() or 1}))
+def test_bench_shared_memory_throughput(benchmark, producers):
+    stats = benchmark.pedantic(shared_memory_throughput, args=(2_000_000, producers),
+                               rounds=3, iterations=1)
+    benchmark.extra_info["messages_per_second"] = stats.messages_per_second
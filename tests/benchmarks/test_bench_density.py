@@ -0,0 +1,19 @@
+"""Flat re-bin latency of density-binned scatter series."""
+import numpy as np
+import pytest
+
+from pegasus.plotting import series
+
+
+@pytest.mark.parametrize("points", [100_000, 2_000_000, 20_000_000])
+def test_bench_density_rebin(benchmark, recording_dpg, points):
+    rng = np.random.default_rng(0)
+    x, y = rng.normal(size=points), rng.normal(size=points)
+    plot = recording_dpg.add_plot()
+    recording_dpg.add_plot_axis(recording_dpg.mvXAxis, parent=plot)
+    y_axis = recording_dpg.add_plot_axis(recording_dpg.mvYAxis, parent=plot)
+    density = series.DensityScatterSeries(x, y, parent=y_axis)
+    shifts = iter(np.linspace(0, 1, 1_000_000))
+    # A pan step over the whole cloud on a 1280x800 plot
+    benchmark(lambda: density._update(-4 + next(shifts), 4, -4, 4, 1280, 800))
+    assert not density.markers
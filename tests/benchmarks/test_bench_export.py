@@ -0,0 +1,52 @@
+"""
+Headless export throughput: 1280x800 PNGs per second per core, and a batch over a process pool.
+
+pytest-benchmark's OPS column is charts per second.
+"""
+import os
+from functools import partial
+
+import numpy as np
+import pytest
+
+from pegasus import CandlestickChart, HeatmapChart, LineChart, ScatterChart, render_charts
+
+
+def make_chart(kind: str):
+    rng = np.random.default_rng(0)
+    if kind == "line-1M":
+        x = np.linspace(0, 1_000, 1_000_000)
+        return LineChart(x, np.cumsum(rng.normal(size=x.size)))
+    if kind == "candles-1M":
+        closes = 1.1 + np.cumsum(rng.normal(0, 1e-4, 1_000_000))
+        opens = np.concatenate(([closes[0]], closes[:-1]))
+        spread = np.abs(rng.normal(0, 1e-4, closes.size))
+        return CandlestickChart(1.7e9 + 60.0 * np.arange(closes.size), opens,
+                                np.maximum(opens, closes) + spread,
+                                np.minimum(opens, closes) - spread, closes)
+    if kind == "scatter-1M":
+        return ScatterChart(rng.normal(size=1_000_000), rng.normal(size=1_000_000))
+    return HeatmapChart(rng.random((500, 1_000)))
+
+
+KINDS = ["line-1M", "candles-1M", "scatter-1M", "heatmap-500x1000"]
+
+
+@pytest.mark.parametrize("kind", KINDS)
+def test_bench_render_to_png(benchmark, tmp_path, kind):
+    chart = make_chart(kind)
+    benchmark(chart.render_to_png, str(tmp_path / "chart.png"))
+
+
+@pytest.mark.parametrize("compress_level", [1, 6])
+def test_bench_render_to_png_compression(benchmark, tmp_path, compress_level):
+    chart = make_chart("line-1M")
+    benchmark(chart.render_to_png, str(tmp_path / "chart.png"), compress_level=compress_level)
+
+
+def test_bench_render_charts_pool(benchmark, tmp_path):
+    """32 charts built and rendered by the workers; charts/s is 32 x OPS."""
+    jobs = [(partial(make_chart, KINDS[k % len(KINDS)]), str(tmp_path / f"{k}.png"))
+            for k in range(32)]
+    benchmark.extra_info["workers"] = os.cpu_count()
+    benchmark.pedantic(render_charts, args=(jobs,), rounds=3, iterations=1)
@@ -0,0 +1,32 @@
+"""Indicator full-history and per-bar costs.
+
+    pytest tests/benchmarks/test_bench_indicators.py --benchmark-only
+
+Set ``PEGASUS_BENCH_BARS`` to change the history length (default 10M).
+"""
+import os
+
+import pytest
+from test_indicators import INDICATORS, m1_bars
+
+N_BARS = int(os.environ.get("PEGASUS_BENCH_BARS", 10_000_000))
+
+
+@pytest.fixture(scope="module")
+def bars():
+    return m1_bars(N_BARS)
+
+
+@pytest.mark.parametrize("kind", list(INDICATORS))
+def test_bench_full_history(benchmark, bars, kind):
+    indicator = INDICATORS[kind]()
+    benchmark.pedantic(indicator.compute, args=bars, rounds=3, iterations=1)
+    benchmark.extra_info["bars_per_second"] = N_BARS / benchmark.stats.stats.mean
+
+
+@pytest.mark.parametrize("kind", list(INDICATORS))
+def test_bench_live_bar(benchmark, bars, kind):
+    indicator = INDICATORS[kind]()
+    indicator.load(*(col[:100_000] for col in bars))
+    bar = tuple(float(col[100_000]) for col in bars)
+    benchmark(indicator.peek, *bar)
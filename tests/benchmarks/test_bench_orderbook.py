@@ -0,0 +1,24 @@
+"""Order book update throughput on a 1,000-level book.
+
+    pytest tests/benchmarks/test_bench_orderbook.py --benchmark-only
+
+The target is 100k updates/s; ``extra_info["updates_per_second"]`` reports it.
+"""
+import pytest
+from test_orderbook import full_book, random_deltas
+
+UPDATES = 1_000_000
+
+
+@pytest.mark.parametrize("batch", [100, 1_000, 10_000])
+def test_bench_l2_updates(benchmark, batch):
+    sides, prices, sizes = random_deltas(UPDATES)
+    book = full_book()
+
+    def run():
+        for start in range(0, UPDATES, batch):
+            book.apply(sides[start:start + batch], prices[start:start + batch],
+                       sizes[start:start + batch])
+
+    benchmark.pedantic(run, rounds=3, iterations=1)
+    benchmark.extra_info["updates_per_second"] = UPDATES / benchmark.stats.stats.mean
@@ -0,0 +1,42 @@
+"""Renko, Kagi and Point & Figure builders against naive per-price loops.
+
+    pytest tests/benchmarks/test_bench_price_charts.py --benchmark-only
+
+Set ``PEGASUS_BENCH_PRICES`` to change the number of prices (default 10M).
+"""
+import os
+
+import pytest
+from test_price_charts import naive_kagi, naive_point_figure, naive_renko, random_walk
+
+from pegasus.utils.price_charts import KagiBuilder, PointFigureBuilder, RenkoBuilder
+
+N_PRICES = int(os.environ.get("PEGASUS_BENCH_PRICES", 10_000_000))
+
+BOX = 0.05
+REVERSAL = 0.25
+
+
+@pytest.fixture(scope="module")
+def prices():
+    return random_walk(N_PRICES)
+
+
+@pytest.mark.parametrize("kind", ["renko", "kagi", "point_figure"])
+def test_bench_naive_loop(benchmark, prices, kind):
+    naive = {
+        "renko": lambda: naive_renko(prices, BOX),
+        "kagi": lambda: naive_kagi(prices, REVERSAL),
+        "point_figure": lambda: naive_point_figure(prices, BOX, 3),
+    }[kind]
+    benchmark.pedantic(naive, rounds=1, iterations=1)
+
+
+@pytest.mark.parametrize("kind", ["renko", "kagi", "point_figure"])
+def test_bench_vectorized(benchmark, prices, kind):
+    build = {
+        "renko": lambda: RenkoBuilder(BOX).extend(prices),
+        "kagi": lambda: KagiBuilder(REVERSAL).extend(prices),
+        "point_figure": lambda: PointFigureBuilder(BOX, reversal=3).extend(prices),
+    }[kind]
+    benchmark.pedantic(build, rounds=3, iterations=1)
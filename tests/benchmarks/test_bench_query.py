@@ -0,0 +1,35 @@
+"""Latency of the hover lookups in ``pegasus.performance.query``."""
+import numpy as np
+import pytest
+
+from pegasus.performance.query import GridIndex, nearest_index
+
+POINTS = 1_000_000
+
+
+@pytest.fixture(scope="module")
+def points():
+    rng = np.random.default_rng(0)
+    return rng.normal(size=POINTS), rng.normal(size=POINTS)
+
+
+def test_bench_nearest_index(benchmark):
+    x = np.cumsum(np.random.default_rng(0).random(10_000_000))
+    benchmark(nearest_index, x, x[-1] / 3)
+
+
+def test_bench_grid_index_build(benchmark, points):
+    benchmark.pedantic(GridIndex, args=points, rounds=3, iterations=1)
+
+
+@pytest.mark.parametrize("incremental", [False, True])
+def test_bench_grid_index_nearest(benchmark, points, incremental):
+    x, y = points
+    if incremental:
+        index = GridIndex()
+        for start in range(0, POINTS, 1_000):
+            index.extend(x[start:start + 1_000], y[start:start + 1_000])
+    else:
+        index = GridIndex(x, y)
+    # A 10 px radius on a 1000 px plot showing the whole cloud
+    benchmark(index.nearest, 0.1, 0.1, 0.08, 0.08)
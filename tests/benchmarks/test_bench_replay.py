@@ -0,0 +1,53 @@
+"""
+Replay as a stress test of the live update path, and seek latency on a long session.
+
+``events_per_second`` in extra_info is the sustained rate through aggregation
+and the per-frame chart flush.
+"""
+import numpy as np
+import pytest
+
+from pegasus import CandlestickChart
+from pegasus.indicators import SMA
+from pegasus.replay import Replay
+from pegasus.utils.ohlc import BarAggregator
+
+TICKS = 1_000_000
+
+
+def session(ticks):
+    rng = np.random.default_rng(0)
+    times = 1.7e9 + np.cumsum(rng.exponential(0.5, ticks))
+    return times, 1.1 + np.cumsum(rng.normal(0, 1e-5, ticks))
+
+
+@pytest.mark.parametrize("max_batch", [100, 10_000])
+def test_bench_replay_into_live_chart(benchmark, recording_dpg, max_batch):
+    """1M ticks into M1/M5/H1 bars and a live M1 chart with an SMA, one flush per frame."""
+    times, prices = session(TICKS)
+
+    def setup():
+        bars = BarAggregator(("M1", "M5", "H1"))
+        chart = CandlestickChart.from_bars(bars["M1"], indicators=[SMA(20)])
+        chart._build_plot()
+        flushes = [kwargs["callback"]
+                   for _, _, kwargs in recording_dpg.named("add_item_visible_handler")[-2:]]
+        replay = Replay.ticks(times, prices, bars, speed=None, max_batch=max_batch)
+        return (replay, lambda: [flush() for flush in flushes]), {}
+
+    def run(replay, frame):
+        recording_dpg.calls.clear()
+        return replay.run(frame)
+
+    stats = benchmark.pedantic(run, setup=setup, rounds=3)
+    assert stats.events == TICKS
+    benchmark.extra_info["events_per_second"] = stats.events_per_second
+    benchmark.extra_info["frames"] = stats.frames
+
+
+def test_bench_replay_seek(benchmark):
+    """Forward seeks on a 10M-tick session: binary search plus a small delivery."""
+    times, prices = session(10_000_000)
+    replay = Replay(times, prices, sink=lambda t, p: None)
+    targets = iter(times[::100])
+    benchmark(lambda: replay.seek(next(targets)))
@@ -0,0 +1,85 @@
+"""Series wrappers and chart construction against the recording DPG stand-in."""
+import numpy as np
+import pytest
+
+from pegasus import CandlestickChart, LineChart, ScatterChart
+from pegasus.plotting import series
+
+POINTS = 1_000_000
+
+
+@pytest.fixture(scope="module")
+def ohlc():
+    rng = np.random.default_rng(0)
+    closes = 1.1 + np.cumsum(rng.normal(0, 1e-4, POINTS))
+    spread = np.abs(rng.normal(0, 1e-4, POINTS))
+    dates = 946_684_800.0 + 60.0 * np.arange(POINTS)
+    return dates, closes, closes + spread, closes - spread, closes
+
+
+@pytest.fixture
+def y_axis(recording_dpg):
+    """Y axis of a recorded plot that also has an x axis, as decimated series expect."""
+    plot = recording_dpg.add_plot()
+    recording_dpg.add_plot_axis(recording_dpg.mvXAxis, parent=plot)
+    return recording_dpg.add_plot_axis(recording_dpg.mvYAxis, parent=plot)
+
+
+@pytest.mark.parametrize("dtype", [np.float64, np.float32])
+def test_bench_add_candle_series(benchmark, y_axis, ohlc, dtype):
+    columns = [col.astype(dtype) for col in ohlc]
+    benchmark(series.add_candle_series, *columns, parent=y_axis)
+
+
+@pytest.mark.parametrize("decimate", [False, True])
+def test_bench_add_line_series(benchmark, y_axis, ohlc, decimate):
+    dates, _, _, _, closes = ohlc
+    benchmark(series.add_line_series, dates, closes, parent=y_axis, decimate=decimate)
+
+
+def test_bench_add_scatter_series(benchmark, y_axis, ohlc):
+    dates, _, _, _, closes = ohlc
+    benchmark(series.add_scatter_series, dates, closes, parent=y_axis)
+
+
+def test_bench_decimated_refresh(benchmark, recording_dpg, y_axis, ohlc):
+    dates, _, _, _, closes = ohlc
+    line = series.DecimatedLineSeries(dates, closes, parent=y_axis)
+    spans = iter(np.linspace(0.01, 1.0, 1_000_000))
+
+    def zoom():
+        # A new visible range every call, so every refresh re-queries the pyramid
+        span = next(spans) * (dates[-1] - dates[0])
+        recording_dpg.set_axis_limits(line.x_axis, dates[0], dates[0] + span)
+        line.refresh()
+
+    benchmark(zoom)
+
+
+@pytest.mark.parametrize("chart", ["candlestick", "line", "scatter"])
+def test_bench_chart_construction(benchmark, recording_dpg, ohlc, chart):
+    dates, opens, highs, lows, closes = ohlc
+    build = {
+        "candlestick": lambda: CandlestickChart(dates, opens, highs, lows, closes).show(),
+        "line": lambda: LineChart(dates, closes).show(),
+        "scatter": lambda: ScatterChart(dates, closes).show(),
+    }[chart]
+    benchmark(build)
+
+
+@pytest.mark.parametrize("update", ["full", "rows", "columns"])
+def test_bench_heatmap_update(benchmark, y_axis, update):
+    rng = np.random.default_rng(0)
+    heatmap = series.HeatmapSeries(rng.random((1_000, 1_000)), parent=y_axis)
+    values = rng.random((1_000, 1_000), dtype=np.float32)
+    refresh = {
+        "full": lambda: heatmap.update(values),
+        "rows": lambda: heatmap.update_rows(slice(0, 10), values[:10]),
+        "columns": lambda: heatmap.update_columns(slice(0, 10), values[:, :10]),
+    }[update]
+
+    def frame():
+        refresh()
+        heatmap.flush()
+
+    benchmark(frame)
@@ -0,0 +1,34 @@
+"""Cold-start cost: a fresh interpreter importing charts, and ``pegasus-demo`` to its first frame.
+
+    pytest tests/benchmarks/test_bench_startup.py --benchmark-only
+
+The first-frame benchmark needs a display and is skipped without one. For a
+per-module breakdown run ``python -X importtime -c "from pegasus import LineChart"``.
+"""
+import os
+import subprocess
+import sys
+
+import pytest
+
+HAS_DISPLAY = sys.platform != "linux" or bool(os.environ.get("DISPLAY")
+                                              or os.environ.get("WAYLAND_DISPLAY"))
+
+
+def run(*args):
+    subprocess.run([sys.executable, *args], check=True, capture_output=True)
+
+
+@pytest.mark.parametrize("statement", [
+    "import pegasus",
+    "from pegasus import LineChart",
+    "from pegasus import CandlestickChart, load_ohlc_csv",
+])
+def test_bench_cold_import(benchmark, statement):
+    benchmark.pedantic(run, args=("-c", statement), rounds=5, iterations=1)
+
+
+@pytest.mark.skipif(not HAS_DISPLAY, reason="needs a display")
+def test_bench_demo_first_frame(benchmark):
+    benchmark.pedantic(run, args=("-m", "pegasus.demo", "--frames", "1"), rounds=3,
+                       iterations=1)
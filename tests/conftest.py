@@ -0,0 +1,128 @@
+"""Shared fixtures for the Pegasus test suite."""
+import contextlib
+import importlib
+import itertools
+import sys
+
+import dearpygui.dearpygui as dpg
+import pytest
+from pytest_benchmark.utils import parse_compare_fail
+
+# Regression threshold of ``--benchmark-compare`` runs that do not pass ``--benchmark-compare-fail``
+BENCHMARK_COMPARE_FAIL = "median:20%"
+
+
+def pytest_configure(config):
+    """Makes ``--benchmark-compare`` fail on regressions beyond ``BENCHMARK_COMPARE_FAIL``."""
+    # Runs before pytest-benchmark's own (trylast) pytest_configure reads the options
+    if config.getoption("benchmark_compare", None) and not config.option.benchmark_compare_fail:
+        config.option.benchmark_compare_fail = [parse_compare_fail(BENCHMARK_COMPARE_FAIL)]
+
+
+class RecordingDPG:
+    """
+    Stand-in for ``dearpygui.dearpygui`` that records calls instead of rendering.
+
+    Every ``add_*`` call returns a fresh integer tag, container functions
+    (``window``, ``plot``, ``plot_axis``, ...) are usable as context managers,
+    and ``mv*`` constants resolve to the real DPG values. The arguments of every
+    call are kept by reference in ``calls`` so tests can assert on identity.
+    Like DPG, ``create_context`` starts the tags over, so ids kept from an
+    earlier context name whatever is created at them next.
+    """
+
+    _CONTAINERS = {
+        "window", "plot", "plot_axis", "subplots", "group", "child_window",
+        "handler_registry", "item_handler_registry", "texture_registry",
+    }
+
+    def __init__(self):
+        self.calls = []
+        self._tags = itertools.count(1000)
+        self._parents = {}
+        self._types = {}
+        self._handlers = {}
+        self._axis_limits = {}
+
+    def __getattr__(self, name):
+        if name.startswith("mv"):
+            return getattr(dpg, name)
+        if name in self._CONTAINERS:
+            return self._container(name)
+        return self._recorder(name)
+
+    def _recorder(self, name):
+        def record(*args, **kwargs):
+            self.calls.append((name, args, kwargs))
+            if name.startswith("add_"):
+                tag = kwargs.get("tag") or next(self._tags)
+                self._parents[tag] = kwargs.get("parent", 0)
+                self._types[tag] = name[4:]
+                return tag
+            return None
+        return record
+
+    def _container(self, name):
+        @contextlib.contextmanager
+        def container(*args, **kwargs):
+            yield self._recorder(f"add_{name}")(*args, **kwargs)
+        return container
+
+    def create_context(self):
+        self.calls.append(("create_context", (), {}))
+        self._tags = itertools.count(1000)
+        self._parents.clear()
+        self._types.clear()
+        self._handlers.clear()
+
+    def bind_item_handler_registry(self, item, registry):
+        self.calls.append(("bind_item_handler_registry", (item, registry), {}))
+        self._handlers[item] = registry
+
+    # Queries that must return something meaningful
+    def get_item_parent(self, item):
+        return self._parents.get(item, 0)
+
+    def get_item_children(self, item, slot=None):
+        children = [tag for tag, parent in self._parents.items() if parent == item]
+        return children if slot is not None else {0: [], 1: children, 2: [], 3: []}
+
+    def get_axis_limits(self, axis):
+        return self._axis_limits.get(axis, (0.0, 1.0))
+
+    def set_axis_limits(self, axis, lo, hi):
+        self.calls.append(("set_axis_limits", (axis, lo, hi), {}))
+        self._axis_limits[axis] = (lo, hi)
+
+    def get_item_rect_size(self, item):
+        return [0, 0]
+
+    def does_item_exist(self, item):
+        return item in self._parents
+
+    def get_item_type(self, item):
+        words = self._types[item].split("_")
+        return "mvAppItemType::mv" + "".join(word.capitalize() for word in words)
+
+    def get_item_info(self, item):
+        return {"parent": self.get_item_parent(item), "handlers": self._handlers.get(item)}
+
+    def named(self, name):
+        """Return the recorded calls to ``name``."""
+        return [call for call in self.calls if call[0] == name]
+
+
+# DPG users that charts import on first use; loaded up front so they get patched too
+LAZY_DPG_MODULES = ("pegasus.performance.profiler",)
+
+
+@pytest.fixture
+def recording_dpg(monkeypatch):
+    """Replace ``dpg`` in every loaded ``pegasus`` module with a ``RecordingDPG``."""
+    for mod_name in LAZY_DPG_MODULES:
+        importlib.import_module(mod_name)
+    recorder = RecordingDPG()
+    for mod_name, module in list(sys.modules.items()):
+        if mod_name.startswith("pegasus") and getattr(module, "dpg", None) is dpg:
+            monkeypatch.setattr(module, "dpg", recorder)
+    return recorder
@@ -0,0 +1,90 @@
+"""Price-axis fitting to the visible range, and the chart inputs that toggle it."""
+import numpy as np
+import pytest
+
+from pegasus import CandlestickChart
+from pegasus.plotting.axes import VisibleRangeFit
+
+
+@pytest.fixture
+def bars():
+    rng = np.random.default_rng(2)
+    dates = 1_700_000_000.0 + 60.0 * np.arange(500)
+    closes = 1.1 + np.cumsum(rng.normal(0, 1e-3, dates.size))
+    opens = np.concatenate(([1.1], closes[:-1]))
+    highs = np.maximum(opens, closes) + rng.random(dates.size) * 1e-3
+    lows = np.minimum(opens, closes) - rng.random(dates.size) * 1e-3
+    return dates, opens, highs, lows, closes
+
+
+def y_limits(recording_dpg, axis):
+    return [args[1:] for _, args, _ in recording_dpg.named("set_axis_limits") if args[0] == axis]
+
+
+def test_fits_padded_min_max_of_visible_rows(recording_dpg, bars):
+    dates, _, highs, lows, _ = bars
+    fit = VisibleRangeFit("plot", "x", "y", dates, lows, highs, padding=0.1)
+    recording_dpg.set_axis_limits("x", dates[100] - 1.0, dates[199] + 1.0)
+    fit.refresh()
+    lo, hi = lows[100:200].min(), highs[100:200].max()
+    pad = (hi - lo) * 0.1
+    assert y_limits(recording_dpg, "y") == [(pytest.approx(lo - pad), pytest.approx(hi + pad))]
+
+    fit.refresh()  # Same x-range: nothing to do
+    recording_dpg.set_axis_limits("x", dates[-1] + 10.0, dates[-1] + 20.0)
+    fit.refresh()  # No bars visible: the axis is left alone
+    assert len(y_limits(recording_dpg, "y")) == 1
+
+
+def test_flat_range_still_gets_padding(recording_dpg):
+    fit = VisibleRangeFit("plot", "x", "y", np.arange(5.0), np.full(5, 2.0), padding=0.5)
+    recording_dpg.set_axis_limits("x", 0.0, 4.0)
+    fit.refresh()
+    assert y_limits(recording_dpg, "y") == [(1.0, 3.0)]
+
+
+def test_scroll_on_price_axis_disables_and_double_click_reenables(recording_dpg, bars):
+    chart = CandlestickChart(*bars)
+    chart._build_plot()
+    chart._setup_handlers()
+    fit = chart._y_fit
+    assert fit is not None and fit.enabled
+
+    recording_dpg.get_item_rect_min = lambda item: (0.0, 0.0)
+    recording_dpg.get_item_rect_max = lambda item: (800.0, 600.0)
+    (_, _, wheel), = recording_dpg.named("add_mouse_wheel_handler")
+    (_, _, double_click), = recording_dpg.named("add_mouse_double_click_handler")
+    dates = bars[0]
+    y_axis = chart.y_axis_tag
+
+    recording_dpg.set_axis_limits(chart.x_axis_tag, dates[0], dates[-1])
+    fit.refresh()
+    fits = len(y_limits(recording_dpg, y_axis))
+
+    # Wheel over the plot area zooms x and keeps fitting
+    recording_dpg.get_mouse_pos = lambda local=True: (400.0, 300.0)
+    wheel["callback"](None, 1)
+    assert fit.enabled
+    fit.refresh()
+    assert len(y_limits(recording_dpg, y_axis)) == fits + 1
+
+    # Wheel over the price axis hands the y-range to the user
+    recording_dpg.get_mouse_pos = lambda local=True: (20.0, 300.0)
+    wheel["callback"](None, 1)
+    assert not fit.enabled
+    zoomed = y_limits(recording_dpg, y_axis)
+    recording_dpg.set_axis_limits(chart.x_axis_tag, dates[10], dates[20])
+    fit.refresh()
+    assert y_limits(recording_dpg, y_axis) == zoomed
+
+    # A double-click outside the plot is ignored; inside, fitting resumes
+    recording_dpg.get_mouse_pos = lambda local=True: (900.0, 300.0)
+    double_click["callback"](None, 0)
+    assert not fit.enabled
+    recording_dpg.get_mouse_pos = lambda local=True: (400.0, 300.0)
+    double_click["callback"](None, 0)
+    assert fit.enabled
+    fit.refresh()
+    lo, hi = bars[3][10:21].min(), bars[2][10:21].max()
+    assert y_limits(recording_dpg, y_axis)[-1] == (
+        pytest.approx(lo - (hi - lo) * 0.05), pytest.approx(hi + (hi - lo) * 0.05))
@@ -0,0 +1,161 @@
+"""Ring buffers, ring-backed series and the per-frame update scheduler."""
+import threading
+
+import numpy as np
+import pytest
+
+from pegasus.performance.buffers import (RingBuffer, RingSeries, UpdateScheduler, batch_render,
+                                         get_scheduler)
+
+
+def reference_window(pushed, capacity):
+    """The last ``capacity`` samples of everything pushed so far."""
+    return np.concatenate(pushed)[-capacity:] if pushed else np.empty(0)
+
+
+def test_append_wraps_around():
+    ring = RingBuffer(4, columns=2)
+    for i in range(11):
+        ring.append(float(i), float(-i))
+        assert len(ring) == min(i + 1, 4)
+        np.testing.assert_array_equal(ring.view(0), np.arange(max(i - 3, 0), i + 1))
+    t, y = ring.views()
+    np.testing.assert_array_equal(y, -t)
+    with pytest.raises(ValueError):
+        ring.append(1.0)
+
+
+@pytest.mark.parametrize("batches", [
+    [3, 3, 3],          # Straddles the end of the first half
+    [9],                # Longer than the capacity: only the tail is kept
+    [2, 17, 1],         # An oversized batch after a partial fill
+    [5, 0, 7, 7, 13],   # Exactly capacity-sized batches and an empty one
+])
+def test_extend_matches_last_capacity_samples(batches):
+    ring = RingBuffer(7, columns=2)
+    pushed, start = [], 0
+    for n in batches:
+        x = np.arange(start, start + n, dtype=np.float64)
+        start += n
+        ring.extend(x, 2 * x)
+        pushed.append(x)
+        expected = reference_window(pushed, 7)
+        t, y = ring.views()
+        np.testing.assert_array_equal(t, expected)
+        np.testing.assert_array_equal(y, 2 * expected)
+
+
+def test_views_stay_contiguous_after_the_mirror_wraps():
+    ring = RingBuffer(5, columns=3, dtype=np.float32)
+    for i in range(23):
+        ring.append(i, i + 0.5, -i)
+        for column in ring.views():
+            # One slice of the mirrored storage: no copy, no rotation
+            assert column.flags["C_CONTIGUOUS"] and np.shares_memory(column, ring._data)
+            assert column.dtype == np.float32
+    np.testing.assert_array_equal(ring.view(0), np.arange(18, 23))
+    # Both halves hold the same samples
+    np.testing.assert_array_equal(ring._data[:, :5], ring._data[:, 5:])
+
+
+def test_clear_keeps_storage():
+    ring = RingBuffer(3)
+    data = ring._data
+    ring.extend(np.arange(5.0), np.arange(5.0))
+    ring.clear()
+    assert len(ring) == 0 and ring.view(0).size == 0 and ring._data is data
+    ring.append(9.0, 9.0)
+    assert ring.view(1).tolist() == [9.0]
+
+
+def test_invalid_shapes():
+    with pytest.raises(ValueError):
+        RingBuffer(0)
+    ring = RingBuffer(3)
+    with pytest.raises(ValueError):
+        ring.extend(np.arange(3.0))
+    with pytest.raises(ValueError):
+        ring.extend(np.arange(3.0), np.arange(2.0))
+
+
+def test_ring_series_flushes_only_when_dirty(recording_dpg):
+    series = RingSeries(7, capacity=4)
+    assert not series.flush()
+    series.extend(np.arange(6.0), np.arange(6.0) * 10)
+    series.append(6.0, 60.0)
+    assert series.flush() and not series.flush()
+    (_, (tag, (t, y)), _) = recording_dpg.named("set_value")[-1]
+    assert tag == 7 and len(series) == 4
+    assert t.tolist() == [3.0, 4.0, 5.0, 6.0] and y.tolist() == [30.0, 40.0, 50.0, 60.0]
+    # Zero-copy: DPG receives the ring's own storage
+    assert np.shares_memory(t, series.buffer._data)
+
+
+def uploads(recording_dpg):
+    """Tags passed to ``set_value``, in call order."""
+    return [args[0] for _, args, _ in recording_dpg.named("set_value")]
+
+
+def test_scheduler_coalesces_one_upload_per_tag(recording_dpg):
+    scheduler = UpdateScheduler()
+    ring = RingSeries(20, capacity=100)
+    for i in range(5):
+        scheduler.set(10, np.full(3, i), np.full(3, -i))
+        scheduler.append(ring, np.arange(i * 2, i * 2 + 2.0), np.ones(2))
+    scheduler.set(11, np.zeros(1), np.zeros(1))
+    assert scheduler.pending == 11 and not recording_dpg.calls
+
+    stats = scheduler.apply()
+    assert sorted(uploads(recording_dpg)) == [10, 11, 20]
+    # The latest set wins, and the appends arrive as one batch in submission order
+    latest = {args[0]: args[1] for _, args, _ in recording_dpg.named("set_value")}
+    assert latest[10][0].tolist() == [4, 4, 4]
+    assert latest[20][0].tolist() == list(range(10))
+    assert (stats.frame, stats.queue_depth, stats.applied) == (1, 11, 3)
+    assert scheduler.pending == 0 and scheduler.last_stats is stats
+
+    recording_dpg.calls.clear()
+    stats = scheduler.apply()
+    assert not recording_dpg.calls and (stats.frame, stats.queue_depth, stats.applied) == (2, 0, 0)
+
+
+def test_scheduler_accepts_updates_from_other_threads(recording_dpg):
+    scheduler = UpdateScheduler(history=2)
+    ring = RingSeries(1, capacity=10_000)
+
+    def feed(offset):
+        for i in range(500):
+            scheduler.append(ring, np.array([offset + i], dtype=np.float64), np.zeros(1))
+
+    threads = [threading.Thread(target=feed, args=(k * 1_000,)) for k in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert scheduler.apply().queue_depth == 2_000
+    assert uploads(recording_dpg) == [1]
+    expected = sorted(k * 1_000 + i for k in range(4) for i in range(500))
+    assert sorted(ring.buffer.view(0)) == expected
+    scheduler.apply()
+    scheduler.apply()
+    assert [stats.frame for stats in scheduler.history] == [2, 3]
+
+
+def test_batch_render_applies_the_default_scheduler(recording_dpg):
+    scheduler = get_scheduler()
+    batch_render()  # Drain anything left by other tests
+    recording_dpg.calls.clear()
+    scheduler.set(5, np.arange(3.0), np.arange(3.0))
+    scheduler.set(5, np.arange(4.0), np.arange(4.0))
+    stats = batch_render()
+    assert uploads(recording_dpg) == [5] and stats.queue_depth == 2 and stats.applied == 1
+    assert batch_render().applied == 0
+
+
+def test_install_applies_every_frame(recording_dpg):
+    scheduler = UpdateScheduler()
+    scheduler.install("window")
+    (_, _, kwargs), = recording_dpg.named("add_item_visible_handler")
+    scheduler.set(3, np.zeros(2), np.zeros(2))
+    kwargs["callback"](None, None)
+    assert uploads(recording_dpg) == [3] and scheduler.last_stats.frame == 1
@@ -0,0 +1,90 @@
+"""Dashboards: several charts in one context, window and render loop."""
+import numpy as np
+import pytest
+
+from pegasus import CandlestickChart, Dashboard, LineChart, ScatterChart
+from pegasus.plotting import series
+
+
+@pytest.fixture
+def bars():
+    n = 1_000
+    rng = np.random.default_rng(0)
+    closes = 1.1 + np.cumsum(rng.normal(0, 1e-4, n))
+    return np.arange(n, dtype=np.float64) * 60.0, closes, closes + 1e-4, closes - 1e-4, closes
+
+
+def test_dashboard_shares_context_and_data(recording_dpg, bars):
+    dates, opens, highs, lows, closes = bars
+    board = Dashboard(rows=2, columns=2)
+    charts = [board.add(CandlestickChart(dates, opens, highs, lows, closes)),
+              board.add(CandlestickChart(dates, opens, highs, lows, closes)),
+              board.add(LineChart(dates, closes, auto_fit_y=True)),
+              board.add(LineChart(dates, closes, auto_fit_y=True))]
+    with pytest.raises(ValueError):
+        board.add(ScatterChart(dates, closes))
+    board.show()
+
+    # One context, window and render loop; one subplot grid with linked x-axes
+    for name in ("create_context", "add_window", "start_dearpygui"):
+        assert len(recording_dpg.named(name)) == 1
+    (_, _, grid), = recording_dpg.named("add_subplots")
+    assert grid["link_all_x"] and grid["tag"] == board.plot_tag
+
+    plots = [kwargs["tag"] for _, _, kwargs in recording_dpg.named("add_plot")]
+    assert plots == [chart.plot_tag for chart in charts]
+    assert len({tag for chart in charts
+                for tag in (chart.plot_tag, chart.x_axis_tag, chart.y_axis_tag)}) == 12
+
+    # Panels over the same arrays build each derived index once
+    assert charts[0]._y_fit.index is charts[1]._y_fit.index
+    assert charts[2]._y_fit.index is charts[3]._y_fit.index
+    line = [series.DecimatedLineSeries(dates, highs, parent=1) for _ in range(2)]
+    assert line[0].pyramid is line[1].pyramid and line[0].pyramid.y is highs
+    candles = [series.PyramidCandleSeries(dates, opens, highs, lows, closes, parent=1)
+               for _ in range(2)]
+    assert candles[0].pyramid is candles[1].pyramid
+    assert series.DecimatedLineSeries(dates, opens, parent=1).pyramid is not line[0].pyramid
+
+
+def test_panel_frame_callbacks_run_in_the_dashboard_loop(recording_dpg, bars):
+    board = Dashboard(rows=1, columns=2)
+    ticks = []
+    board.on_frame(lambda: ticks.append("board"))
+    board.add(LineChart(bars[0], bars[4])).on_frame(lambda: ticks.append("line"))
+    candles = board.add(CandlestickChart(*bars))
+    candles.on_frame(lambda: ticks.append("candles"))
+    board.show()
+
+    # One frame: every visible handler runs once
+    for _, _, kwargs in recording_dpg.named("add_item_visible_handler"):
+        kwargs["callback"](None, None)
+    assert sorted(ticks) == ["board", "candles", "line"]
+
+
+def test_panel_profiler_times_the_dashboard_loop(recording_dpg, bars):
+    board = Dashboard(rows=1, columns=2)
+    chart = board.add(LineChart(bars[0], bars[4]))
+    profiler = chart.enable_profiling(overlay=True)
+    recording_dpg.is_dearpygui_running = lambda: True
+    board.show(frames=3)
+    assert board.profiler is profiler and len(profiler) == 3
+    (_, _, app), = recording_dpg.named("configure_app")
+    assert app["manual_callback_management"]
+    windows = [kwargs.get("label") for _, _, kwargs in recording_dpg.named("add_window")]
+    assert "Frame timings" in windows
+    assert not recording_dpg.named("start_dearpygui")
+
+
+def test_dashboard_rejects_several_profilers(recording_dpg, bars):
+    board = Dashboard(rows=1, columns=2)
+    for _ in range(2):
+        board.add(LineChart(bars[0], bars[4])).enable_profiling()
+    with pytest.raises(ValueError):
+        board.show()
+
+    board = Dashboard(rows=1, columns=1)
+    board.enable_profiling()
+    board.add(LineChart(bars[0], bars[4])).enable_profiling()
+    with pytest.raises(ValueError):
+        board.show()
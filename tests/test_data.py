@@ -0,0 +1,94 @@
+"""CSV loading and the parsed-column cache of ``pegasus.utils.data``."""
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from pegasus.utils.data import load_ohlc_csv, load_ohlc_many
+
+MINUTES_PER_DAY = 1_440
+
+
+def write_ohlc_csv(path, rows, start="2000-01-01"):
+    """Writes an M1 CSV in the default MT4 layout. Every day repeats the same prices."""
+    rng = np.random.default_rng(0)
+    closes = 1.1 + np.cumsum(rng.normal(0, 1e-4, MINUTES_PER_DAY))
+    spread = np.abs(rng.normal(0, 1e-4, MINUTES_PER_DAY))
+    times = pd.date_range("2000-01-01", periods=MINUTES_PER_DAY, freq="min").strftime("%H:%M:%S")
+    lines = [f"{t},{c:.5f},{c + s:.5f},{c - s:.5f},{c:.5f}\n"
+             for t, c, s in zip(times, closes, spread)]
+    days = pd.date_range(start, periods=-(-rows // MINUTES_PER_DAY), freq="D")
+    with open(path, "w") as f:
+        f.write("DATE,TIME,OPEN,HIGH,LOW,CLOSE\n")
+        for i, day in enumerate(days.strftime("%Y.%m.%d")):
+            prefix = day + ","
+            f.write(prefix + prefix.join(lines[:min(MINUTES_PER_DAY, rows - i * MINUTES_PER_DAY)]))
+
+
+def write_csv(path, header, rows):
+    with open(path, "w") as f:
+        f.write(header + "\n" + "".join(row + "\n" for row in rows))
+
+
+def cache_files(cache_dir):
+    return sorted(name for name in os.listdir(cache_dir) if name.endswith(".npy"))
+
+
+def test_cache_keeps_one_entry_per_option_set(tmp_path):
+    path = str(tmp_path / "EURUSD.csv")
+    write_csv(path, "DATE,TIME,OPEN,HIGH,LOW,CLOSE",
+              ["2025.10.29,00:00:00,1,2,0.5,1.5", "2025.10.29,00:01:00,1.5,2,1,1"])
+    cache_dir = str(tmp_path / "cache")
+    by_time = load_ohlc_csv(path, cache_dir=cache_dir)
+    by_date = load_ohlc_csv(path, time_col=None, date_col="TIME",
+                            date_format="%H:%M:%S", cache_dir=cache_dir)
+    entries = cache_files(cache_dir)
+    assert len(entries) == 2
+
+    # Alternating option sets hits both entries instead of evicting each other
+    for _ in range(2):
+        for options in ({}, {"time_col": None, "date_col": "TIME", "date_format": "%H:%M:%S"}):
+            load_ohlc_csv(path, cache_dir=cache_dir, **options)
+            assert cache_files(cache_dir) == entries
+    cached = load_ohlc_csv(path, cache_dir=cache_dir)
+    assert isinstance(cached[0], np.memmap)
+    np.testing.assert_array_equal(cached[0], by_time[0])
+    assert by_date[0][1] - by_date[0][0] == 60.0
+
+    # A changed file replaces only the entries of the option set loaded again
+    write_csv(path, "DATE,TIME,OPEN,HIGH,LOW,CLOSE", ["2025.10.30,00:00:00,1,2,0.5,1.5"])
+    os.utime(path, ns=(0, 1))
+    assert len(load_ohlc_csv(path, cache_dir=cache_dir)[0]) == 1
+    updated = cache_files(cache_dir)
+    assert len(updated) == 2 and len(set(updated) & set(entries)) == 1
+
+
+@pytest.mark.parametrize("row, column", [
+    (",00:01:00,1.5,2,1,1", "DATE"),
+    ("2025.10.29,,1.5,2,1,1", "TIME"),
+])
+def test_empty_timestamp_cell_raises(tmp_path, row, column):
+    path = str(tmp_path / "EURUSD.csv")
+    write_csv(path, "DATE,TIME,OPEN,HIGH,LOW,CLOSE",
+              ["2025.10.29,00:00:00,1,2,0.5,1.5", row, "2025.10.29,00:02:00,1,2,0.5,1.5"])
+    cache_dir = str(tmp_path / "cache")
+    with pytest.raises(ValueError, match=f"'{column}' has 1 empty cells \\(first at row 1\\)"):
+        load_ohlc_csv(path, cache_dir=cache_dir)
+    assert not os.path.exists(cache_dir) or not cache_files(cache_dir)
+
+
+def test_load_ohlc_many_merges_and_dedupes(tmp_path):
+    write_ohlc_csv(tmp_path / "b.csv", 2 * MINUTES_PER_DAY, start="2000-01-02")
+    write_ohlc_csv(tmp_path / "a.csv", 2 * MINUTES_PER_DAY, start="2000-01-01")
+    merged = load_ohlc_many(str(tmp_path / "*.csv"), max_workers=2, cache=False)
+
+    first = load_ohlc_csv(str(tmp_path / "a.csv"), cache=False)
+    second = load_ohlc_csv(str(tmp_path / "b.csv"), cache=False)
+    # 2000-01-02 is in both files; the rows of the later file win
+    assert len(merged[0]) == 3 * MINUTES_PER_DAY
+    assert np.all(np.diff(merged[0]) > 0)
+    for col, a, b in zip(merged, first, second):
+        assert col.flags.c_contiguous
+        np.testing.assert_array_equal(col[:MINUTES_PER_DAY], a[:MINUTES_PER_DAY])
+        np.testing.assert_array_equal(col[MINUTES_PER_DAY:], b)
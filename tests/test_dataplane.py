@@ -0,0 +1,112 @@
+"""Shared-memory rings written by feed processes and read by chart series."""
+import pickle
+import warnings
+
+import numpy as np
+import pytest
+
+from pegasus import LineChart, dataplane
+from pegasus.dataplane import (SharedRingBuffer, SharedRingSeries, shared_memory_throughput,
+                               start_feed, synthetic_feed)
+from pegasus.performance.buffers import RingBuffer
+
+
+@pytest.fixture
+def ring():
+    ring = SharedRingBuffer(1_000, columns=2)
+    yield ring
+    ring.close()
+
+
+def test_matches_ring_buffer_and_publishes_sequence(ring):
+    local = RingBuffer(1_000, columns=2)
+    rng = np.random.default_rng(0)
+    for n in (10, 700, 1, 999, 2_500, 3):
+        x, y = rng.normal(size=n), rng.normal(size=n)
+        ring.extend(x, y)
+        local.extend(x, y)
+    ring.append(1.0, 2.0)
+    local.append(1.0, 2.0)
+    assert ring.sequence == 10 + 700 + 1 + 999 + 2_500 + 3 + 1
+    for shared, expected in zip(ring.views(), local.views()):
+        np.testing.assert_array_equal(shared, expected)
+
+
+def test_reader_attaches_zero_copy(ring):
+    reader = pickle.loads(pickle.dumps(ring))
+    try:
+        assert reader.name == ring.name and reader.capacity == 1_000 and len(reader) == 0
+        ring.extend(np.arange(5.0), np.arange(5.0) * 2)
+        t, p = reader.views()
+        assert reader.sequence == 5 and t.tolist() == [0, 1, 2, 3, 4]
+        ring.append(5.0, 10.0)
+        assert np.shares_memory(reader.window(6, 3)[0], reader.view(0))
+        assert reader.window(6, 3)[1].tolist() == [6.0, 8.0, 10.0]
+        del t, p
+    finally:
+        reader.close()
+
+
+def test_series_sends_only_new_data_and_detects_laps(recording_dpg, ring):
+    series = SharedRingSeries(1, ring, window=600)
+    assert series.flush()  # The empty window, once
+    ring.extend(np.arange(800.0), np.arange(800.0))
+    assert series.flush() and not series.flush()
+    (_, (tag, (t, p)), _) = recording_dpg.named("set_value")[-1]
+    assert tag == 1 and t.tolist() == list(range(200, 800))
+
+    # A writer lapping the window while DPG copies it: the frame is re-sent next time
+    def lapping(tag, columns):
+        ring.extend(np.zeros(500), np.zeros(500))  # More than capacity - window
+    recording_dpg.set_value = lapping
+    ring.append(800.0, 800.0)
+    assert series.flush() and series.torn == 1
+    del recording_dpg.set_value
+    assert series.flush() and series.torn == 1
+    recording_dpg.calls.clear()
+    del t, p
+
+
+def test_line_chart_from_shared(recording_dpg, ring):
+    ring.extend(np.arange(100.0), np.sin(np.arange(100.0)))
+    chart = LineChart.from_shared(ring, width=400, height=300)
+    chart._build_plot()
+    flush, = [kwargs["callback"]
+              for _, _, kwargs in recording_dpg.named("add_item_visible_handler")]
+    flush()
+    (_, (_, (x, y)), _) = recording_dpg.named("set_value")[-1]
+    np.testing.assert_array_equal(y, np.sin(np.arange(100.0)))
+    assert chart._hover_row(42.0, y[42], 0.5, 0.5)[0] == 42.0
+    assert chart.rasterize().shape == (300, 400, 4)
+    recording_dpg.calls.clear()
+    del x, y
+
+
+def test_feed_process_writes_into_ui_ring(ring):
+    process = start_feed(synthetic_feed, ring, 5_000, 100)
+    process.join(timeout=60)
+    assert process.exitcode == 0 and ring.finished and ring.sequence == 5_000
+    t, p = ring.views()
+    assert t.size == 1_000 and np.all(np.diff(t) > 0)
+    del t, p
+
+
+def test_shared_memory_throughput():
+    stats = shared_memory_throughput(50_000, producers=2, batch=1_000)
+    assert stats.messages == 100_000 and stats.messages_per_second > 0
+
+
+def test_warns_without_ordered_stores(monkeypatch):
+    monkeypatch.setattr(dataplane.platform, "machine", lambda: "x86_64")
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        ring = SharedRingBuffer(10)
+    try:
+        monkeypatch.setattr(dataplane.platform, "machine", lambda: "aarch64")
+        with pytest.warns(RuntimeWarning, match="aarch64"):
+            reader = SharedRingBuffer.attach(ring.name)
+        reader.close()
+        with pytest.warns(RuntimeWarning):
+            SharedRingBuffer(10).close()
+    finally:
+        ring.close()
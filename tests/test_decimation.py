@@ -0,0 +1,190 @@
+"""Zoom-dependent indexes in ``pegasus.performance.decimation`` and the series drawing them."""
+import numpy as np
+import pytest
+
+from pegasus.performance.decimation import DensityGrid, MinMaxPyramid, OHLCPyramid, RangeMinMax
+from pegasus.plotting import series
+from pegasus.utils.ohlc import resample_ohlc, timeframe_seconds
+
+DAY = 86_400.0
+
+
+@pytest.fixture(scope="module")
+def bars():
+    """Four days of M1 bars with random gaps, starting at midnight."""
+    rng = np.random.default_rng(3)
+    minutes = np.flatnonzero(rng.random(4 * 1_440) > 0.2)
+    dates = 10 * DAY + 60.0 * minutes
+    closes = 1.1 + np.cumsum(rng.normal(0, 1e-4, dates.size))
+    opens = np.concatenate(([1.1], closes[:-1]))
+    highs = np.maximum(opens, closes) + rng.random(dates.size) * 1e-4
+    lows = np.minimum(opens, closes) - rng.random(dates.size) * 1e-4
+    return dates, opens, highs, lows, closes
+
+
+def bucket_extremes(y, start, stop, max_points, factor):
+    """Brute force: the finest ``factor ** k`` buckets over the range that fit the budget."""
+    size = factor
+    while (stop - 1) // size - start // size + 1 > max(max_points // 2, 1):
+        size *= factor
+    idx = []
+    for b in range(start // size, (stop - 1) // size + 1):
+        bucket = slice(b * size, min((b + 1) * size, y.size))
+        lo = b * size + int(np.argmin(y[bucket]))
+        hi = b * size + int(np.argmax(y[bucket]))
+        idx += [min(lo, hi), max(lo, hi)]
+    return np.array(idx)
+
+
+def cloud(n, seed=0):
+    rng = np.random.default_rng(seed)
+    return rng.normal(size=n), 3 * rng.standard_cauchy(size=n)
+
+
+def grouped_ohlc(bars, timeframe):
+    """Brute-force aggregation: one bar per distinct bucket, in time order."""
+    dates, opens, highs, lows, closes = bars
+    seconds = timeframe_seconds(timeframe)
+    buckets = np.floor(dates / seconds) * seconds
+    out = []
+    for bucket in np.unique(buckets):
+        rows = np.flatnonzero(buckets == bucket)
+        out.append((bucket, opens[rows[0]], highs[rows].max(), lows[rows].min(),
+                    closes[rows[-1]]))
+    return tuple(np.array(col) for col in zip(*out))
+
+
+@pytest.mark.parametrize("factor", [2, 4, 7])
+@pytest.mark.parametrize("max_points", [2, 3, 50, 333, 1_000])
+def test_min_max_query_matches_brute_force(factor, max_points):
+    rng = np.random.default_rng(factor)
+    x = np.cumsum(rng.random(20_011))
+    y = rng.normal(size=x.size)
+    pyramid = MinMaxPyramid(x, y, factor=factor)
+    for x_min, x_max in ((x[0], x[-1]), (x[1_234], x[5_678]), (x[100], x[900]), (x[7], x[9])):
+        xs, ys = pyramid.query(x_min, x_max, max_points)
+        start, stop = pyramid.visible_range(x_min, x_max)
+        assert xs.size <= max(max_points, 2)
+        if stop - start <= max_points:
+            np.testing.assert_array_equal(ys, y[start:stop])
+            continue
+        idx = bucket_extremes(y, start, stop, max_points, factor)
+        np.testing.assert_array_equal(xs, x[idx])
+        np.testing.assert_array_equal(ys, y[idx])
+        assert ys.min() <= y[start:stop].min() and ys.max() >= y[start:stop].max()
+
+
+def test_range_min_max_matches_scan():
+    rng = np.random.default_rng(1)
+    lows = rng.normal(size=10_000)
+    highs = lows + rng.random(10_000)
+    index = RangeMinMax(lows, highs, block=16)
+    for start, stop in rng.integers(0, 10_000, size=(2_000, 2)):
+        start, stop = min(start, stop), max(start, stop) + 1
+        assert index.minmax(start, stop) == (lows[start:stop].min(), highs[start:stop].max())
+
+
+def test_levels_aggregate_the_source_groups(bars):
+    pyramid = OHLCPyramid(*bars, timeframes=("M1", "M5", "M15", "H1", "D1"))
+    # M1 is not coarser than the source bars
+    assert pyramid.names == ["source", "M5", "M15", "H1", "D1"]
+    for name, level in zip(pyramid.names[1:], pyramid.levels[1:]):
+        expected = grouped_ohlc(bars, name)
+        for got, want, by_resample in zip(level, expected, resample_ohlc(*bars, name)):
+            np.testing.assert_array_equal(got, want)
+            np.testing.assert_array_equal(got, by_resample)
+    assert pyramid.levels[-1][0].tolist() == [10 * DAY + d * DAY for d in range(4)]
+
+
+@pytest.mark.parametrize("minutes, width, level", [
+    (300, 1_000, 0),     # ~240 M1 bars fit 500 candles
+    (2_000, 1_000, 1),   # ~1600 M1 bars do not, ~400 M5 bars do
+    (6_000, 1_000, 2),   # The whole set: 384 M15 bars
+    (6_000, 200, 3),     # 96 H1 bars fit 100 candles
+    (6_000, 100, 4),     # They do not fit 50, so the 4 D1 bars are drawn
+])
+def test_level_selection_follows_zoom(bars, minutes, width, level):
+    pyramid = OHLCPyramid(*bars)
+    x_min = bars[0][0]
+    x_max = x_min + 60.0 * minutes
+    chosen, columns = pyramid.query(x_min, x_max, width)
+    assert chosen == level
+    start, stop = pyramid.visible_range(level, x_min, x_max)
+    assert stop - start <= max(width * 0.5, 1.0) or level == len(pyramid.levels) - 1
+    if level:
+        # The next finer level would exceed the budget
+        finer = pyramid.visible_range(level - 1, x_min, x_max)
+        assert finer[1] - finer[0] > width * 0.5
+    for col, full in zip(columns, pyramid.levels[level]):
+        assert np.shares_memory(col, full)
+        np.testing.assert_array_equal(col, full[start:stop])
+
+
+def test_candle_series_sends_the_level_for_the_zoom(recording_dpg, bars):
+    plot = recording_dpg.add_plot()
+    x_axis = recording_dpg.add_plot_axis(recording_dpg.mvXAxis, parent=plot)
+    y_axis = recording_dpg.add_plot_axis(recording_dpg.mvYAxis, parent=plot)
+    candles = series.PyramidCandleSeries(*bars, parent=y_axis)
+    assert candles.x_axis == x_axis
+
+    def sent():
+        (_, (tag, columns), _) = recording_dpg.named("set_value")[-1]
+        assert tag == candles.tag
+        dates, opens, closes, lows, highs = columns
+        return dates, opens, highs, lows, closes
+
+    def expect(level, timeframe):
+        # The sent bars are the groups of the source bars around the visible range
+        dates, *prices = sent()
+        assert candles.level == level and dates.size
+        full = grouped_ohlc(bars, timeframe) if timeframe else bars
+        start = int(np.searchsorted(full[0], dates[0]))
+        for got, want in zip((dates, *prices), full):
+            np.testing.assert_array_equal(got, want[start:start + dates.size])
+
+    # Built at the default width over the whole set: 384 M15 bars
+    expect(2, "M15")
+
+    start = bars[0][0]
+    recording_dpg.set_axis_limits(x_axis, start + DAY, start + DAY + 3_600 * 4)
+    candles.refresh()
+    expect(0, None)
+
+    uploads = len(recording_dpg.named("set_value"))
+    recording_dpg.set_axis_limits(x_axis, start + DAY + 600, start + DAY + 3_600 * 4 + 600)
+    candles.refresh()  # A small pan is served from the bars already sent
+    assert len(recording_dpg.named("set_value")) == uploads
+
+    recording_dpg.set_axis_limits(x_axis, start, start + 2 * DAY)
+    candles.refresh()
+    expect(1, "M5")
+
+
+def test_density_grid_points_and_count_match_scan():
+    x, y = cloud(100_000)
+    x[::501] = np.nan
+    grid = DensityGrid(x, y, resolution=256)
+    rng = np.random.default_rng(1)
+    for x_min, y_min, w, h in zip(rng.normal(size=100), rng.normal(size=100),
+                                  rng.choice([0.01, 0.5, 5.0], size=100),
+                                  rng.choice([0.1, 5.0, 100.0], size=100)):
+        inside = (x >= x_min) & (x <= x_min + w) & (y >= y_min) & (y <= y_min + h)
+        found = grid.points(x_min, x_min + w, y_min, y_min + h)
+        np.testing.assert_array_equal(np.sort(found), np.flatnonzero(inside))
+        assert grid.count(x_min, x_min + w, y_min, y_min + h) >= inside.sum()
+
+
+@pytest.mark.parametrize("box", [(-2.0, 2.0, -10.0, 10.0), (0.1, 0.12, 0.0, 0.05)])
+def test_density_grid_histogram_matches_histogram2d(box):
+    x, y = cloud(200_000)
+    grid = DensityGrid(x, y, resolution=1024)
+    x_min, x_max, y_min, y_max = box
+    density = grid.histogram(x_min, x_max, y_min, y_max, bins_x=64, bins_y=32)
+    area = (x_max - x_min) / 64 * (y_max - y_min) / 32
+    counts = np.histogram2d(y, x, bins=(32, 64), range=((y_min, y_max), (x_min, x_max)))[0]
+    assert density.shape == (32, 64) and density.dtype == np.float32
+    # Snapping bin edges to fine cells moves at most a cell's worth of points per bin
+    assert abs(density.sum() * area - counts.sum()) <= 0.01 * counts.sum() + 1
+    coarse = density.reshape(8, 4, 8, 8).sum(axis=(1, 3)) * area
+    np.testing.assert_allclose(coarse, counts.reshape(8, 4, 8, 8).sum(axis=(1, 3)),
+                               rtol=0.1, atol=20)
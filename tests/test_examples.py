@@ -0,0 +1,55 @@
+"""Smoke runs of the scripts in ``examples/`` on the recording DPG stand-in."""
+import importlib.util
+import os
+
+import pytest
+
+EXAMPLES = os.path.join(os.path.dirname(__file__), os.pardir, "examples")
+
+
+def load_example(name):
+    spec = importlib.util.spec_from_file_location(name, os.path.join(EXAMPLES, f"{name}.py"))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+# Loaded at collection, so ``recording_dpg`` also patches the pegasus modules they import
+fft_analyzer = load_example("fft_analyzer")
+hft_dashboard = load_example("hft_dashboard")
+
+
+@pytest.fixture
+def run_example(recording_dpg, monkeypatch):
+    """Runs ``example.main(["--frames", N])``, firing every visible handler once per frame."""
+    def frame():
+        for _, _, kwargs in recording_dpg.named("add_item_visible_handler"):
+            kwargs["callback"](None, None)
+
+    recording_dpg.is_dearpygui_running = lambda: True
+    recording_dpg.render_dearpygui_frame = frame
+
+    def run(example, frames=3):
+        monkeypatch.setattr(example, "dpg", recording_dpg)
+        example.main(["--frames", str(frames)])
+    return run
+
+
+def test_hft_dashboard(recording_dpg, run_example):
+    run_example(hft_dashboard)
+    assert len(recording_dpg.named("add_candle_series")) == 1
+    assert not recording_dpg.named("start_dearpygui")
+    # The initial snapshot, then one re-send per frame the book changed
+    sent = [recording_dpg.get_item_type(args[0]) for _, args, _ in recording_dpg.named("set_value")]
+    assert sent == ["mvAppItemType::mvStairSeries"] * 8
+
+
+def test_fft_analyzer(recording_dpg, run_example):
+    run_example(fft_analyzer, frames=12)
+    (_, _, texture), = recording_dpg.named("add_dynamic_texture")
+    assert recording_dpg.get_item_type(texture["parent"]) == "mvAppItemType::mvTextureRegistry"
+    sent = [recording_dpg.get_item_type(args[0]) for _, args, _ in recording_dpg.named("set_value")]
+    # Every frame uploads the signal; frames that complete an FFT also send the
+    # spectrum and the spectrogram texture
+    assert sent.count("mvAppItemType::mvLineSeries") > 12
+    assert "mvAppItemType::mvDynamicTexture" in sent
@@ -0,0 +1,126 @@
+"""Headless export: the NumPy rasterizer, PNG encoding and batch rendering, without DPG."""
+import struct
+import zlib
+from functools import partial
+
+import numpy as np
+import pytest
+
+from pegasus import (CandlestickChart, Dashboard, HeatmapChart, LineChart, ScatterChart,
+                     render_charts)
+from pegasus.performance.textures import colormap_lut
+from pegasus.plotting.raster import PLOT_BACKGROUND, RasterPlot, encode_png
+
+
+def decode_png(data: bytes) -> np.ndarray:
+    """Minimal decoder for the unfiltered 8-bit RGBA PNGs ``encode_png`` writes."""
+    assert data[:8] == b"\x89PNG\r\n\x1a\n"
+    pos, chunks = 8, {}
+    while pos < len(data):
+        (length,) = struct.unpack(">I", data[pos:pos + 4])
+        kind, body = data[pos + 4:pos + 8], data[pos + 8:pos + 8 + length]
+        assert struct.unpack(">I", data[pos + 8 + length:pos + 12 + length])[0] == \
+            zlib.crc32(kind + body)
+        chunks[kind] = chunks.get(kind, b"") + body
+        pos += 12 + length
+    width, height, depth, color_type = struct.unpack(">IIBB", chunks[b"IHDR"][:10])
+    assert (depth, color_type) == (8, 6) and b"IEND" in chunks
+    raw = np.frombuffer(zlib.decompress(chunks[b"IDAT"]), dtype=np.uint8)
+    raw = raw.reshape(height, width * 4 + 1)
+    assert not raw[:, 0].any()
+    return raw[:, 1:].reshape(height, width, 4)
+
+
+def has_color(pixels, color) -> bool:
+    return bool((pixels == np.asarray(color, dtype=np.uint8)).all(axis=-1).any())
+
+
+def test_encode_png_round_trips():
+    pixels = np.random.default_rng(0).integers(0, 256, (37, 53, 4), dtype=np.uint8)
+    np.testing.assert_array_equal(decode_png(encode_png(pixels)), pixels)
+
+
+def test_line_keeps_single_sample_spike():
+    x = np.arange(1_000_000, dtype=np.float64)
+    y = np.zeros_like(x)
+    y[612_345] = 1.0
+    pixels = np.empty((300, 600, 4), dtype=np.uint8)
+    plot = RasterPlot(pixels, (x[0], x[-1]), (0.0, 1.0))
+    plot.line(x, y, (255, 0, 0, 255))
+    red = (pixels == (255, 0, 0, 255)).all(axis=-1)
+    spike_col = int(np.rint(plot._px(612_345)))
+    top_row = int(np.rint(plot._py(1.0)))
+    assert red[top_row, spike_col]
+    assert red[:, plot.left + 1:plot.right].any(axis=0).all()  # Continuous, no gaps
+
+
+def test_line_chart_png_matches_rasterize(tmp_path):
+    x = np.linspace(0, 10, 5_000)
+    chart = LineChart(x, np.sin(x), width=400, height=300)
+    path = chart.render_to_png(str(tmp_path / "line.png"))
+    image = decode_png(open(path, "rb").read())
+    np.testing.assert_array_equal(image, chart.rasterize())
+    assert image.shape == (300, 400, 4) and has_color(image, chart.color)
+
+
+def test_candles_draw_bull_and_bear_bodies():
+    dates = 1.7e9 + 3600.0 * np.arange(4)
+    opens = np.array([1.0, 2.0, 2.0, 1.0])
+    closes = np.array([2.0, 1.0, 3.0, 0.5])
+    chart = CandlestickChart(dates, opens, np.maximum(opens, closes) + 0.2,
+                             np.minimum(opens, closes) - 0.2, closes, width=400, height=300)
+    pixels = chart.rasterize()
+    bull = (pixels == chart.bull_color).all(axis=-1)
+    bear = (pixels == chart.bear_color).all(axis=-1)
+    assert bull.any() and bear.any()
+    # Rows crossing only wicks are one pixel wide; bodies are 2 * weight of the bar spacing
+    widths = bull.sum(axis=1)
+    assert widths[widths > 0].min() == 1 and widths.max() > 10
+
+
+@pytest.mark.parametrize("points, density", [(2_000, False), (300_000, True)])
+def test_scatter_markers_or_density(points, density):
+    rng = np.random.default_rng(0)
+    chart = ScatterChart(rng.normal(size=points), rng.normal(size=points),
+                         width=400, height=300, marker_threshold=50_000)
+    pixels = chart.rasterize()
+    lut = np.rint(colormap_lut(chart.colormap) * 255).astype(np.uint8)
+    assert has_color(pixels, lut[-1]) == density  # Densest bins get the top color
+    assert has_color(pixels, (76, 114, 176, 255)) != density
+
+
+def test_heatmap_cells_map_to_colormap():
+    chart = HeatmapChart([[0.0, 1.0], [1.0, 0.0]], width=400, height=300, colormap="gray")
+    pixels = chart.rasterize()
+    plot = RasterPlot(np.empty_like(pixels), (0.0, 2.0), (0.0, 2.0), pad_y=0.0)
+    top_left = pixels[int(plot._py(1.5)), int(plot._px(0.5))]
+    top_right = pixels[int(plot._py(1.5)), int(plot._px(1.5))]
+    np.testing.assert_array_equal(top_left, (0, 0, 0, 255))       # Row 0 is the top row
+    np.testing.assert_array_equal(top_right, (255, 255, 255, 255))
+
+
+def test_dashboard_draws_each_panel_in_its_cell():
+    x = np.linspace(0, 1, 100)
+    board = Dashboard(rows=1, columns=2, width=800, height=300)
+    board.add(LineChart(x, x, color=(255, 0, 0, 255)))
+    board.add(LineChart(x, -x, color=(0, 0, 255, 255)))
+    pixels = board.rasterize()
+    assert has_color(pixels[:, :400], (255, 0, 0, 255))
+    assert not has_color(pixels[:, 400:], (255, 0, 0, 255))
+    assert has_color(pixels[:, 400:], (0, 0, 255, 255))
+    assert has_color(pixels, PLOT_BACKGROUND)
+
+
+def sine_chart(frequency):
+    x = np.linspace(0, 10, 10_000)
+    return LineChart(x, np.sin(frequency * x), width=320, height=200)
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_render_charts_in_order(tmp_path, max_workers):
+    jobs = [(partial(sine_chart, k), str(tmp_path / f"{k}.png")) for k in range(5)]
+    jobs.append((sine_chart(9), str(tmp_path / "chart.png")))
+    assert render_charts(jobs, max_workers=max_workers) == [path for _, path in jobs]
+    for factory, path in jobs[:5]:
+        expected = factory().rasterize()
+        np.testing.assert_array_equal(decode_png(open(path, "rb").read()), expected)
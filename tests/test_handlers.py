@@ -0,0 +1,47 @@
+"""Per-item handler registries in ``pegasus.events.handlers``."""
+import numpy as np
+
+from pegasus import Dashboard, LineChart
+from pegasus.events.handlers import add_query_handler, add_visible_handler
+
+
+def bound_handlers(recording_dpg, since=0):
+    """``{item: handler parents}`` of the handlers added after call ``since``."""
+    bound = {}
+    for name, args, kwargs in recording_dpg.calls[since:]:
+        if name in ("add_item_visible_handler", "add_item_hover_handler"):
+            bound.setdefault(kwargs["parent"], []).append(name)
+    return bound
+
+
+def test_callbacks_on_one_item_share_its_registry(recording_dpg):
+    recording_dpg.create_context()
+    add_visible_handler("plot", lambda *args: None)
+    add_query_handler("plot", lambda x, y: None)
+    add_visible_handler("window", lambda *args: None)
+    binds = dict(args for _, args, _ in recording_dpg.named("bind_item_handler_registry"))
+    assert set(binds) == {"plot", "window"} and binds["plot"] != binds["window"]
+    assert bound_handlers(recording_dpg) == {
+        binds["plot"]: ["add_item_visible_handler", "add_item_hover_handler"],
+        binds["window"]: ["add_item_visible_handler"]}
+
+
+def test_registries_are_not_reused_across_contexts(recording_dpg):
+    x = np.arange(100.0)
+    first, second = LineChart(x, x), LineChart(x, -x)
+    first.show()
+
+    # A new context hands the ids of the first one out again
+    board = Dashboard(rows=1, columns=2)
+    board.add(second)
+    board.add(first)
+    start = len(recording_dpg.calls)
+    board.show()
+    binds = {args[0]: args[1] for name, args, _ in recording_dpg.calls[start:]
+             if name == "bind_item_handler_registry"}
+    assert first.plot_tag in binds and second.plot_tag in binds
+    assert binds[first.plot_tag] != binds[second.plot_tag]
+    for registry in binds.values():
+        assert recording_dpg.get_item_type(registry) == "mvAppItemType::mvItemHandlerRegistry"
+    # Every handler of the second context hangs off a registry bound in it
+    assert set(bound_handlers(recording_dpg, start)) <= set(binds.values())
@@ -0,0 +1,134 @@
+"""Out-of-core column stores: chunk selection, boundaries, eviction and viewport queries."""
+import numpy as np
+import pytest
+
+from pegasus.utils.mmap_series import MmapColumns, MmapLineSource, MmapOHLCSource, write_columns
+
+ROWS = 10_000
+CHUNK = 1_000
+
+
+@pytest.fixture
+def store(tmp_path):
+    t = np.arange(ROWS, dtype=np.float64) * 2.0  # Even keys: odd values fall between rows
+    y = np.sin(t / 50.0)
+    write_columns(str(tmp_path), t=t, y=y)
+    store = MmapColumns(str(tmp_path), chunk_size=CHUNK, cache_chunks=3)
+    yield store
+    store.close()
+
+
+def test_write_columns_appends_and_validates(tmp_path):
+    directory = str(tmp_path)
+    assert write_columns(directory, t=np.arange(3.0), y=np.zeros(3)) == 3
+    assert write_columns(directory, append=True, t=np.arange(3.0, 5.0), y=np.ones(2)) == 5
+    store = MmapColumns(directory, chunk_size=2)
+    np.testing.assert_array_equal(store.read(0, 5, ("t",))[0], np.arange(5.0))
+    with pytest.raises(ValueError):
+        write_columns(directory, append=True, t=np.array([1.0]), y=np.zeros(1))
+    with pytest.raises(ValueError):
+        write_columns(directory, t=np.array([2.0, 1.0]), y=np.zeros(2))
+
+
+def test_search_matches_searchsorted_across_chunk_boundaries(store):
+    keys = np.asarray(store.columns["t"])
+    # Exact chunk-start keys, the keys just before them, gaps and both ends
+    values = np.concatenate((store.index, store.index - 2.0, store.index + 1.0,
+                             [-5.0, 0.0, keys[-1], keys[-1] + 5.0]))
+    for value in values:
+        for side in ("left", "right"):
+            assert store.search(value, side) == np.searchsorted(keys, value, side)
+
+
+def test_visible_range_pads_one_row_each_side(store):
+    assert store.visible_range(2 * 1_500, 2 * 2_500) == (1_499, 2_502)
+    assert store.visible_range(3.0, 3.0) == (1, 3)  # Between rows: both neighbours
+    assert store.visible_range(-100.0, -10.0) == (0, 1)
+    assert store.visible_range(1e9, 2e9) == (ROWS - 1, ROWS)
+
+
+def test_read_within_and_across_chunks(store):
+    raw_t = np.asarray(store.columns["t"])
+    inside_t, inside_y = store.read(1_100, 1_200)
+    np.testing.assert_array_equal(inside_t, raw_t[1_100:1_200])
+    assert np.shares_memory(inside_t, store.chunk(1)["t"])  # A view of the cached chunk
+
+    across, = store.read(CHUNK - 5, 3 * CHUNK + 5, ("t",))
+    np.testing.assert_array_equal(across, raw_t[CHUNK - 5:3 * CHUNK + 5])
+    last, = store.read(ROWS - 3, ROWS + 100, ("y",))
+    assert last.size == 3
+
+
+@pytest.mark.parametrize("start, stop", [(5, 5), (7, 3), (ROWS, ROWS + 10), (-20, 0)])
+def test_empty_and_out_of_range_reads(store, start, stop):
+    t, y = store.read(start, stop)
+    assert t.size == y.size == 0 and t.dtype == np.float64
+
+
+def test_lru_eviction_keeps_cache_bounded(store):
+    for chunk in (0, 1, 2):
+        store.chunk(chunk)
+    store.chunk(0)  # Touch: chunk 1 is now the least recently used
+    store.chunk(3)
+    assert list(store._cache) == [2, 0, 3]
+    store.read(0, ROWS)
+    assert len(store._cache) == store.cache_chunks
+
+
+def test_prefetch_loads_neighbouring_chunks(store):
+    store.prefetch(4 * CHUNK + 10, 4 * CHUNK + 20)
+    store.close()  # Waits for the prefetch thread
+    assert not store._cache
+    store.prefetch(4 * CHUNK + 10, 4 * CHUNK + 20)
+    store._executor.shutdown(wait=True)
+    assert sorted(store._cache) == [3, 5]
+
+
+def test_empty_store(tmp_path):
+    write_columns(str(tmp_path), t=np.empty(0), y=np.empty(0))
+    store = MmapColumns(str(tmp_path), chunk_size=CHUNK)
+    assert len(store) == 0 and store.chunks == 0 and store.search(1.0) == 0
+    assert store.visible_range(0.0, 1.0) == (0, 0)
+    assert store.read(0, 10)[0].size == 0
+    store.prefetch(0, 10)
+    source = MmapLineSource(store, "y")
+    assert source.bounds == (0.0, 0.0)
+    assert source.query(0.0, 1.0, 100)[0].size == 0
+
+
+@pytest.mark.parametrize("max_points", [20_000, 1_000, 10])
+def test_line_query_keeps_extremes(store, max_points):
+    """Exact rows when they fit; otherwise per-bucket min/max, from raw rows or the overview."""
+    source = MmapLineSource(store, "y", overview_block=256)
+    raw_t, raw_y = np.asarray(store.columns["t"]), np.asarray(store.columns["y"])
+    x, y = source.query(2 * 1_000, 2 * 9_000, max_points)
+    start, stop = store.visible_range(2 * 1_000, 2 * 9_000)
+    if stop - start <= max_points:
+        np.testing.assert_array_equal(x, raw_t[start:stop])
+        return
+    assert y.min() == raw_y[start:stop].min() and y.max() == raw_y[start:stop].max()
+    assert np.all(np.diff(x) >= 0)
+    assert np.isin(x, raw_t).all()
+    np.testing.assert_array_equal(y, raw_y[(x / 2).astype(int)])
+
+
+def test_ohlc_query_merges_bars(tmp_path):
+    rng = np.random.default_rng(0)
+    closes = 1.0 + np.cumsum(rng.normal(0, 1e-3, ROWS))
+    opens = np.concatenate(([1.0], closes[:-1]))
+    highs = np.maximum(opens, closes) + 1e-3
+    lows = np.minimum(opens, closes) - 1e-3
+    dates = 60.0 * np.arange(ROWS)
+    write_columns(str(tmp_path), date=dates, open=opens, high=highs, low=lows, close=closes)
+    store = MmapColumns(str(tmp_path), chunk_size=CHUNK)
+    source = MmapOHLCSource(store, overview_block=64)
+
+    exact = source.query(dates[10], dates[20], max_bars=100)
+    np.testing.assert_array_equal(exact[0], dates[9:22])
+    for max_bars in (500, 20):
+        merged = source.query(dates[0], dates[-1], max_bars)
+        count = merged[0].size
+        assert count <= max_bars
+        assert merged[2].max() == highs.max() and merged[3].min() == lows.min()
+        assert merged[1][0] == opens[0] and merged[4][-1] == closes[-1]
+    store.close()
@@ -0,0 +1,100 @@
+"""Tick and bar aggregation in ``pegasus.utils.ohlc``."""
+import numpy as np
+import pytest
+
+from pegasus.utils.ohlc import BarAggregator, TimeframeBars, resample_ohlc, ticks_to_ohlc
+
+TIMEFRAMES = ("M1", "M5", "H1", 7)
+
+
+@pytest.fixture(scope="module")
+def ticks():
+    """Two hours of irregular ticks, with bursts and minute-long gaps."""
+    rng = np.random.default_rng(11)
+    times = np.sort(rng.uniform(0.0, 7_200.0, 3_000)) + 1_700_000_000.0
+    times = times[(times % 600.0 < 520.0)]
+    prices = 1.1 + np.cumsum(rng.normal(0, 1e-5, times.size))
+    return times, prices
+
+
+def assert_bars_equal(bars, expected):
+    for got, want in zip(bars.arrays(), expected):
+        np.testing.assert_array_equal(got, want)
+
+
+def test_update_matches_resample(ticks):
+    agg = BarAggregator(TIMEFRAMES)
+    for t, price in zip(*ticks):
+        agg.update(t, price)
+    for timeframe in TIMEFRAMES:
+        assert_bars_equal(agg[timeframe], ticks_to_ohlc(*ticks, timeframe))
+
+
+@pytest.mark.parametrize("splits", [[], [1, 2, 500], [17, 999, 1_000, 1_001, 2_000]])
+def test_update_many_merges_batches(ticks, splits):
+    agg = BarAggregator(TIMEFRAMES)
+    for times, prices in zip(np.split(ticks[0], splits), np.split(ticks[1], splits)):
+        agg.update_many(times, prices)
+    for timeframe in TIMEFRAMES:
+        assert_bars_equal(agg[timeframe], ticks_to_ohlc(*ticks, timeframe))
+
+
+def test_load_bars_then_live_ticks(ticks):
+    times, prices = ticks
+    split = times.size // 2
+    agg = BarAggregator(("M5", "H1"))
+    agg.load_bars(*ticks_to_ohlc(times[:split], prices[:split], "M1"))
+    for t, price in zip(times[split:], prices[split:]):
+        agg.update(t, price)
+    for timeframe in ("M5", "H1"):
+        assert_bars_equal(agg[timeframe], ticks_to_ohlc(times, prices, timeframe))
+
+
+def test_merge_of_resampled_bars(ticks):
+    m1 = ticks_to_ohlc(*ticks, "M1")
+    bars = TimeframeBars("M5")
+    for start in range(0, m1[0].size, 13):
+        bars.merge(*resample_ohlc(*(col[start:start + 13] for col in m1), "M5"))
+    assert_bars_equal(bars, resample_ohlc(*m1, "M5"))
+    bars.merge(*(np.empty(0) for _ in range(5)))
+    assert_bars_equal(bars, resample_ohlc(*m1, "M5"))
+
+
+def test_out_of_order_ticks_fold_into_the_open_bar():
+    bars = TimeframeBars("M1")
+    bars.update(120.0, 1.0)
+    bars.update(185.0, 2.0)  # Opens the 180 bar
+    bars.update(150.0, 5.0)  # Late tick of the closed 120 bar
+    bars.update(10.0, 0.5)   # Even older
+    assert len(bars.closed) == 1
+    np.testing.assert_array_equal(bars.closed.views()[0], [120.0])
+    assert bars.open_bar.tolist() == [180.0, 2.0, 5.0, 0.5, 0.5]
+    bars.update(240.0, 3.0)
+    dates, opens, highs, lows, closes = bars.arrays()
+    assert dates.tolist() == [120.0, 180.0, 240.0] and highs.tolist() == [1.0, 5.0, 3.0]
+
+
+def test_version_counters_and_resets():
+    bars = TimeframeBars("M1", capacity=3)
+    bars.update(0.0, 1.0)
+    bars.update(30.0, 1.5)
+    assert (bars.closed_version, bars.open_version) == (0, 2)
+    bars.update(60.0, 2.0)  # Closes the first bar
+    assert (bars.closed_version, bars.open_version) == (1, 3)
+
+    # A merged batch closing several bars bumps closed_version once
+    dates = np.array([60.0, 120.0, 180.0, 240.0, 300.0])
+    bars.merge(dates, dates, dates, dates, dates)
+    assert (bars.closed_version, bars.open_version) == (2, 4)
+    # Only the last `capacity` closed bars are kept
+    assert bars.closed.views()[0].tolist() == [120.0, 180.0, 240.0] and len(bars) == 4
+    assert bars.open_bar[0] == 300.0
+
+    agg = BarAggregator(("M1", "M5"))
+    agg.update(0.0, 1.0)
+    agg.clear()
+    for timeframe in ("M1", "M5"):
+        assert len(agg[timeframe]) == 0 and agg[timeframe].resets == 1
+        assert agg[timeframe].closed_version == 1
+    agg.update(600.0, 2.0)
+    assert agg["M5"].arrays()[0].tolist() == [600.0]
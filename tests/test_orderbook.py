@@ -0,0 +1,71 @@
+"""Array-backed L2 and L3 order books against dict references."""
+import numpy as np
+
+from pegasus.orderbook import ASK, BID, L3OrderBook, OrderBook
+
+LEVELS = 1_000
+
+
+def random_deltas(n, levels=LEVELS, tick=0.5, seed=0):
+    rng = np.random.default_rng(seed)
+    sides = rng.integers(0, 2, n)
+    distance = rng.integers(0, levels, n) * tick
+    prices = np.where(sides == BID, 5000.0 - distance, 5001.0 + distance)
+    sizes = np.where(rng.random(n) < 0.1, 0.0, rng.random(n))
+    return sides, prices, sizes
+
+
+def full_book(levels=LEVELS, tick=0.5):
+    book = OrderBook(levels=levels)
+    distance = np.arange(levels) * tick
+    book.snapshot(5000.0 - distance, np.ones(levels), 5001.0 + distance, np.ones(levels))
+    return book
+
+
+def test_l2_matches_dict_reference():
+    book = full_book()
+    levels = {BID: dict(zip(book.bids.prices(), book.bids.sizes())),
+              ASK: dict(zip(book.asks.prices(), book.asks.sizes()))}
+    sides, prices, sizes = random_deltas(50_000)
+    for start in range(0, sides.size, 997):
+        batch = slice(start, start + 997)
+        book.apply(sides[batch], prices[batch], sizes[batch])
+        for side, price, size in zip(sides[batch], prices[batch], sizes[batch]):
+            if size > 0:
+                levels[side][price] = size
+            else:
+                levels[side].pop(price, None)
+
+    for side, book_side in ((BID, book.bids), (ASK, book.asks)):
+        expected = sorted(levels[side].items(), reverse=side == BID)
+        np.testing.assert_array_equal(book_side.prices(), [p for p, _ in expected])
+        np.testing.assert_array_equal(book_side.sizes(), [s for _, s in expected])
+        np.testing.assert_allclose(book_side.depth(), np.cumsum([s for _, s in expected]))
+
+
+def test_l3_aggregates_orders_into_levels():
+    rng = np.random.default_rng(1)
+    book = L3OrderBook(levels=200, order_capacity=8)
+    orders = {}
+    for _ in range(200):
+        n = int(rng.integers(1, 100))
+        ids = rng.integers(0, 500, n)
+        sides = rng.integers(0, 2, n)
+        prices = rng.integers(0, 50, n) + np.where(sides == BID, 0.0, 60.0)
+        sizes = np.where(rng.random(n) < 0.3, 0.0, rng.random(n))
+        book.apply_orders(ids, sides, prices, sizes)
+        for order in zip(ids, sides, prices, sizes):
+            if order[3] > 0:
+                orders[order[0]] = order[1:]
+            else:
+                orders.pop(order[0], None)
+
+    assert len(book) == len(orders)
+    for side, book_side in ((BID, book.bids), (ASK, book.asks)):
+        levels = {}
+        for s, price, size in orders.values():
+            if s == side:
+                levels[price] = levels.get(price, 0.0) + size
+        expected = sorted(levels.items(), reverse=side == BID)
+        np.testing.assert_array_equal(book_side.prices(), [p for p, _ in expected])
+        np.testing.assert_allclose(book_side.sizes(), [s for _, s in expected])
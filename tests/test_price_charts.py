@@ -0,0 +1,97 @@
+"""Renko, Kagi and Point & Figure builders against naive per-price reference loops."""
+import math
+
+import numpy as np
+
+from pegasus.utils.price_charts import KagiBuilder, PointFigureBuilder, RenkoBuilder
+
+
+def random_walk(n, step=0.01, seed=7):
+    rng = np.random.default_rng(seed)
+    return 100.0 + np.cumsum(rng.normal(0.0, step, n))
+
+
+def naive_renko(prices, box):
+    bottom, top = prices[0] - box, prices[0]
+    bricks = []
+    for p in prices:
+        while p >= top + box:
+            bottom, top = top, top + box
+            bricks.append((bottom, 1))
+        while p <= bottom - box:
+            bottom, top = bottom - box, bottom
+            bricks.append((bottom, -1))
+    return bricks
+
+
+def naive_kagi(prices, reversal):
+    first = prices[0]
+    direction, extreme, vertices = 0, first, [first]
+    for p in prices:
+        if direction == 0:
+            if p > first or p < first - reversal:
+                direction = 1 if p > first else -1
+                extreme = p
+                vertices.append(p)
+        elif direction * (p - extreme) > 0:
+            extreme = p
+            vertices[-1] = p
+        elif direction * (extreme - p) > reversal:
+            direction = -direction
+            extreme = p
+            vertices.append(p)
+    return vertices
+
+
+def naive_point_figure(prices, box, reversal):
+    columns, direction = [], 0
+    origin = top = math.floor(prices[0] / box)
+    bottom = None
+    for p in prices:
+        u = p / box
+        if direction >= 0:
+            if math.floor(u) > top:
+                top = math.floor(u)
+                if direction == 0:
+                    columns.append([1, origin, top])
+                    direction = 1
+                else:
+                    columns[-1][2] = top
+            elif math.ceil(u) <= top - reversal:
+                start = top - 1 if direction == 1 else origin
+                bottom = math.ceil(u)
+                columns.append([-1, bottom, start])
+                direction = -1
+        else:
+            if math.ceil(u) < bottom:
+                bottom = math.ceil(u)
+                columns[-1][1] = bottom
+            elif math.floor(u) >= bottom + reversal:
+                top = math.floor(u)
+                columns.append([1, bottom + 1, top])
+                direction = 1
+    return columns
+
+
+def test_builders_match_naive_loops_in_chunks():
+    prices = random_walk(200_000, step=0.05, seed=3)
+    chunks = np.array_split(prices, 7)
+
+    renko = RenkoBuilder(0.5)
+    kagi = KagiBuilder(0.7)
+    pnf = PointFigureBuilder(0.5, reversal=3)
+    for chunk in chunks:
+        renko.extend(chunk)
+        kagi.extend(chunk)
+        pnf.extend(chunk)
+
+    expected = np.array(naive_renko(prices, 0.5))
+    _, lows, _, directions = renko.bricks()
+    np.testing.assert_allclose(lows, expected[:, 0])
+    np.testing.assert_array_equal(directions, expected[:, 1])
+
+    np.testing.assert_allclose(kagi.vertices()[1], naive_kagi(prices, 0.7))
+
+    expected = np.array(naive_point_figure(prices, 0.5, 3))
+    _, directions, lows, highs = pnf.columns()
+    np.testing.assert_array_equal(np.column_stack([directions, lows, highs]), expected)
@@ -0,0 +1,137 @@
+"""The instrumented render loop and frame-timing exports, driven by a fake frame source."""
+import csv
+import json
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from pegasus import LineChart
+from pegasus.performance import profiler as profiler_module
+from pegasus.performance.profiler import COLUMNS, FrameProfiler, run_render_loop
+
+
+class FakeClock:
+    """Deterministic ``perf_counter``: time only moves when ``advance`` is called."""
+
+    def __init__(self):
+        self.now = 100.0
+
+    def perf_counter(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(profiler_module, "time", SimpleNamespace(perf_counter=clock.perf_counter))
+    return clock
+
+
+def test_summary_percentiles_and_fps():
+    profiler = FrameProfiler(capacity=100)
+    frame = np.linspace(0.010, 0.030, 150)  # More frames than capacity: the ring wraps
+    for i, value in enumerate(frame):
+        profiler.record(value, 0.001 * (i % 3), i % 4, 0.002, 0.001, 0.005)
+    assert len(profiler) == 100 and profiler.frames == 150
+
+    kept = frame[-100:]
+    np.testing.assert_array_equal(profiler.column("frame"), kept)
+    stats = profiler.summary()
+    assert stats["frame"].p50 == pytest.approx(np.percentile(kept, 50) * 1e3)
+    assert stats["frame"].p99 == pytest.approx(np.percentile(kept, 99) * 1e3)
+    assert stats["frame"].max == pytest.approx(kept.max() * 1e3)
+    assert stats["frame"].mean == pytest.approx(kept.mean() * 1e3)
+    assert stats["callbacks"].max == 3.0  # Counts are not scaled to milliseconds
+    assert profiler.fps == pytest.approx(1.0 / np.median(kept))
+    assert "FPS" in profiler.overlay_text()
+
+
+def test_empty_profiler():
+    profiler = FrameProfiler()
+    assert profiler.fps == 0.0
+    assert all(s.max == 0.0 for s in profiler.summary().values())
+
+
+def test_render_loop_times_each_phase(recording_dpg, clock):
+    calls = []
+
+    def fast(sender, app_data):
+        calls.append((sender, app_data))
+        clock.advance(0.002)
+
+    def slow():
+        clock.advance(0.005)
+
+    scheduler = SimpleNamespace(apply=lambda: clock.advance(0.001))
+    recording_dpg.is_dearpygui_running = lambda: True
+    recording_dpg.get_callback_queue = lambda: [(fast, "button", 7, None), (None,), (slow,)]
+    recording_dpg.render_dearpygui_frame = lambda: clock.advance(0.010)
+
+    profiler = run_render_loop(scheduler=scheduler, overlay="overlay", overlay_every=2,
+                               max_frames=5)
+    assert profiler.frames == 5 and calls == [("button", 7)] * 5
+    expected = {"frame": 0.018, "apply": 0.001, "callbacks": 2, "callback_total": 0.007,
+                "callback_max": 0.005, "render": 0.010}
+    for name, value in expected.items():
+        np.testing.assert_allclose(profiler.column(name), value, atol=1e-12)
+    overlays = [args for _, args, _ in recording_dpg.named("set_value")]
+    assert [tag for tag, _ in overlays] == ["overlay", "overlay"]
+
+
+def test_render_loop_stops_with_the_viewport(recording_dpg, clock):
+    running = iter([True, True, False])
+    recording_dpg.is_dearpygui_running = lambda: next(running)
+    recording_dpg.get_callback_queue = lambda: None
+    recording_dpg.render_dearpygui_frame = lambda: clock.advance(0.004)
+    profiler = run_render_loop(scheduler=SimpleNamespace(apply=lambda: None))
+    assert profiler.frames == 2
+    np.testing.assert_allclose(profiler.column("callbacks"), 0.0)
+
+
+def test_chart_show_fills_the_enabled_profiler(recording_dpg, clock):
+    recording_dpg.is_dearpygui_running = lambda: True
+    recording_dpg.render_dearpygui_frame = lambda: clock.advance(0.004)
+    chart = LineChart(np.arange(100.0), np.arange(100.0))
+    profiler = chart.enable_profiling()
+    chart.show(frames=6)
+    # The recorder handed out before ``show`` is the one the loop writes into
+    assert chart.profiler is profiler
+    assert len(profiler) == 6 and profiler.frames == 6
+    assert profiler.summary()["render"].max == pytest.approx(4.0)
+
+
+def filled_profiler(frames=10):
+    profiler = FrameProfiler()
+    for i in range(frames):
+        profiler.record(0.016 + i * 1e-4, 0.001, i, 0.002, 0.001, 0.012)
+    return profiler
+
+
+def test_json_export_schema(tmp_path):
+    profiler = filled_profiler()
+    path = str(tmp_path / "trace.json")
+    profiler.export(path)
+    with open(path) as f:
+        trace = json.load(f)
+    assert set(trace) == {"columns", "summary", "frames"}
+    assert trace["columns"] == list(COLUMNS)
+    assert set(trace["summary"]) == set(COLUMNS) == set(trace["frames"])
+    for name in COLUMNS:
+        assert set(trace["summary"][name]) == {"p50", "p99", "max", "mean"}
+        assert trace["frames"][name] == profiler.column(name).tolist()
+    assert trace["summary"]["frame"]["max"] == pytest.approx(profiler.summary()["frame"].max)
+
+
+def test_csv_export_schema(tmp_path):
+    profiler = filled_profiler()
+    path = str(tmp_path / "trace.csv")
+    profiler.export(path)
+    with open(path, newline="") as f:
+        header, *rows = list(csv.reader(f))
+    assert tuple(header) == COLUMNS and len(rows) == 10
+    np.testing.assert_array_equal(np.array(rows, dtype=float),
+                                  np.column_stack(profiler.samples.views()))
@@ -0,0 +1,222 @@
+"""Hover lookups of ``pegasus.performance.query`` and the chart readouts built on them."""
+import time
+
+import numpy as np
+import pytest
+
+from pegasus import CandlestickChart, LineChart, ScatterChart
+from pegasus.events.handlers import add_click_handler, add_query_handler
+from pegasus.performance.query import GridIndex, nearest_index
+from pegasus.utils.mmap_series import MmapColumns, MmapOHLCSource, write_columns
+from pegasus.utils.ohlc import TimeframeBars, resample_ohlc
+
+
+def cloud_points(n, seed=0):
+    rng = np.random.default_rng(seed)
+    return rng.normal(size=n), 3 * rng.standard_cauchy(size=n)
+
+
+def brute_nearest(x, y, qx, qy, rx, ry):
+    d2 = ((x - qx) / rx) ** 2 + ((y - qy) / ry) ** 2
+    k = int(np.nanargmin(d2))
+    return k if d2[k] <= 1.0 else -1
+
+
+def test_nearest_index_matches_scan():
+    rng = np.random.default_rng(2)
+    x = np.sort(rng.random(5_000))
+    for value in np.concatenate((rng.random(500), [-1.0, 2.0, x[0], x[-1]])):
+        assert nearest_index(x, value) == np.argmin(np.abs(x - value))
+    assert nearest_index(x[:0], 0.5) == -1
+    assert nearest_index(x, 5.0, max_distance=1.0) == -1
+
+
+@pytest.mark.parametrize("incremental", [False, True])
+def test_grid_index_matches_scan(incremental):
+    rng = np.random.default_rng(3)
+    x, y = rng.normal(size=50_000), 100 * rng.standard_cauchy(size=50_000)
+    x[::997] = np.nan
+    if incremental:
+        index = GridIndex(min_level=1_000)
+        for start in range(0, x.size, 777):
+            index.extend(x[start:start + 777], y[start:start + 777])
+    else:
+        index = GridIndex(x, y)
+    for qx, qy, radius in zip(rng.normal(size=300), 100 * rng.normal(size=300),
+                              rng.choice([0.01, 0.1, 1.0], size=300)):
+        expected = brute_nearest(x, y, qx, qy, radius, 100 * radius)
+        found = index.nearest(qx, qy, radius, 100 * radius)
+        assert found == expected or (
+            found >= 0 and np.isclose((x[found] - qx) ** 2 + ((y[found] - qy) / 100) ** 2,
+                                      (x[expected] - qx) ** 2 + ((y[expected] - qy) / 100) ** 2))
+
+
+def stamp(t):
+    return time.strftime("%Y-%m-%d %H:%M", time.gmtime(t))
+
+
+def bar_text(bar):
+    t, o, h, l, c = bar
+    return f"{stamp(t)}  O {o:.6g}  H {h:.6g}  L {l:.6g}  C {c:.6g}"
+
+
+@pytest.fixture
+def bars():
+    rng = np.random.default_rng(4)
+    dates = 1_700_006_400.0 + 60.0 * np.arange(6_000)
+    closes = 1.1 + np.cumsum(rng.normal(0, 1e-4, dates.size))
+    opens = np.concatenate(([1.1], closes[:-1]))
+    highs = np.maximum(opens, closes) + rng.random(dates.size) * 1e-4
+    lows = np.minimum(opens, closes) - rng.random(dates.size) * 1e-4
+    return dates, opens, highs, lows, closes
+
+
+class Screen:
+    """Shows a chart on the recording DPG and moves the mouse over it."""
+
+    def __init__(self, recording_dpg, chart, size=(1_000, 500)):
+        self.dpg = recording_dpg
+        self.chart = chart
+        recording_dpg.get_item_rect_size = lambda item: size
+        chart.show()
+
+    def view(self, x_min, x_max, y_min, y_max):
+        """Sets the axis limits and runs one frame so the series follow them."""
+        self.dpg.set_axis_limits(self.chart.x_axis_tag, x_min, x_max)
+        self.dpg.set_axis_limits(self.chart.y_axis_tag, y_min, y_max)
+        for _, _, kwargs in self.dpg.named("add_item_visible_handler"):
+            kwargs["callback"](None, None)
+
+    def hover(self, x, y):
+        """The readout shown with the mouse at ``(x, y)`` as ``(anchor, text)``, or None."""
+        self.dpg.get_plot_mouse_pos = lambda: (x, y)
+        (_, _, handler), = self.dpg.named("add_item_hover_handler")
+        handler["callback"](None, None)
+        tag = self.chart._readout_tag
+        (_, _, shown) = [call for call in self.dpg.named("configure_item")
+                         if call[1][0] == tag][-1]
+        if not shown["show"]:
+            return None
+        (_, (_, anchor), _) = [call for call in self.dpg.named("set_value")
+                               if call[1][0] == tag][-1]
+        return tuple(anchor), shown["label"]
+
+
+def test_query_handler_runs_only_when_the_mouse_moves(recording_dpg):
+    seen = []
+    add_query_handler("plot", lambda x, y: seen.append((x, y)))
+    (_, _, kwargs), = recording_dpg.named("add_item_hover_handler")
+    for pos in ((1.0, 2.0), (1.0, 2.0), (3.0, 2.0), (3.0, 2.0), (1.0, 2.0)):
+        recording_dpg.get_plot_mouse_pos = lambda pos=pos: list(pos)
+        kwargs["callback"](None, None)
+    assert seen == [(1.0, 2.0), (3.0, 2.0), (1.0, 2.0)]
+
+
+def test_click_handler_passes_plot_coordinates(recording_dpg):
+    clicks = []
+    add_click_handler("plot", lambda x, y: clicks.append((x, y)), button=1)
+    (_, (button,), kwargs), = recording_dpg.named("add_item_clicked_handler")
+    assert button == 1
+    recording_dpg.get_plot_mouse_pos = lambda: (5.0, -1.5)
+    kwargs["callback"](None, None)
+    assert clicks == [(5.0, -1.5)]
+
+
+def test_candlestick_readout_of_in_memory_bars(recording_dpg, bars):
+    dates, _, highs, lows, _ = bars
+    screen = Screen(recording_dpg, CandlestickChart(*bars, pyramid=False))
+    screen.view(dates[100], dates[200], lows.min(), highs.max())
+    bar = [col[150] for col in bars]
+    assert screen.hover(dates[150] + 20.0, 1.0) == ((dates[150], highs[150]), bar_text(bar))
+    assert screen.hover(dates[-1] + 3_600.0, 1.0) is None
+
+
+def test_candlestick_readout_of_the_drawn_pyramid_level(recording_dpg, bars):
+    dates, _, highs, lows, _ = bars
+    chart = CandlestickChart(*bars, pyramid=True)
+    screen = Screen(recording_dpg, chart)
+    screen.view(dates[0], dates[-1], lows.min(), highs.max())
+    level = chart._candles.level
+    assert level > 0
+    # The readout describes the aggregated bar drawn under the cursor, not an M1 bar
+    grouped = resample_ohlc(*bars, chart._candles.pyramid.names[level])
+    i = len(grouped[0]) // 2
+    bar = [col[i] for col in grouped]
+    assert screen.hover(grouped[0][i] + 1.0, 1.0) == ((bar[0], bar[2]), bar_text(bar))
+
+
+def test_candlestick_readout_of_live_bars(recording_dpg):
+    bars = TimeframeBars("M1")
+    for t, price in ((0.0, 1.0), (30.0, 1.5), (60.0, 1.2), (130.0, 1.1), (150.0, 1.4)):
+        bars.update(1_700_006_400.0 + t, price)
+    screen = Screen(recording_dpg, CandlestickChart.from_bars(bars))
+    start = 1_700_006_400.0
+    screen.view(start - 60.0, start + 240.0, 0.5, 2.0)
+    assert screen.hover(start + 5.0, 1.0) == ((start, 1.5), bar_text([start, 1.0, 1.5, 1.0, 1.5]))
+    # The open bar is read from the aggregator, not from the closed ring
+    open_bar = [start + 120.0, 1.1, 1.4, 1.1, 1.4]
+    assert screen.hover(start + 125.0, 1.0) == ((start + 120.0, 1.4), bar_text(open_bar))
+    assert screen.hover(start + 900.0, 1.0) is None
+
+
+def test_candlestick_readout_of_an_mmap_source(recording_dpg, bars, tmp_path):
+    dates, opens, highs, lows, closes = bars
+    write_columns(str(tmp_path), date=dates, open=opens, high=highs, low=lows, close=closes)
+    store = MmapColumns(str(tmp_path), chunk_size=1_000)
+    try:
+        screen = Screen(recording_dpg, CandlestickChart.from_source(MmapOHLCSource(store)))
+        screen.view(dates[1_990], dates[2_010], lows.min(), highs.max())
+        # Across a chunk boundary
+        for i in (1_999, 2_000):
+            bar = [col[i] for col in bars]
+            assert screen.hover(dates[i] - 10.0, 1.0) == ((dates[i], highs[i]), bar_text(bar))
+    finally:
+        store.close()
+
+
+def test_line_readout_snaps_to_the_nearest_sample(recording_dpg):
+    x = np.arange(1_000.0)
+    y = np.sin(x / 10.0)
+    screen = Screen(recording_dpg, LineChart(x, y, decimate=False))
+    screen.view(0.0, 100.0, -1.0, 1.0)
+    assert screen.hover(41.6, 0.0) == ((42.0, y[42]), f"x 42  y {y[42]:.6g}")
+    assert screen.hover(1_200.0, 0.0) is None
+
+
+def test_scatter_readout_finds_the_nearest_point(recording_dpg):
+    x, y = cloud_points(2_000)
+    screen = Screen(recording_dpg, ScatterChart(x, y, density=False))
+    screen.view(-4.0, 4.0, -40.0, 40.0)
+    # Radii of the readout: 10 pixels of a 1000 x 500 plot
+    rx, ry = 10 * 8.0 / 1_000, 10 * 80.0 / 500
+    for k in (0, 10, 500):
+        qx, qy = x[k] + rx / 3, y[k] - ry / 3
+        i = brute_nearest(x, y, qx, qy, rx, ry)
+        assert screen.hover(qx, qy) == ((x[i], y[i]), f"x {x[i]:.6g}  y {y[i]:.6g}")
+    assert screen.hover(100.0, 1_000.0) is None
+
+
+def test_scatter_readout_in_density_and_marker_mode(recording_dpg):
+    x, y = cloud_points(200_000)
+    chart = ScatterChart(x, y, density=True, marker_threshold=5_000)
+    screen = Screen(recording_dpg, chart)
+    screen.view(-2.0, 2.0, -10.0, 10.0)
+    assert not chart._density.markers
+
+    # Density mode: the count of the drawn bin under the cursor
+    count = chart._density.bin_count(0.5, 1.0)
+    assert count > 0
+    assert screen.hover(0.5, 1.0) == ((0.5, 1.0), f"x 0.5  y 1  ~{count:,.0f} points")
+    bins_y, bins_x = chart._density.density.shape
+    col, row = int(2.5 / 4.0 * bins_x), int(11.0 / 20.0 * bins_y)
+    in_bin = ((x >= -2.0 + col * 4.0 / bins_x) & (x < -2.0 + (col + 1) * 4.0 / bins_x)
+              & (y >= -10.0 + row * 20.0 / bins_y) & (y < -10.0 + (row + 1) * 20.0 / bins_y))
+    assert abs(count - in_bin.sum()) <= 0.2 * in_bin.sum() + 2
+
+    # Zoomed in far enough to draw markers: the nearest drawn point
+    screen.view(0.0, 0.05, 0.0, 0.5)
+    assert chart._density.markers
+    rx, ry = 10 * 0.05 / 1_000, 10 * 0.5 / 500
+    k = int(np.flatnonzero((x > 0.01) & (x < 0.04) & (y > 0.1) & (y < 0.4))[0])
+    i = brute_nearest(x, y, x[k] + rx / 3, y[k], rx, ry)
+    assert screen.hover(x[k] + rx / 3, y[k]) == ((x[i], y[i]), f"x {x[i]:.6g}  y {y[i]:.6g}")
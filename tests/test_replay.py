@@ -0,0 +1,117 @@
+"""Deterministic replay of recorded ticks into bars and live charts."""
+import numpy as np
+import pytest
+
+from pegasus import CandlestickChart
+from pegasus.indicators import SMA
+from pegasus.replay import Replay
+from pegasus.utils.ohlc import BarAggregator
+
+
+def session(ticks=20_000, seed=0):
+    """Ticks about 0.5 s apart over a few hours."""
+    rng = np.random.default_rng(seed)
+    times = 1.7e9 + np.cumsum(rng.exponential(0.5, ticks))
+    return times, 1.1 + np.cumsum(rng.normal(0, 1e-5, ticks))
+
+
+def assert_same_bars(a: BarAggregator, b: BarAggregator):
+    for timeframe in a.timeframes:
+        for col_a, col_b in zip(a[timeframe].arrays(), b[timeframe].arrays()):
+            np.testing.assert_array_equal(col_a, col_b)
+
+
+def test_clock_delivers_one_batch_per_frame():
+    times, prices = session()
+    batches = []
+    replay = Replay(times, prices, sink=lambda t, p: batches.append(t.copy()),
+                    speed=600, frame_seconds=1 / 60)
+    replay.advance()
+    assert replay.now == pytest.approx(times[0] + 10.0)
+    assert batches[0][-1] <= replay.now < times[replay.position]
+
+    replay.run()
+    assert replay.done and replay.stats.events == times.size
+    assert replay.stats.batches == len(batches) <= replay.stats.frames
+    np.testing.assert_array_equal(np.concatenate(batches), times)
+
+
+def test_replay_is_deterministic_and_matches_live_aggregation():
+    times, prices = session()
+    played = []
+    for _ in range(2):
+        bars = BarAggregator(("M1", "M5"))
+        Replay.ticks(times, prices, bars, speed=10_000, frame_seconds=1 / 60).run()
+        played.append(bars)
+    assert_same_bars(*played)
+
+    direct = BarAggregator(("M1", "M5"))
+    direct.load_ticks(times, prices)
+    assert_same_bars(played[0], direct)
+
+
+def test_as_fast_as_possible_delivers_max_batch_per_frame():
+    times, prices = session()
+    sizes = []
+    replay = Replay(times, prices, sink=lambda t, p: sizes.append(t.size),
+                    speed=None, max_batch=3_000)
+    stats = replay.run()
+    assert sizes == [3_000] * 6 + [2_000]
+    assert stats.largest_batch == 3_000 and stats.events_per_second > 0
+
+
+def test_pause_step_and_seek():
+    times, prices = session()
+    bars = BarAggregator(("M1",))
+    replay = Replay.ticks(times, prices, bars, speed=100, frame_seconds=0.1)
+    replay.pause()
+    assert replay.advance() == 0 and replay.run().events == 0
+    assert replay.step(5) == 5 and replay.now == times[4]
+
+    target = times[12_345]
+    assert replay.seek(target) == 12_346
+    expected = BarAggregator(("M1",))
+    expected.load_ticks(times[:12_346], prices[:12_346])
+    assert_same_bars(bars, expected)
+
+    # Backwards: bars are cleared and rebuilt up to the target
+    assert replay.seek(times[100]) == 101
+    expected = BarAggregator(("M1",))
+    expected.load_ticks(times[:101], prices[:101])
+    assert_same_bars(bars, expected)
+
+    replay.resume()
+    replay.advance()
+    assert replay.now == pytest.approx(times[100] + 10.0)
+
+
+def test_backward_seek_needs_reset():
+    times, prices = session(100)
+    replay = Replay(times, prices, sink=lambda t, p: None)
+    replay.seek(times[50])
+    with pytest.raises(ValueError):
+        replay.seek(times[10])
+
+
+def test_seek_back_reloads_live_indicator(recording_dpg):
+    times, prices = session()
+    bars = BarAggregator(("M1",))
+    replay = Replay.ticks(times, prices, bars, speed=None)
+    chart = CandlestickChart.from_bars(bars["M1"], indicators=[SMA(5)])
+    chart._build_plot()
+    flushes = [kwargs["callback"]
+               for _, _, kwargs in recording_dpg.named("add_item_visible_handler")]
+
+    replay.seek(times[-1])
+    for flush in flushes:
+        flush()
+    replay.seek(times[5_000])
+    for flush in flushes:
+        flush()
+
+    closed = bars["M1"].closed.views()
+    expected = SMA(5).load(*closed)[0]
+    sent = [args for _, args, _ in recording_dpg.named("set_value")]
+    x, y = sent[-2][1]  # The history line, before the open-bar tail
+    np.testing.assert_array_equal(x, closed[0][4:])
+    np.testing.assert_allclose(y, expected[4:])
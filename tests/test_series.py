@@ -0,0 +1,62 @@
+"""Series wrappers in ``pegasus.plotting.series``, run against the recording DPG stand-in."""
+import numpy as np
+import pytest
+
+from pegasus import HeatmapChart, LineChart, ScatterChart
+from pegasus.performance.textures import apply_colormap
+from pegasus.plotting import series
+
+
+@pytest.mark.parametrize("rows", [np.array([3, 0, 7]), np.arange(10) % 3 == 0, slice(2, 5), 4])
+def test_heatmap_update_rows_recolors_pixels(recording_dpg, rows):
+    rng = np.random.default_rng(0)
+    heatmap = series.HeatmapSeries(rng.random((10, 6)), parent=1)
+    heatmap.flush()
+    expected = heatmap.values.copy()
+    new = rng.random((10, 6), dtype=np.float32)[rows]
+    expected[rows] = new
+    heatmap.update_rows(rows, new)
+
+    np.testing.assert_array_equal(heatmap.values, expected)
+    np.testing.assert_array_equal(heatmap._pixels,
+                                  apply_colormap(expected, 0.0, 1.0, heatmap.lut))
+    assert heatmap.flush()
+    (_, (_, uploaded), _) = recording_dpg.named("set_value")[-1]
+    np.testing.assert_array_equal(uploaded, heatmap._pixels.reshape(-1))
+
+
+def test_textures_go_to_a_registry_of_the_current_context(recording_dpg):
+    values = np.arange(6.0).reshape(2, 3)
+    HeatmapChart(values).show()
+    # The next contexts reuse the ids of the first, registry included
+    LineChart(np.arange(50.0), np.arange(50.0)).show()
+    HeatmapChart(values).show()
+    (_, _, kwargs) = recording_dpg.named("add_dynamic_texture")[-1]
+    assert recording_dpg.get_item_type(kwargs["parent"]) == "mvAppItemType::mvTextureRegistry"
+
+
+def test_add_heatmap_creates_heat_series(recording_dpg):
+    values = np.arange(6.0).reshape(2, 3)
+    series.add_heatmap(values, 2, 3, parent=1)
+    (_, (data, rows, cols), kwargs), = recording_dpg.named("add_heat_series")
+    np.testing.assert_array_equal(data, values.reshape(-1))  # Row-major, flat
+    assert (rows, cols) == (2, 3) and kwargs["parent"] == 1
+
+
+def test_scatter_switches_between_markers_and_density(recording_dpg):
+    rng = np.random.default_rng(0)
+    x, y = rng.normal(size=300_000), 3 * rng.standard_cauchy(size=300_000)
+    chart = ScatterChart(x, y, marker_threshold=10_000)
+    assert chart._use_density()
+    chart._build_plot()
+    density = chart._density
+    assert not density.markers and density.image is not None
+    assert len(recording_dpg.named("add_image_series")) == 1
+
+    density._update(0.0, 0.01, 0.0, 0.01, 1280, 720)
+    assert density.markers and 0 < density.visible.size <= 10_000
+    assert density.bin_count(0.005, 0.005) is None
+    assert len(recording_dpg.named("add_image_series")) == 1
+
+    small = ScatterChart(x[:1_000], y[:1_000])
+    assert not small._use_density()
@@ -0,0 +1,83 @@
+"""Sliding-window spectra and the scrolling spectrogram texture."""
+import numpy as np
+import pytest
+
+from pegasus.performance.textures import apply_colormap
+from pegasus.plotting import series
+from pegasus.spectral import SlidingSpectrum
+
+RATE = 1024.0
+SIZE = 256
+HOP = 64
+
+
+def tones(n):
+    """Bin 32 at full scale plus bin 80 at half scale (both exactly on a bin)."""
+    t = np.arange(n) / RATE
+    return np.sin(2 * np.pi * 128.0 * t) + 0.5 * np.sin(2 * np.pi * 320.0 * t)
+
+
+@pytest.mark.parametrize("scale", ["linear", "db"])
+def test_frames_match_rfft_of_each_window(scale):
+    signal = tones(4_000)
+    spectrum = SlidingSpectrum(SIZE, HOP, sample_rate=RATE, scale=scale)
+    frames = [spectrum.push(block) for block in np.split(signal, [1, 100, 357, 358, 2_000])]
+    frames = np.concatenate(frames)
+
+    ends = np.arange(SIZE, signal.size + 1, HOP)
+    assert frames.shape == (ends.size, SIZE // 2 + 1) and spectrum.frames == ends.size
+    windows = np.stack([signal[end - SIZE:end] for end in ends])
+    expected = np.abs(np.fft.rfft(windows * np.hanning(SIZE), axis=1)) * 2 / np.hanning(SIZE).sum()
+    if scale == "db":
+        expected = 20 * np.log10(np.maximum(expected, 1e-12))
+    np.testing.assert_allclose(frames, expected, rtol=1e-9, atol=1e-9)
+    np.testing.assert_array_equal(spectrum.latest, frames[-1])
+
+
+def test_tones_peak_at_their_bins():
+    spectrum = SlidingSpectrum(SIZE, HOP, sample_rate=RATE, scale="linear")
+    last = spectrum.push(tones(SIZE))[-1]
+    assert spectrum.frequencies[32] == 128.0 and spectrum.frequencies[80] == 320.0
+    assert last[32] == pytest.approx(1.0, rel=1e-4)
+    assert last[80] == pytest.approx(0.5, rel=1e-4)
+    # The Hann taper spreads each tone over its two neighbouring bins only
+    far = np.ones(last.size, dtype=bool)
+    far[[31, 32, 33, 79, 80, 81]] = False
+    assert last[far].max() < 0.01
+
+
+def test_reset_needs_a_full_window_again():
+    spectrum = SlidingSpectrum(SIZE, HOP, sample_rate=RATE)
+    assert spectrum.push(tones(SIZE - 1)).shape[0] == 0
+    assert spectrum.push(tones(1)).shape[0] == 1
+    spectrum.reset()
+    assert spectrum.push(tones(HOP)).shape[0] == 0 and spectrum.frames == 0
+
+
+def test_spectrogram_columns_scroll_in(recording_dpg):
+    bins, history = 3, 4
+    spectrogram = series.SpectrogramSeries(bins, history=history, parent=1, frame_seconds=0.5,
+                                           max_frequency=10.0, vmin=0.0, vmax=5.0)
+    frames = np.arange(6 * bins, dtype=np.float64).reshape(6, bins) / 3.0
+
+    def column(frame):
+        # Highest frequency at the top row
+        return apply_colormap(frames[frame, ::-1], 0.0, 5.0, spectrogram.lut)
+
+    def images():
+        latest = recording_dpg.named("configure_item")[-2:]
+        return [(kwargs["show"], kwargs["bounds_min"][0], kwargs["bounds_max"][0],
+                 kwargs["uv_min"][0], kwargs["uv_max"][0]) for _, _, kwargs in latest]
+
+    spectrogram.push(frames[:3])
+    assert spectrogram.flush() and not spectrogram.flush()
+    for frame in range(3):
+        np.testing.assert_array_equal(spectrogram._pixels[:, frame], column(frame))
+    assert images() == [(True, 0.0, 1.5, 0.0, 0.75), (False, 0.0, 0.0, 0.0, 0.0)]
+
+    # Frames 4 and 5 wrap around into columns 3 and 0; frame 0 scrolls out on the left
+    spectrogram.push(frames[3:5])
+    spectrogram.flush()
+    np.testing.assert_array_equal(spectrogram._pixels[:, 0], column(4))
+    np.testing.assert_array_equal(spectrogram._pixels[:, 3], column(3))
+    assert images() == [(True, 0.5, 2.0, 0.25, 1.0), (True, 2.0, 2.5, 0.0, 0.25)]
@@ -0,0 +1,104 @@
+"""
+Import-time budget: ``import pegasus`` stays light and charts never load pandas.
+
+Import times are always checked against a bare ``import numpy`` timed the same
+way, which keeps the budgets meaningful on slow or loaded CI machines.
+``PEGASUS_IMPORT_BUDGETS=1`` adds the stricter absolute budgets.
+"""
+import os
+import re
+import subprocess
+import sys
+
+import pytest
+
+from pegasus import demo
+
+# Best of three cold imports as a multiple of ``import numpy``; generous, for real regressions
+RELATIVE_BUDGETS = {
+    "import pegasus": 0.5,
+    "from pegasus import CandlestickChart, Dashboard, LineChart, ScatterChart": 3.0,
+}
+# Best of three cold imports, in ms; scale with PEGASUS_IMPORT_BUDGET_SCALE on slow machines
+CHECK_BUDGETS = os.environ.get("PEGASUS_IMPORT_BUDGETS", "") not in ("", "0")
+BUDGETS_MS = {
+    "import pegasus": 50,
+    "from pegasus import CandlestickChart, Dashboard, LineChart, ScatterChart": 500,
+}
+BUDGET_SCALE = float(os.environ.get("PEGASUS_IMPORT_BUDGET_SCALE", 1.0))
+
+_IMPORT_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)")
+
+
+def import_profile(statement):
+    """
+    Runs ``statement`` in a fresh interpreter under ``-X importtime``.
+
+    Returns:
+        (wall ms of the statement, loaded module names, slowest imports as
+        (cumulative ms, module) sorted descending)
+    """
+    code = ("import sys, time\n"
+            "start = time.perf_counter()\n"
+            f"{statement}\n"
+            "print((time.perf_counter() - start) * 1e3)\n"
+            "print(' '.join(sys.modules))\n")
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", code],
+                            capture_output=True, text=True, check=True)
+    wall, modules = result.stdout.splitlines()
+    imports = [(int(m.group(2)) / 1e3, m.group(4))
+               for m in map(_IMPORT_LINE.match, result.stderr.splitlines()) if m]
+    return float(wall), set(modules.split()), sorted(imports, reverse=True)
+
+
+def test_import_pegasus_loads_no_dependencies():
+    _, modules, _ = import_profile("import pegasus")
+    assert not {"numpy", "pandas", "dearpygui"} & modules
+
+
+def test_charts_never_load_pandas():
+    _, modules, _ = import_profile(
+        "from pegasus import CandlestickChart, Dashboard, LineChart, ScatterChart\n"
+        "import pegasus.utils.data")
+    assert "dearpygui" in modules and "pandas" not in modules
+
+
+def test_charts_defer_optional_modules():
+    _, modules, _ = import_profile(
+        "from pegasus import CandlestickChart, Dashboard, LineChart, ScatterChart")
+    deferred = {"pegasus.indicators", "pegasus.performance.profiler", "pegasus.performance.query",
+                "pegasus.plotting.raster", "pegasus.utils.mmap_series", "pegasus.utils.ohlc",
+                "pegasus.dataplane"}
+    assert not deferred & modules
+
+
+def test_load_ohlc_csv_cache_hit_skips_pandas(tmp_path):
+    path = tmp_path / "ohlc.csv"
+    path.write_text("DATE,TIME,OPEN,HIGH,LOW,CLOSE\n2025.10.29,17:24:00,1.1,1.2,1.0,1.15\n")
+    load = f"from pegasus import load_ohlc_csv\nload_ohlc_csv({str(path)!r}, cache_dir={str(tmp_path)!r})"
+    assert "pandas" in import_profile(load)[1]
+    assert "pandas" not in import_profile(load)[1]
+
+
+@pytest.fixture(scope="module")
+def numpy_import_ms():
+    """Best of three cold ``import numpy`` runs: the yardstick for this machine."""
+    return min(import_profile("import numpy")[0] for _ in range(3))
+
+
+@pytest.mark.parametrize("statement", list(RELATIVE_BUDGETS))
+def test_import_time_budget(statement, numpy_import_ms):
+    budget = RELATIVE_BUDGETS[statement] * numpy_import_ms
+    if CHECK_BUDGETS:
+        budget = min(budget, BUDGETS_MS[statement] * BUDGET_SCALE)
+    profiles = [import_profile(statement) for _ in range(3)]
+    best, _, slowest = min(profiles, key=lambda profile: profile[0])
+    top = ", ".join(f"{module} {ms:.0f} ms" for ms, module in slowest[:5])
+    assert best <= budget, (f"{statement!r} took {best:.0f} ms > {budget:.0f} ms "
+                            f"(import numpy: {numpy_import_ms:.0f} ms; {top})")
+
+
+def test_demo_entry_point_builds_dashboard(recording_dpg):
+    demo.main(["--points", "1000", "--frames", "1"])
+    assert len(recording_dpg.named("add_subplots")) == 1
+    assert len(recording_dpg.named("add_line_series")) == 3
@@ -0,0 +1,84 @@
+"""End-to-end ingestion through the loopback feed server."""
+import asyncio
+
+import numpy as np
+import pytest
+
+from pegasus.performance.buffers import RingSeries, UpdateScheduler
+from pegasus.streaming import (
+    POLICIES,
+    BinaryFrameDecoder,
+    JsonLinesDecoder,
+    LoopbackFeedServer,
+    StreamClient,
+    encode_binary_frame,
+    loopback_throughput,
+    series_sink,
+)
+
+
+def test_binary_decoder_handles_split_frames():
+    decoder = BinaryFrameDecoder(columns=2)
+    frame = encode_binary_frame([1.0, 2.0], [3.0, 4.0])
+    assert decoder.feed(frame[:5]) is None
+    t, p = decoder.feed(frame[5:] + frame)
+    np.testing.assert_array_equal(t, [1.0, 2.0, 1.0, 2.0])
+    np.testing.assert_array_equal(p, [3.0, 4.0, 3.0, 4.0])
+
+
+def test_json_decoder_keeps_partial_lines():
+    decoder = JsonLinesDecoder(("t", "p"))
+    t, p = decoder.feed(b'{"t":1,"p":2}\n{"t":3')
+    assert t.tolist() == [1.0] and p.tolist() == [2.0]
+    t, p = decoder.feed(b',"p":4}\n')
+    assert t.tolist() == [3.0] and p.tolist() == [4.0]
+
+
+def test_json_decoder_skips_and_counts_bad_lines():
+    decoder = JsonLinesDecoder(("t", "p"))
+    t, p = decoder.feed(b'{"t":1,"p":2}\n{"t":2,"p":\n{"t":3}\n[4]\n{"t":5,"p":"x"}\n'
+                        b'{"t":6,"p":7}\n')
+    assert t.tolist() == [1.0, 6.0] and p.tolist() == [2.0, 7.0]
+    assert decoder.bad_lines == 4
+    assert decoder.feed(b"oops\n") is None and decoder.bad_lines == 5
+    t, p = decoder.feed(b'{"t":8,"p":9}\n')
+    assert t.tolist() == [8.0] and p.tolist() == [9.0]
+
+
+@pytest.mark.parametrize("policy", POLICIES)
+def test_sink_error_stops_the_stream(policy):
+    calls = []
+
+    def sink(*columns):
+        calls.append(len(columns[0]))
+        raise RuntimeError("sink failed")
+
+    client = StreamClient(BinaryFrameDecoder(2), sink, max_pending=2, policy=policy,
+                          read_size=1 << 10)
+
+    async def run():
+        async with LoopbackFeedServer(200_000, batch=100) as server:
+            # Bounded so a reader left waiting on a dead dispatcher fails instead of hanging
+            return await asyncio.wait_for(client.run_tcp(server.host, server.port), 30)
+
+    with pytest.raises(RuntimeError, match="sink failed"):
+        asyncio.run(run())
+    assert len(calls) == 1 and client.stats.messages == 0
+    assert client.stats.bytes < 200_000 * 16
+
+
+@pytest.mark.parametrize("fmt", ["binary", "json"])
+def test_loopback_into_ring_series(recording_dpg, fmt):
+    scheduler = UpdateScheduler()
+    series = RingSeries(tag=1, capacity=5_000)
+    stats = loopback_throughput(20_000, fmt=fmt, sink=series_sink(series, scheduler))
+
+    assert stats.messages == 20_000 and stats.dropped_messages == 0
+    assert stats.messages_per_second > 0
+
+    frame = scheduler.apply()
+    assert frame.applied == 1
+    assert len(series) == 5_000
+    (_, (tag, (t, p)), _), = recording_dpg.named("set_value")
+    assert tag == 1 and len(t) == len(p) == 5_000
+    assert np.all(np.diff(t) > 0)
@@ -0,0 +1,110 @@
+"""The NumPy data path must reach DPG without intermediate Python lists."""
+import array
+
+import numpy as np
+import pytest
+
+from pegasus import CandlestickChart, LineChart, ScatterChart, load_ohlc_csv
+from pegasus.performance.buffers import update_series_data
+from pegasus.plotting import series
+from pegasus.utils.arrays import as_series_array
+
+
+@pytest.fixture
+def ohlc():
+    n = 1_000
+    rng = np.random.default_rng(0)
+    closes = 1.1 + np.cumsum(rng.normal(0, 1e-4, n))
+    return (
+        np.arange(n, dtype=np.float64) * 60.0,
+        closes,
+        closes + 1e-4,
+        closes - 1e-4,
+        closes.astype(np.float32),
+    )
+
+
+def _assert_no_lists(call):
+    name, args, kwargs = call
+    for value in list(args) + list(kwargs.values()):
+        assert not isinstance(value, list), f"{name} received a Python list"
+
+
+@pytest.mark.parametrize("dtype", [np.float64, np.float32])
+def test_contiguous_arrays_pass_through(dtype):
+    arr = np.arange(10, dtype=dtype)
+    assert as_series_array(arr) is arr
+
+
+def test_buffer_protocol_objects_share_memory():
+    buf = array.array("d", range(10))
+    arr = as_series_array(buf)
+    assert isinstance(arr, np.ndarray)
+    assert np.shares_memory(arr, np.frombuffer(buf, dtype=np.float64))
+
+    view = memoryview(np.arange(10, dtype=np.float32))
+    assert np.shares_memory(as_series_array(view), np.asarray(view))
+
+
+def test_series_wrappers_forward_same_arrays(recording_dpg, ohlc):
+    dates, opens, highs, lows, closes = ohlc
+    series.add_candle_series(dates, opens, highs, lows, closes, parent=1)
+    series.add_line_series(dates, closes, parent=1, decimate=False)
+    series.add_scatter_series(dates, closes, parent=1)
+    series.add_bar_series(dates, closes, parent=1)
+
+    candle, line, scatter, bar = recording_dpg.calls
+    # DPG order is dates, opens, closes, lows, highs
+    for sent, original in zip(candle[1], (dates, opens, closes, lows, highs)):
+        assert sent is original
+    for _, args, _ in (line, scatter, bar):
+        assert args[0] is dates and args[1] is closes
+    for call in recording_dpg.calls:
+        _assert_no_lists(call)
+
+
+def test_update_series_data_forwards_same_arrays(recording_dpg, ohlc):
+    x, y = ohlc[0], ohlc[4]
+    update_series_data(42, (x, y))
+
+    (name, (tag, columns), _), = recording_dpg.calls
+    assert name == "set_value" and tag == 42
+    assert columns[0] is x and columns[1] is y
+
+
+def test_charts_keep_and_forward_arrays(recording_dpg, ohlc):
+    dates, opens, highs, lows, closes = ohlc
+    chart = CandlestickChart(dates, opens, highs, lows, closes)
+    assert chart.closes is closes
+    chart.show()
+    (_, args, _), = recording_dpg.named("add_candle_series")
+    assert args[0] is dates and args[2] is closes
+
+    line = LineChart(dates, opens, decimate=False)
+    line.show()
+    (_, args, _), = recording_dpg.named("add_line_series")
+    assert args[0] is dates and args[1] is opens
+
+    scatter = ScatterChart(dates, highs)
+    scatter.show()
+    (_, args, _), = recording_dpg.named("add_scatter_series")
+    assert args[0] is dates and args[1] is highs
+
+    for call in recording_dpg.calls:
+        _assert_no_lists(call)
+
+
+def test_load_ohlc_csv_returns_arrays(tmp_path):
+    path = tmp_path / "ohlc.csv"
+    path.write_text(
+        "DATE,TIME,OPEN,HIGH,LOW,CLOSE\n"
+        "2025.10.29,17:24:00,1.1,1.2,1.0,1.15\n"
+        "2025.10.29,17:25:00,1.15,1.25,1.1,1.2\n"
+    )
+    # Second load is served from the memory-mapped cache
+    for _ in range(2):
+        columns = load_ohlc_csv(str(path), cache_dir=str(tmp_path / "cache"))
+        for col in columns:
+            assert isinstance(col, np.ndarray)
+            assert col.dtype == np.float64 and col.flags.c_contiguous
+        assert columns[0][1] - columns[0][0] == 60.0